@@ -114,6 +114,20 @@ changed:
     returned: always
     type: bool
     sample: true
+providers_detected:
+    description: Cloud and Terraform providers required by the configuration
+    returned: always
+    type: list
+    sample: ["aws", "azure"]
+warnings:
+    description: Warnings reported while generating
+    returned: always
+    type: list
+timings:
+    description: Wall time and per-stage timings of the run
+    returned: when yamlforge runs in-process or with --ansible output
+    type: dict
+    sample: {"wall_seconds": 0.42, "stages": [{"name": "convert", "calls": 1, "total_seconds": 0.31}]}
 '''
 
 import os
@@ -131,6 +145,73 @@ except ImportError:
     HAS_JSONSCHEMA = False
 
 
+def find_yamlforge_root():
+    """Find the YamlForge checkout (a directory with defaults/ and mappings/), if any"""
+    
+    # Start from current directory and work up
+    current_path = os.getcwd()
+    search_paths = [current_path]
+    
+    # Add parent directories up to root
+    path = current_path
+    for _ in range(10):  # Limit search to avoid infinite loops
+        parent = os.path.dirname(path)
+        if parent == path:  # Reached filesystem root
+            break
+        search_paths.append(parent)
+        path = parent
+    
+    # Also check if this collection is within the YamlForge repository
+    # The collection should be at ansible_collections/rut31337/yamlforge/
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    marker = os.sep + 'ansible_collections' + os.sep
+    if marker in module_dir:
+        yamlforge_repo_root = module_dir[:module_dir.rindex(marker)]  # Parent of ansible_collections
+        search_paths.append(yamlforge_repo_root)
+    
+    for path in search_paths:
+        if os.path.exists(os.path.join(path, 'defaults')) and os.path.exists(os.path.join(path, 'mappings')):
+            return path
+    return None
+
+
+def load_yamlforge_api(yamlforge_root):
+    """Import the in-process yamlforge API, or return None to fall back to the CLI"""
+    try:
+        from yamlforge import api
+        return api
+    except ImportError:
+        pass
+    
+    # Use the YamlForge checkout this collection lives in
+    if yamlforge_root and os.path.isdir(os.path.join(yamlforge_root, 'yamlforge')):
+        sys.path.insert(0, yamlforge_root)
+        try:
+            from yamlforge import api
+            return api
+        except ImportError:
+            sys.path.remove(yamlforge_root)
+    return None
+
+
+def run_yamlforge_in_process(yamlforge_api, config_file, output_dir, **kwargs):
+    """Run yamlforge through its library API; returns (returncode, stdout, stderr, result)"""
+    
+    result = yamlforge_api.generate(
+        config_file,
+        output_dir,
+        auto_deploy=kwargs.get('auto_deploy', False),
+        no_credentials=kwargs.get('no_credentials', False),
+        verbose=kwargs.get('verbose', False),
+        guid=kwargs.get('guid'),
+        exclude_providers=kwargs.get('exclude_providers'),
+    )
+    stdout = result.pop('output', '')
+    returncode = 0 if result.get('success') else 1
+    stderr = '\n'.join(result.get('errors', []))
+    return returncode, stdout, stderr, result
+
+
 def validate_yaml_config(module, config_file, yamlforge_root):
     """Validate YAML configuration against YamlForge schema"""
     
@@ -200,34 +281,7 @@ def run_yamlforge_command(module, config_file, output_dir, **kwargs):
     """Execute yamlforge command with specified parameters"""
     
     # Find YamlForge root directory first to locate yamlforge.py
-    yamlforge_root = None
-    
-    # Start from current directory and work up
-    current_path = os.getcwd()
-    search_paths = [current_path]
-    
-    # Add parent directories up to root
-    path = current_path
-    for _ in range(10):  # Limit search to avoid infinite loops
-        parent = os.path.dirname(path)
-        if parent == path:  # Reached filesystem root
-            break
-        search_paths.append(parent)
-        path = parent
-    
-    # Also check if this collection is within the YamlForge repository
-    # The collection should be at ansible_collections/rut31337/yamlforge/
-    module_file = os.path.abspath(__file__)
-    module_dir = os.path.dirname(module_file)
-    collection_root = os.path.dirname(os.path.dirname(os.path.dirname(module_dir)))  # Go up 3 levels from plugins/modules/
-    if 'ansible_collections' in collection_root:
-        yamlforge_repo_root = os.path.dirname(collection_root)  # Parent of ansible_collections
-        search_paths.append(yamlforge_repo_root)
-    
-    for path in search_paths:
-        if os.path.exists(os.path.join(path, 'defaults')) and os.path.exists(os.path.join(path, 'mappings')):
-            yamlforge_root = path
-            break
+    yamlforge_root = find_yamlforge_root()
     
     # Try to find yamlforge.py in YamlForge root, then fall back to module
     yamlforge_script = None
@@ -345,34 +399,19 @@ def main():
         module.fail_json(msg=f"Configuration file not found: {config_file}")
     
     # Find YamlForge root directory for schema validation
-    yamlforge_root = None
-    current_path = os.getcwd()
-    search_paths = [current_path]
+    yamlforge_root = find_yamlforge_root()
     
-    # Add parent directories up to root
-    path = current_path
-    for _ in range(10):  # Limit search to avoid infinite loops
-        parent = os.path.dirname(path)
-        if parent == path:  # Reached filesystem root
-            break
-        search_paths.append(parent)
-        path = parent
+    # Prefer running yamlforge in this process; fall back to the CLI if it cannot be imported
+    yamlforge_api = load_yamlforge_api(yamlforge_root)
     
-    # Also check if this collection is within the YamlForge repository
-    module_file = os.path.abspath(__file__)
-    module_dir = os.path.dirname(module_file)
-    collection_root = os.path.dirname(os.path.dirname(os.path.dirname(module_dir)))  # Go up 3 levels from plugins/modules/
-    if 'ansible_collections' in collection_root:
-        yamlforge_repo_root = os.path.dirname(collection_root)  # Parent of ansible_collections
-        search_paths.append(yamlforge_repo_root)
-    
-    for path in search_paths:
-        if os.path.exists(os.path.join(path, 'defaults')) and os.path.exists(os.path.join(path, 'mappings')):
-            yamlforge_root = path
-            break
-    
-    # Validate YAML configuration against schema
-    validate_yaml_config(module, config_file, yamlforge_root)
+    # Validate YAML configuration against schema (the in-process run validates
+    # while generating, so only check mode needs a separate pass)
+    if yamlforge_api is None:
+        validate_yaml_config(module, config_file, yamlforge_root)
+    elif module.check_mode:
+        validation_errors = yamlforge_api.validate(config_file)
+        if validation_errors:
+            module.fail_json(msg=validation_errors[0])
     
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
@@ -390,12 +429,17 @@ def main():
     
     # Execute yamlforge
     kwargs = {k: v for k, v in module.params.items() if k not in ['config_file', 'output_dir']}
-    returncode, stdout, stderr = run_yamlforge_command(
-        module, config_file, output_dir, **kwargs
-    )
-    
-    # Parse output
-    parsed_result = parse_yamlforge_output(stdout, stderr, output_dir)
+    if yamlforge_api is not None:
+        returncode, stdout, stderr, parsed_result = run_yamlforge_in_process(
+            yamlforge_api, config_file, output_dir, **kwargs
+        )
+    else:
+        returncode, stdout, stderr = run_yamlforge_command(
+            module, config_file, output_dir, **kwargs
+        )
+        
+        # Parse output
+        parsed_result = parse_yamlforge_output(stdout, stderr, output_dir)
     
     # Determine if changes were made
     changed = len(parsed_result['terraform_files']) > 0
@@ -2,6 +2,7 @@ import streamlit as st
 import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, List
 import yaml
@@ -70,6 +71,7 @@ from core.sharing import (
 )
 from core.rhdp_integration import get_rhdp_integration
 from core.openshift_logging import app_logger, metrics, log_execution_time
+from core.metrics import start_metrics_server, ANALYSIS_SECONDS
 
 
 def validate_essential_files():
@@ -231,6 +233,7 @@ def clear_session_state():
         'conversation_history',
         'current_yaml', 
         'analysis_result',
+        'analysis_diagram',
         'workflow_stage',
         'yaml_generator',
         'yamlforge_analyzer'
@@ -796,6 +799,11 @@ def handle_complete_stage(user_input: str) -> str:
 
 
 def run_analysis():
+    """Analyze the current YAML, then render its diagram from the analysis"""
+    st.session_state.analysis_diagram = None
+    status = st.status("Analyzing configuration...", expanded=False)
+    
+    start = time.perf_counter()
     try:
         analyzer = st.session_state.yamlforge_analyzer
         
@@ -805,6 +813,7 @@ def run_analysis():
         success, result, errors = asyncio.run(
             analyzer.analyze_configuration(st.session_state.current_yaml, enabled_providers)
         )
+        ANALYSIS_SECONDS.observe(time.perf_counter() - start, outcome='success' if success else 'failure')
         
         if success:
             st.session_state.analysis_result = result
@@ -815,10 +824,29 @@ def run_analysis():
                 'errors': errors
             }
     except Exception as e:
+        ANALYSIS_SECONDS.observe(time.perf_counter() - start, outcome='error')
         st.session_state.analysis_result = {
             'error': True,
             'errors': [f"Analysis failed: {str(e)}"]
         }
+    
+    analysis_result = st.session_state.analysis_result
+    if analysis_result.get('error'):
+        status.update(label="Analysis failed", state="error")
+        return
+    status.write(f"📊 Cost analysis complete ({len(analysis_result.get('instances', []))} instances)")
+    
+    # The diagram is built from the analysis instances, so it follows the analysis
+    if getattr(st.session_state, 'show_diagrams_in_chat', True):
+        st.session_state.analysis_diagram = display_diagram_in_chat(
+            analysis_result,
+            st.session_state.current_yaml,
+            getattr(st.session_state, 'original_requirements', '')
+        )
+        if st.session_state.analysis_diagram:
+            status.write("🗺️ Infrastructure diagram ready")
+    
+    status.update(label="Analysis complete", state="complete")
 
 
 def display_yaml_preview():
@@ -1070,17 +1098,20 @@ def format_analysis_as_chat_message() -> str:
     
     # Add infrastructure diagram marker for rendering (if enabled)
     if getattr(st.session_state, 'show_diagrams_in_chat', True):
-        yaml_content = getattr(st.session_state, 'current_yaml', '')
-        user_requirements = getattr(st.session_state, 'original_requirements', '')
-        diagram_mermaid = display_diagram_in_chat(result, yaml_content, user_requirements)
+        # Reuse the diagram rendered after the analysis when available
+        diagram_mermaid = getattr(st.session_state, 'analysis_diagram', None)
+        if not diagram_mermaid:
+            yaml_content = getattr(st.session_state, 'current_yaml', '')
+            user_requirements = getattr(st.session_state, 'original_requirements', '')
+            diagram_mermaid = display_diagram_in_chat(result, yaml_content, user_requirements)
         
         if diagram_mermaid:
-            # Check generation source from the comment in the mermaid code
+            # Check generation source from the comment in the diagram code
             generation_source = "Unknown"
-            if "%% Generated by: AI Generated" in diagram_mermaid:
+            if "// Generated by: AI Generated" in diagram_mermaid:
                 generation_source = "AI Generated"
-            elif "%% Generated by: Fallback" in diagram_mermaid:
-                generation_source = "Fallback"
+            elif "// Generated by: Local Renderer" in diagram_mermaid:
+                generation_source = "Local Renderer"
             
             message += f"📊 **Infrastructure Diagram** *({generation_source})*:\n\n"
             # Use a special marker that will be processed during display
@@ -1868,6 +1899,9 @@ Need help with specific cloud provider setup? Check the [YamlForge documentation
 
 @log_execution_time("main_app_execution")
 def main():
+    # Prometheus endpoint for latency-based autoscaling (started once per process)
+    start_metrics_server()
+    
     # Initialize logging and track session start
     try:
         app_logger.log_event("application_start", 
@@ -0,0 +1,265 @@
+"""
+Content-addressed cache for AI responses in DemoBuilder.
+
+Identical diagram summaries and generation prompts are served from a local
+LRU/TTL cache (optionally backed by a shared directory or Redis) instead of
+calling the AI service again. Long-lived AI clients are shared per process.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 256
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize sets in a stable order so equal content hashes equally."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def normalize_payload(payload: Any) -> str:
+    """Return a canonical text form of a prompt or structured summary."""
+    if isinstance(payload, str):
+        # Trailing whitespace and blank-line runs do not change the meaning of a prompt
+        lines = [line.rstrip() for line in payload.strip().splitlines()]
+        normalized = []
+        for line in lines:
+            if line or (normalized and normalized[-1]):
+                normalized.append(line)
+        return '\n'.join(normalized)
+    return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=_json_default)
+
+
+def make_cache_key(kind: str, model: str, payload: Any) -> str:
+    """Build a content-addressed key from the request kind, model name and payload."""
+    digest = hashlib.sha256()
+    for part in (kind, model or '', normalize_payload(payload)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return f"{kind}:{digest.hexdigest()}"
+
+
+class FileCacheBackend:
+    """Shared on-disk cache, e.g. a volume mounted by every replica."""
+
+    # Expired entries that are never read again are swept from set() at most this often
+    SWEEP_INTERVAL_SECONDS = 600
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._last_sweep = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key.replace(':', '_') + '.json')
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('expires', 0) < time.time():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        return entry.get('value')
+
+    def _sweep(self) -> None:
+        """Delete expired entries and stray temporary files."""
+        now = time.time()
+        self._last_sweep = now
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for dir_entry in entries:
+            try:
+                if dir_entry.name.endswith('.tmp'):
+                    expired = dir_entry.stat().st_mtime < now - self.SWEEP_INTERVAL_SECONDS
+                elif dir_entry.name.endswith('.json'):
+                    with open(dir_entry.path, 'r') as f:
+                        expired = json.load(f).get('expires', 0) < now
+                else:
+                    continue
+                if expired:
+                    os.unlink(dir_entry.path)
+            except (OSError, ValueError):
+                pass
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        if time.time() - self._last_sweep >= self.SWEEP_INTERVAL_SECONDS:
+            self._sweep()
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'expires': time.time() + ttl, 'value': value}, f)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+class RedisCacheBackend:
+    """Shared cache in any Redis-compatible server."""
+
+    def __init__(self, url: str, password: Optional[str] = None):
+        self.client = redis.Redis.from_url(url, password=password, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(f"demobuilder:ai:{key}")
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self.client.setex(f"demobuilder:ai:{key}", ttl, value)
+
+
+class AIResponseCache:
+    """In-process LRU/TTL cache with an optional shared backend behind it."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: int = DEFAULT_TTL_SECONDS, backend=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.backend = backend
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = None
+        if self.backend is not None:
+            try:
+                value = self.backend.get(key)
+            except Exception as e:
+                print(f"Warning: AI cache backend read failed: {e}")
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store_local(key, value, now)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response locally and in the shared backend."""
+        with self._lock:
+            self._store_local(key, value, time.time())
+        if self.backend is not None:
+            try:
+                self.backend.set(key, value, self.ttl)
+            except Exception as e:
+                print(f"Warning: AI cache backend write failed: {e}")
+
+    def _store_local(self, key: str, value: str, now: float) -> None:
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all locally cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of local entries."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+def _create_backend():
+    """Select the shared backend from the environment, if any."""
+    redis_url = os.getenv("REDIS_URL")
+    if os.getenv("REDIS_ENABLED", "false").lower() == "true" and redis_url:
+        if REDIS_AVAILABLE:
+            try:
+                return RedisCacheBackend(redis_url, os.getenv("REDIS_PASSWORD"))
+            except Exception as e:
+                print(f"Warning: Could not connect AI cache to Redis: {e}")
+        else:
+            print("Warning: REDIS_ENABLED is set but the redis package is not installed")
+
+    cache_dir = os.getenv("AI_CACHE_DIR")
+    if cache_dir:
+        try:
+            return FileCacheBackend(cache_dir)
+        except OSError as e:
+            print(f"Warning: Could not use AI cache directory {cache_dir}: {e}")
+
+    return None
+
+
+_cache: Optional[AIResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_ai_cache() -> Optional[AIResponseCache]:
+    """Return the process-wide AI response cache, or None when disabled."""
+    global _cache
+    if os.getenv("AI_CACHE_ENABLED", "true").lower() == "false":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AIResponseCache(
+                    max_entries=int(os.getenv("AI_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    ttl=int(os.getenv("AI_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                    backend=_create_backend()
+                )
+    return _cache
+
+
+_clients: Dict[Hashable, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_shared_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return a long-lived client for key, creating it with factory on first use.
+
+    Factory exceptions propagate and nothing is stored, so a failed client is
+    retried on the next call.
+    """
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+    return client
@@ -0,0 +1,227 @@
+"""
+Deterministic Graphviz DOT renderer for DemoBuilder.
+
+Builds infrastructure diagrams directly from extract_diagram_data() output,
+offline and without an AI round trip. The same data always renders the same DOT.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+
+PROVIDER_STYLES = {
+    'aws': ('☁️ AWS Cloud', '#FFF4E6', '#FF9900'),
+    'azure': ('🔷 Azure Cloud', '#E6F3FF', '#00BCF2'),
+    'gcp': ('🍃 GCP Cloud', '#E8F5E8', '#34A853'),
+    'ibm_vpc': ('🔵 IBM Cloud VPC', '#E6F0FF', '#054ADA'),
+    'ibm_classic': ('🔵 IBM Cloud Classic', '#E6F0FF', '#054ADA'),
+    'oci': ('🔴 Oracle Cloud', '#FFE6E6', '#F80000'),
+    'alibaba': ('🟠 Alibaba Cloud', '#FFF0E6', '#FF6A00'),
+    'vmware': ('🟢 VMware vSphere', '#EEF7EE', '#607078'),
+    'cnv': ('☸️ OpenShift Virtualization', '#FFECEC', '#EE0000'),
+}
+DEFAULT_PROVIDER_STYLE = ('☁️ {name} Cloud', '#F5F5F5', '#808080')
+
+PURPOSE_ICONS = {
+    'web': '🌐',
+    'loadbalancer': '⚖️',
+    'application': '🖥️',
+    'app': '🖥️',
+    'api': '🖥️',
+    'database': '🗄️',
+    'gpu': '🎮',
+    'openshift': '☸️',
+}
+DEFAULT_PURPOSE_ICON = '💻'
+
+# Layout order of networks inside a provider, outermost tier first
+NETWORK_TYPE_ORDER = ['vpc', 'public_subnet', 'app_subnet', 'db_subnet', 'private_subnet']
+NETWORK_TYPE_LABELS = {
+    'vpc': 'VPC',
+    'public_subnet': 'Public Subnet',
+    'app_subnet': 'App Subnet',
+    'db_subnet': 'DB Subnet',
+    'private_subnet': 'Private Subnet',
+}
+
+# Network an instance is drawn in when it is attached to several
+PRIMARY_NETWORK_TYPES = {
+    'web': 'public_subnet',
+    'loadbalancer': 'public_subnet',
+    'application': 'app_subnet',
+    'database': 'db_subnet',
+}
+
+
+def _dot_id(value: str) -> str:
+    """Convert an arbitrary name into a safe Graphviz identifier."""
+    return re.sub(r'[^A-Za-z0-9_]', '_', str(value))
+
+
+def _dot_label(value: str) -> str:
+    """Escape a label for use inside a double-quoted DOT string."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _provider_style(provider: str):
+    label, fillcolor, color = PROVIDER_STYLES.get(provider, DEFAULT_PROVIDER_STYLE)
+    return label.format(name=str(provider).upper()), fillcolor, color
+
+
+def _network_sort_key(network: Dict):
+    network_type = network.get('type', '')
+    rank = NETWORK_TYPE_ORDER.index(network_type) if network_type in NETWORK_TYPE_ORDER else len(NETWORK_TYPE_ORDER)
+    return (rank, str(network.get('id', '')), str(network.get('name', '')))
+
+
+def _network_label(network: Dict) -> str:
+    network_type = network.get('type', '')
+    label = NETWORK_TYPE_LABELS.get(network_type, network.get('name', 'Network'))
+    if 'isolated' in network.get('description', '').lower():
+        label = network.get('name', label)
+    cidr = network.get('cidr')
+    return f"{label} ({cidr})" if cidr else label
+
+
+def _instance_label(instance: Dict, mini: bool) -> str:
+    """Return the escaped node label for an instance."""
+    icon = PURPOSE_ICONS.get(instance.get('purpose', ''), DEFAULT_PURPOSE_ICON)
+    label = _dot_label(f"{icon} {instance.get('name', 'instance')}")
+    instance_type = instance.get('type')
+    if not mini and instance_type and instance_type != 'unknown':
+        label += f"\\n{_dot_label(instance_type)}"
+    return label
+
+
+def _primary_network(instance: Dict, attached: List[Dict]) -> Optional[Dict]:
+    """Pick the single network an instance is drawn inside."""
+    if not attached:
+        return None
+    preferred = PRIMARY_NETWORK_TYPES.get(instance.get('purpose', ''))
+    for network in attached:
+        if network.get('type') == preferred:
+            return network
+    return attached[0]
+
+
+def render_graphviz_diagram(diagram_data: Dict, mini: bool = False) -> str:
+    """Render DOT code for the data produced by extract_diagram_data().
+
+    Providers, networks and nodes are emitted in a fixed order so the output
+    is byte-identical for identical input. Compact (mini) diagrams place
+    instances directly in their provider cluster without network tiers.
+    """
+    instances = diagram_data.get('instances', [])
+    networks = sorted(diagram_data.get('networks', []), key=_network_sort_key)
+    storage = diagram_data.get('storage', [])
+    connections = diagram_data.get('connections', [])
+
+    providers = set(diagram_data.get('providers', []))
+    providers.update(item.get('provider', 'unknown') for item in instances + storage)
+    providers = sorted(str(provider) for provider in providers)
+
+    networks_by_id = {network.get('id'): network for network in networks}
+    attached_networks = {}
+    for connection in connections:
+        if connection.get('type') == 'network' and connection.get('to') in networks_by_id:
+            attached_networks.setdefault(connection.get('from'), []).append(networks_by_id[connection['to']])
+    for attached in attached_networks.values():
+        attached.sort(key=_network_sort_key)
+
+    # Resolve the cluster every instance is drawn in so edges can target it
+    instance_clusters = {}
+    members = {}
+    for instance in sorted(instances, key=lambda item: (str(item.get('provider')), str(item.get('id', '')))):
+        provider_cluster = f"cluster_{_dot_id(instance.get('provider', 'unknown'))}"
+        network = None if mini else _primary_network(instance, attached_networks.get(instance.get('id'), []))
+        cluster = f"{provider_cluster}_{_dot_id(network['id'])}" if network else provider_cluster
+        instance_clusters[instance.get('id')] = cluster
+        members.setdefault(cluster, []).append(instance)
+
+    lines = [
+        'digraph infrastructure {',
+        '    compound=true;',
+        '    rankdir=TB;',
+        '    bgcolor=transparent;',
+        '    splines=ortho;',
+        '    nodesep=0.3;',
+        '    ranksep=0.6;',
+        '    overlap=false;',
+        '    ',
+        '    node [shape=box, style=rounded, margin=0.2];',
+        '    edge [color=gray, penwidth=1.5];',
+        '    ',
+        '    internet [label="🌐 Internet", shape=circle, style=filled, fillcolor=lightblue];',
+    ]
+
+    def add_instances(cluster: str, indent: str):
+        for instance in members.get(cluster, []):
+            lines.append(f'{indent}"{_dot_id(instance.get("id"))}" '
+                         f'[label="{_instance_label(instance, mini)}", style=filled, fillcolor=white];')
+
+    internet_targets = []
+    for provider in providers:
+        provider_cluster = f"cluster_{_dot_id(provider)}"
+        label, fillcolor, color = _provider_style(provider)
+        lines.extend([
+            '    ',
+            f'    subgraph {provider_cluster} {{',
+            f'        label="{_dot_label(label)}";',
+            '        style=filled;',
+            f'        fillcolor="{fillcolor}";',
+            f'        color="{color}";',
+            '        penwidth=2;',
+        ])
+
+        first_node = None
+        add_instances(provider_cluster, '        ')
+        if members.get(provider_cluster):
+            first_node = members[provider_cluster][0].get('id')
+
+        if not mini:
+            for network in networks:
+                if network.get('provider') != provider:
+                    continue
+                network_cluster = f"{provider_cluster}_{_dot_id(network['id'])}"
+                if not members.get(network_cluster):
+                    continue
+                lines.extend([
+                    '        ',
+                    f'        subgraph {network_cluster} {{',
+                    f'            label="{_dot_label(_network_label(network))}";',
+                    '            style=filled;',
+                    '            fillcolor="#F0F8FF";' if network.get('type') == 'vpc' else '            fillcolor="#F5F5DC";',
+                    '            color="#4682B4";' if network.get('type') == 'vpc' else '            color="#8B4513";',
+                ])
+                add_instances(network_cluster, '            ')
+                lines.append('        }')
+                if first_node is None:
+                    first_node = members[network_cluster][0].get('id')
+
+        for item in storage:
+            if item.get('provider') != provider:
+                continue
+            storage_id = _dot_id(item.get('id', item.get('name', 'storage')))
+            lines.append(f'        "{storage_id}" [label="{_dot_label("🗄️ " + str(item.get("name", "storage")))}", shape=cylinder];')
+            if first_node is None:
+                first_node = item.get('id', item.get('name', 'storage'))
+
+        lines.append('    }')
+        if first_node is not None:
+            internet_targets.append((first_node, provider_cluster))
+
+    lines.append('    ')
+    for node_id, provider_cluster in internet_targets:
+        lines.append(f'    internet -> "{_dot_id(node_id)}" [lhead={provider_cluster}, minlen=2];')
+
+    for connection in connections:
+        if connection.get('type') != 'inter-cloud':
+            continue
+        source, target = connection.get('from'), connection.get('to')
+        if source not in instance_clusters or target not in instance_clusters:
+            continue
+        lines.append(f'    "{_dot_id(source)}" -> "{_dot_id(target)}" '
+                     f'[ltail={instance_clusters[source]}, lhead={instance_clusters[target]}, style=dotted, minlen=3];')
+
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
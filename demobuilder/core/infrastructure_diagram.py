@@ -4,11 +4,15 @@ Infrastructure diagram visualization using Graphviz for DemoBuilder.
 This module creates Graphviz infrastructure diagrams from YamlForge analysis results.
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 import streamlit as st
 import json
 import os
+import time
 from .infrastructure_description import generate_infrastructure_description
+from .ai_cache import get_ai_cache, get_shared_client, make_cache_key
+from .metrics import AI_REQUEST_SECONDS, DIAGRAM_SECONDS
+from .graphviz_renderer import render_graphviz_diagram
 
 # AI client imports
 try:
@@ -29,6 +33,9 @@ try:
 except ImportError:
     VERTEX_AI = False
 
+# Model used for diagrams when calling the Anthropic API directly
+DIRECT_DIAGRAM_MODEL = "claude-3-haiku-20240307"
+
 
 def extract_diagram_data(analysis_result: Dict, yaml_content: str = None, user_requirements: str = None) -> Dict:
     """Extract infrastructure data from YamlForge analysis for visualization"""
@@ -281,15 +288,11 @@ def _generate_connections(diagram_data: Dict) -> List[Dict]:
 
 
 def create_graphviz_diagram(diagram_data: Dict, mini: bool = False) -> str:
-    """Create a Graphviz DOT diagram using AI-driven generation
+    """Create a Graphviz DOT diagram for the infrastructure
     
-    This function includes enhanced error handling to distinguish between:
-    - Template formatting errors (f-string issues)
-    - AI service availability issues  
-    - DOT syntax validation errors
-    - Empty/invalid responses
-    
-    Returns appropriate error diagrams with specific messages for each failure type.
+    Diagrams are rendered locally and deterministically by default. When
+    AI_DIAGRAMS_ENABLED=true an AI-generated diagram is tried first, and the
+    local renderer is used whenever the AI path fails or returns invalid DOT.
     """
     
     if not diagram_data or not diagram_data.get('instances'):
@@ -308,109 +311,49 @@ digraph empty {
 }
 """
     
-    # AI-only diagram generation
+    if os.getenv("AI_DIAGRAMS_ENABLED", "false").lower() == "true":
+        start = time.perf_counter()
+        ai_diagram = _try_ai_graphviz_diagram(diagram_data, mini)
+        if ai_diagram:
+            DIAGRAM_SECONDS.observe(time.perf_counter() - start, renderer='ai')
+            return ai_diagram
+    
+    with DIAGRAM_SECONDS.time(renderer='local'):
+        return _add_generation_source_indicator(render_graphviz_diagram(diagram_data, mini), "Local Renderer")
+
+
+def _try_ai_graphviz_diagram(diagram_data: Dict, mini: bool = False) -> Optional[str]:
+    """Generate a diagram with AI, returning None on any failure
+    
+    Failures are reported by type so they can be told apart in the logs:
+    - Template formatting errors (f-string issues)
+    - AI service availability issues  
+    - DOT syntax validation errors
+    - Empty/invalid responses
+    """
     try:
         ai_diagram = _generate_ai_graphviz_diagram(diagram_data, mini)
         if ai_diagram and len(ai_diagram.strip()) > 50:
             # Strict validation for proper DOT syntax
-            if (ai_diagram.strip().startswith('digraph') and 
-                ai_diagram.count('{') == ai_diagram.count('}')):
+            if _is_valid_dot(ai_diagram):
                 # Add generation source indicator
-                ai_diagram = _add_generation_source_indicator(ai_diagram, "AI Generated")
-                return ai_diagram
-            else:
-                print("AI diagram has syntax issues")
-                return _create_syntax_error_diagram()
+                return _add_generation_source_indicator(ai_diagram, "AI Generated")
+            print("AI diagram has syntax issues")
         else:
             print("AI diagram generation returned empty or short result")
-            return _create_ai_unavailable_diagram()
     except ValueError as e:
         if "Invalid format specifier" in str(e) or "unmatched" in str(e).lower():
             print(f"Prompt template formatting error: {e}")
-            return _create_template_error_diagram()
         else:
             print(f"AI diagram generation value error: {e}")
-            return _create_ai_unavailable_diagram()
     except Exception as e:
         error_msg = str(e).lower()
         if "ai client" in error_msg or "anthropic" in error_msg or "api" in error_msg:
             print(f"AI service error: {e}")
-            return _create_ai_unavailable_diagram()
         else:
             print(f"Unknown diagram generation error: {e}")
-            return _create_template_error_diagram()
-    
-    # Fallback - should not reach here
-    return _create_ai_unavailable_diagram()
-
-
-def _create_ai_unavailable_diagram() -> str:
-    """Create an error diagram when AI is unavailable"""
-    return """
-digraph error {
-    rankdir=TB;
-    splines=ortho;
-    nodesep=0.3;
-    ranksep=0.6;
-    overlap=false;
     
-    node [shape=box, style=rounded, margin=0.2];
-    edge [color=gray, penwidth=1.5];
-    
-    error [label="❌ Diagram Generation Unavailable", style=filled, fillcolor="#ffebee"];
-    service [label="AI service is not available", style=filled, fillcolor="#fff3e0"];
-    config [label="Please check your API configuration", style=filled, fillcolor="#fff3e0"];
-    
-    error -> service;
-    error -> config;
-}
-"""
-
-
-def _create_template_error_diagram() -> str:
-    """Create an error diagram when prompt template has formatting issues"""
-    return """
-digraph template_error {
-    rankdir=TB;
-    splines=ortho;
-    nodesep=0.3;
-    ranksep=0.6;
-    overlap=false;
-    
-    node [shape=box, style=rounded, margin=0.2];
-    edge [color=gray, penwidth=1.5];
-    
-    error [label="❌ Prompt Template Error", style=filled, fillcolor="#ffebee"];
-    fstring [label="F-string formatting issue detected", style=filled, fillcolor="#fff3e0"];
-    check [label="Check diagram template for unescaped braces", style=filled, fillcolor="#fff3e0"];
-    
-    error -> fstring;
-    error -> check;
-}
-"""
-
-
-def _create_syntax_error_diagram() -> str:
-    """Create an error diagram when AI generates invalid DOT syntax"""
-    return """
-digraph syntax_error {
-    rankdir=TB;
-    splines=ortho;
-    nodesep=0.3;
-    ranksep=0.6;
-    overlap=false;
-    
-    node [shape=box, style=rounded, margin=0.2];
-    edge [color=gray, penwidth=1.5];
-    
-    error [label="❌ Diagram Syntax Error", style=filled, fillcolor="#ffebee"];
-    invalid [label="AI generated invalid DOT code", style=filled, fillcolor="#fff3e0"];
-    retry [label="Please try regenerating the diagram", style=filled, fillcolor="#fff3e0"];
-    
-    error -> invalid;
-    error -> retry;
-}
-"""
+    return None
 
 
 def _add_generation_source_indicator(dot_code: str, source: str) -> str:
@@ -463,6 +406,19 @@ def _generate_ai_graphviz_diagram(diagram_data: Dict, mini: bool = False) -> str
         } for net in networks]
     }
     
+    # Identical infrastructure for the same model reuses the previous diagram
+    cache = get_ai_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = make_cache_key(
+            'graphviz-mini' if mini else 'graphviz',
+            f"{ai_client[0]}:{ai_client[2]}",
+            dict(infrastructure_summary, providers=sorted(providers, key=str))
+        )
+        cached_code = cache.get(cache_key)
+        if cached_code:
+            return cached_code
+    
     # Create AI prompt for diagram generation
     try:
         prompt = _create_graphviz_generation_prompt(infrastructure_summary, mini)
@@ -483,16 +439,31 @@ def _generate_ai_graphviz_diagram(diagram_data: Dict, mini: bool = False) -> str
     # Add proper indentation for better rendering
     formatted_code = _format_graphviz_indentation(cleaned_code)
     
+    # Only cache diagrams that will pass validation so bad responses are retried
+    if cache_key and _is_valid_dot(formatted_code):
+        cache.set(cache_key, formatted_code)
+    
     return formatted_code
 
 
+def _is_valid_dot(dot_code: str) -> bool:
+    """Check that generated DOT code is non-trivial with balanced braces"""
+    return (bool(dot_code) and len(dot_code.strip()) > 50 and
+            dot_code.strip().startswith('digraph') and
+            dot_code.count('{') == dot_code.count('}'))
+
+
 def _get_ai_client():
-    """Initialize and return an AI client"""
+    """Return a shared AI client as (client_type, client, model_name)
+    
+    Clients are created once per configuration and reused by later diagrams.
+    """
     # Try direct Anthropic API first
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if api_key and ANTHROPIC_DIRECT:
         try:
-            return ('direct', Anthropic(api_key=api_key))
+            client = get_shared_client(('anthropic', api_key), lambda: Anthropic(api_key=api_key))
+            return ('direct', client, DIRECT_DIAGRAM_MODEL)
         except Exception:
             pass
     
@@ -524,14 +495,17 @@ def _get_ai_client():
                 else:
                     model_name = "publishers/anthropic/models/claude-3-haiku@20240307"
                 
-            llm = ChatVertexAI(
-                model=model_name,
-                temperature=0.1,
-                max_tokens=1500,
-                project=vertex_project,
-                location="us-east5"
+            llm = get_shared_client(
+                ('diagram-vertex', model_name, vertex_project),
+                lambda: ChatVertexAI(
+                    model=model_name,
+                    temperature=0.1,
+                    max_tokens=1500,
+                    project=vertex_project,
+                    location="us-east5"
+                )
             )
-            return ('vertex', llm)
+            return ('vertex', llm, model_name)
         except Exception:
             pass
     
@@ -539,8 +513,11 @@ def _get_ai_client():
     if LANGCHAIN_ANTHROPIC:
         try:
             model = os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
-            llm = ChatAnthropic(model=model, temperature=0.1, max_tokens=1500)
-            return ('langchain', llm)
+            llm = get_shared_client(
+                ('diagram-langchain', model),
+                lambda: ChatAnthropic(model=model, temperature=0.1, max_tokens=1500)
+            )
+            return ('langchain', llm, model)
         except Exception:
             pass
     
@@ -834,20 +811,22 @@ Generate the Graphviz DOT diagram:"""
 
 def _call_ai_for_graphviz(ai_client, prompt: str) -> str:
     """Call AI service to generate Graphviz DOT diagram"""
-    client_type, client = ai_client
+    client_type, client, model_name = ai_client
     
     try:
         if client_type == "direct":
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=1500,
-                temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with AI_REQUEST_SECONDS.time(operation='diagram'):
+                response = client.messages.create(
+                    model=model_name,
+                    max_tokens=1500,
+                    temperature=0.1,
+                    messages=[{"role": "user", "content": prompt}]
+                )
             return response.content[0].text.strip()
         
         elif client_type in ["vertex", "langchain"]:
-            response = client.invoke(prompt)
+            with AI_REQUEST_SECONDS.time(operation='diagram'):
+                response = client.invoke(prompt)
             return response.content.strip() if hasattr(response, 'content') else str(response).strip()
     
     except Exception as e:
@@ -0,0 +1,256 @@
+"""
+In-process metrics registry for DemoBuilder.
+
+Counters and latency histograms are kept in memory and exposed in the
+Prometheus text format on a small HTTP endpoint (METRICS_PORT, default 9090),
+so the OpenShift monitoring stack can scrape them and the autoscaler can act
+on p95 latency. Recording a sample only takes a lock and a few additions.
+"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Seconds; covers quick local renders up to slow multi-attempt AI calls
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+DEFAULT_METRICS_PORT = 9090
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in values]
+
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by labels."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    _key = Counter._key
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block; an 'outcome' label is filled in if declared."""
+        start = time.perf_counter()
+        outcome = 'success'
+        try:
+            yield
+        except Exception:
+            outcome = 'error'
+            raise
+        finally:
+            if 'outcome' in self.labelnames and 'outcome' not in labels:
+                labels['outcome'] = outcome
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, [list(s[0]), s[1], s[2]]) for key, s in self._series.items())
+        lines = []
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the metrics of this process and renders them for Prometheus."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, float]]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, float]]]) -> None:
+        """Register a callback yielding (name, kind, help, value) samples read at scrape time."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                print(f"Warning: Metrics collector failed: {e}")
+                continue
+            for name, kind, documentation, value in samples:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+AI_REQUEST_SECONDS = registry.histogram(
+    'demobuilder_ai_request_duration_seconds', 'Latency of individual AI model calls.',
+    ('operation', 'outcome'))
+ANALYSIS_SECONDS = registry.histogram(
+    'demobuilder_analysis_duration_seconds', 'Latency of YamlForge cost and provider analysis.',
+    ('outcome',))
+DIAGRAM_SECONDS = registry.histogram(
+    'demobuilder_diagram_duration_seconds', 'Latency of infrastructure diagram generation.',
+    ('renderer',))
+OPERATION_SECONDS = registry.histogram(
+    'demobuilder_operation_duration_seconds', 'Latency of operations timed with log_execution_time.',
+    ('operation', 'outcome'))
+VALIDATION_RETRIES = registry.counter(
+    'demobuilder_validation_retries_total', 'AI responses rejected by validation and requested again.',
+    ('operation',))
+
+
+def _ai_cache_samples():
+    from .ai_cache import get_ai_cache
+    cache = get_ai_cache()
+    if cache is None:
+        return []
+    stats = cache.stats()
+    return [
+        ('demobuilder_ai_cache_hits_total', 'counter', 'AI response cache hits.', stats['hits']),
+        ('demobuilder_ai_cache_misses_total', 'counter', 'AI response cache misses.', stats['misses']),
+        ('demobuilder_ai_cache_entries', 'gauge', 'AI responses held in the local cache.', stats['entries']),
+    ]
+
+
+registry.add_collector(_ai_cache_samples)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would otherwise flood the container log
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_attempted = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = None) -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics from a daemon thread once per process (disable with METRICS_ENABLED=false)."""
+    global _server, _server_attempted
+    if os.getenv('METRICS_ENABLED', 'true').lower() == 'false':
+        return None
+    with _server_lock:
+        if not _server_attempted:
+            _server_attempted = True
+            port = port if port is not None else int(os.getenv('METRICS_PORT', DEFAULT_METRICS_PORT))
+            try:
+                _server = ThreadingHTTPServer(('0.0.0.0', port), _MetricsHandler)
+            except OSError as e:
+                print(f"Warning: Could not start metrics endpoint on port {port}: {e}")
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+    return _server
@@ -4,18 +4,203 @@ OpenShift Native Logging for DemoBuilder
 This module provides structured logging that integrates seamlessly with OpenShift's
 container-native logging infrastructure. All logs are sent to stdout/stderr in JSON
 format for automatic collection by OpenShift logging stack.
+
+Records are queued and serialized/written by a background thread in batches,
+so logging never blocks the Streamlit script thread on stdout. The queue is
+bounded (LOG_QUEUE_SIZE); when it is full records are dropped and counted.
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
+import threading
 import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from functools import wraps
 import streamlit as st
+from .metrics import OPERATION_SECONDS, registry
+
+
+DEFAULT_LOG_QUEUE_SIZE = 10000
+DEFAULT_LOG_BATCH_SIZE = 256
+
+# Seconds between the warnings that report dropped records
+DROP_REPORT_INTERVAL = 10.0
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+class AsyncLogWriter:
+    """
+    Bounded queue drained by a daemon thread that writes log lines to stdout.
+    Items are (render, argument) pairs; rendering happens on the writer thread
+    and everything available is written with a single write and flush.
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_LOG_QUEUE_SIZE, batch_size: int = DEFAULT_LOG_BATCH_SIZE):
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._last_drop_report = 0.0
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, render, argument) -> bool:
+        """Queue a record without blocking; returns False if it was dropped."""
+        try:
+            self._queue.put_nowait((render, argument))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until everything queued so far has been written."""
+        done = threading.Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        lines = []
+        waiters = []
+        for render, argument in batch:
+            if render is None:
+                waiters.append(argument)
+                continue
+            try:
+                lines.append(render(argument))
+            except Exception as e:
+                lines.append(json.dumps({
+                    "timestamp": datetime.utcnow().isoformat() + "Z",
+                    "level": "ERROR",
+                    "logger": "demobuilder.logging",
+                    "message": f"Could not serialize log record: {e}"
+                }))
+
+        newly_dropped = 0
+        now = time.monotonic()
+        if now - self._last_drop_report >= DROP_REPORT_INTERVAL:
+            with self._lock:
+                newly_dropped = self.dropped - self._reported_dropped
+                self._reported_dropped = self.dropped
+        if newly_dropped:
+            self._last_drop_report = now
+            lines.append(json.dumps({
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "level": "WARNING",
+                "logger": "demobuilder.logging",
+                "message": f"Dropped {newly_dropped} log records because the log queue was full",
+                "dropped_total": self._reported_dropped
+            }))
+
+        if lines:
+            try:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            except Exception:
+                pass
+            self.written += len(lines)
+        for waiter in waiters:
+            waiter.set()
+
+
+class AsyncLogHandler(logging.Handler):
+    """Logging handler that hands records to the AsyncLogWriter for formatting and output."""
+
+    def __init__(self, writer: AsyncLogWriter):
+        super().__init__()
+        self.writer = writer
+
+    def emit(self, record):
+        # Resolve %-args now, like logging.handlers.QueueHandler, as they may change later
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        self.writer.submit(self.format, record)
+
+
+_writer = AsyncLogWriter(
+    max_queue=int(os.getenv('LOG_QUEUE_SIZE', DEFAULT_LOG_QUEUE_SIZE)),
+    batch_size=int(os.getenv('LOG_BATCH_SIZE', DEFAULT_LOG_BATCH_SIZE))
+)
+atexit.register(_writer.flush)
+
+
+def _log_writer_samples():
+    return [
+        ('demobuilder_log_records_written_total', 'counter', 'Log lines written to stdout.', _writer.written),
+        ('demobuilder_log_records_dropped_total', 'counter', 'Log records dropped because the log queue was full.', _writer.dropped),
+        ('demobuilder_log_queue_depth', 'gauge', 'Log records waiting to be written.', _writer.queue_depth()),
+    ]
+
+
+registry.add_collector(_log_writer_samples)
+
+
+_loggers: Dict[str, "OpenShiftLogger"] = {}
+_loggers_lock = threading.Lock()
+_root_lock = threading.Lock()
+_root_configured = False
+
+
+def _configure_root_logger() -> logging.Logger:
+    """Attach the one shared handler to the 'demobuilder' logger (once per process)."""
+    global _root_configured
+    root = logging.getLogger("demobuilder")
+    with _root_lock:
+        if not _root_configured:
+            root.setLevel(logging.INFO)
+            handler = AsyncLogHandler(_writer)
+            handler.setLevel(logging.INFO)
+            handler.setFormatter(OpenShiftJSONFormatter())
+            root.addHandler(handler)
+            root.propagate = False
+            _root_configured = True
+    return root
+
+
+def get_logger(component: str = "demobuilder") -> "OpenShiftLogger":
+    """Return the shared OpenShiftLogger for a component."""
+    logger = _loggers.get(component)
+    if logger is None:
+        with _loggers_lock:
+            logger = _loggers.get(component)
+            if logger is None:
+                logger = _loggers[component] = OpenShiftLogger(component)
+    return logger
 
 
 class OpenShiftLogger:
@@ -26,7 +211,6 @@ class OpenShiftLogger:
     
     def __init__(self, component: str = "demobuilder"):
         self.component = component
-        self.session_id = self._get_or_create_session_id()
         self.logger = self._setup_logger()
         
         # OpenShift environment context
@@ -37,6 +221,17 @@ class OpenShiftLogger:
             "cluster_name": os.getenv('CLUSTER_NAME', 'unknown'),
             "deployment": os.getenv('DEPLOYMENT_NAME', component)
         }
+        # Context that never changes is serialized once, not per event
+        self._component_json = json.dumps(component)
+        self._static_json = (
+            f'"openshift": {json.dumps(self.openshift_context)}, "app": "demobuilder", '
+            f'"version": {json.dumps(os.getenv("APP_VERSION", "unknown"))}'
+        )
+    
+    @property
+    def session_id(self) -> str:
+        """Session ID of the Streamlit session currently running"""
+        return self._get_or_create_session_id()
         
     def _get_or_create_session_id(self) -> str:
         """Get or create session ID for Streamlit session tracking"""
@@ -45,55 +240,32 @@ class OpenShiftLogger:
         return st.session_state.logging_session_id
     
     def _setup_logger(self) -> logging.Logger:
-        """Setup JSON logger that outputs to stdout for OpenShift collection"""
-        logger = logging.getLogger(f"demobuilder.{self.component}")
-        logger.setLevel(logging.INFO)
-        
-        # Remove existing handlers to avoid duplicates
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        
-        # Create stdout handler for OpenShift logging
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        
-        # JSON formatter for structured logging
-        formatter = OpenShiftJSONFormatter()
-        handler.setFormatter(formatter)
-        
-        logger.addHandler(handler)
-        logger.propagate = False
-        
-        return logger
+        """Return a child of the 'demobuilder' logger, which owns the shared async handler"""
+        _configure_root_logger()
+        return logging.getLogger(f"demobuilder.{self.component}")
     
-    def _get_base_log_data(self) -> Dict[str, Any]:
-        """Get base log data with OpenShift context"""
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "component": self.component,
-            "session_id": self.session_id,
-            "openshift": self.openshift_context.copy(),
-            "app": "demobuilder",
-            "version": os.getenv('APP_VERSION', 'unknown')
-        }
+    def _render_event(self, event) -> str:
+        """Serialize a queued event; runs on the log writer thread"""
+        created, session_id, event_type, event_data = event
+        timestamp = datetime.utcfromtimestamp(created).isoformat() + "Z"
+        return (
+            f'{{"timestamp": "{timestamp}", "component": {self._component_json}, '
+            f'"session_id": {json.dumps(session_id)}, {self._static_json}, '
+            f'"event_type": {json.dumps(event_type)}, '
+            f'"event_data": {json.dumps(event_data, default=str)}}}'
+        )
     
     def log_event(self, event_type: str, level: str = "INFO", **kwargs):
         """Log a structured event with OpenShift context"""
-        log_data = self._get_base_log_data()
-        log_data.update({
-            "event_type": event_type,
-            "event_data": kwargs
-        })
-        
-        # Log at appropriate level
-        if level.upper() == "ERROR":
-            self.logger.error(json.dumps(log_data))
-        elif level.upper() == "WARNING":
-            self.logger.warning(json.dumps(log_data))
-        elif level.upper() == "DEBUG":
-            self.logger.debug(json.dumps(log_data))
-        else:
-            self.logger.info(json.dumps(log_data))
+        if not self.logger.isEnabledFor(_LEVELS.get(level.upper(), logging.INFO)):
+            return
+        # Session state is only reachable from the script thread, so capture it here, and copy
+        # containers (often live session state lists) before the writer thread serializes them
+        event_data = {
+            key: value.copy() if isinstance(value, (list, dict, set)) else value
+            for key, value in kwargs.items()
+        }
+        _writer.submit(self._render_event, (time.time(), self.session_id, event_type, event_data))
     
     def log_user_action(self, action: str, user_id: str = None, **kwargs):
         """Log user interaction events"""
@@ -192,7 +364,7 @@ class DemoBuilderMetrics:
     """
     
     def __init__(self):
-        self.logger = OpenShiftLogger("metrics")
+        self.logger = get_logger("metrics")
         self.start_time = time.time()
     
     def track_session_start(self, user_agent: str = None):
@@ -257,12 +429,13 @@ def log_execution_time(operation_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger = OpenShiftLogger("performance")
+            logger = get_logger("performance")
             start_time = time.time()
             
             try:
                 result = func(*args, **kwargs)
                 duration_ms = (time.time() - start_time) * 1000
+                OPERATION_SECONDS.observe(duration_ms / 1000, operation=operation_name, outcome='success')
                 
                 logger.log_performance_metric(
                     operation=operation_name,
@@ -273,6 +446,7 @@ def log_execution_time(operation_name: str):
                 return result
             except Exception as e:
                 duration_ms = (time.time() - start_time) * 1000
+                OPERATION_SECONDS.observe(duration_ms / 1000, operation=operation_name, outcome='error')
                 
                 logger.log_performance_metric(
                     operation=operation_name,
@@ -288,5 +462,5 @@ def log_execution_time(operation_name: str):
 
 
 # Global logger instances
-app_logger = OpenShiftLogger("app")
+app_logger = get_logger("app")
 metrics = DemoBuilderMetrics()
\ No newline at end of file
@@ -12,18 +12,275 @@ import json
 import yaml
 import tempfile
 import base64
+import atexit
+import shutil
+import threading
+import time
 from typing import Dict, Any, Optional, List
 import streamlit as st
 from config.auth_config import get_auth_config
 
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
     from kubernetes.client.rest import ApiException
     K8S_AVAILABLE = True
 except ImportError:
     K8S_AVAILABLE = False
 
 
+# ResourceClaims are custom resources in the poolboy.gpte.redhat.com group
+CLAIM_GROUP = 'poolboy.gpte.redhat.com'
+CLAIM_VERSION = 'v1'
+CLAIM_PLURAL = 'resourceclaims'
+
+# How often the kubeconfig secret's resourceVersion is re-checked
+SECRET_CHECK_INTERVAL = int(os.getenv('RHDP_SECRET_CHECK_INTERVAL', '60'))
+
+# A namespace's watch stops once nobody has read its claims for this long
+WATCH_IDLE_SECONDS = int(os.getenv('RHDP_WATCH_IDLE_SECONDS', '900'))
+WATCH_TIMEOUT_SECONDS = 60
+INITIAL_SYNC_TIMEOUT = 10
+
+
+class RHDPClientPool:
+    """Process-wide RHDP API client, rebuilt only when the kubeconfig secret changes."""
+
+    def __init__(self, secret_name: str, secret_key: str, namespace: str):
+        self.secret_name = secret_name
+        self.secret_key = secret_key
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._core_api = None
+        self._api_client = None
+        self._custom_api = None
+        self._cert_dir = None
+        self._resource_version = None
+        self._checked_at = 0.0
+
+    def get(self) -> Optional['client.CustomObjectsApi']:
+        """Return the shared CustomObjectsApi, or None if the RHDP cluster is not configured."""
+        with self._lock:
+            now = time.monotonic()
+            if self._custom_api is not None and now - self._checked_at < SECRET_CHECK_INTERVAL:
+                return self._custom_api
+            self._checked_at = now
+
+            secret = self._read_secret()
+            if secret is None:
+                # Keep serving the last good client through transient read errors
+                return self._custom_api
+            resource_version = secret.metadata.resource_version
+            if self._custom_api is not None and resource_version == self._resource_version:
+                return self._custom_api
+
+            if not secret.data or self.secret_key not in secret.data:
+                return self._custom_api
+            try:
+                kubeconfig = base64.b64decode(secret.data[self.secret_key]).decode('utf-8')
+                api_client, cert_dir = self._build_api_client(yaml.safe_load(kubeconfig))
+            except Exception as e:
+                print(f"Warning: Could not build RHDP client from secret {self.secret_name}: {e}")
+                return self._custom_api
+
+            self._close_client()
+            self._api_client = api_client
+            self._cert_dir = cert_dir
+            self._custom_api = client.CustomObjectsApi(api_client)
+            self._resource_version = resource_version
+            return self._custom_api
+
+    def _read_secret(self):
+        try:
+            if self._core_api is None:
+                # Load in-cluster config (when running in OpenShift)
+                config.load_incluster_config()
+                self._core_api = client.CoreV1Api()
+            return self._core_api.read_namespaced_secret(name=self.secret_name, namespace=self.namespace)
+        except Exception:
+            return None
+
+    def _build_api_client(self, kubeconfig_dict: Dict[str, Any]):
+        """Create an ApiClient for the RHDP cluster; returns (api_client, certificate directory)."""
+        rhdp_config = client.Configuration()
+
+        # Extract cluster info
+        cluster = kubeconfig_dict['clusters'][0]['cluster']
+        rhdp_config.host = cluster['server']
+
+        # Certificates are passed to urllib3 as file paths and read on every new
+        # connection, so they live in one private directory for the life of the client
+        cert_dir = tempfile.mkdtemp(prefix='rhdp-kubeconfig-')
+
+        def write_cert(file_name: str, data: str) -> str:
+            path = os.path.join(cert_dir, file_name)
+            with open(path, 'wb') as f:
+                f.write(base64.b64decode(data))
+            return path
+
+        try:
+            # Handle certificate authority
+            if 'certificate-authority-data' in cluster:
+                rhdp_config.ssl_ca_cert = write_cert('ca.crt', cluster['certificate-authority-data'])
+            elif cluster.get('insecure-skip-tls-verify'):
+                rhdp_config.verify_ssl = False
+
+            # Extract user credentials
+            user = kubeconfig_dict['users'][0]['user']
+            if 'client-certificate-data' in user and 'client-key-data' in user:
+                # Client certificate auth
+                rhdp_config.cert_file = write_cert('client.crt', user['client-certificate-data'])
+                rhdp_config.key_file = write_cert('client.key', user['client-key-data'])
+            elif 'token' in user:
+                # Token auth
+                rhdp_config.api_key = {'authorization': f"Bearer {user['token']}"}
+
+            return client.ApiClient(rhdp_config), cert_dir
+        except Exception:
+            shutil.rmtree(cert_dir, ignore_errors=True)
+            raise
+
+    def _close_client(self) -> None:
+        if self._api_client is not None:
+            try:
+                self._api_client.close()
+            except Exception:
+                pass
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+        self._api_client = None
+        self._custom_api = None
+        self._cert_dir = None
+        self._resource_version = None
+
+    def close(self) -> None:
+        """Close the client and remove its certificate files."""
+        with self._lock:
+            self._close_client()
+
+
+class ResourceClaimCache:
+    """ResourceClaims of one namespace, kept current by a background list-and-watch loop."""
+
+    def __init__(self, pool: RHDPClientPool, namespace: str):
+        self.pool = pool
+        self.namespace = namespace
+        self._claims: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Set while the cached claims are current (cleared when the watch fails)
+        self._synced = threading.Event()
+        # Set once the first list has either succeeded or failed
+        self._settled = threading.Event()
+        self._waited = False
+        self._last_read = time.monotonic()
+        self.stopped = False
+        self._thread = threading.Thread(target=self._run, name=f"rhdp-claims-{namespace}", daemon=True)
+        self._thread.start()
+
+    def list_claims(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached claims, or None while they are not current.
+
+        Only the first read waits (up to INITIAL_SYNC_TIMEOUT) for the initial
+        list; later reads return None straight away while the watch is failing.
+        """
+        self._last_read = time.monotonic()
+        if not self._waited:
+            self._settled.wait(INITIAL_SYNC_TIMEOUT)
+            self._waited = True
+        if not self._synced.is_set():
+            return None
+        with self._lock:
+            return list(self._claims.values())
+
+    def _run(self) -> None:
+        resource_version = None
+        backoff = 1
+        while time.monotonic() - self._last_read < WATCH_IDLE_SECONDS:
+            custom_api = self.pool.get()
+            if custom_api is None:
+                # Nothing to watch; the next read starts a new cache once the pool has a client
+                break
+            try:
+                if resource_version is None:
+                    resource_version = self._relist(custom_api)
+                resource_version = self._watch(custom_api, resource_version)
+                backoff = 1
+                continue
+            except ApiException as e:
+                resource_version = None
+                if e.status == 410:
+                    # Our resourceVersion is too old: list again straight away
+                    continue
+                print(f"Warning: RHDP ResourceClaim watch in {self.namespace} failed: {e.status} {e.reason}")
+            except Exception as e:
+                resource_version = None
+                print(f"Warning: RHDP ResourceClaim watch in {self.namespace} failed: {e}")
+            # Readers query the API directly until the claims are listed again
+            self._synced.clear()
+            self._settled.set()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+        self._synced.clear()
+        self.stopped = True
+        self._settled.set()
+
+    def _relist(self, custom_api) -> str:
+        response = custom_api.list_namespaced_custom_object(
+            group=CLAIM_GROUP, version=CLAIM_VERSION, namespace=self.namespace,
+            plural=CLAIM_PLURAL, timeout_seconds=30
+        )
+        claims = {item.get('metadata', {}).get('name', ''): item for item in response.get('items', [])}
+        with self._lock:
+            self._claims = claims
+        self._synced.set()
+        self._settled.set()
+        return response.get('metadata', {}).get('resourceVersion', '')
+
+    def _watch(self, custom_api, resource_version: str) -> str:
+        """Apply watch events until the server closes the stream; returns the last resourceVersion."""
+        stream = watch.Watch().stream(
+            custom_api.list_namespaced_custom_object,
+            group=CLAIM_GROUP, version=CLAIM_VERSION, namespace=self.namespace, plural=CLAIM_PLURAL,
+            resource_version=resource_version, timeout_seconds=WATCH_TIMEOUT_SECONDS
+        )
+        for event in stream:
+            claim = event['object']
+            if event['type'] == 'ERROR':
+                raise ApiException(status=claim.get('code', 500), reason=claim.get('message', 'watch error'))
+            metadata = claim.get('metadata', {})
+            resource_version = metadata.get('resourceVersion', resource_version)
+            with self._lock:
+                if event['type'] == 'DELETED':
+                    self._claims.pop(metadata.get('name', ''), None)
+                else:
+                    self._claims[metadata.get('name', '')] = claim
+        return resource_version
+
+
+_client_pool: Optional[RHDPClientPool] = None
+_claim_caches: Dict[str, ResourceClaimCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_rhdp_client_pool(secret_name: str, secret_key: str, namespace: str) -> RHDPClientPool:
+    """Return the process-wide RHDP client pool."""
+    global _client_pool
+    with _shared_lock:
+        if _client_pool is None:
+            _client_pool = RHDPClientPool(secret_name, secret_key, namespace)
+            atexit.register(_client_pool.close)
+        return _client_pool
+
+
+def get_claim_cache(pool: RHDPClientPool, namespace: str) -> ResourceClaimCache:
+    """Return the watch-backed claim cache for a namespace, starting it if needed."""
+    with _shared_lock:
+        cache = _claim_caches.get(namespace)
+        if cache is None or cache.stopped:
+            cache = ResourceClaimCache(pool, namespace)
+            _claim_caches[namespace] = cache
+        return cache
+
+
 class RHDPIntegration:
     """Handles RHDP ResourceClaim integration for credential extraction."""
     
@@ -31,6 +288,8 @@ class RHDPIntegration:
         self.enabled = self._is_rhdp_enabled()
         self.kubeconfig_secret_name = "rhdp-kubeconfig"
         self.kubeconfig_secret_key = "kubeconfig"
+        # Serve ResourceClaims from a per-namespace watch instead of listing them on every rerun
+        self.watch_enabled = os.getenv('RHDP_CLAIM_WATCH_ENABLED', 'true').lower() in ['true', '1', 'yes']
         
         # ResourceClaim patterns for different cloud providers
         self.claim_patterns = {
@@ -57,45 +316,6 @@ class RHDPIntegration:
         except:
             return 'demobuilder'
 
-    def _get_kubeconfig_from_secret(self) -> Optional[str]:
-        """
-        Get kubeconfig content from Kubernetes secret using k8s client.
-        
-        Returns:
-            The kubeconfig content as string, or None if not available
-        """
-        if not self.enabled or not K8S_AVAILABLE:
-            return None
-            
-        try:
-            # Load in-cluster config (when running in OpenShift)
-            config.load_incluster_config()
-            
-            # Create API client
-            v1 = client.CoreV1Api()
-            
-            # Get the current namespace from service account
-            namespace = self._get_current_namespace()
-            
-            # Get the secret
-            secret = v1.read_namespaced_secret(
-                name=self.kubeconfig_secret_name,
-                namespace=namespace
-            )
-            
-            # Extract kubeconfig data
-            if self.kubeconfig_secret_key in secret.data:
-                kubeconfig_b64 = secret.data[self.kubeconfig_secret_key]
-                kubeconfig_content = base64.b64decode(kubeconfig_b64).decode('utf-8')
-                return kubeconfig_content
-            
-            return None
-            
-        except ApiException as e:
-            return None
-        except Exception as e:
-            return None
-    
     def transform_email_to_username(self, email: str) -> str:
         """
         Transform email to RHDP username format.
@@ -122,66 +342,42 @@ class RHDPIntegration:
             
         return self.transform_email_to_username(user.email)
     
-    def _get_rhdp_client(self) -> Optional[client.CustomObjectsApi]:
+    def _get_rhdp_client(self) -> Optional['client.CustomObjectsApi']:
         """
-        Create a Kubernetes client for the RHDP cluster using kubeconfig from secret.
+        Get the shared Kubernetes client for the RHDP cluster using kubeconfig from secret.
         
         Returns:
             CustomObjectsApi client for ResourceClaims, or None if not available
         """
         if not self.enabled or not K8S_AVAILABLE:
             return None
-            
-        try:
-            # Get kubeconfig from secret
-            kubeconfig_content = self._get_kubeconfig_from_secret()
-            if not kubeconfig_content:
-                return None
-            
-            # Parse kubeconfig
-            kubeconfig_dict = yaml.safe_load(kubeconfig_content)
-            
-            # Create configuration from kubeconfig
-            rhdp_config = client.Configuration()
-            
-            # Extract cluster info
-            cluster = kubeconfig_dict['clusters'][0]['cluster']
-            rhdp_config.host = cluster['server']
-            
-            # Handle certificate authority
-            if 'certificate-authority-data' in cluster:
-                cert_data = base64.b64decode(cluster['certificate-authority-data'])
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.crt') as f:
-                    f.write(cert_data)
-                    rhdp_config.ssl_ca_cert = f.name
-            elif cluster.get('insecure-skip-tls-verify'):
-                rhdp_config.verify_ssl = False
-            
-            # Extract user credentials
-            user = kubeconfig_dict['users'][0]['user']
-            if 'client-certificate-data' in user and 'client-key-data' in user:
-                # Client certificate auth
-                cert_data = base64.b64decode(user['client-certificate-data'])
-                key_data = base64.b64decode(user['client-key-data'])
-                
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.crt') as f:
-                    f.write(cert_data)
-                    rhdp_config.cert_file = f.name
-                    
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.key') as f:
-                    f.write(key_data)
-                    rhdp_config.key_file = f.name
-                    
-            elif 'token' in user:
-                # Token auth
-                rhdp_config.api_key = {'authorization': f"Bearer {user['token']}"}
-            
-            # Create API client
-            rhdp_api_client = client.ApiClient(rhdp_config)
-            return client.CustomObjectsApi(rhdp_api_client)
-            
-        except Exception as e:
-            return None
+        
+        return self._get_rhdp_client_pool().get()
+
+    def _get_rhdp_client_pool(self):
+        """Get the process-wide client pool for this RHDP kubeconfig secret."""
+        return get_rhdp_client_pool(self.kubeconfig_secret_name, self.kubeconfig_secret_key,
+                                    self._get_current_namespace())
+
+    def _list_resource_claims(self, namespace: str) -> List[Dict[str, Any]]:
+        """List the ResourceClaims in a namespace, from the watch cache when it is running."""
+        if self.watch_enabled:
+            claims = get_claim_cache(self._get_rhdp_client_pool(), namespace).list_claims()
+            if claims is not None:
+                return claims
+        
+        # Watch disabled or not synced yet: query the API server directly
+        rhdp_client = self._get_rhdp_client()
+        if not rhdp_client:
+            return []
+        claims_response = rhdp_client.list_namespaced_custom_object(
+            group=CLAIM_GROUP,
+            version=CLAIM_VERSION,
+            namespace=namespace,
+            plural=CLAIM_PLURAL,
+            timeout_seconds=30
+        )
+        return claims_response.get('items', [])
 
     def query_resource_claims(self, namespace: str, provider_patterns: List[str]) -> List[Dict[str, Any]]:
         """
@@ -200,23 +396,8 @@ class RHDPIntegration:
         resource_claims = []
         
         try:
-            # Get RHDP cluster client
-            rhdp_client = self._get_rhdp_client()
-            if not rhdp_client:
-                return []
-            
-            # Query ResourceClaims using Custom Resource API
-            # ResourceClaims are custom resources in the poolboy.gpte.redhat.com group
-            claims_response = rhdp_client.list_namespaced_custom_object(
-                group='poolboy.gpte.redhat.com',
-                version='v1',
-                namespace=namespace,
-                plural='resourceclaims',
-                timeout_seconds=30
-            )
-            
             # Filter claims by patterns
-            for claim in claims_response.get('items', []):
+            for claim in self._list_resource_claims(namespace):
                 claim_name = claim.get('metadata', {}).get('name', '')
                 
                 # Check if claim name starts with any of the provider patterns
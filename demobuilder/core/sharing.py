@@ -7,12 +7,152 @@ Captures conversation history, provider settings, and workflow state.
 
 import json
 import base64
+import copy
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
 import urllib.parse
+import zlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 import streamlit as st
 from demobuilder.version import __version__
 
 
+# Share tokens are "<format>.<payload>":
+#   z1.<base64url deflate of the compact JSON, using SHARE_ZDICT_V1 as preset dictionary>
+#   r1.<content hash of a z1 payload kept in the share store>
+# Tokens without a prefix are the original base64 JSON and still decode.
+INLINE_FORMAT = 'z1'
+STORED_FORMAT = 'r1'
+
+# Preset deflate dictionary of strings every shared state repeats. Never edit
+# it in place: a new dictionary needs a new format prefix so old links decode.
+SHARE_ZDICT_V1 = (
+    '{"version":"","conversation_history":[{"role":"user","content":"'
+    '"},{"role":"assistant","content":"","current_yaml":"","workflow_stage":"requirements'
+    'generationanalysisrefinementcomplete","enabled_providers":["aws","azure","gcp",'
+    '"ibm_vpc","ibm_classic","oci","alibaba","vmware","cnv","cheapest"],'
+    '"original_requirements":"","analysis_result":{"guid":"","workspace_name":"",'
+    '"validation_status":"","providers_detected":[],"resource_summary":{},'
+    '"estimated_costs":{}},"show_diagrams_in_chat":true,"timestamp":'
+    'yamlforge:\n  cloud_workspace:\n    name: \n    description: \n  instances:\n'
+    '  - name: \n    provider: \n    flavor: \n    cores: \n    memory: \n    image: RHEL9-latest\n'
+    '    location: \n    region: \n    count: \n  security_groups:\n  - name: \n    rules:\n'
+    '  - direction: ingress\n    protocol: tcp\n    port_range: \n    source: 0.0.0.0/0\n'
+    '  openshift_clusters:\n  - name: \n    type: rosa-classic\n    size: \n  tags:\n'
+    '```yaml\n```\nguid: '
+).encode('utf-8')
+
+# Inline tokens longer than this are moved to the share store
+SHARE_INLINE_MAX_CHARS = int(os.getenv('SHARE_INLINE_MAX_CHARS', '1800'))
+
+# Directory holding stored share payloads; use a shared volume with several replicas
+SHARE_STORE_DIR = os.getenv('SHARE_STORE_DIR') or os.path.join(tempfile.gettempdir(), 'demobuilder-shares')
+
+# Stored payloads unused for this long are deleted when new ones are stored
+SHARE_STORE_MAX_AGE_DAYS = float(os.getenv('SHARE_STORE_MAX_AGE_DAYS', '30'))
+
+# Upper bound for a decompressed share payload; larger ones are rejected
+SHARE_MAX_DECODED_BYTES = int(os.getenv('SHARE_MAX_DECODED_BYTES', str(4 * 1024 * 1024)))
+
+_STORE_KEY_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+_DECODE_CACHE_SIZE = 64
+_decoded: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode((text + '=' * (-len(text) % 4)).encode('ascii'))
+
+
+def _compress(json_bytes: bytes) -> bytes:
+    compressor = zlib.compressobj(level=9, wbits=-15, zdict=SHARE_ZDICT_V1)
+    return compressor.compress(json_bytes) + compressor.flush()
+
+
+def _decompress(data: bytes) -> bytes:
+    decompressor = zlib.decompressobj(wbits=-15, zdict=SHARE_ZDICT_V1)
+    # Bound the output so a small link cannot inflate into a huge payload
+    json_bytes = decompressor.decompress(data, SHARE_MAX_DECODED_BYTES)
+    if decompressor.unconsumed_tail:
+        raise ValueError("shared configuration is too large")
+    return json_bytes + decompressor.flush()
+
+
+def _store_path(key: str) -> str:
+    return os.path.join(SHARE_STORE_DIR, f"{key}.bin")
+
+
+def _prune_share_store() -> None:
+    """Delete stored payloads (and stray temporary files) older than SHARE_STORE_MAX_AGE_DAYS."""
+    cutoff = time.time() - SHARE_STORE_MAX_AGE_DAYS * 86400
+    try:
+        entries = list(os.scandir(SHARE_STORE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.endswith(('.bin', '.tmp')):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def store_share_payload(payload: bytes) -> str:
+    """Save a compressed payload in the share store and return its content key.
+
+    Storing a payload refreshes its age; entries not stored again within
+    SHARE_STORE_MAX_AGE_DAYS are deleted by later calls.
+    """
+    key = hashlib.sha256(payload).hexdigest()[:32]
+    path = _store_path(key)
+    if os.path.exists(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return key
+    os.makedirs(SHARE_STORE_DIR, exist_ok=True)
+    _prune_share_store()
+    # Write to a temporary file first so readers never see a partial payload
+    fd, temp_path = tempfile.mkstemp(dir=SHARE_STORE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return key
+
+
+def load_share_payload(key: str) -> bytes:
+    """Read a compressed payload from the share store."""
+    if not _STORE_KEY_PATTERN.match(key):
+        raise ValueError("invalid share reference")
+    try:
+        with open(_store_path(key), 'rb') as f:
+            payload = f.read()
+    except FileNotFoundError:
+        raise ValueError("shared configuration not found (it may have expired)")
+    if hashlib.sha256(payload).hexdigest()[:32] != key:
+        raise ValueError("stored shared configuration is corrupted")
+    return payload
+
+
 def capture_shareable_state() -> Dict[str, Any]:
     """
     Capture the current application state that should be shared.
@@ -50,55 +190,72 @@ def capture_shareable_state() -> Dict[str, Any]:
 
 def encode_state_to_url_param(state: Dict[str, Any]) -> str:
     """
-    Encode state dictionary to URL-safe base64 string.
+    Encode state dictionary to a compact, URL-safe share token.
     
     Args:
         state: State dictionary to encode
         
     Returns:
-        URL-safe base64 encoded string
+        Versioned share token (compressed inline, or a share store reference when large)
     """
     try:
-        # Convert to JSON string
-        json_str = json.dumps(state, separators=(',', ':'))  # Compact JSON
-        
-        # Encode to bytes then base64
-        json_bytes = json_str.encode('utf-8')
-        b64_bytes = base64.urlsafe_b64encode(json_bytes)
-        
-        # Convert to string and remove padding
-        b64_str = b64_bytes.decode('ascii').rstrip('=')
-        
-        return b64_str
+        # Compact JSON, compressed against the preset dictionary
+        json_bytes = json.dumps(state, separators=(',', ':')).encode('utf-8')
+        payload = _compress(json_bytes)
+        
+        token = f"{INLINE_FORMAT}.{_b64encode(payload)}"
+        if len(token) <= SHARE_INLINE_MAX_CHARS:
+            return token
+        
+        # Too long for a comfortable URL: keep the payload server-side
+        try:
+            return f"{STORED_FORMAT}.{store_share_payload(payload)}"
+        except OSError as e:
+            print(f"Warning: Could not save share payload in {SHARE_STORE_DIR}, using a long link: {e}")
+            return token
     except Exception as e:
         st.error(f"Failed to encode state: {str(e)}")
         return ""
 
 
+def _decode_token(param: str) -> Dict[str, Any]:
+    fmt, _, body = param.partition('.')
+    if fmt == INLINE_FORMAT and body:
+        json_bytes = _decompress(_b64decode(body))
+    elif fmt == STORED_FORMAT and body:
+        json_bytes = _decompress(load_share_payload(body))
+    else:
+        # Original format: uncompressed base64 JSON without a prefix
+        json_bytes = _b64decode(param)
+    return json.loads(json_bytes.decode('utf-8'))
+
+
 def decode_url_param_to_state(param: str) -> Optional[Dict[str, Any]]:
     """
     Decode URL parameter back to state dictionary.
     
+    Decoded tokens are memoized, so reruns with the same link do not decode it again.
+    
     Args:
-        param: URL-safe base64 encoded string
+        param: Share token from encode_state_to_url_param (or an original base64 link)
         
     Returns:
         Decoded state dictionary or None if decoding fails
     """
     try:
-        # Add padding back if needed
-        missing_padding = len(param) % 4
-        if missing_padding:
-            param += '=' * (4 - missing_padding)
-        
-        # Decode from base64 to bytes
-        json_bytes = base64.urlsafe_b64decode(param.encode('ascii'))
-        
-        # Decode from bytes to JSON string to dict
-        json_str = json_bytes.decode('utf-8')
-        state = json.loads(json_str)
-        
-        return state
+        with _decoded_lock:
+            state = _decoded.get(param)
+            if state is not None:
+                _decoded.move_to_end(param)
+        if state is None:
+            state = _decode_token(param)
+            with _decoded_lock:
+                _decoded[param] = state
+                while len(_decoded) > _DECODE_CACHE_SIZE:
+                    _decoded.popitem(last=False)
+        
+        # Sessions restore (and later mutate) their own copy
+        return copy.deepcopy(state)
     except Exception as e:
         st.error(f"Failed to decode shared state: {str(e)}")
         return None
@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from .validation import validate_and_fix_yaml
+from .ai_cache import get_ai_cache, get_shared_client, make_cache_key
+from .metrics import AI_REQUEST_SECONDS, VALIDATION_RETRIES
 
 # Import YamlForge utilities
 import sys
@@ -78,6 +80,7 @@ class YamlForgeGenerator:
     def __init__(self):
         self.use_ai = AI_AVAILABLE
         self.client_type = None
+        self.model_id = None
         self.ai_model = os.getenv("AI_MODEL", "claude").lower()
         self.ai_model_version = os.getenv("AI_MODEL_VERSION")
         # AI client initialization (debug output removed for cleaner logs)
@@ -87,8 +90,9 @@ class YamlForgeGenerator:
             api_key = os.getenv("ANTHROPIC_API_KEY")
             if api_key and ANTHROPIC_DIRECT:
                 try:
-                    self.anthropic = Anthropic(api_key=api_key)
+                    self.anthropic = get_shared_client(('anthropic', api_key), lambda: Anthropic(api_key=api_key))
                     self.client_type = "direct"
+                    self.model_id = f"direct:{self._get_claude_model_name()}"
                     # Direct Anthropic client ready
                 except Exception as e:
                     print(f"DEBUG: Direct Anthropic client initialization failed: {e}")
@@ -165,23 +169,29 @@ class YamlForgeGenerator:
                         if self.ai_model == "claude" and not config.get("no_publisher", False):
                             model_name = f"publishers/anthropic/models/{model_name}"
                         
-                        test_llm = ChatVertexAI(
-                            model=model_name,
-                            temperature=0.1,
-                            max_tokens=100,
-                            project=vertex_project,
-                            location=config["location"],
-                            max_retries=1
-                        )
+                        def create_tested_llm(model_name=model_name, location=config["location"]):
+                            test_llm = ChatVertexAI(
+                                model=model_name,
+                                temperature=0.1,
+                                max_tokens=100,
+                                project=vertex_project,
+                                location=location,
+                                max_retries=1
+                            )
+                            
+                            # Test the model with a simple query to verify it works
+                            print(f"DEBUG: Testing Vertex AI config - model: {model_name}, location: {location}")
+                            test_llm.invoke("Hello")
+                            print(f"DEBUG: Test successful for {model_name}")
+                            return test_llm
                         
-                        # Test the model with a simple query to verify it works
-                        print(f"DEBUG: Testing Vertex AI config - model: {model_name}, location: {config['location']}")
-                        test_response = test_llm.invoke("Hello")
-                        print(f"DEBUG: Test successful for {model_name}")
-                        
-                        # If we get here, the model works
-                        self.llm = test_llm
+                        # A configuration that passed its test is reused by later sessions untested
+                        self.llm = get_shared_client(
+                            ('generator-vertex', model_name, config["location"], vertex_project),
+                            create_tested_llm
+                        )
                         self.client_type = "vertex"
+                        self.model_id = f"vertex:{model_name}@{config['location']}"
                         print(f"DEBUG: Vertex AI client initialized and tested successfully with model: {model_name}, location: {config['location']}, project: {vertex_project}")
                         break  # Success, exit the loop
                     except Exception as e:
@@ -196,8 +206,12 @@ class YamlForgeGenerator:
                 try:
                     # Use AI_MODEL_VERSION if set, otherwise fall back to ANTHROPIC_MODEL, then default
                     model = self.ai_model_version or os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
-                    self.llm = ChatAnthropic(model=model, temperature=0.1, max_tokens=2000)
+                    self.llm = get_shared_client(
+                        ('generator-langchain', model),
+                        lambda: ChatAnthropic(model=model, temperature=0.1, max_tokens=2000)
+                    )
                     self.client_type = "langchain"
+                    self.model_id = f"langchain:{model}"
                     print(f"DEBUG: LangChain Anthropic client initialized successfully with model: {model}")
                 except Exception as e:
                     print(f"DEBUG: LangChain Anthropic client initialization failed: {e}")
@@ -577,14 +591,16 @@ class YamlForgeGenerator:
             
             # Get AI response
             if self.client_type == "direct":
-                response = self.anthropic.messages.create(
-                    model=self._get_claude_model_name(),
-                    max_tokens=200,
-                    messages=[{"role": "user", "content": prompt}]
-                )
+                with AI_REQUEST_SECONDS.time(operation='extraction'):
+                    response = self.anthropic.messages.create(
+                        model=self._get_claude_model_name(),
+                        max_tokens=200,
+                        messages=[{"role": "user", "content": prompt}]
+                    )
                 result = response.content[0].text.strip()
             elif self.client_type in ["langchain", "vertex"]:
-                response = self.llm.invoke(prompt)
+                with AI_REQUEST_SECONDS.time(operation='extraction'):
+                    response = self.llm.invoke(prompt)
                 result = response.content.strip() if hasattr(response, 'content') else str(response).strip()
             else:
                 raise ValueError(f"No valid AI client available for {element_type} extraction")
@@ -1161,19 +1177,29 @@ Generate YAML:"""
     def _call_ai_for_generation(self, prompt: str) -> str:
         """Call AI with the given prompt and return YAML"""
         
+        # A prompt already answered by this model returns the validated YAML from before
+        cache = get_ai_cache() if self.client_type else None
+        cache_key = make_cache_key('yaml-generation', self.model_id, prompt) if cache else None
+        if cache_key:
+            cached_yaml = cache.get(cache_key)
+            if cached_yaml:
+                return cached_yaml
+        
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
                 if self.client_type == "direct":
-                    response = self.anthropic.messages.create(
-                        model=self._get_claude_model_name(),
-                        max_tokens=1000,
-                        temperature=0.1,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
+                    with AI_REQUEST_SECONDS.time(operation='yaml_generation'):
+                        response = self.anthropic.messages.create(
+                            model=self._get_claude_model_name(),
+                            max_tokens=1000,
+                            temperature=0.1,
+                            messages=[{"role": "user", "content": prompt}]
+                        )
                     yaml_content = response.content[0].text.strip()
                 elif self.client_type in ["vertex", "langchain"]:
-                    response = self.llm.invoke(prompt)
+                    with AI_REQUEST_SECONDS.time(operation='yaml_generation'):
+                        response = self.llm.invoke(prompt)
                     yaml_content = response.content.strip() if hasattr(response, 'content') else str(response).strip()
                 else:
                     return None
@@ -1189,9 +1215,12 @@ Generate YAML:"""
                 is_valid, fixed_yaml, messages = validate_and_fix_yaml(yaml_content, auto_fix=True)
                 
                 if is_valid:
+                    if cache_key:
+                        cache.set(cache_key, fixed_yaml)
                     return fixed_yaml
                 elif attempt < max_attempts - 1:
                     # If validation failed, try again with error feedback
+                    VALIDATION_RETRIES.inc(operation='yaml_generation')
                     error_msg = '; '.join(messages)
                     prompt += f"\n\nPrevious attempt failed validation with errors: {error_msg}\nPlease fix these issues and generate valid YAML:"
                 
@@ -1268,18 +1297,21 @@ OUTPUT FORMAT:
         for attempt in range(max_attempts):
             try:
                 if self.client_type == "direct":
-                    response = self.anthropic.messages.create(
-                        model=self._get_claude_model_name(),
-                        max_tokens=3000,
-                        temperature=0.1,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
+                    with AI_REQUEST_SECONDS.time(operation='yaml_modification'):
+                        response = self.anthropic.messages.create(
+                            model=self._get_claude_model_name(),
+                            max_tokens=3000,
+                            temperature=0.1,
+                            messages=[{"role": "user", "content": prompt}]
+                        )
                     yaml_content = response.content[0].text.strip()
                 elif self.client_type == "vertex":
-                    response = self.llm.invoke(prompt)
+                    with AI_REQUEST_SECONDS.time(operation='yaml_modification'):
+                        response = self.llm.invoke(prompt)
                     yaml_content = response.content.strip()
                 elif self.client_type == "langchain":
-                    response = self.llm.invoke(prompt)
+                    with AI_REQUEST_SECONDS.time(operation='yaml_modification'):
+                        response = self.llm.invoke(prompt)
                     yaml_content = response.content.strip()
                 else:
                     return None
@@ -1305,6 +1337,7 @@ OUTPUT FORMAT:
                 
                 # If validation failed and we have more attempts, retry with feedback
                 if attempt < max_attempts - 1:
+                    VALIDATION_RETRIES.inc(operation='yaml_modification')
                     prompt += f"\n\nPrevious attempt failed YAML parsing. Ensure the output is valid YAML syntax."
                 
             except Exception as e:
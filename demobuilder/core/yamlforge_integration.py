@@ -1,7 +1,7 @@
 import sys
 import os
+import asyncio
 import tempfile
-import subprocess
 from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 import yaml
@@ -129,34 +129,35 @@ class YamlForgeAnalyzer:
                     "--no-credentials"
                 ]
                 
-                # Change to YamlForge directory before running
-                original_cwd = os.getcwd()
+                # Run from the YamlForge directory without changing the shared
+                # process working directory, and without blocking the event loop
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(self.yamlforge_root),
+                    env=env
+                )
                 try:
-                    os.chdir(str(self.yamlforge_root))
-                    
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        env=env
-                    )
-                finally:
-                    # Always restore original directory
-                    os.chdir(original_cwd)
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    return False, {}, ["Analysis timed out after 30 seconds"]
+                
+                stdout = stdout.decode(errors='replace')
+                stderr = stderr.decode(errors='replace')
                 
-                if result.returncode == 0:
-                    analysis_result = self._parse_analyze_output(result.stdout, yaml_config)
+                if process.returncode == 0:
+                    analysis_result = self._parse_analyze_output(stdout, yaml_config)
                     return True, analysis_result, []
                 else:
-                    errors = result.stderr.strip().split('\n') if result.stderr else []
+                    errors = stderr.strip().split('\n') if stderr else []
                     return False, {}, errors
                     
             finally:
                 os.unlink(config_file)
                 
-        except subprocess.TimeoutExpired:
-            return False, {}, ["Analysis timed out after 30 seconds"]
         except Exception as e:
             return False, {}, [f"Analysis failed: {str(e)}"]
     
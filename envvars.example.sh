@@ -129,6 +129,8 @@ export OCI_FINGERPRINT="12:34:56:78:90:ab:cd:ef"
 export OCI_TENANCY_OCID="ocid1.tenancy.oc1..aaaaaaaa..."
 export OCI_REGION="us-ashburn-1"
 export OCI_PRIVATE_KEY="$(cat ~/.oci/oci_api_key.pem)"
+# Optional: compartment images are listed in (defaults to the tenancy)
+export OCI_COMPARTMENT_ID="ocid1.compartment.oc1..aaaaaaaa..."
 
 # Terraform variable format (alternative)
 export TF_VAR_tenancy_ocid="$OCI_TENANCY_OCID"
@@ -223,6 +225,16 @@ export OPENSHIFT_CLUSTER_TOKEN="your_openshift_token"
 # export SSLCOM_EAB_KID="your_sslcom_eab_kid"
 # export SSLCOM_EAB_HMAC="your_sslcom_eab_hmac"
 
+# =============================================================================
+# IMAGE DISCOVERY CACHE
+# =============================================================================
+
+# Cloud image listings are cached on disk between runs (default ~/.cache/yamlforge)
+# export YAMLFORGE_CACHE_DIR="$HOME/.cache/yamlforge"
+# export YAMLFORGE_CACHE_TTL=86400      # Seconds before cached listings are refreshed
+# export YAMLFORGE_NO_CACHE=true        # Always query the cloud APIs and parse mappings from YAML
+# export YAMLFORGE_CATALOG_SNAPSHOT="$HOME/.cache/yamlforge/catalog/catalog.snapshot"  # Prebuilt mappings snapshot (yamlforge catalog build)
+
 # =============================================================================
 # SETUP VERIFICATION
 # =============================================================================
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Large-fleet benchmark for the full yamlforge pipeline.
+
+Generates synthetic configurations (10 to 10,000 instances across every
+provider, cheapest/cheapest-gpu mixes, many security groups and 1-50 OpenShift
+clusters with operators) and runs each one through the yamlforge CLI in a
+separate process with --no-credentials, offline cloud SDK stubs and a fake
+terraform binary. Reports wall time, peak RSS and per-stage time from
+--profile-output, and compares the results against a stored baseline.
+
+Usage:
+    python tools/benchmark_fleet.py
+    python tools/benchmark_fleet.py --scenarios fleet-10 fleet-1000 openshift-50
+    python tools/benchmark_fleet.py --save-baseline
+    python tools/benchmark_fleet.py --threshold 20 --fail-on-regression
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+# Allow running from a repository checkout without installing the package
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, REPO_ROOT)
+
+import yaml
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+PROVIDERS = ['aws', 'azure', 'gcp', 'ibm_vpc', 'ibm_classic', 'oci', 'alibaba', 'vmware']
+LOCATIONS = ['us-east-1', 'us-west-2', 'eu-west-1']
+FLAVORS = ['small', 'medium', 'large']
+
+# SDK modules imported unconditionally by the providers; stubbed when missing
+REQUIRED_SDK_STUBS = {
+    'ibm_vpc': ['VpcV1'],
+    'ibm_cloud_sdk_core': [],
+    'ibm_cloud_sdk_core.authenticators': ['IAMAuthenticator'],
+}
+
+# Stages shown in the report and stored in the baseline
+REPORTED_STAGES = ['load_input', 'schema_validation', 'converter_init', 'convert', 'networking',
+                   'security_groups', 'generate_virtual_machine', 'openshift_clusters',
+                   'generate_variables_tf', 'generate_terraform_tfvars', 'write_file']
+
+
+def _security_group(name, rule_count):
+    rules = []
+    for index in range(rule_count):
+        rules.append({
+            'direction': 'ingress',
+            'protocol': 'tcp',
+            'port_range': str(8000 + index),
+            'source': f"10.{index % 250}.0.0/16",
+        })
+    rules.append({'direction': 'ingress', 'protocol': 'tcp', 'port_range': '22', 'source': '0.0.0.0/0'})
+    return {'name': name, 'description': f"Synthetic group {name}", 'rules': rules}
+
+
+def _instance(index, provider, security_groups):
+    # IBM Cloud requires every resource in one configuration to share a region
+    location = LOCATIONS[0] if provider.startswith('ibm_') else LOCATIONS[index % len(LOCATIONS)]
+    return {
+        'name': f"{provider.replace('_', '-')}-node{index:05d}",
+        'provider': provider,
+        'location': location,
+        'flavor': FLAVORS[index % len(FLAVORS)],
+        'image': 'RHEL9-latest',
+        'security_groups': security_groups,
+        'tags': {'benchmark': 'fleet', 'shard': str(index % 16)},
+    }
+
+
+def build_fleet(instance_count):
+    """Spread instance_count instances round-robin across every provider."""
+    instances = [_instance(index, PROVIDERS[index % len(PROVIDERS)], ['web', 'ssh']) for index in range(instance_count)]
+    return {
+        'instances': instances,
+        'security_groups': [_security_group('web', 2), _security_group('ssh', 0)],
+    }
+
+
+def build_counted(definition_count, count=100):
+    """Definitions using `count`, one per provider plus cheapest, cheapest-gpu and GPU flavors."""
+    instances = []
+    for index in range(definition_count):
+        provider = (PROVIDERS + ['cheapest', 'cheapest-gpu'])[index % (len(PROVIDERS) + 2)]
+        instance = _instance(index, provider, ['ssh'])
+        instance['count'] = count
+        if provider == 'cheapest-gpu':
+            instance.update({'gpu_count': 1, 'gpu_type': 'NVIDIA T4'})
+        instances.append(instance)
+    return {'instances': instances, 'security_groups': [_security_group('ssh', 0)]}
+
+
+def build_cheapest(instance_count):
+    """Alternate cheapest (cores/memory) and cheapest-gpu instances."""
+    instances = []
+    for index in range(instance_count):
+        instance = {
+            'name': f"cheap-node{index:05d}",
+            'location': LOCATIONS[index % len(LOCATIONS)],
+            'image': 'RHEL9-latest',
+            'security_groups': ['ssh'],
+        }
+        if index % 2:
+            instance.update({'provider': 'cheapest-gpu', 'cores': 4, 'memory': 16384,
+                             'gpu_count': 1, 'gpu_type': 'NVIDIA T4'})
+        else:
+            instance.update({'provider': 'cheapest', 'cores': 2 + 2 * (index % 4), 'memory': 4096 * (1 + index % 4)})
+        instances.append(instance)
+    return {'instances': instances, 'security_groups': [_security_group('ssh', 0)]}
+
+
+def build_security_groups(group_count, instance_count=100, rules_per_group=10):
+    """Many security groups with overlapping rules (compacted), three attached per instance."""
+    groups = [dict(_security_group(f"sg-{index:04d}", rules_per_group), compact=True) for index in range(group_count)]
+    instances = []
+    for index in range(instance_count):
+        attached = [groups[(index + offset) % group_count]['name'] for offset in range(3)]
+        instances.append(_instance(index, PROVIDERS[index % 3], attached))
+    return {'instances': instances, 'security_groups': groups}
+
+
+def build_openshift(cluster_count):
+    """ROSA Classic, ROSA HCP and self-managed AWS clusters with operators on every cluster."""
+    cluster_types = ['rosa-classic', 'rosa-hcp', 'self-managed']
+    clusters = []
+    for index in range(cluster_count):
+        cluster_type = cluster_types[index % len(cluster_types)]
+        cluster = {
+            'name': f"ocp-{index:03d}",
+            'type': cluster_type,
+            'region': 'us-east-1',
+            'version': '4.18.19',
+            'size': 'small',
+        }
+        if cluster_type == 'self-managed':
+            cluster['provider'] = 'aws'
+        clusters.append(cluster)
+    cluster_names = [cluster['name'] for cluster in clusters]
+    operators = [
+        {'name': 'cluster-monitoring', 'type': 'monitoring', 'clusters': cluster_names},
+        {'name': 'openshift-gitops', 'type': 'gitops', 'clusters': cluster_names},
+    ]
+    return {
+        'instances': [_instance(0, 'aws', ['ssh'])],
+        'security_groups': [_security_group('ssh', 0)],
+        'openshift_clusters': clusters,
+        'openshift_operators': operators,
+    }
+
+
+SCENARIOS = {
+    'fleet-10': lambda: build_fleet(10),
+    'fleet-100': lambda: build_fleet(100),
+    'fleet-1000': lambda: build_fleet(1000),
+    'fleet-10000': lambda: build_fleet(10000),
+    'count-1000': lambda: build_counted(10),
+    'cheapest-100': lambda: build_cheapest(100),
+    'cheapest-1000': lambda: build_cheapest(1000),
+    'security-groups-500': lambda: build_security_groups(500),
+    'openshift-1': lambda: build_openshift(1),
+    'openshift-10': lambda: build_openshift(10),
+    'openshift-50': lambda: build_openshift(50),
+}
+
+
+def build_config(scenario):
+    """Return the full yamlforge document for a scenario."""
+    config = {
+        'cloud_workspace': {'name': f"bench-{scenario}"},
+        'ibm_classic': {'domain': 'bench.example.com'},
+    }
+    config.update(SCENARIOS[scenario]())
+    return {'guid': 'bench', 'yamlforge': config}
+
+
+class _OfflineStub:
+    """Stand-in for a missing SDK class; fails if it is ever used."""
+
+    def __init__(self, *args, **kwargs):
+        raise RuntimeError("Cloud SDK calls are disabled for benchmarking")
+
+
+def _offline(*args, **kwargs):
+    raise ConnectionError("Network access is disabled for benchmarking")
+
+
+def install_offline_stubs():
+    """Cut every cloud SDK off from the network and stub the ones that are missing.
+
+    Installed SDKs stay importable so provider validation behaves as in a real
+    run, but their transports raise immediately; HTTP through requests fails
+    the same way.
+    """
+    for module_name, class_names in REQUIRED_SDK_STUBS.items():
+        try:
+            __import__(module_name)
+        except ImportError:
+            module = types.ModuleType(module_name)
+            for class_name in class_names:
+                setattr(module, class_name, _OfflineStub)
+            sys.modules[module_name] = module
+
+    try:
+        import botocore.endpoint
+        botocore.endpoint.Endpoint.make_request = _offline
+    except ImportError:
+        pass
+
+    try:
+        import google.auth
+        google.auth.default = _offline
+    except ImportError:
+        pass
+
+    try:
+        import requests
+        requests.Session.request = _offline
+    except ImportError:
+        pass
+
+
+def run_child(config_path, output_dir, profile_path):
+    """Run yamlforge in this process with the SDK stubs installed (child mode)."""
+    install_offline_stubs()
+    from yamlforge.main import main as yamlforge_main
+
+    sys.argv = ['yamlforge', config_path, '-d', output_dir, '--no-credentials',
+                '--profile-output', profile_path]
+    try:
+        yamlforge_main()
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
+def _make_fake_terraform(bin_dir):
+    """Write a terraform stub that only answers the version check."""
+    path = os.path.join(bin_dir, 'terraform')
+    with open(path, 'w') as f:
+        f.write("#!/bin/sh\necho 'Terraform v1.12.2'\n")
+    os.chmod(path, 0o755)
+
+
+def _peak_rss_mb(rusage):
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return rusage.ru_maxrss / divisor
+
+
+def run_scenario(scenario, work_dir):
+    """Run one scenario in a child process and return its measurements."""
+    scenario_dir = os.path.join(work_dir, scenario)
+    output_dir = os.path.join(scenario_dir, 'terraform')
+    os.makedirs(output_dir)
+    config_path = os.path.join(scenario_dir, 'config.yaml')
+    profile_path = os.path.join(scenario_dir, 'profile.json')
+    log_path = os.path.join(scenario_dir, 'yamlforge.log')
+
+    config = build_config(scenario)
+    with open(config_path, 'w') as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+
+    env = dict(os.environ)
+    env['PATH'] = os.path.join(work_dir, 'bin') + os.pathsep + env.get('PATH', '')
+    env['GUID'] = 'bench'
+    env['PYTHONHASHSEED'] = '0'
+    env.pop('YAMLFORGE_EXCLUDE_PROVIDERS', None)
+
+    command = [sys.executable, os.path.abspath(__file__), '--child', config_path, output_dir, profile_path]
+    start = time.perf_counter()
+    with open(log_path, 'w') as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, env=env, cwd=REPO_ROOT)
+        _, status, rusage = os.wait4(process.pid, 0)
+    wall_seconds = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    result = {
+        'instances': sum(instance.get('count', 1) for instance in config['yamlforge'].get('instances', [])),
+        'security_groups': len(config['yamlforge'].get('security_groups', [])),
+        'clusters': len(config['yamlforge'].get('openshift_clusters', [])),
+        'exit_code': process.returncode,
+        'wall_seconds': round(wall_seconds, 3),
+        'peak_rss_mb': round(_peak_rss_mb(rusage), 1),
+        'stages': {},
+    }
+    try:
+        with open(profile_path) as f:
+            profile = json.load(f)
+        result['pipeline_seconds'] = round(profile['wall_seconds'], 3)
+        for stage in profile['stages']:
+            if stage['name'] in REPORTED_STAGES:
+                result['stages'][stage['name']] = round(stage['total_seconds'], 3)
+    except (OSError, ValueError, KeyError):
+        pass
+    if process.returncode != 0:
+        with open(log_path) as f:
+            tail = f.read().splitlines()[-5:]
+        result['error'] = '\n'.join(tail)
+    return result
+
+
+def _delta(current, baseline):
+    if not baseline:
+        return None
+    return (current - baseline) / baseline * 100
+
+
+def _format_delta(delta, threshold):
+    if delta is None:
+        return f"{'':>8}"
+    marker = '!' if delta > threshold else ' '
+    return f"{delta:>+6.0f}%{marker}"
+
+
+def print_report(results, baseline, threshold):
+    """Print the results table and return the scenarios that regressed."""
+    baseline_results = (baseline or {}).get('results', {})
+    regressions = []
+
+    print(f"{'Scenario':<22} {'Inst':>6} {'Clus':>5} {'Wall (s)':>9} {'vs base':>8} {'Pipeline':>9} {'RSS (MB)':>9} {'vs base':>8}  Status")
+    print("-" * 96)
+    for scenario, result in results.items():
+        previous = baseline_results.get(scenario, {})
+        wall_delta = _delta(result['wall_seconds'], previous.get('wall_seconds'))
+        rss_delta = _delta(result['peak_rss_mb'], previous.get('peak_rss_mb'))
+        status = 'ok' if result['exit_code'] == 0 else f"exit {result['exit_code']}"
+        if (wall_delta or 0) > threshold or (rss_delta or 0) > threshold:
+            status += ' REGRESSION'
+            regressions.append(scenario)
+        print(f"{scenario:<22} {result['instances']:>6} {result['clusters']:>5} {result['wall_seconds']:>9.2f} "
+              f"{_format_delta(wall_delta, threshold)} {result.get('pipeline_seconds', 0.0):>9.2f} {result['peak_rss_mb']:>9.1f} "
+              f"{_format_delta(rss_delta, threshold)}  {status}")
+
+    print()
+    print("Per-stage time (s):")
+    columns = [stage for stage in REPORTED_STAGES if any(stage in result['stages'] for result in results.values())]
+    for scenario, result in results.items():
+        stages = ', '.join(f"{stage}={result['stages'][stage]:.3f}" for stage in columns if stage in result['stages'])
+        print(f"  {scenario:<20} {stages}")
+
+    for scenario, result in results.items():
+        if result.get('error'):
+            print(f"\n{scenario} failed:\n{result['error']}")
+    return regressions
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == '--child':
+        sys.exit(run_child(*sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description='Benchmark yamlforge on synthetic large-fleet configurations')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS),
+                        metavar='SCENARIO', help='Scenarios to run (default: all)')
+    parser.add_argument('--list', action='store_true', help='List the available scenarios and exit')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline file (default: tools/benchmark_baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to the baseline file')
+    parser.add_argument('--threshold', type=float, default=25.0, help='Percent slowdown or RSS growth flagged as a regression (default: 25)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero when a scenario regresses')
+    parser.add_argument('--output', help='Also write the results as JSON to this file')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated configs and Terraform output')
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS:
+            config = build_config(scenario)['yamlforge']
+            instance_count = sum(instance.get('count', 1) for instance in config.get('instances', []))
+            print(f"{scenario:<22} {instance_count:>6} instances  "
+                  f"{len(config.get('security_groups', [])):>4} security groups  "
+                  f"{len(config.get('openshift_clusters', [])):>3} clusters")
+        return
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    work_dir = tempfile.mkdtemp(prefix='yamlforge-bench-')
+    os.makedirs(os.path.join(work_dir, 'bin'))
+    _make_fake_terraform(os.path.join(work_dir, 'bin'))
+
+    results = {}
+    try:
+        for scenario in args.scenarios:
+            print(f"Running {scenario}...", flush=True)
+            results[scenario] = run_scenario(scenario, work_dir)
+    finally:
+        if args.keep:
+            print(f"Benchmark files kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print()
+    regressions = print_report(results, baseline, args.threshold)
+
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+    if args.save_baseline:
+        if baseline:
+            # Keep scenarios that were not re-run in this invocation
+            document['results'] = dict(baseline.get('results', {}), **results)
+        with open(args.baseline, 'w') as f:
+            json.dump(document, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline written to {args.baseline}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for OpenShift operator and application HCL generation.
+
+Measures how long the per-cluster fan-out of the compiled HCL templates takes
+for 1 versus 50 target clusters (or any other cluster counts).
+
+Usage:
+    python tools/benchmark_operator_templates.py
+    python tools/benchmark_operator_templates.py --clusters 1 10 50 100 --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Allow running from a repository checkout without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from yamlforge.providers.openshift.features.operators import OpenShiftOperatorProvider
+from yamlforge.providers.openshift.features.applications import ApplicationProvider
+
+
+OPERATORS = [
+    {'name': 'cluster-monitoring', 'type': 'monitoring'},
+    {'name': 'openshift-gitops', 'type': 'gitops'},
+]
+
+
+def build_workload(cluster_count):
+    """Build operator, application and cluster definitions for a fan-out."""
+    clusters = [{'name': f'cluster-{index:03d}', 'type': 'rosa-classic'} for index in range(cluster_count)]
+    cluster_names = [cluster['name'] for cluster in clusters]
+
+    applications = [
+        {
+            'name': 'global-web-app',
+            'type': 'multi-cluster',
+            'clusters': cluster_names,
+            'deployment_type': 'deployment',
+            'image': 'registry.example.com/web:v1',
+            'replicas': 2,
+            'port': 8080,
+            'namespace': 'web',
+        },
+        {
+            'name': 'platform-config',
+            'type': 'multi-cluster',
+            'clusters': cluster_names,
+            'deployment_type': 'argocd',
+            'git_repo': 'https://github.com/example/platform-config',
+            'path': 'clusters',
+            'namespace': 'platform',
+        },
+    ]
+
+    return {'openshift_operators': OPERATORS, 'openshift_applications': applications}, clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark OpenShift operator and application HCL generation')
+    parser.add_argument('--clusters', type=int, nargs='+', default=[1, 50], help='Target cluster counts to benchmark (default: 1 50)')
+    parser.add_argument('--repeat', type=int, default=100, help='Generations per measurement (default: 100)')
+    args = parser.parse_args()
+
+    operator_provider = OpenShiftOperatorProvider(None)
+    application_provider = ApplicationProvider(None)
+
+    print(f"{'Clusters':>8}  {'Operators (ms)':>14}  {'Applications (ms)':>17}  {'Per cluster (ms)':>16}  {'Output (KB)':>11}")
+    print("-" * 76)
+
+    for cluster_count in args.clusters:
+        yaml_data, clusters = build_workload(cluster_count)
+
+        # Warm up lazy operator construction so only generation is measured
+        output = operator_provider.generate_operators(yaml_data, clusters)
+        output += application_provider.generate_applications_terraform(yaml_data, clusters)
+
+        operators_seconds = min(timeit.repeat(
+            lambda: operator_provider.generate_operators(yaml_data, clusters), number=args.repeat, repeat=3))
+        applications_seconds = min(timeit.repeat(
+            lambda: application_provider.generate_applications_terraform(yaml_data, clusters), number=args.repeat, repeat=3))
+
+        operators_ms = operators_seconds * 1000 / args.repeat
+        applications_ms = applications_seconds * 1000 / args.repeat
+        per_cluster_ms = (operators_ms + applications_ms) / cluster_count
+
+        print(f"{cluster_count:>8}  {operators_ms:>14.3f}  {applications_ms:>17.3f}  {per_cluster_ms:>16.4f}  {len(output) / 1024:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
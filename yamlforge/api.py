@@ -0,0 +1,214 @@
+"""
+Library entry point for yamlforge
+
+Runs the generation pipeline inside the calling process and returns the same
+structured result the CLI prints with --ansible. Callers that generate many
+workspaces (such as the Ansible infrastructure module) avoid starting a new
+interpreter and reloading the catalog and schema for every configuration.
+
+Example:
+    from yamlforge.api import generate
+
+    result = generate('config.yaml', '/tmp/terraform', no_credentials=True)
+    if not result['success']:
+        print(result['errors'])
+"""
+
+import contextlib
+import copy
+import io
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from .core.converter import YamlForgeConverter
+from .core.profiling import get_profiler, profile_span
+from .core.reporting import NullSink, Reporter
+from .main import auto_deploy_infrastructure, merge_openshift_defaults, validate_yaml_against_schema
+from .utils import load_yaml
+
+
+# Bump when keys are removed or change meaning; new keys may be added freely
+RESULT_SCHEMA_VERSION = 1
+
+# generate() uses the process-wide profiler and redirects the process-wide
+# stdout, so concurrent calls from different threads run one at a time
+_generate_lock = threading.Lock()
+
+
+def _new_result() -> Dict[str, Any]:
+    return {
+        'schema_version': RESULT_SCHEMA_VERSION,
+        'success': False,
+        'terraform_files': [],
+        'generated_files': [],
+        'deployment_status': 'not_attempted',
+        'providers_detected': [],
+        'warnings': [],
+        'errors': [],
+        'timings': {},
+    }
+
+
+def _load_configuration(config_file: Optional[str], yaml_data: Optional[dict]) -> dict:
+    """Parse config_file, or copy yaml_data so the caller's dict is never modified."""
+    with profile_span('load_input'):
+        if yaml_data is not None:
+            return copy.deepcopy(yaml_data)
+        if not config_file:
+            raise ValueError("Either config_file or yaml_data is required")
+        with open(config_file, 'r') as f:
+            data = load_yaml(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"'{config_file}' does not contain a YAML mapping")
+    return data
+
+
+def validate(config_file: Optional[str] = None, yaml_data: Optional[dict] = None) -> List[str]:
+    """Validate a configuration against the YamlForge schema and return its errors (empty if valid)."""
+    try:
+        data = _load_configuration(config_file, yaml_data)
+        with profile_span('schema_validation'):
+            validate_yaml_against_schema(data, config_file or '<yaml_data>', ansible_mode=True)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return [str(e)]
+    return []
+
+
+def _apply_options(converter: YamlForgeConverter, raw_yaml_data: dict, guid: Optional[str],
+                   exclude_providers: Optional[List[str]]) -> None:
+    """Apply per-call GUID and provider exclusions without touching os.environ.
+
+    Both are written into the parsed configuration because convert() reloads
+    the GUID and core overrides from it; a GUID environment variable still
+    takes priority, exactly as on the command line.
+    """
+    if guid:
+        guid = guid.strip().lower()
+        if not converter.validate_guid_format(guid):
+            raise ValueError(
+                f"Invalid GUID format: '{guid}'. "
+                f"GUID must be exactly 5 characters, alphanumeric only (a-z, 0-9)"
+            )
+        raw_yaml_data['guid'] = guid
+
+    if exclude_providers:
+        core_overrides = raw_yaml_data['yamlforge'].setdefault('core', {})
+        provider_selection = core_overrides.setdefault('provider_selection', {})
+        excluded = provider_selection.get(
+            'exclude_from_cheapest',
+            converter.core_config.get('provider_selection', {}).get('exclude_from_cheapest', []))
+        provider_selection['exclude_from_cheapest'] = sorted(set(excluded) | set(exclude_providers))
+
+
+def _run(result: Dict[str, Any], reporter: Reporter, config_file: Optional[str], output_dir: str,
+         yaml_data: Optional[dict], auto_deploy: bool, no_credentials: bool, verbose: bool, guid: Optional[str],
+         exclude_providers: Optional[List[str]]) -> None:
+    raw_yaml_data = _load_configuration(config_file, yaml_data)
+
+    with profile_span('schema_validation'):
+        validate_yaml_against_schema(raw_yaml_data, config_file or '<yaml_data>', ansible_mode=True)
+
+    if 'yamlforge' not in raw_yaml_data:
+        raise ValueError("YAML configuration must have a 'yamlforge' root element")
+    if raw_yaml_data.get('instances'):
+        result['warnings'].append("Found 'instances' at root level. This is deprecated and will be ignored.")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    with profile_span('converter_init'):
+        converter = YamlForgeConverter(ansible_mode=True, reporter=reporter)
+    converter.verbose = verbose
+    converter.no_credentials = no_credentials
+    _apply_options(converter, raw_yaml_data, guid, exclude_providers)
+
+    config = raw_yaml_data['yamlforge']
+    merge_openshift_defaults(config, verbose)
+
+    with profile_span('convert'):
+        converter.convert(config, output_dir, verbose=verbose, full_yaml_data=raw_yaml_data)
+
+    result['generated_files'] = list(converter.generated_files)
+    result['terraform_files'] = [path for path in converter.generated_files if path.endswith('.tf')]
+    result['providers_detected'] = sorted(converter.detected_providers)
+
+    if auto_deploy:
+        result['deployment_status'] = 'attempting'
+        try:
+            with profile_span('auto_deploy'):
+                deployed = auto_deploy_infrastructure(output_dir, raw_yaml_data)
+        except Exception as e:
+            result['deployment_status'] = 'failed'
+            result['errors'].append(f"Deployment failed: {e}")
+            return
+        if deployed is False:
+            result['deployment_status'] = 'failed'
+            result['errors'].append("Deployment failed")
+        else:
+            result['deployment_status'] = 'deployed'
+
+
+def generate(config_file: Optional[str] = None, output_dir: Optional[str] = None, yaml_data: Optional[dict] = None,
+             auto_deploy: bool = False, no_credentials: bool = False, verbose: bool = False,
+             guid: Optional[str] = None, exclude_providers: Optional[List[str]] = None,
+             capture_output: bool = True) -> Dict[str, Any]:
+    """Generate Terraform for one configuration and return a structured result.
+
+    Pass either config_file or an already parsed yaml_data dict. The result
+    holds success, terraform_files, generated_files, providers_detected,
+    deployment_status, warnings, errors and per-stage timings; with
+    capture_output the console text (stdout and stderr) is returned as
+    'output' instead of being printed. Errors are reported in the result rather than raised.
+
+    Calls are serialized with a lock because they share the process-wide
+    profiler and stdout; the profiler's previous state is restored afterwards.
+    """
+    result = _new_result()
+    if not output_dir:
+        result['errors'].append("output_dir is required")
+        return result
+
+    with _generate_lock:
+        profiler = get_profiler()
+        was_enabled, previous_spans, previous_origin = profiler.enabled, profiler.spans, profiler.origin
+        profiler.enable()
+        try:
+            _generate(result, config_file, output_dir, yaml_data, auto_deploy, no_credentials, verbose,
+                      guid, exclude_providers, capture_output)
+            result['timings'] = profiler.to_dict(include_spans=False)
+        finally:
+            profiler.disable()
+            with profiler._lock:
+                profiler.spans, profiler.origin = previous_spans, previous_origin
+            if was_enabled:
+                profiler.enabled = True
+    return result
+
+
+def _generate(result: Dict[str, Any], config_file: Optional[str], output_dir: str, yaml_data: Optional[dict],
+              auto_deploy: bool, no_credentials: bool, verbose: bool, guid: Optional[str],
+              exclude_providers: Optional[List[str]], capture_output: bool) -> None:
+    # Warnings and errors are collected from the reporter's events; it also writes them to stderr
+    reporter = Reporter(NullSink())
+    stream = io.StringIO()
+    try:
+        with contextlib.ExitStack() as redirect:
+            if capture_output:
+                redirect.enter_context(contextlib.redirect_stdout(stream))
+                redirect.enter_context(contextlib.redirect_stderr(stream))
+            _run(result, reporter, config_file, output_dir, yaml_data, auto_deploy, no_credentials, verbose, guid, exclude_providers)
+        result['success'] = not result['errors']
+    except ValueError as e:
+        result['errors'].append(str(e))
+    except FileNotFoundError as e:
+        result['errors'].append(f"File Error: {e}")
+    except yaml.YAMLError as e:
+        result['errors'].append(f"Invalid YAML syntax in '{config_file}': {e}")
+    except Exception as e:
+        result['errors'].append(f"Unexpected Error: {e}")
+
+    result['warnings'].extend(reporter.warnings)
+    if capture_output:
+        result['output'] = stream.getvalue()
@@ -0,0 +1,231 @@
+"""
+Precompiled catalog snapshot for yamlforge
+
+Parses every bundled mappings/ and defaults/ YAML file once and stores the
+result as a marshal snapshot, so later runs deserialize it instead of
+re-parsing thousands of lines of YAML on startup. Only the per-file parse is
+cached; providers still merge and index the parsed files themselves.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import find_yamlforge_file, load_yaml
+from .discovery_cache import get_cache_dir
+
+
+# Bump when the snapshot layout changes so old snapshots are rebuilt
+SNAPSHOT_FORMAT = 1
+
+# Directories (relative to the yamlforge package) covered by the snapshot
+CATALOG_DIRECTORIES = ['mappings', 'defaults']
+
+CATALOG_ROOT = Path(__file__).parent.parent
+
+
+def get_snapshot_path() -> Path:
+    """Return the snapshot location (YAMLFORGE_CATALOG_SNAPSHOT or the yamlforge cache dir)."""
+    snapshot_path = os.environ.get('YAMLFORGE_CATALOG_SNAPSHOT')
+    if snapshot_path:
+        return Path(snapshot_path)
+    python_tag = f"py{sys.version_info[0]}{sys.version_info[1]}"
+    return get_cache_dir() / 'catalog' / f"catalog-{python_tag}.snapshot"
+
+
+def _scan_sources(root: Path) -> Dict[str, Tuple[int, int]]:
+    """Return {relative path: (mtime_ns, size)} for every catalog YAML file."""
+    manifest = {}
+    for directory in CATALOG_DIRECTORIES:
+        base = root / directory
+        if not base.is_dir():
+            continue
+        for path in base.rglob('*.yaml'):
+            stat = path.stat()
+            manifest[path.relative_to(root).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return manifest
+
+
+class CatalogSnapshot:
+    """Parsed catalog files, each kept as marshal bytes and decoded on demand.
+
+    Every lookup decodes a fresh copy, so callers may mutate what they get
+    back exactly as they could with a freshly parsed YAML file.
+    """
+
+    def __init__(self, content_hash: str, manifest: Dict[str, Tuple[int, int]], files: Dict[str, bytes]):
+        self.content_hash = content_hash
+        self.manifest = manifest
+        self.files = files
+
+    def get(self, relative_path: str) -> Any:
+        return marshal.loads(self.files[relative_path])
+
+    def list_directory(self, directory: str) -> List[str]:
+        """Return the YAML files directly inside a catalog directory, in directory order."""
+        prefix = directory.rstrip('/') + '/'
+        return [path for path in self.files
+                if path.startswith(prefix) and '/' not in path[len(prefix):]]
+
+
+def _read_sources(root: Path, manifest: Dict[str, Tuple[int, int]]) -> Tuple[str, Dict[str, bytes]]:
+    """Return the content hash and raw bytes of every file in the manifest."""
+    contents = {relative_path: (root / relative_path).read_bytes() for relative_path in manifest}
+    digest = hashlib.sha256()
+    for relative_path in sorted(contents):
+        digest.update(relative_path.encode('utf-8') + b'\0' + contents[relative_path] + b'\0')
+    return digest.hexdigest(), contents
+
+
+def build_snapshot(root: Path = CATALOG_ROOT) -> CatalogSnapshot:
+    """Parse every catalog YAML file under root into a snapshot."""
+    manifest = _scan_sources(root)
+    content_hash, contents = _read_sources(root, manifest)
+    # Keep directory order: flavor lookups fall back to the first matching file
+    files = {relative_path: marshal.dumps(load_yaml(content)) for relative_path, content in contents.items()}
+    return CatalogSnapshot(content_hash, manifest, files)
+
+
+def write_snapshot(snapshot: CatalogSnapshot, path: Optional[Path] = None) -> Path:
+    """Atomically write a snapshot to disk and return its path."""
+    path = path or get_snapshot_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = marshal.dumps({
+        'format': SNAPSHOT_FORMAT,
+        'content_hash': snapshot.content_hash,
+        'manifest': snapshot.manifest,
+        'files': snapshot.files,
+    })
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_snapshot(path: Optional[Path] = None) -> Optional[CatalogSnapshot]:
+    """Read a snapshot from disk, or return None if it is missing or unreadable."""
+    path = path or get_snapshot_path()
+    try:
+        with open(path, 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get('format') != SNAPSHOT_FORMAT:
+        return None
+    return CatalogSnapshot(data['content_hash'], data['manifest'], data['files'])
+
+
+def _snapshot_enabled() -> bool:
+    return os.environ.get('YAMLFORGE_NO_CACHE', '').lower() not in ['true', '1', 'yes']
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_snapshot_loaded = False
+_snapshot_lock = threading.Lock()
+
+
+def get_catalog() -> Optional[CatalogSnapshot]:
+    """Return the process-wide catalog snapshot, rebuilding it if any source changed.
+
+    The snapshot is trusted while every source file still has the recorded
+    modification time and size and no file was added or removed. When that
+    check fails (for example after a checkout touched every file), the
+    sources are hashed and the snapshot is kept if its content_hash still
+    matches; otherwise the YAML is parsed again and a fresh snapshot is
+    written. Returns None when snapshots are disabled (YAMLFORGE_NO_CACHE).
+    """
+    global _snapshot, _snapshot_loaded
+    if _snapshot_loaded:
+        return _snapshot
+    with _snapshot_lock:
+        if _snapshot_loaded:
+            return _snapshot
+        if _snapshot_enabled():
+            try:
+                manifest = _scan_sources(CATALOG_ROOT)
+                snapshot = read_snapshot()
+                if snapshot is None or snapshot.manifest != manifest:
+                    snapshot = _revalidate(snapshot, manifest)
+                    try:
+                        write_snapshot(snapshot)
+                    except OSError:
+                        # A read-only cache directory only costs the startup speedup
+                        pass
+                _snapshot = snapshot
+            except Exception as e:
+                print(f"Warning: Could not load catalog snapshot, parsing YAML instead: {e}")
+                _snapshot = None
+        _snapshot_loaded = True
+    return _snapshot
+
+
+def _revalidate(snapshot: Optional[CatalogSnapshot], manifest: Dict[str, Tuple[int, int]]) -> CatalogSnapshot:
+    """Reuse a snapshot whose sources only changed metadata, else rebuild it."""
+    if snapshot is not None and set(snapshot.manifest) == set(manifest):
+        content_hash, _ = _read_sources(CATALOG_ROOT, manifest)
+        if content_hash == snapshot.content_hash:
+            return CatalogSnapshot(content_hash, manifest, snapshot.files)
+    return build_snapshot()
+
+
+def load_catalog_file(relative_path: str) -> Any:
+    """Return the parsed contents of a mappings/ or defaults/ YAML file.
+
+    Files that resolve to the bundled catalog are served from the snapshot;
+    overrides found through YAMLFORGE_DATA_PATH or the working directory are
+    parsed directly. Raises FileNotFoundError like find_yamlforge_file().
+    """
+    snapshot = get_catalog()
+    if snapshot is not None and relative_path in snapshot.files and not _has_override(relative_path):
+        return snapshot.get(relative_path)
+    with open(find_yamlforge_file(relative_path), 'r') as f:
+        return load_yaml(f)
+
+
+def _has_override(relative_path: str) -> bool:
+    """Check whether find_yamlforge_file() would pick a file other than the bundled one."""
+    env_data_path = os.environ.get('YAMLFORGE_DATA_PATH')
+    if env_data_path and (Path(env_data_path) / relative_path).exists():
+        return True
+    cwd_path = Path(relative_path)
+    if cwd_path.exists():
+        try:
+            return cwd_path.resolve() != (CATALOG_ROOT / relative_path).resolve()
+        except OSError:
+            return True
+    return False
+
+
+def list_catalog_directory(directory: str) -> List[str]:
+    """Return the relative paths of the bundled YAML files in a catalog directory."""
+    snapshot = get_catalog()
+    if snapshot is not None:
+        return snapshot.list_directory(directory)
+    base = CATALOG_ROOT / directory
+    if not base.is_dir():
+        return []
+    return [path.relative_to(CATALOG_ROOT).as_posix() for path in base.glob('*.yaml')]
+
+
+def build_catalog(output_path: Optional[Path] = None) -> Tuple[Path, CatalogSnapshot]:
+    """Rebuild the snapshot from the YAML sources and write it (yamlforge catalog build)."""
+    global _snapshot, _snapshot_loaded
+    snapshot = build_snapshot()
+    path = write_snapshot(snapshot, output_path)
+    with _snapshot_lock:
+        _snapshot = snapshot
+        _snapshot_loaded = True
+    return path, snapshot
@@ -7,12 +7,22 @@ infrastructure generation using provider-specific implementations.
 
 import os
 import re
-import yaml
 import subprocess
 from pathlib import Path
 
 from .credentials import CredentialsManager
-from ..utils import find_yamlforge_file
+from .catalog import CATALOG_ROOT, load_catalog_file, list_catalog_directory
+from .instance_expansion import group_instances
+from .profiling import profile_span, profiled
+from .render_pipeline import LazyValue, get_render_workers, print_once, record_cost, render_in_order
+from .reporting import Reporter, create_sink
+from .security_group_rules import compact_security_group_rules
+from .shared_resources import SharedResourceRegistry
+from .terraform_providers import (
+    CLI_CONFIG_FILE, LOCK_FILE, generate_cli_config, generate_lock_file, get_plugin_cache_dir, read_mirror_lock,
+    required_providers_block,
+)
+from ..utils import load_yaml
 from ..providers.aws import AWSProvider
 from ..providers.azure import AzureProvider
 from ..providers.gcp import GCPProvider
@@ -28,9 +38,12 @@ from ..providers.cnv import CNVProvider
 class YamlForgeConverter:
     """Main converter class that orchestrates multi-cloud infrastructure generation."""
 
-    def __init__(self, images_file="mappings/images.yaml", analyze_mode=False, ansible_mode=False):
+    def __init__(self, images_file="mappings/images.yaml", analyze_mode=False, ansible_mode=False, output_format='auto',
+                 reporter=None):
         """Initialize the converter with mappings and provider modules."""
         self.ansible_mode = ansible_mode
+        # Progress output; --ansible reports results as JSON instead
+        self.reporter = reporter or Reporter(create_sink('quiet' if ansible_mode else output_format))
         # Check Terraform version early (skip if in analyze mode)
         if not analyze_mode:
             self.validate_terraform_version()
@@ -49,10 +62,17 @@ class YamlForgeConverter:
 
         # Initialize credentials manager
         self.credentials = CredentialsManager()
+        self._default_ssh_key = None
+
+        # Per-region AMI lookups and SSH keys shared by instances (set while generating instances)
+        self.shared_resources = None
+
+        # Keys of output shown only once per run (see print_once)
+        self._shown_once = set()
 
         # Initialize provider modules (GUID will be set when processing YAML)
         # Note: AWS provider is initialized lazily to avoid credential checks when not needed
-        self._aws_provider = None  # Lazy initialization
+        self._aws_provider = LazyValue('aws-provider')  # Lazy initialization
         self.azure_provider = AzureProvider(self)
         self.gcp_provider = GCPProvider(self)
         self.ibm_classic_provider = IBMClassicProvider(self)
@@ -72,6 +92,9 @@ class YamlForgeConverter:
         
         # Cache for resolved regions to prevent multiple validations
         self._region_cache = {}
+
+        # Cache for cheapest-provider cost scans, keyed by the requirements
+        self._cost_scan_cache = {}
         
         # No-credentials mode flag (set by main.py)
         self.no_credentials = False
@@ -81,11 +104,13 @@ class YamlForgeConverter:
         # Track OpenShift cluster costs for total calculation
         self.openshift_costs = []
 
+        # Results of the last convert(), for library and Ansible callers
+        self.detected_providers = set()
+        self.generated_files = []
+
     def get_aws_provider(self):
         """Return the AWS provider instance for use by other components."""
-        if self._aws_provider is None:
-            self._aws_provider = AWSProvider(self)
-        return self._aws_provider
+        return self._aws_provider.get(lambda: AWSProvider(self))
 
     def get_cnv_provider(self):
         """Return the CNV provider instance for use by other components."""
@@ -179,7 +204,7 @@ class YamlForgeConverter:
             # Success - version is acceptable
             current_version_str = f"{major}.{minor}.{patch}"
             if not getattr(self, 'ansible_mode', False):
-                print(f"Detected Terraform version {current_version_str} (meets minimum requirement)")
+                self.reporter.echo(f"Detected Terraform version {current_version_str} (meets minimum requirement)")
             
         except subprocess.TimeoutExpired:
             raise ValueError(
@@ -326,12 +351,10 @@ class YamlForgeConverter:
     def load_images(self, file_path):
         """Load image mappings from YAML file."""
         try:
-            actual_path = find_yamlforge_file(file_path)
-            with open(actual_path, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('images', {})
+            data = load_catalog_file(file_path)
+            return data.get('images', {})
         except FileNotFoundError:
-            print(f"Warning: {file_path} not found. Using empty image mappings.")
+            self.reporter.echo(f"Warning: {file_path} not found. Using empty image mappings.")
             return {}
 
 
@@ -339,23 +362,19 @@ class YamlForgeConverter:
     def load_locations(self, file_path):
         """Load location mappings from YAML file."""
         try:
-            actual_path = find_yamlforge_file(file_path)
-            with open(actual_path, 'r') as f:
-                data = yaml.safe_load(f)
-                return data or {}
+            data = load_catalog_file(file_path)
+            return data or {}
         except FileNotFoundError:
-            print(f"Warning: {file_path} not found. Using empty location mappings.")
+            self.reporter.echo(f"Warning: {file_path} not found. Using empty location mappings.")
             return {}
 
     def load_storage_costs(self, file_path):
         """Load storage cost mappings from YAML file."""
         try:
-            actual_path = find_yamlforge_file(file_path)
-            with open(actual_path, 'r') as f:
-                data = yaml.safe_load(f)
-                return data or {}
+            data = load_catalog_file(file_path)
+            return data or {}
         except FileNotFoundError:
-            print(f"Warning: {file_path} not found. Storage cost optimization disabled.")
+            self.reporter.echo(f"Warning: {file_path} not found. Storage cost optimization disabled.")
             return {}
 
     def load_flavors(self, directory_path):
@@ -371,11 +390,24 @@ class YamlForgeConverter:
                 module_dir = Path(__file__).parent.parent
                 flavor_dir = module_dir / directory_path
                 
-            if flavor_dir.exists():
+            if flavor_dir.exists() and flavor_dir.resolve() == (CATALOG_ROOT / directory_path).resolve():
+                # Bundled flavors are served from the precompiled catalog snapshot
+                for relative_path in list_catalog_directory(directory_path):
+                    try:
+                        data = load_catalog_file(relative_path)
+                        if data:
+                            cloud_name = Path(relative_path).stem
+                            if cloud_name == 'generic':
+                                flavors.update(data)
+                            else:
+                                flavors[cloud_name] = data
+                    except Exception as e:
+                        self.reporter.echo(f"Warning: Could not load {relative_path}: {e}")
+            elif flavor_dir.exists():
                 for file_path in flavor_dir.glob("*.yaml"):
                     try:
                         with open(file_path, 'r') as f:
-                            data = yaml.safe_load(f)
+                            data = load_yaml(f)
                             if data:
                                 cloud_name = file_path.stem
                                 if cloud_name == 'generic':
@@ -383,7 +415,7 @@ class YamlForgeConverter:
                                 else:
                                     flavors[cloud_name] = data
                     except Exception as e:
-                        print(f"Warning: Could not load {file_path}: {e}")
+                        self.reporter.echo(f"Warning: Could not load {file_path}: {e}")
             else:
                 # For pip installs, try to load individual files from the package
                 try:
@@ -401,7 +433,7 @@ class YamlForgeConverter:
                         try:
                             file_path = f"{directory_path}/{filename}"
                             data_content = package_files.joinpath(file_path).read_text()
-                            data = yaml.safe_load(data_content)
+                            data = load_yaml(data_content)
                             if data:
                                 cloud_name = filename.replace('.yaml', '')
                                 if cloud_name == 'generic':
@@ -415,7 +447,7 @@ class YamlForgeConverter:
                     pass
                     
         except Exception as e:
-            print(f"Warning: Could not load flavors from {directory_path}: {e}")
+            self.reporter.echo(f"Warning: Could not load flavors from {directory_path}: {e}")
             
         return flavors
 
@@ -424,12 +456,10 @@ class YamlForgeConverter:
     def load_core_config(self, file_path):
         """Load core yamlforge configuration from YAML file."""
         try:
-            actual_path = find_yamlforge_file(file_path)
-            with open(actual_path, 'r') as f:
-                data = yaml.safe_load(f)
-                config = data or {}
+            data = load_catalog_file(file_path)
+            config = data or {}
         except FileNotFoundError:
-            print(f"Warning: {file_path} not found. Using default core configuration.")
+            self.reporter.echo(f"Warning: {file_path} not found. Using default core configuration.")
             config = self.get_default_core_config()
         
         # Override with environment variables if present
@@ -455,7 +485,7 @@ class YamlForgeConverter:
                 all_excluded = list(set(existing_excluded + excluded_providers))
                 config['provider_selection']['exclude_from_cheapest'] = all_excluded
                 
-                print(f"Environment override: Excluding providers from cheapest analysis: {excluded_providers}")
+                self.reporter.echo(f"Environment override: Excluding providers from cheapest analysis: {excluded_providers}")
 
     def get_default_core_config(self):
         """Get default core configuration when core.yaml is not found."""
@@ -495,10 +525,10 @@ class YamlForgeConverter:
                 discount_percentage = float(env_discount)
                 # Validate range
                 if discount_percentage < 0 or discount_percentage > 100:
-                    print(f"Warning: Invalid discount percentage in {env_var_name}={env_discount}. Must be 0-100. Using 0.")
+                    self.reporter.echo(f"Warning: Invalid discount percentage in {env_var_name}={env_discount}. Must be 0-100. Using 0.")
                     discount_percentage = 0
             except ValueError:
-                print(f"Warning: Invalid discount percentage in {env_var_name}={env_discount}. Must be a number. Using 0.")
+                self.reporter.echo(f"Warning: Invalid discount percentage in {env_var_name}={env_discount}. Must be a number. Using 0.")
                 discount_percentage = 0
         else:
             # Fall back to core config
@@ -567,9 +597,10 @@ class YamlForgeConverter:
         # Default SSH key configuration if none provided
         if not ssh_keys:
             # Try to get SSH key from environment variables via credentials system
-            from yamlforge.core.credentials import CredentialsManager
-            creds_manager = CredentialsManager()
-            default_ssh_key = creds_manager.get_default_ssh_key()
+            # (looked up once; this runs for every instance)
+            if self._default_ssh_key is None:
+                self._default_ssh_key = self.credentials.get_default_ssh_key()
+            default_ssh_key = self._default_ssh_key
             
             if default_ssh_key and default_ssh_key.get('available'):
                 return {
@@ -659,9 +690,10 @@ class YamlForgeConverter:
         
         if all_excluded:
             excluded_list = ', '.join(all_excluded)
-            print(f"   Per Instance provider exclusions for {analysis_type}: {excluded_list} (excluded from cost comparison)")
+            self.reporter.echo(f"   Per Instance provider exclusions for {analysis_type}: {excluded_list} (excluded from cost comparison)")
             # Don't show available providers here since they're shown in the main analysis
 
+    @profiled()
     def detect_required_providers(self, yaml_data):
         """Detect which cloud providers are actually being used."""
         providers_in_use = set()
@@ -768,6 +800,7 @@ class YamlForgeConverter:
 
         return sorted(list(providers_in_use))
 
+    @profiled()
     def validate_provider_setup(self, yaml_data):
         """Validate cloud provider setup early to catch issues before processing."""
         
@@ -939,7 +972,7 @@ class YamlForgeConverter:
                 validate_operator = cnv_config.get('validate_operator', True)
                 
                 # Skip CNV validation for now to avoid hanging
-                print("CNV operator validation skipped (temporarily disabled)")
+                self.reporter.echo("CNV operator validation skipped (temporarily disabled)")
                 
                 # TODO: Re-enable validation once kubectl timeout issues are resolved
                 # if validate_operator:
@@ -1123,104 +1156,7 @@ terraform {{
   required_version = ">= 1.12.0"
   required_providers {{'''
 
-        # Add provider configurations
-        ibm_provider_added = False  # Track if IBM provider has been added
-        for provider in required_providers:
-            if provider == 'aws':
-                terraform_content += '''
-    aws = {
-      source  = "hashicorp/aws"
-      version = "~> 5.0"
-    }'''
-            elif provider == 'azure':
-                terraform_content += '''
-    azurerm = {
-      source  = "hashicorp/azurerm"
-      version = "~> 3.0"
-    }
-    azuread = {
-      source  = "hashicorp/azuread"
-      version = "~> 2.0"
-    }'''
-            elif provider == 'gcp':
-                terraform_content += '''
-    google = {
-      source  = "hashicorp/google"
-      version = "~> 4.0"
-    }
-    time = {
-      source  = "hashicorp/time"
-      version = "~> 0.9"
-    }
-    local = {
-      source  = "hashicorp/local"
-      version = "~> 2.4"
-    }'''
-            elif provider in ['ibm_vpc', 'ibm_classic']:
-                # Only add IBM provider once, even if both ibm_vpc and ibm_classic are used
-                if not ibm_provider_added:
-                    terraform_content += '''
-    ibm = {
-      source  = "IBM-Cloud/ibm"
-      version = "~> 1.0"
-    }'''
-                    ibm_provider_added = True
-            elif provider == 'oci':
-                terraform_content += '''
-    oci = {
-      source  = "oracle/oci"
-      version = "~> 5.0"
-    }'''
-            elif provider == 'vmware':
-                terraform_content += '''
-    vsphere = {
-      source  = "hashicorp/vsphere"
-      version = "~> 2.4"
-    }'''
-            elif provider == 'alibaba':
-                terraform_content += '''
-    alicloud = {
-      source  = "aliyun/alicloud"
-      version = "~> 1.0"
-    }'''
-            elif provider == 'rhcs':
-                terraform_content += '''
-    rhcs = {
-      source  = "terraform-redhat/rhcs"
-      version = ">= 1.0.1"
-    }'''
-            elif provider == 'kubernetes':
-                terraform_content += '''
-    kubernetes = {
-      source  = "hashicorp/kubernetes"
-      version = "~> 2.23"
-    }'''
-            elif provider == 'helm':
-                terraform_content += '''
-    helm = {
-      source  = "hashicorp/helm"
-      version = "~> 2.11"
-    }'''
-            elif provider == 'kubectl':
-                terraform_content += '''
-    kubectl = {
-      source  = "gavinbunney/kubectl"
-      version = "~> 1.14"
-    }'''
-            elif provider == 'cnv':
-                terraform_content += '''
-    kubernetes = {
-      source  = "hashicorp/kubernetes"
-      version = "~> 2.23"
-    }
-    kubectl = {
-      source  = "gavinbunney/kubectl"
-      version = "~> 1.14"
-    }
-    helm = {
-      source  = "hashicorp/helm"
-      version = "~> 2.11"
-    }'''
+        terraform_content += required_providers_block(required_providers)
 
         terraform_content += '''
   }
@@ -1371,7 +1307,8 @@ provider "helm" {
             terraform_content += self.gcp_provider.generate_project_management(yaml_data)
 
         # Collect zone information for IBM VPC instances (do this once)
-        ibm_vpc_zones = self.collect_ibm_vpc_zones(yaml_data)
+        with profile_span('collect_ibm_vpc_zones'):
+            ibm_vpc_zones = self.collect_ibm_vpc_zones(yaml_data)
         
         # Generate regional networking infrastructure
         terraform_content += '''# ========================================
@@ -1379,7 +1316,8 @@ provider "helm" {
 # ========================================
 
 '''
-        terraform_content += self.generate_regional_networking(yaml_data, ibm_vpc_zones)
+        with profile_span('networking'):
+            terraform_content += self.generate_regional_networking(yaml_data, ibm_vpc_zones)
 
         # Generate regional security groups
         terraform_content += '''
@@ -1388,7 +1326,8 @@ provider "helm" {
 # ========================================
 
 '''
-        terraform_content += self.generate_regional_security_groups(yaml_data)
+        with profile_span('security_groups'):
+            terraform_content += self.generate_regional_security_groups(yaml_data)
 
         # Generate VM instances
         terraform_content += '''
@@ -1408,46 +1347,56 @@ provider "helm" {
         # Validate IBM Cloud region consistency
         self.validate_ibm_cloud_region_consistency(instances)
         
+        # Every GCP image family the instances and HyperShift workers use is looked up at once
+        if 'gcp' in required_providers:
+            with profile_span('gcp_image_catalog'):
+                self.gcp_provider.prefetch_images(self.collect_gcp_images(yaml_data))
+        if 'oci' in required_providers:
+            with profile_span('oci_image_catalog'):
+                self.oci_provider.prefetch_images(self.collect_oci_images(yaml_data))
+
+        # Images and SSH keys the instances need are registered once per provider
+        # region and written ahead of the instances that reference them
+        self.shared_resources = SharedResourceRegistry()
+
+        # Each definition is rendered as one task; definitions run concurrently
+        # (see render_pipeline) and their output is assembled in order
+        tasks = []
         instance_counter = 1
-        for instance in instances:
-            # Get count for this instance (default to 1 if not specified)
-            instance_count = instance.get('count', 1)
-            
-            # Generate multiple instances if count > 1
-            for instance_index in range(instance_count):
-                # Get zone for IBM VPC instances
-                zone = None
-                if instance.get('provider') == 'ibm_vpc':
-                    region = self.resolve_instance_region(instance, 'ibm_vpc')
-                    zone = ibm_vpc_zones.get(region)
-                
-                # Create a copy of the instance with modified name if count > 1
-                instance_copy = instance.copy()
-                if instance_count > 1:
-                    original_name = instance_copy['name']
-                    # Resolve GUID first before applying count naming logic
-                    if '{guid}' in original_name:
-                        guid = self.get_validated_guid()
-                        original_name = original_name.replace('{guid}', guid)
-                    
-                    # Check if name ends with a number and increment from there
-                    import re
-                    match = re.search(r'(.+?)(\d+)$', original_name)
-                    if match:
-                        # Name ends with number, increment from that base
-                        base_name = match.group(1)
-                        base_number_str = match.group(2)
-                        base_number = int(base_number_str)
-                        # Preserve padding (e.g., 01, 02, 003) by using the same width
-                        padding_width = len(base_number_str)
-                        new_number = base_number + instance_index
-                        instance_copy['name'] = f"{base_name}{new_number:0{padding_width}d}"
-                    else:
-                        # Name doesn't end with number, append -X
-                        instance_copy['name'] = f"{original_name}-{instance_index + 1}"
-                
-                terraform_content += self.generate_virtual_machine(instance_copy, instance_counter, yaml_data, full_yaml_data=effective_yaml_data, zone=zone)
-                instance_counter += 1
+        for group in group_instances(instances, self.get_validated_guid):
+            tasks.append((group, instance_counter))
+            instance_counter += len(group)
+
+        def render_group(task):
+            group, first_index = task
+            # Get zone for IBM VPC instances (shared by every member of the definition)
+            zone = None
+            if group.template.get('provider') == 'ibm_vpc':
+                region = self.resolve_instance_region(group.template, 'ibm_vpc')
+                zone = ibm_vpc_zones.get(region)
+
+            # Provider, instance type and cost selection resolved for the first
+            # member are reused for the rest of a counted definition
+            resolution = {}
+            content = ""
+            for offset, member in enumerate(group):
+                instance_copy = member.to_dict()
+                with profile_span('generate_virtual_machine', instance=member.name, provider=instance_copy.get('provider')):
+                    content += self.generate_virtual_machine(instance_copy, first_index + offset, yaml_data, full_yaml_data=effective_yaml_data, zone=zone, resolution=resolution)
+            return content
+
+        # Without credentials there are no lookups to overlap
+        workers = get_render_workers(1) if self.no_credentials else get_render_workers()
+        try:
+            instances_content = "".join(render_in_order(tasks, render_group, self._shown_once, self.instance_costs, workers))
+        finally:
+            shared_resources, self.shared_resources = self.shared_resources, None
+
+        if shared_resources:
+            terraform_content += "# Shared images and SSH keys\n"
+            terraform_content += shared_resources.render()
+            terraform_content += "\n"
+        terraform_content += instances_content
 
         # Generate object storage buckets
         terraform_content += '''
@@ -1457,8 +1406,9 @@ provider "helm" {
 
 '''
         storage = yaml_data.get('storage', [])
-        for bucket in storage:
-            terraform_content += self.generate_storage_bucket(bucket, yaml_data, effective_yaml_data)
+        with profile_span('storage'):
+            for bucket in storage:
+                terraform_content += self.generate_storage_bucket(bucket, yaml_data, effective_yaml_data)
 
         # ROSA clusters use ROSA CLI instead of Terraform providers
 
@@ -1469,7 +1419,8 @@ provider "helm" {
 # ========================================
 
 '''
-        terraform_content += self.openshift_provider.generate_openshift_clusters(yaml_data)
+        with profile_span('openshift_clusters'):
+            terraform_content += self.openshift_provider.generate_openshift_clusters(yaml_data)
 
         # Generate comprehensive outputs for all cloud providers
         terraform_content += '''
@@ -1478,7 +1429,8 @@ provider "helm" {
 # ========================================
 
 '''
-        terraform_content += self.generate_comprehensive_outputs(yaml_data, required_providers)
+        with profile_span('outputs'):
+            terraform_content += self.generate_comprehensive_outputs(yaml_data, required_providers)
 
         return terraform_content
 
@@ -1986,45 +1938,59 @@ output "external_ips" {
 
     def print_provider_output(self, provider, message, indent_level=1):
         """Print provider-specific output with proper formatting."""
+        if not self.reporter.enabled:
+            return
         provider_name = self.format_provider_name_for_display(provider)
-        indent = "  " * indent_level
-        print(f"{indent}{provider_name}: {message}")
+        self.reporter.emit('provider', f"{provider_name}: {message}", indent_level, provider=provider)
 
     def start_provider_section(self, provider):
         """Start a new provider section in output."""
+        if not self.reporter.enabled:
+            return
         provider_name = self.format_provider_name_for_display(provider)
-        print(f"{provider_name}:")
+        self.reporter.emit('section', f"{provider_name}:", 0, provider=provider)
 
     def start_global_section(self):
         """Start the global section for setup operations."""
-        if not getattr(self, 'ansible_mode', False):
-            print()
-            print("[GLOBAL]")
+        self.reporter.emit('section', "\n[GLOBAL]", 0)
 
     def print_global_output(self, message, indent_level=1):
         """Print global output with proper indentation."""
-        if not getattr(self, 'ansible_mode', False):
-            indent = "  " * indent_level
-            print(f"{indent}{message}")
+        self.reporter.emit('global', message, indent_level)
 
     def start_instance_section(self, instance_name, provider):
         """Start a new instance section in the output."""
-        # Check if this is the first instance being processed
-        if not hasattr(self, '_instances_header_printed'):
-            print("\nInstances:")
-            self._instances_header_printed = True
-        
+        if not self.reporter.enabled:
+            return
+        # Only the first instance being processed prints the header
+        self.print_once('instances-header', self.reporter.output('section', "\nInstances:", 0))
+
         # Replace {guid} with actual GUID in instance name
         resolved_instance_name = self.replace_guid_placeholders(instance_name)
-        print(f"[{resolved_instance_name}]")
+        self.reporter.emit('section', f"[{resolved_instance_name}]", 0, instance=resolved_instance_name, provider=provider)
+
+    def print_once(self, key, message, repeat=None):
+        """Print message the first time key is shown in this run, and repeat (if given) after that."""
+        print_once(self._shown_once, key, message, repeat)
+
+    def format_instance_output(self, instance_name, provider, message, indent_level=1):
+        """Return an instance line as output for print_once() (None when output is off)."""
+        if not self.reporter.enabled:
+            return None
+        return self.reporter.output('instance', message, indent_level,
+                                    instance=self.replace_guid_placeholders(instance_name), provider=provider)
 
     def print_instance_output(self, instance_name, provider, message, indent_level=1):
         """Print instance-specific output with proper indentation."""
-        indent = "  " * indent_level
-        print(f"{indent}{message}")
+        if not self.reporter.enabled:
+            return
+        self.reporter.emit('instance', message, indent_level,
+                           instance=self.replace_guid_placeholders(instance_name), provider=provider)
 
     def _print_cost_analysis_for_instance(self, instance, selected_provider):
         """Print cost analysis for cheapest provider selection under instance section."""
+        if not self.reporter.enabled:
+            return
         instance_name = instance.get('name', 'unnamed')
         instance_count = instance.get('count', 1)
         # Get instance-specific exclusions
@@ -2087,6 +2053,8 @@ output "external_ips" {
 
     def _print_gpu_cost_analysis_for_instance(self, instance, selected_provider):
         """Print GPU cost analysis for cheapest GPU provider selection under instance section."""
+        if not self.reporter.enabled:
+            return
         instance_name = instance.get('name', 'unnamed')
         instance_count = instance.get('count', 1)
         gpu_type = instance.get("gpu_type")
@@ -2540,7 +2508,7 @@ ssh_public_key = "ssh-rsa AAAAB3NzaC1yc2EAAAA... your-public-key-here"
             # Get AWS credentials with auto-discovery (skip in no-credentials mode)
             if self.no_credentials:
                 aws_creds = {'available': False}
-                print("  NO-CREDENTIALS MODE: Skipping AWS credential discovery")
+                self.reporter.echo("  NO-CREDENTIALS MODE: Skipping AWS credential discovery")
             else:
                 aws_creds = self.credentials.get_aws_credentials()
             
@@ -2817,26 +2785,31 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         self.validate_provider_setup(full_yaml_data or config)
         
         required_providers = self.detect_required_providers(full_yaml_data or config)
+        self.detected_providers = required_providers
+        self.generated_files = []
 
         # Generate the complete terraform configuration
-        terraform_config = self.generate_complete_terraform(config, required_providers, full_yaml_data)
+        with profile_span('generate_complete_terraform'):
+            terraform_config = self.generate_complete_terraform(config, required_providers, full_yaml_data)
         
         # Write the main.tf file
         main_tf_path = os.path.join(output_dir, 'main.tf')
-        with open(main_tf_path, 'w') as f:
-            f.write(terraform_config)
+        self._write_output_file(main_tf_path, terraform_config)
         
         # Generate and write variables.tf
-        variables_config = self.generate_variables_tf(required_providers, config)
+        with profile_span('generate_variables_tf'):
+            variables_config = self.generate_variables_tf(required_providers, config)
         variables_path = os.path.join(output_dir, 'variables.tf')
-        with open(variables_path, 'w') as f:
-            f.write(variables_config)
+        self._write_output_file(variables_path, variables_config)
         
         # Generate and write terraform.tfvars
-        tfvars_config = self.generate_terraform_tfvars(required_providers, full_yaml_data or config)
+        with profile_span('generate_terraform_tfvars'):
+            tfvars_config = self.generate_terraform_tfvars(required_providers, full_yaml_data or config)
         tfvars_path = os.path.join(output_dir, 'terraform.tfvars')
-        with open(tfvars_path, 'w') as f:
-            f.write(tfvars_config)
+        self._write_output_file(tfvars_path, tfvars_config)
+        
+        # Provider lock file and CLI configuration (shared plugin cache / local mirror)
+        self._write_provider_installation_files(output_dir, required_providers)
             
         # Generate ROSA CLI setup script if ROSA clusters are present AND using CLI deployment method
         if self.openshift_provider._has_rosa_clusters(config):
@@ -2845,49 +2818,76 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             deployment_method = rosa_deployment.get('method', 'terraform')
             
             if deployment_method == 'cli':
-                rosa_script = self.openshift_provider.generate_rosa_cli_script(config)
+                with profile_span('generate_rosa_scripts'):
+                    rosa_script = self.openshift_provider.generate_rosa_cli_script(config)
+                    cleanup_script = self.openshift_provider.generate_rosa_cleanup_script(config)
                 script_path = os.path.join(output_dir, 'rosa-setup.sh')
-                with open(script_path, 'w') as f:
-                    f.write(rosa_script)
-                # Make script executable
-                os.chmod(script_path, 0o755)
+                self._write_output_file(script_path, rosa_script, executable=True)
                 
-                # Generate ROSA cleanup script
-                cleanup_script = self.openshift_provider.generate_rosa_cleanup_script(config)
+                # Write ROSA cleanup script
                 if cleanup_script:
                     cleanup_path = os.path.join(output_dir, 'rosa-cleanup.sh')
-                    with open(cleanup_path, 'w') as f:
-                        f.write(cleanup_script)
-                    # Make script executable
-                    os.chmod(cleanup_path, 0o755)
+                    self._write_output_file(cleanup_path, cleanup_script, executable=True)
                 
                 if self.verbose:
-                    print()
-                    print(f"Generated files:")
-                    print(f"  - {main_tf_path}")
-                    print(f"  - {variables_path}")
-                    print(f"  - {tfvars_path}")
-                    print(f"  - {script_path}")
+                    self.reporter.echo()
+                    self.reporter.echo(f"Generated files:")
+                    self.reporter.echo(f"  - {main_tf_path}")
+                    self.reporter.echo(f"  - {variables_path}")
+                    self.reporter.echo(f"  - {tfvars_path}")
+                    self.reporter.echo(f"  - {script_path}")
                     if cleanup_script:
-                        print(f"  - {cleanup_path}")
+                        self.reporter.echo(f"  - {cleanup_path}")
             else:
                 # Terraform deployment method - no scripts generated
                 if self.verbose:
-                    print()
-                    print(f"Generated files:")
-                    print(f"  - {main_tf_path}")
-                    print(f"  - {variables_path}")
-                    print(f"  - {tfvars_path}")
+                    self.reporter.echo()
+                    self.reporter.echo(f"Generated files:")
+                    self.reporter.echo(f"  - {main_tf_path}")
+                    self.reporter.echo(f"  - {variables_path}")
+                    self.reporter.echo(f"  - {tfvars_path}")
         else:
             # No ROSA clusters
             if self.verbose:
-                print()
-                print(f"Generated files:")
-                print(f"  - {main_tf_path}")
-                print(f"  - {variables_path}")
-                print(f"  - {tfvars_path}")
-
-
+                self.reporter.echo()
+                self.reporter.echo(f"Generated files:")
+                self.reporter.echo(f"  - {main_tf_path}")
+                self.reporter.echo(f"  - {variables_path}")
+                self.reporter.echo(f"  - {tfvars_path}")
+
+
+
+    def _write_provider_installation_files(self, output_dir, required_providers):
+        """Write the Terraform CLI configuration and, for prefetched providers, the lock file."""
+        mirror_locks = read_mirror_lock()
+        lock_content = generate_lock_file(required_providers, mirror_locks)
+        if lock_content:
+            lock_path = os.path.join(output_dir, LOCK_FILE)
+            existing = ''
+            if os.path.exists(lock_path):
+                with open(lock_path) as f:
+                    existing = f.read()
+            # Never replace selections that terraform init already recorded
+            if not existing or 'Generated by YamlForge' in existing:
+                self._write_output_file(lock_path, lock_content)
+            elif self.verbose:
+                self.reporter.echo(f"Keeping existing {lock_path}")
+        self._write_output_file(os.path.join(output_dir, CLI_CONFIG_FILE),
+                                generate_cli_config(required_providers, mirror_locks))
+        try:
+            # Terraform only uses a plugin cache directory that already exists
+            os.makedirs(get_plugin_cache_dir(), exist_ok=True)
+        except OSError:
+            pass
+
+    def _write_output_file(self, path, content, executable=False):
+        """Write a generated file, optionally marking it executable."""
+        with profile_span('write_file', 'io', path=os.path.basename(path), bytes=len(content)):
+            with open(path, 'w') as f:
+                f.write(content)
+            if executable:
+                os.chmod(path, 0o755)
+        self.generated_files.append(path)
 
     def clean_name(self, name):
         """Clean a name for use as a Terraform resource identifier."""
@@ -3475,7 +3475,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         cheapest_provider = min(provider_costs.keys(), key=lambda p: provider_costs[p]['cost'])
         
         # Only print cost analysis if not suppressed
-        if not suppress_output:
+        if not suppress_output and self.reporter.enabled:
             instance_name = instance.get('name', 'unnamed')
             # Get instance-specific exclusions
             instance_exclusions = instance.get('exclude_providers', [])
@@ -3483,7 +3483,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             self.log_provider_exclusions("cheapest provider selection", suppress_output, instance_exclusions, True)
             # Resolve GUID in instance name before showing cost analysis
             resolved_instance_name = self.replace_guid_placeholders(instance_name)
-            print(f"   Cost analysis for instance '{resolved_instance_name}':")
+            self.reporter.emit('cost_table', f"   Cost analysis for instance '{resolved_instance_name}':", 0, instance=resolved_instance_name)
             for provider, info in sorted(provider_costs.items(), key=lambda x: x[1]['cost']):
                 marker = " ← SELECTED" if provider == cheapest_provider else ""
                 vcpus = info.get('vcpus', 'N/A')
@@ -3496,9 +3496,9 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 
                 if gpu_count > 0:
                     gpu_info = f", {gpu_count}x {detected_gpu_type}" if detected_gpu_type else f", {gpu_count} GPU(s)"
-                    print(f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB{gpu_info}){marker}")
+                    self.reporter.emit('cost_table', f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB{gpu_info}){marker}", 0, instance=resolved_instance_name, provider=provider)
                 else:
-                    print(f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB){marker}")
+                    self.reporter.emit('cost_table', f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB){marker}", 0, instance=resolved_instance_name, provider=provider)
         
         return cheapest_provider
     
@@ -3524,7 +3524,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         if not provider_costs:
             # Fallback to AWS if no cost information available
             if not suppress_output:
-                print(f"Warning: No GPU cost information found for {analysis_type}, defaulting to AWS")
+                self.reporter.echo(f"Warning: No GPU cost information found for {analysis_type}, defaulting to AWS")
             return 'aws'
         
         # Apply discounts to all provider costs before finding cheapest
@@ -3537,11 +3537,11 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         cheapest_provider = min(provider_costs.keys(), key=lambda p: provider_costs[p]['cost'])
         
         # Only print cost analysis if not suppressed
-        if not suppress_output:
+        if not suppress_output and self.reporter.enabled:
             instance_name = instance.get('name', 'unnamed')
             # Log provider exclusions if any (always suppress since they're shown under instance name)
             self.log_provider_exclusions("cheapest GPU provider selection", suppress_output, instance_exclusions, True)
-            print(f"   GPU-optimized cost analysis for instance '{instance_name}':")
+            self.reporter.emit('cost_table', f"   GPU-optimized cost analysis for instance '{instance_name}':", 0, instance=instance_name)
             for provider, info in sorted(provider_costs.items(), key=lambda x: x[1]['cost']):
                 marker = " ← SELECTED" if provider == cheapest_provider else ""
                 vcpus = info.get('vcpus', 'N/A')
@@ -3553,7 +3553,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 cost_display = self._format_cost_with_discount(provider, info.get('original_cost'), info['cost'])
                 
                 gpu_info = f", {gpu_count}x {detected_gpu_type}" if detected_gpu_type else f", {gpu_count} GPU(s)"
-                print(f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB{gpu_info}){marker}")
+                self.reporter.emit('cost_table', f"     {provider}: {cost_display} ({info['instance_type']}, {vcpus} vCPU, {memory_gb}GB{gpu_info}){marker}", 0, instance=instance_name, provider=provider)
         
         return cheapest_provider
 
@@ -3564,7 +3564,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         # Check if storage costs are available
         if not self.storage_costs or not self.storage_costs.get('storage_costs'):
             if not suppress_output:
-                print(f"   Storage analysis for bucket '{bucket_name}': No cost data available, defaulting to AWS")
+                self.reporter.echo(f"   Storage analysis for bucket '{bucket_name}': No cost data available, defaulting to AWS")
             return 'aws'
         
         # Get available providers (excluding those configured to be excluded from cheapest)
@@ -3609,19 +3609,19 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         
         if not provider_costs:
             if not suppress_output:
-                print(f"   Storage analysis for bucket '{bucket_name}': No providers with cost data, defaulting to AWS")
+                self.reporter.echo(f"   Storage analysis for bucket '{bucket_name}': No providers with cost data, defaulting to AWS")
             return 'aws'
         
         # Find the cheapest provider
         cheapest_provider = min(provider_costs.keys(), key=lambda p: provider_costs[p])
         
-        if not suppress_output:
-            print(f"   Storage cost analysis for bucket '{bucket_name}':")
+        if not suppress_output and self.reporter.enabled:
+            self.reporter.emit('cost_table', f"   Storage cost analysis for bucket '{bucket_name}':", 0, bucket=bucket_name)
             # Sort providers by cost for display
             sorted_providers = sorted(provider_costs.items(), key=lambda x: x[1])
             for provider, cost in sorted_providers:
                 marker = " ← cheapest" if provider == cheapest_provider else ""
-                print(f"     {provider}: ${cost:.2f}/month{marker}")
+                self.reporter.emit('cost_table', f"     {provider}: ${cost:.2f}/month{marker}", 0, bucket=bucket_name, provider=provider)
         
         return cheapest_provider
     
@@ -3659,6 +3659,10 @@ no_credentials_mode = {str(self.no_credentials).lower()}
     
     def find_cheapest_gpu_by_specs(self, gpu_type=None, instance_exclusions=None):
         """Find cheapest GPU instances across all providers, ignoring CPU/memory constraints."""
+        cache_key = ('gpu', gpu_type, tuple(instance_exclusions or ()))
+        if cache_key in self._cost_scan_cache:
+            return self._copy_provider_costs(self._cost_scan_cache[cache_key])
+
         provider_costs = {}
         
         # Get available providers (excluding those configured to be excluded from cheapest)
@@ -3731,8 +3735,14 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             if best_option:
                 provider_costs[provider] = best_option
         
+        self._cost_scan_cache[cache_key] = self._copy_provider_costs(provider_costs)
         return provider_costs
 
+    @staticmethod
+    def _copy_provider_costs(provider_costs):
+        """Copy a cost scan result; callers apply discounts to the entries in place."""
+        return {provider: dict(info) for provider, info in provider_costs.items()}
+
     def get_cheapest_gpu_instance_type(self, instance, provider):
         """Get the cheapest GPU instance type for the selected provider."""
         gpu_type = instance.get("gpu_type")
@@ -3816,6 +3826,10 @@ no_credentials_mode = {str(self.no_credentials).lower()}
     
     def find_cheapest_by_specs(self, required_cores, required_memory_mb, required_gpus=None, gpu_type=None, instance_exclusions=None):
         """Find cheapest provider for specific CPU/memory/GPU requirements."""
+        cache_key = ('specs', required_cores, required_memory_mb, required_gpus, gpu_type, tuple(instance_exclusions or ()))
+        if cache_key in self._cost_scan_cache:
+            return self._copy_provider_costs(self._cost_scan_cache[cache_key])
+
         provider_costs = {}
         required_memory_gb = required_memory_mb / 1024
         
@@ -3905,6 +3919,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             if best_option:
                 provider_costs[provider] = best_option
         
+        self._cost_scan_cache[cache_key] = self._copy_provider_costs(provider_costs)
         return provider_costs
     
     def gpu_type_matches(self, instance_gpu_type, required_gpu_type):
@@ -4188,23 +4203,10 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                     instance_type = selected_option['instance_type']
                     # Get and display region information for cheapest provider
                     region = instance.get('region') or instance.get('location', 'unspecified')
-                    mapped_region = self.locations.get(region, {}).get(provider, region) if region != 'unspecified' else 'unspecified'
-                    if region == mapped_region:
-                        self.print_instance_output(instance_name, provider, f"Region: {region}")
-                    else:
-                        self.print_instance_output(instance_name, provider, f"Region: {region} ({mapped_region})")
-                    # Show flavor mapping format: original_flavor (resolved_instance_type)
-                    if flavor and flavor != instance_type:
-                        self.print_instance_output(instance_name, provider, f"Flavor: {flavor} ({instance_type})")
-                    else:
-                        self.print_instance_output(instance_name, provider, f"Flavor: {instance_type}")
-                    # Apply discount and format display
-                    original_cost = hourly_cost
                     discounted_cost = self.apply_discount(hourly_cost, provider)
-                    cost_display = self._format_cost_with_discount(provider, original_cost, discounted_cost)
-                    self.print_instance_output(instance_name, provider, f"Hourly Cost: {cost_display}")
+                    self._report_instance_placement(instance_name, provider, region, flavor, instance_type, (hourly_cost, discounted_cost))
                     # Track the discounted cost for total calculation
-                    self.instance_costs.append({
+                    record_cost(self.instance_costs, {
                         'instance_name': instance_name,
                         'provider': provider,
                         'cost': discounted_cost
@@ -4231,7 +4233,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                     self.print_instance_output(instance_name, provider, f"Provider: {provider}")
                     self.print_instance_output(instance_name, provider, f"Instance specs: {cores} vCPU, {memory}MB RAM")
                     self.print_instance_output(instance_name, provider, "Hourly Cost: $0.001 (minimal CNV cost)")
-                    self.instance_costs.append({
+                    record_cost(self.instance_costs, {
                         'instance_name': instance_name,
                         'provider': provider,
                         'cost': 0.001
@@ -4253,7 +4255,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 self.print_instance_output(instance_name, provider, f"Instance flavor: {flavor_name} ({vcpus} vCPU, {memory_gb}GB RAM)")
                 self.print_instance_output(instance_name, provider, f"Hourly Cost: ${hourly_cost:.4f}")
                 
-                self.instance_costs.append({
+                record_cost(self.instance_costs, {
                     'instance_name': instance_name,
                     'provider': provider,
                     'cost': hourly_cost
@@ -4263,7 +4265,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 self.print_instance_output(instance_name, provider, f"Provider: {provider}")
                 self.print_instance_output(instance_name, provider, f"Instance flavor: {actual_flavor}")
                 self.print_instance_output(instance_name, provider, "Hourly Cost: $0.001 (minimal CNV cost)")
-                self.instance_costs.append({
+                record_cost(self.instance_costs, {
                     'instance_name': instance_name,
                     'provider': provider,
                     'cost': 0.001
@@ -4279,43 +4281,37 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         
         if cost_info and cost_info.get('cost') is not None:
             hourly_cost = cost_info['cost']
-            # Get and display region information
-            region = instance.get('region', 'unspecified')
-            mapped_region = self.locations.get(region, {}).get(provider, region) if region != 'unspecified' else 'unspecified'
-            if region == mapped_region:
-                self.print_instance_output(instance_name, provider, f"Region: {region}")
-            else:
-                self.print_instance_output(instance_name, provider, f"Region: {region} ({mapped_region})")
-            # Show flavor mapping format: original_flavor (resolved_instance_type)
-            if flavor and flavor != instance_type:
-                self.print_instance_output(instance_name, provider, f"Flavor: {flavor} ({instance_type})")
-            else:
-                self.print_instance_output(instance_name, provider, f"Flavor: {instance_type}")
-            # Apply discount and format display
-            original_cost = hourly_cost
             discounted_cost = self.apply_discount(hourly_cost, provider)
-            cost_display = self._format_cost_with_discount(provider, original_cost, discounted_cost)
-            self.print_instance_output(instance_name, provider, f"Hourly Cost: {cost_display}")
+            self._report_instance_placement(instance_name, provider, instance.get('region', 'unspecified'), flavor, instance_type, (hourly_cost, discounted_cost))
             # Track the discounted cost for total calculation
-            self.instance_costs.append({
+            record_cost(self.instance_costs, {
                 'instance_name': instance_name,
                 'provider': provider,
                 'cost': discounted_cost
             })
         else:
-            # Get and display region information even when cost is not available
-            region = instance.get('region', 'unspecified')
-            mapped_region = self.locations.get(region, {}).get(provider, region) if region != 'unspecified' else 'unspecified'
-            if region == mapped_region:
-                self.print_instance_output(instance_name, provider, f"Region: {region}")
-            else:
-                self.print_instance_output(instance_name, provider, f"Region: {region} ({mapped_region})")
-            # Show flavor mapping format: original_flavor (resolved_instance_type)
-            if flavor and flavor != instance_type:
-                self.print_instance_output(instance_name, provider, f"Flavor: {flavor} ({instance_type})")
-            else:
-                self.print_instance_output(instance_name, provider, f"Flavor: {instance_type}")
+            # Display region and flavor even when cost is not available
+            self._report_instance_placement(instance_name, provider, instance.get('region', 'unspecified'), flavor, instance_type, None)
+
+    def _report_instance_placement(self, instance_name, provider, region, flavor, instance_type, cost):
+        """Print the Region, Flavor and Hourly Cost lines; cost is (original, discounted) or None."""
+        if not self.reporter.enabled:
+            return
+        mapped_region = self.locations.get(region, {}).get(provider, region) if region != 'unspecified' else 'unspecified'
+        if region == mapped_region:
+            self.print_instance_output(instance_name, provider, f"Region: {region}")
+        else:
+            self.print_instance_output(instance_name, provider, f"Region: {region} ({mapped_region})")
+        # Show flavor mapping format: original_flavor (resolved_instance_type)
+        if flavor and flavor != instance_type:
+            self.print_instance_output(instance_name, provider, f"Flavor: {flavor} ({instance_type})")
+        else:
+            self.print_instance_output(instance_name, provider, f"Flavor: {instance_type}")
+        if cost is None:
             self.print_instance_output(instance_name, provider, "Hourly Cost: Cost information not available")
+        else:
+            cost_display = self._format_cost_with_discount(provider, *cost)
+            self.print_instance_output(instance_name, provider, f"Hourly Cost: {cost_display}")
 
     def calculate_openshift_cluster_cost(self, cluster, cluster_type):
         """Calculate the hourly cost for an OpenShift cluster."""
@@ -4431,7 +4427,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
     def display_openshift_cluster_cost(self, cluster_name, cluster_type, hourly_cost):
         """Display the hourly cost for an OpenShift cluster."""
         if hourly_cost is not None:
-            print(f"  Cluster hourly cost: ${hourly_cost:.4f}")
+            self.reporter.echo(f"  Cluster hourly cost: ${hourly_cost:.4f}")
             # Track the cost for total calculation
             self.openshift_costs.append({
                 'cluster_name': cluster_name,
@@ -4439,7 +4435,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 'cost': hourly_cost
             })
         else:
-            print(f"  Cluster hourly cost: Cost information not available")
+            self.reporter.echo(f"  Cluster hourly cost: Cost information not available")
 
     def get_openshift_cluster_cost_string(self, cluster_name, cluster_type, hourly_cost):
         """Get the hourly cost string for an OpenShift cluster."""
@@ -4469,7 +4465,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             total_cost += openshift_total
         
         if total_cost > 0:
-            print(f"\nTotal hourly cost for all instances and clusters: ${total_cost:.4f}")
+            self.reporter.echo(f"\nTotal hourly cost for all instances and clusters: ${total_cost:.4f}")
 
     def get_total_hourly_cost_string(self):
         """Get the total hourly cost string for all instances and OpenShift clusters."""
@@ -4491,8 +4487,22 @@ no_credentials_mode = {str(self.no_credentials).lower()}
 
 
     # Placeholder methods for provider delegation
-    def generate_virtual_machine(self, instance, index, yaml_data, available_subnets=None, full_yaml_data=None, zone=None):
-        """Generate virtual machine configuration using provider modules."""
+    @staticmethod
+    def _shared_resolution(resolution, key, compute):
+        """Return resolution[key], computing it on first use; resolution=None disables sharing."""
+        if resolution is None:
+            return compute()
+        if key not in resolution:
+            resolution[key] = compute()
+        return resolution[key]
+
+    def generate_virtual_machine(self, instance, index, yaml_data, available_subnets=None, full_yaml_data=None, zone=None, resolution=None):
+        """Generate virtual machine configuration using provider modules.
+
+        resolution is a dict shared by the members of one `count` definition;
+        the provider, instance type and cheapest selection resolved for the
+        first member are stored in it and reused for the others.
+        """
         provider = instance.get("provider")
         if not provider:
             instance_name = instance.get("name", "unknown")
@@ -4510,23 +4520,23 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         if provider == 'cheapest':
             # Convert generic flavor to cores/memory if needed
             instance = self._convert_flavor_to_specs_for_cheapest(instance)
-            provider = self.find_cheapest_provider(instance, suppress_output=True)
+            provider = self._shared_resolution(resolution, 'provider', lambda: self.find_cheapest_provider(instance, suppress_output=True))
             # Update the instance with the selected provider for consistency
             instance = instance.copy()
             instance['provider'] = provider
             
             # Get the selected instance type from cheapest provider analysis
-            selected_instance_type = self.get_cheapest_instance_type(instance, provider)
+            selected_instance_type = self._shared_resolution(resolution, 'selected_instance_type', lambda: self.get_cheapest_instance_type(instance, provider))
         elif provider == 'cheapest-gpu':
             # Convert generic flavor to cores/memory if needed
             instance = self._convert_flavor_to_specs_for_cheapest(instance)
-            provider = self.find_cheapest_gpu_provider(instance, suppress_output=True)
+            provider = self._shared_resolution(resolution, 'provider', lambda: self.find_cheapest_gpu_provider(instance, suppress_output=True))
             # Update the instance with the selected provider for consistency
             instance = instance.copy()
             instance['provider'] = provider
             
             # Get the selected instance type from cheapest GPU provider analysis
-            selected_instance_type = self.get_cheapest_gpu_instance_type(instance, provider)
+            selected_instance_type = self._shared_resolution(resolution, 'selected_instance_type', lambda: self.get_cheapest_gpu_instance_type(instance, provider))
         
         # Start instance section with the resolved provider
         self.start_instance_section(instance_name, provider)
@@ -4534,8 +4544,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         # Clear region cache to ensure instance-specific messages are shown
         # This allows resolve_instance_region to be called again during instance processing
         cache_key = f"{instance_name}_{provider}_{instance.get('region', '')}_{instance.get('location', '')}"
-        if cache_key in self._region_cache:
-            del self._region_cache[cache_key]
+        self._region_cache.pop(cache_key, None)
         
         # Call resolve_instance_region to show instance-specific messages
         self.resolve_instance_region(instance, provider)
@@ -4572,7 +4581,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         if provider == 'cnv':
             instance_type = None  # CNV doesn't use instance types
         else:
-            instance_type = selected_instance_type or self.resolve_instance_type(provider, flavor, instance)
+            instance_type = selected_instance_type or self._shared_resolution(resolution, 'instance_type', lambda: self.resolve_instance_type(provider, flavor, instance))
 
         # Calculate and display hourly cost
         self._display_instance_hourly_cost(instance_name, provider, instance_type, flavor, original_provider, instance)
@@ -4727,15 +4736,15 @@ no_credentials_mode = {str(self.no_credentials).lower()}
 
     def start_bucket_section(self, bucket_name, provider):
         """Start a new bucket section in the output."""
-        print()
+        if not self.reporter.enabled:
+            return
         # Replace {guid} with actual GUID in bucket name
         resolved_bucket_name = self.replace_guid_placeholders(bucket_name)
-        print(f"[{resolved_bucket_name}]")
+        self.reporter.emit('section', f"\n[{resolved_bucket_name}]", 0, bucket=resolved_bucket_name, provider=provider)
 
     def print_bucket_output(self, bucket_name, provider, message, indent_level=1):
         """Print bucket-specific output with proper indentation."""
-        indent = "  " * indent_level
-        print(f"{indent}{message}")
+        self.reporter.emit('bucket', message, indent_level, bucket=bucket_name, provider=provider)
 
     def generate_native_security_group_rule(self, rule, provider):
         """Generate native security group rule data for specified provider."""
@@ -4935,6 +4944,8 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             security_groups = security_groups_raw
             
         sg_terraform = ""
+        # Compacted rules per security group, shared by every region it is created in
+        compacted_rules = {}
 
         for region_key, region_data in regional_analysis.items():
             provider = region_data['provider']
@@ -4996,8 +5007,9 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                         instance['security_groups'].append(auto_outbound_sg_name)
 
             for sg_name in region_data['security_groups']:
-                sg_config = security_groups[sg_name]
-                rules = sg_config.get('rules', [])
+                rules = compacted_rules.get(sg_name)
+                if rules is None:
+                    rules = compacted_rules[sg_name] = self.compact_security_group(sg_name, security_groups[sg_name], provider)
 
                 # Generate region-specific security group
                 if provider == 'aws':
@@ -5017,6 +5029,24 @@ no_credentials_mode = {str(self.no_credentials).lower()}
 
         return sg_terraform
 
+    def compact_security_group(self, sg_name, sg_config, provider):
+        """Return the security group's rules compacted to an equivalent minimal set when 'compact: true'.
+
+        Off by default: rule resources are numbered by position, so compaction
+        renames them and Terraform would replace rules in existing deployments.
+        """
+        rules = sg_config.get('rules', [])
+        if not sg_config.get('compact', False):
+            return rules
+        compacted = compact_security_group_rules(rules)
+        if len(compacted) < len(rules):
+            self.print_provider_output(
+                provider,
+                f"Security group '{sg_name}': compacted {len(rules)} rules to {len(compacted)} "
+                f"({len(rules) - len(compacted)} fewer)"
+            )
+        return compacted
+
     def analyze_regional_instances(self, config):
         """Analyze which regions have instances deployed and need networking."""
         regional_instances = {}
@@ -5045,6 +5075,22 @@ no_credentials_mode = {str(self.no_credentials).lower()}
 
         return regional_instances
 
+    def collect_gcp_images(self, config):
+        """Collect the images GCP instances and HyperShift worker nodes use."""
+        images = {instance.get('image') for instance in config.get('instances', [])
+                  if instance.get('provider') == 'gcp' and instance.get('image')}
+        hypershift = self.openshift_provider.hypershift_provider
+        for cluster in config.get('openshift_clusters', []):
+            if cluster.get('type') == 'hypershift' and cluster.get('provider') == 'gcp':
+                images.add(hypershift.get_coreos_image_for_openshift_version(cluster.get('version', '4.14.15')))
+        return images
+
+    def collect_oci_images(self, config):
+        """Collect the (image, region) pairs OCI instances use (regions are resolved on demand)."""
+        return ((instance['image'], self._resolve_instance_region_silent(instance, 'oci'))
+                for instance in config.get('instances', [])
+                if instance.get('provider') == 'oci' and instance.get('image'))
+
     def collect_ibm_vpc_zones(self, config):
         """Collect zone information for IBM VPC instances to ensure consistency."""
         instances = config.get('instances', [])
@@ -5086,14 +5132,14 @@ no_credentials_mode = {str(self.no_credentials).lower()}
             ibm_vpc_zones = self.collect_ibm_vpc_zones(config)
 
         if hasattr(self, 'verbose') and self.verbose:
-            print(f"DEBUG: regional_analysis = {regional_analysis}")
-            print(f"DEBUG: ibm_vpc_zones = {ibm_vpc_zones}")
+            self.reporter.echo(f"DEBUG: regional_analysis = {regional_analysis}")
+            self.reporter.echo(f"DEBUG: ibm_vpc_zones = {ibm_vpc_zones}")
 
         for region_key, region_data in regional_analysis.items():
             provider = region_data['provider']
             region = region_data.get('region', region_key)  # Use actual region, fallback to region_key
             if hasattr(self, 'verbose') and self.verbose:
-                print(f"DEBUG: Processing region_key={region_key}, region={region}, provider={provider}")
+                self.reporter.echo(f"DEBUG: Processing region_key={region_key}, region={region}, provider={provider}")
             # Get deployment name from cloud_workspace
             cloud_workspace = config.get('cloud_workspace', {})
             workspace_name = cloud_workspace.get('name', 'yamlforge-deployment')
@@ -5116,7 +5162,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
                 networking_terraform += self.gcp_provider.generate_gcp_networking(deployment_name, deployment_config, region)
             elif provider == 'ibm_vpc':
                 if hasattr(self, 'verbose') and self.verbose:
-                    print(f"DEBUG: About to call IBM VPC networking for region={region}")
+                    self.reporter.echo(f"DEBUG: About to call IBM VPC networking for region={region}")
                 # Pass the selected zone for this region
                 zone = ibm_vpc_zones.get(region)
                 networking_terraform += self.ibm_vpc_provider.generate_ibm_vpc_networking(deployment_name, deployment_config, region, config, zone)
@@ -5233,9 +5279,20 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         """Determine default owner key for image discovery."""
         return "redhat_public"
 
-    def generate_ami_data_source(self, image_key, instance_name, architecture):
-        """Generate AWS AMI data source."""
-        clean_name = self.clean_name(instance_name)
+    def shared_resource(self, key, factory):
+        """Return (hcl, reference) for a block shared by instances.
+
+        While instances are generated the block is registered once per key and
+        emitted in the shared section, so hcl is empty; otherwise factory()'s
+        block is returned for inline use.
+        """
+        if self.shared_resources is None:
+            return factory()
+        return "", self.shared_resources.get_or_create(key, factory)
+
+    def generate_ami_data_source(self, image_key, data_source_name, architecture, provider_reference=""):
+        """Generate AWS AMI data source, using the regional provider reference when given."""
+        clean_name = data_source_name
         
         # Handle different image types
         if "FEDORA" in image_key.upper():
@@ -5265,7 +5322,7 @@ no_credentials_mode = {str(self.no_credentials).lower()}
         # Generate the data source
         data_source = f'''
 # AWS AMI Data Source for {image_key}
-data "aws_ami" "{clean_name}_ami" {{
+data "aws_ami" "{clean_name}_ami" {{{provider_reference}
   most_recent = true
   owners      = ["{owner}"]
 
@@ -7,7 +7,8 @@ All credential configuration moved to environment variables - no file loading.
 
 import os
 from pathlib import Path
-from ..utils import find_yamlforge_file
+from .catalog import load_catalog_file
+from .profiling import api_span
 
 
 class CredentialsManager:
@@ -84,7 +85,8 @@ class CredentialsManager:
                 
             # Get caller identity using STS
             sts = session.client('sts')
-            identity = sts.get_caller_identity()
+            with api_span('aws', 'sts.get_caller_identity'):
+                identity = sts.get_caller_identity()
             
             account_id = identity['Account']
             user_arn = identity['Arn']
@@ -152,6 +154,7 @@ class CredentialsManager:
         region = os.getenv('OCI_REGION', 'us-ashburn-1')
         private_key = os.getenv('OCI_PRIVATE_KEY')
         private_key_path = os.getenv('OCI_PRIVATE_KEY_PATH') or os.getenv('TF_VAR_private_key_path')
+        compartment_id = os.getenv('OCI_COMPARTMENT_ID') or os.getenv('TF_VAR_oci_compartment_id')
         
         if not all([user_ocid, fingerprint, tenancy_ocid]):
             return {'available': False}
@@ -167,6 +170,7 @@ class CredentialsManager:
             'region': region,
             'private_key': private_key,
             'private_key_path': private_key_path,
+            'compartment_id': compartment_id,
             'available': True
         }
 
@@ -246,6 +250,7 @@ class CredentialsManager:
             'key_file': oci_creds.get('private_key_path'),
             'fingerprint': oci_creds.get('fingerprint'),
             'tenancy_ocid': oci_creds.get('tenancy_ocid'),
+            'compartment_id': oci_creds.get('compartment_id'),
             'region': oci_creds.get('region')
         }
 
@@ -296,38 +301,34 @@ class CredentialsManager:
         
         # Check core defaults configuration for auto-detection settings
         try:
-            import yaml
-            core_defaults_path = find_yamlforge_file('defaults/core.yaml')
-            with open(core_defaults_path, 'r') as f:
-                core_config = yaml.safe_load(f) or {}
-                
-                # Check for configured default key in core config
-                default_key = core_config.get('security', {}).get('default_ssh_public_key', '')
-                if default_key and default_key.strip():
-                    return {
-                        'public_key': default_key.strip(),
-                        'source': 'defaults/core.yaml configuration',
-                        'available': True
-                    }
-                    
-                # Check if auto-detection is enabled
-                auto_detect_enabled = core_config.get('security', {}).get('auto_detect_ssh_keys', False)
-                if auto_detect_enabled:
-                    ssh_dir = Path.home() / '.ssh'
-                    for key_file in ['id_ed25519.pub', 'id_rsa.pub']:
-                        key_path = ssh_dir / key_file
-                        if key_path.exists():
-                            try:
-                                with open(key_path, 'r') as f:
-                                    ssh_key = f.read().strip()
-                                    if ssh_key:
-                                        return {
-                                            'public_key': ssh_key,
-                                            'source': f'Auto-detected from {key_path}',
-                                            'available': True
-                                        }
-                            except Exception:
-                                continue
+            core_config = load_catalog_file('defaults/core.yaml') or {}
+            # Check for configured default key in core config
+            default_key = core_config.get('security', {}).get('default_ssh_public_key', '')
+            if default_key and default_key.strip():
+                return {
+                    'public_key': default_key.strip(),
+                    'source': 'defaults/core.yaml configuration',
+                    'available': True
+                }
+
+            # Check if auto-detection is enabled
+            auto_detect_enabled = core_config.get('security', {}).get('auto_detect_ssh_keys', False)
+            if auto_detect_enabled:
+                ssh_dir = Path.home() / '.ssh'
+                for key_file in ['id_ed25519.pub', 'id_rsa.pub']:
+                    key_path = ssh_dir / key_file
+                    if key_path.exists():
+                        try:
+                            with open(key_path, 'r') as f:
+                                ssh_key = f.read().strip()
+                                if ssh_key:
+                                    return {
+                                        'public_key': ssh_key,
+                                        'source': f'Auto-detected from {key_path}',
+                                        'available': True
+                                    }
+                        except Exception:
+                            continue
         except Exception:
             pass  # Silently continue
         
@@ -0,0 +1,78 @@
+"""
+Persistent discovery cache for yamlforge
+
+Stores cloud API discovery results (image catalogs and similar listings) on disk
+with a time-to-live, so repeated runs do not re-list the same resources.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_TTL = 86400  # 24 hours
+
+
+def get_cache_dir() -> Path:
+    """Return the yamlforge cache directory (YAMLFORGE_CACHE_DIR or ~/.cache/yamlforge)."""
+    cache_dir = os.environ.get('YAMLFORGE_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(xdg_cache) / 'yamlforge'
+
+
+class DiscoveryCache:
+    """JSON file cache with a per-namespace time-to-live.
+
+    Entries live under <cache dir>/<namespace>/<sha256 of key>.json. Setting
+    YAMLFORGE_NO_CACHE disables reads and writes; YAMLFORGE_CACHE_TTL overrides
+    the default TTL in seconds. Cache failures never break generation, they
+    only cause a fresh API call.
+    """
+
+    def __init__(self, namespace: str, ttl: Optional[int] = None):
+        self.directory = get_cache_dir() / namespace
+        self.ttl = ttl if ttl is not None else int(os.environ.get('YAMLFORGE_CACHE_TTL', DEFAULT_CACHE_TTL))
+        self.enabled = os.environ.get('YAMLFORGE_NO_CACHE', '').lower() not in ['true', '1', 'yes']
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or older than the TTL."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key or time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value for key."""
+        if not self.enabled:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent runs never read a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=str(self.directory), suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'key': key, 'timestamp': time.time(), 'value': value}, f)
+            os.replace(temp_path, self._path(key))
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
@@ -0,0 +1,91 @@
+"""
+Lazy expansion of instance `count` definitions for yamlforge
+
+A definition with `count: N` is resolved once (GUID substitution and the
+numbered-name split) and its members are produced on demand as small records
+that share the definition instead of N full copies of it.
+"""
+
+import re
+from typing import Callable, Iterator, List, Optional
+
+
+_NUMBERED_NAME = re.compile(r'(.+?)(\d+)$')
+
+
+class InstanceMember:
+    """One instance of a definition: its generated name and index within the count."""
+
+    __slots__ = ('group', 'name', 'index')
+
+    def __init__(self, group, name, index):
+        self.group = group
+        self.name = name
+        self.index = index
+
+    @property
+    def template(self) -> dict:
+        return self.group.template
+
+    @property
+    def is_counted(self) -> bool:
+        return self.group.count > 1
+
+    def to_dict(self) -> dict:
+        """Return a standalone instance dict for this member (a shallow copy of the definition)."""
+        instance = self.group.template.copy()
+        if self.group.count > 1:
+            instance['name'] = self.name
+        return instance
+
+
+class InstanceGroup:
+    """All members of one instance definition, with member naming resolved up front.
+
+    Members of a counted definition are named by incrementing a trailing
+    number while keeping its padding (web01 -> web01, web02, ...), or by
+    appending -1, -2, ... when the name has no trailing number.
+    """
+
+    __slots__ = ('template', 'count', 'original_name', '_base_name', '_base_number', '_padding_width')
+
+    def __init__(self, template: dict, resolve_guid: Optional[Callable[[], str]] = None):
+        self.template = template
+        self.count = template.get('count', 1)
+        self.original_name = template.get('name')
+        self._base_name = None
+        self._base_number = None
+        self._padding_width = 0
+
+        if self.count > 1:
+            original_name = self.original_name
+            # Resolve GUID first before applying count naming logic
+            if '{guid}' in original_name and resolve_guid:
+                original_name = original_name.replace('{guid}', resolve_guid())
+            self.original_name = original_name
+
+            match = _NUMBERED_NAME.search(original_name)
+            if match:
+                self._base_name = match.group(1)
+                self._base_number = int(match.group(2))
+                self._padding_width = len(match.group(2))
+
+    def member_name(self, index: int) -> str:
+        if self.count <= 1:
+            return self.original_name
+        if self._base_number is not None:
+            return f"{self._base_name}{self._base_number + index:0{self._padding_width}d}"
+        return f"{self.original_name}-{index + 1}"
+
+    def __len__(self) -> int:
+        return max(self.count, 0)
+
+    def __iter__(self) -> Iterator[InstanceMember]:
+        for index in range(len(self)):
+            yield InstanceMember(self, self.member_name(index), index)
+
+
+def group_instances(instances: List[dict], resolve_guid: Optional[Callable[[], str]] = None) -> Iterator[InstanceGroup]:
+    """Yield one InstanceGroup per instance definition without copying any of them."""
+    for instance in instances:
+        yield InstanceGroup(instance, resolve_guid)
@@ -0,0 +1,134 @@
+"""
+Concurrent Terraform deployment for yamlforge --auto-deploy
+
+Runs terraform init/plan/apply for each provider-partitioned workspace (see
+workspaces.py) in its own thread, sharing one provider plugin cache and
+streaming every line of output with a [workspace] prefix. ROSA cluster
+creation starts as soon as the workspace holding the AWS resources has been
+applied instead of waiting for every cloud.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .profiling import profile_span
+from .terraform_providers import cli_config_env, get_plugin_cache_dir
+from .workspaces import Workspace
+
+
+# Workspaces that configure resources inside clusters rather than in a cloud
+CLUSTER_GROUPS = {'kubernetes'}
+
+_print_lock = threading.Lock()
+
+# Terraform does not guarantee the plugin cache is safe for concurrent
+# writes, so provider installation (init) is serialized; plan and apply,
+# where the time goes, run in parallel.
+_init_lock = threading.Lock()
+
+
+def _log(prefix: str, message: str) -> None:
+    with _print_lock:
+        print(f"[{prefix}] {message}")
+        sys.stdout.flush()
+
+
+def run_prefixed(command: List[str], cwd: str, prefix: str, env: Optional[dict] = None) -> bool:
+    """Run a command, streaming its combined output with a [prefix] on every line."""
+    _log(prefix, f"Executing: {' '.join(command)}")
+    with profile_span(f"{prefix}: {' '.join(command[:2])}", 'subprocess'):
+        try:
+            process = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, text=True, bufsize=1)
+        except OSError as e:
+            _log(prefix, f"Failed to start {command[0]}: {e}")
+            return False
+        for line in process.stdout:
+            _log(prefix, line.rstrip('\n'))
+        returncode = process.wait()
+    if returncode != 0:
+        _log(prefix, f"Failed with exit code {returncode}")
+        return False
+    return True
+
+
+class ParallelDeployment:
+    """Deploys partitioned workspaces concurrently, then the cluster-level workspaces."""
+
+    def __init__(self, output_dir: str, workspaces: List[Workspace], rosa_script: Optional[str] = None):
+        self.output_dir = output_dir
+        self.workspaces = workspaces
+        self.rosa_script = rosa_script
+        self.results: Dict[str, bool] = {}
+        self.durations: Dict[str, float] = {}
+        self.env = cli_config_env(output_dir)
+        self.env.update(TF_PLUGIN_CACHE_DIR=get_plugin_cache_dir(), TF_IN_AUTOMATION='1')
+
+    def _apply_workspace(self, workspace: Workspace) -> bool:
+        start = time.perf_counter()
+        name = workspace.name
+        with _init_lock:
+            ok = run_prefixed(['terraform', 'init', '-input=false'], workspace.path, name, self.env)
+        ok = ok and run_prefixed(['terraform', 'plan', '-input=false', '-out=tfplan'], workspace.path, name, self.env)
+        ok = ok and run_prefixed(['terraform', 'apply', '-input=false', '-auto-approve', 'tfplan'],
+                                 workspace.path, name, self.env)
+        self.durations[name] = time.perf_counter() - start
+        self.results[name] = ok
+        _log(name, f"{'Applied' if ok else 'FAILED'} in {self.durations[name]:.1f}s")
+        return ok
+
+    def _run_rosa(self, aws_workspace: Optional[Workspace]) -> bool:
+        start = time.perf_counter()
+        os.chmod(self.rosa_script, 0o755)
+        # The script reads subnet IDs with 'terraform output', so it runs where the AWS state is
+        cwd = aws_workspace.path if aws_workspace is not None else self.output_dir
+        ok = run_prefixed([os.path.abspath(self.rosa_script)], cwd, 'rosa', self.env)
+        self.durations['rosa'] = time.perf_counter() - start
+        self.results['rosa'] = ok
+        return ok
+
+    def run(self) -> bool:
+        """Deploy every workspace; returns True only if all of them (and ROSA) succeeded."""
+        os.makedirs(self.env['TF_PLUGIN_CACHE_DIR'], exist_ok=True)
+        cloud_workspaces = [w for w in self.workspaces if not w.groups <= CLUSTER_GROUPS]
+        cluster_workspaces = [w for w in self.workspaces if w.groups <= CLUSTER_GROUPS]
+        aws_workspace = next((w for w in cloud_workspaces if 'aws' in w.groups), None)
+
+        with ThreadPoolExecutor(max_workers=max(len(cloud_workspaces), 1) + 1) as executor:
+            futures = {w.name: executor.submit(self._apply_workspace, w) for w in cloud_workspaces}
+            rosa_future = None
+            if self.rosa_script:
+                # ROSA only needs the AWS networking, not the other clouds
+                if aws_workspace is None or futures[aws_workspace.name].result():
+                    _log('rosa', "AWS infrastructure ready, starting ROSA cluster creation")
+                    rosa_future = executor.submit(self._run_rosa, aws_workspace)
+                else:
+                    _log('rosa', "Skipped: AWS workspace failed")
+                    self.results['rosa'] = False
+            clouds_ok = all(future.result() for future in futures.values())
+
+            # Cluster-level resources need the clouds (and their clusters) in place
+            if clouds_ok:
+                for workspace in cluster_workspaces:
+                    self._apply_workspace(workspace)
+            else:
+                for workspace in cluster_workspaces:
+                    _log(workspace.name, "Skipped: a cloud workspace failed")
+                    self.results[workspace.name] = False
+            if rosa_future is not None:
+                rosa_future.result()
+
+        self.print_summary()
+        return all(self.results.values())
+
+    def print_summary(self) -> None:
+        print("\nParallel deployment summary:")
+        for name, ok in self.results.items():
+            duration = self.durations.get(name)
+            timing = f"{duration:8.1f}s" if duration is not None else f"{'-':>9}"
+            print(f"  {name:<24} {'OK' if ok else 'FAILED':<7} {timing}")
@@ -0,0 +1,222 @@
+"""
+Lightweight stage profiling for yamlforge
+
+Provides nested timing spans for the generation stages and outbound cloud API
+calls, a sorted text breakdown for --profile, and JSON / Chrome trace exports.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+
+class _NullSpan:
+    """Span returned while profiling is disabled; does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """A single timed region; records itself on the profiler when it exits."""
+
+    __slots__ = ('profiler', 'name', 'category', 'attributes', 'start', 'depth')
+
+    def __init__(self, profiler, name, category, attributes):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        self.depth = len(stack)
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, _exc_value, _traceback):
+        end = time.perf_counter()
+        stack = self.profiler._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self.profiler._record(self, end)
+        return False
+
+
+class Profiler:
+    """Collects spans from every thread of a single yamlforge run."""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self) -> None:
+        """Start recording spans; the run's wall clock starts here."""
+        self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans; already recorded spans are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = []
+            self.origin = time.perf_counter()
+
+    def span(self, name: str, category: str = 'stage', **attributes):
+        """Return a context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, attributes)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: _Span, end: float) -> None:
+        record = {
+            'name': span.name,
+            'category': span.category,
+            'start': span.start - self.origin,
+            'duration': end - span.start,
+            'depth': span.depth,
+            'thread': threading.get_ident(),
+        }
+        if span.attributes:
+            record['attributes'] = span.attributes
+        with self._lock:
+            self.spans.append(record)
+
+    def wall_time(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate spans by name, sorted by total time (largest first)."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for record in spans:
+            stage = stages.setdefault(record['name'], {
+                'name': record['name'],
+                'category': record['category'],
+                'calls': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0,
+            })
+            stage['calls'] += 1
+            stage['total_seconds'] += record['duration']
+            stage['max_seconds'] = max(stage['max_seconds'], record['duration'])
+        return sorted(stages.values(), key=lambda stage: stage['total_seconds'], reverse=True)
+
+    def to_dict(self, include_spans: bool = True) -> Dict[str, Any]:
+        """Return the timings as JSON-serializable data (also used for --ansible output)."""
+        result = {
+            'wall_seconds': round(self.wall_time(), 6),
+            'stages': [
+                dict(stage, total_seconds=round(stage['total_seconds'], 6), max_seconds=round(stage['max_seconds'], 6))
+                for stage in self.summary()
+            ],
+        }
+        if include_spans:
+            with self._lock:
+                result['spans'] = list(self.spans)
+        return result
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans in Chrome trace event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = []
+        for record in spans:
+            events.append({
+                'name': record['name'],
+                'cat': record['category'],
+                'ph': 'X',
+                'ts': round(record['start'] * 1e6, 3),
+                'dur': round(record['duration'] * 1e6, 3),
+                'pid': pid,
+                'tid': record['thread'],
+                'args': record.get('attributes', {}),
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path: str, output_format: str = 'json') -> None:
+        """Write the profile to path as 'json' or 'chrome' trace data."""
+        data = self.to_chrome_trace() if output_format == 'chrome' else self.to_dict()
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+    def format_report(self, limit: Optional[int] = None) -> str:
+        """Return a sorted text breakdown of where the time went."""
+        wall = self.wall_time()
+        stages = self.summary()
+        if limit:
+            stages = stages[:limit]
+        lines = [
+            "=" * 80,
+            "  YAMLFORGE PROFILE",
+            "=" * 80,
+            f"{'Stage':<44} {'Calls':>6} {'Total (s)':>10} {'Max (s)':>9} {'% Wall':>7}",
+            "-" * 80,
+        ]
+        for stage in stages:
+            name = stage['name'] if stage['category'] == 'stage' else f"[{stage['category']}] {stage['name']}"
+            if len(name) > 44:
+                name = name[:41] + '...'
+            share = (stage['total_seconds'] / wall * 100) if wall > 0 else 0.0
+            lines.append(f"{name:<44} {stage['calls']:>6} {stage['total_seconds']:>10.3f} "
+                         f"{stage['max_seconds']:>9.3f} {share:>6.1f}%")
+        lines.append("-" * 80)
+        lines.append(f"{'Wall time':<44} {'':>6} {wall:>10.3f}")
+        lines.append("Nested stages are included in their parents' totals.")
+        return '\n'.join(lines)
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Return the process-wide profiler."""
+    return _profiler
+
+
+def profile_span(name: str, category: str = 'stage', **attributes):
+    """Time a block on the process-wide profiler (no-op unless profiling is enabled)."""
+    return _profiler.span(name, category, **attributes)
+
+
+def api_span(provider: str, operation: str, **attributes):
+    """Time an outbound cloud API call, e.g. api_span('aws', 'ec2.describe_images')."""
+    return _profiler.span(f"{provider}.{operation}", 'cloud_api', **attributes)
+
+
+def profiled(name: Optional[str] = None, category: str = 'stage'):
+    """Decorator timing every call of a function as a span."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _profiler.span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,231 @@
+"""
+Parallel instance rendering for yamlforge
+
+generate_complete_terraform renders each instance definition as a task on a
+thread pool so the cloud lookups behind them (AMIs, zones, images, SSH keys)
+overlap. A task's console output and cost records are captured and replayed
+in definition order, and output that a serial run shows only once (the
+Instances header, repeated image results, what creating a shared client or
+resource printed) is decided during that replay, so the console output and
+main.tf are the same as with a single worker.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+
+DEFAULT_RENDER_WORKERS = 8
+
+_local = threading.local()
+
+
+def get_render_workers(default: int = DEFAULT_RENDER_WORKERS) -> int:
+    """Return the worker count from YAMLFORGE_RENDER_WORKERS (1 renders serially)."""
+    value = os.environ.get('YAMLFORGE_RENDER_WORKERS')
+    if not value:
+        return default
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Ignoring invalid YAMLFORGE_RENDER_WORKERS '{value}', using {default}")
+        return default
+
+
+class _Capture:
+    """Output segments and cost records of the task running on this thread."""
+
+    __slots__ = ('segments', 'costs')
+
+    def __init__(self):
+        self.segments = []
+        self.costs = []
+
+
+def _current() -> Optional[_Capture]:
+    return getattr(_local, 'capture', None)
+
+
+class _CapturingStream:
+    """Stands in for sys.stdout/sys.stderr while tasks run, diverting what tasks write."""
+
+    def __init__(self, name: str, stream):
+        self._name = name
+        self._stream = stream
+
+    def write(self, text):
+        capture = _current()
+        if capture is None:
+            return self._stream.write(text)
+        capture.segments.append(('write', self._name, text))
+        return len(text)
+
+    def flush(self):
+        if _current() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _show_once(seen: Set, key, message, repeat) -> None:
+    shown = repeat if key in seen else message
+    seen.add(key)
+    if isinstance(shown, list):
+        _replay_segments(shown, seen)
+    elif shown is not None:
+        print(shown)
+
+
+def print_once(seen: Set, key, message, repeat=None) -> None:
+    """Print message the first time key is shown and repeat (if any) every later time.
+
+    Either may be a string or output captured by capture_output(). Inside a
+    task the choice is made when the task's output is replayed, so it follows
+    definition order rather than the order the tasks happened to run.
+    """
+    capture = _current()
+    if capture is None:
+        _show_once(seen, key, message, repeat)
+    else:
+        capture.segments.append(('once', key, message, repeat))
+
+
+def record_cost(costs: List, entry: dict) -> None:
+    """Append a cost record to costs, deferring it to the replay when inside a task."""
+    capture = _current()
+    (costs if capture is None else capture.costs).append(entry)
+
+
+def capture_output(func: Callable[[], Any]) -> Tuple[Any, Optional[list]]:
+    """Call func() and return (result, output), where output is what it printed inside a task.
+
+    Outside a task func prints directly and output is None.
+    """
+    capture = _current()
+    if capture is None:
+        return func(), None
+    outer, capture.segments = capture.segments, []
+    try:
+        result = func()
+    except BaseException:
+        outer.extend(capture.segments)
+        raise
+    finally:
+        output, capture.segments = capture.segments, outer
+    return result, output
+
+
+def show_output(output: Optional[list]) -> None:
+    """Show output captured by capture_output() as part of the current task's output."""
+    capture = _current()
+    if output and capture is not None:
+        capture.segments.extend(output)
+
+
+def show_output_once(key, output: Optional[list]) -> None:
+    """Show output captured by capture_output() with the first task (in order) that uses it."""
+    capture = _current()
+    if output and capture is not None:
+        capture.segments.append(('once', key, output, None))
+
+
+class LazyValue:
+    """A value created on first use by whichever thread needs it first.
+
+    What creating it printed is shown with the first user in definition order,
+    where a serial run would have printed it.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.value = None
+        self._created = False
+        self._output = None
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[[], Any]) -> Any:
+        if not self._created:
+            with self._lock:
+                if not self._created:
+                    self.value, self._output = capture_output(factory)
+                    self._created = True
+        show_output_once(self.key, self._output)
+        return self.value
+
+
+class KeyedLocks:
+    """One lock per key, so concurrent lookups of the same key run once while others proceed."""
+
+    def __init__(self):
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, key) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+def write_output(stream, text: str) -> None:
+    """Write text to a stream other than sys.stdout/sys.stderr, deferring it to the replay when inside a task."""
+    capture = _current()
+    if capture is None:
+        stream.write(text)
+    else:
+        capture.segments.append(('write', stream, text))
+
+
+def _replay_segments(segments: list, seen: Set) -> None:
+    for segment in segments:
+        if segment[0] == 'write':
+            stream = segment[1]
+            (getattr(sys, stream) if isinstance(stream, str) else stream).write(segment[2])
+        else:
+            _show_once(seen, *segment[1:])
+
+
+def render_in_order(tasks: List, render: Callable[[Any], Any], seen: Set, costs: List,
+                    workers: int = DEFAULT_RENDER_WORKERS) -> List:
+    """Return [render(task) for task in tasks], running up to `workers` tasks at a time.
+
+    Each task's output and cost records (appended to costs) are replayed as
+    soon as it and every task before it have finished. If a task raises, the
+    output of the tasks up to and including it is shown, the tasks still
+    running are allowed to finish and the exception is re-raised.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [render(task) for task in tasks]
+
+    def run(task):
+        capture = _Capture()
+        _local.capture = capture
+        try:
+            return capture, render(task), None
+        except BaseException as e:  # SystemExit from validation must reach the caller too
+            return capture, None, e
+        finally:
+            _local.capture = None
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _CapturingStream('stdout', stdout), _CapturingStream('stderr', stderr)
+    try:
+        results = []
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(run, task) for task in tasks]
+            try:
+                for future in futures:
+                    capture, result, error = future.result()
+                    _replay_segments(capture.segments, seen)
+                    costs.extend(capture.costs)
+                    if error is not None:
+                        raise error
+                    results.append(result)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
@@ -0,0 +1,210 @@
+"""
+Console reporting for yamlforge
+
+The converter reports progress as events (a section header, an instance,
+provider or bucket line, a row of a cost table) to a Reporter instead of
+printing them. The sink chosen for the run decides what becomes of them:
+styled text on a terminal, plain text written in blocks, one JSON object
+per line, or nothing at all (--ansible). When the sink drops events,
+callers skip building them in the first place; warnings and errors are the
+exception and still reach stderr. Every warning and error is also kept on
+the Reporter so --ansible and the library API can return them.
+
+With json, quiet or --ansible, stdout carries only events and the final
+result: redirect_console_output() moves everything else that is printed
+(banners, summaries, library warnings) to stderr.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+from .render_pipeline import write_output
+
+
+OUTPUT_FORMATS = ['auto', 'tty', 'plain', 'json', 'quiet']
+
+_BOLD = '\033[1m'
+_YELLOW = '\033[33m'
+_RESET = '\033[0m'
+
+
+# Event kinds that are always reported, even by a sink that drops everything else
+PROBLEM_KINDS = ('warning', 'error')
+
+
+class NullSink:
+    """Drops every event (--ansible and --output-format quiet); the Reporter still shows problems on stderr."""
+
+    enabled = False
+
+    def format(self, kind, message, indent, context):
+        return None
+
+
+class PlainSink:
+    """Plain text, exactly as yamlforge has always printed it."""
+
+    enabled = True
+
+    def format(self, kind, message, indent, context):
+        return "  " * indent + message
+
+
+class TTYSink(PlainSink):
+    """Plain text with section headers in bold and warnings in yellow."""
+
+    def format(self, kind, message, indent, context):
+        if kind == 'section':
+            stripped = message.lstrip('\n')
+            return message[:len(message) - len(stripped)] + _BOLD + stripped + _RESET
+        if message.lower().startswith('warning'):
+            message = _YELLOW + message + _RESET
+        return "  " * indent + message
+
+
+class JSONSink:
+    """One JSON object per event, for tools that parse yamlforge's progress."""
+
+    enabled = True
+
+    def format(self, kind, message, indent, context):
+        if not message.strip():
+            return None
+        event = {'event': kind, 'message': message.strip()}
+        event.update((key, value) for key, value in context.items() if value is not None)
+        return json.dumps(event)
+
+
+# The real stdout once redirect_console_output() has moved other output to stderr
+_result_stream = None
+
+
+def redirect_console_output():
+    """Send everything printed outside the Reporter to stderr; return the stream kept for events and results."""
+    global _result_stream
+    if _result_stream is None:
+        _result_stream = sys.stdout
+        sys.stdout = sys.stderr
+    return _result_stream
+
+
+def get_result_stream():
+    """Return the stream events and machine-readable results are written to."""
+    return _result_stream if _result_stream is not None else sys.stdout
+
+
+def run_console_command(args, **kwargs) -> None:
+    """Run a command whose output is console output; raises CalledProcessError on failure.
+
+    A child process writes to the real fd 1, past a redirected sys.stdout
+    (stderr for --ansible/json, or a buffer when the library API captures
+    output), so in that case its output is piped through sys.stdout.
+    """
+    if sys.stdout is sys.__stdout__:
+        subprocess.run(args, check=True, **kwargs)
+        return
+    sys.stdout.flush()
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1, **kwargs)
+    with process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args)
+
+
+def _use_color(stream) -> bool:
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def create_sink(output_format: str = 'auto'):
+    """Return the sink for an --output-format value; 'auto' picks tty or plain for stdout."""
+    if output_format == 'auto':
+        output_format = 'tty' if _use_color(sys.stdout) else 'plain'
+    if output_format == 'tty':
+        return TTYSink()
+    if output_format == 'plain':
+        # Write in blocks even on a terminal, where Python flushes every line
+        reconfigure = getattr(sys.stdout, 'reconfigure', None)
+        if reconfigure and getattr(sys.stdout, 'line_buffering', False):
+            reconfigure(line_buffering=False)
+        return PlainSink()
+    if output_format == 'json':
+        return JSONSink()
+    if output_format == 'quiet':
+        return NullSink()
+    raise ValueError(f"Unknown output format '{output_format}'. Valid formats: {', '.join(OUTPUT_FORMATS)}")
+
+
+class Reporter:
+    """Formats events with its sink and writes them to the current sys.stdout.
+
+    Events are written when they happen (to whatever sys.stdout is at that
+    moment), so they stay in order with everything else yamlforge prints and
+    are captured per instance while instances render concurrently.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink or create_sink()
+        self.enabled = self.sink.enabled
+        self.warnings: List[str] = []
+        self.errors: List[str] = []
+        self._problems_lock = threading.Lock()
+
+    def _record_problem(self, kind: str, message: str) -> None:
+        """Keep a warning or error and, when the sink drops it, show it on stderr."""
+        message = message.strip()
+        with self._problems_lock:
+            (self.warnings if kind == 'warning' else self.errors).append(message)
+        if not self.enabled:
+            sys.stderr.write(message + "\n")
+
+    def render(self, kind: str, message: str, indent: int = 1, **context) -> Optional[str]:
+        """Return the text the sink would write for an event, or None if it drops it."""
+        if not self.enabled:
+            return None
+        return self.sink.format(kind, message, indent, context)
+
+    def emit(self, kind: str, message: str, indent: int = 1, **context) -> None:
+        """Report one event."""
+        if kind in PROBLEM_KINDS:
+            self._record_problem(kind, message)
+        if not self.enabled:
+            return
+        text = self.sink.format(kind, message, indent, context)
+        if text is None:
+            return
+        if _result_stream is None:
+            sys.stdout.write(text + "\n")
+        else:
+            write_output(_result_stream, text + "\n")
+
+    def output(self, kind: str, message: str, indent: int = 1, **context) -> Optional[list]:
+        """Return an event as output for render_pipeline.print_once(), or None if the sink drops it."""
+        text = self.render(kind, message, indent, **context)
+        if text is None:
+            return None
+        return [('write', 'stdout' if _result_stream is None else _result_stream, text + "\n")]
+
+    def echo(self, message: str = "", kind: Optional[str] = None, **context) -> None:
+        """Report a line of plain text; its leading spaces become the indent.
+
+        The kind defaults to 'warning' or 'error' when the text starts with
+        that word and 'message' otherwise. Only 'message' lines are skipped
+        when the sink drops events.
+        """
+        if not self.enabled and kind in (None, 'message') and not message.lstrip().lower().startswith(PROBLEM_KINDS):
+            return
+        text = message.lstrip(' ')
+        indent, extra = divmod(len(message) - len(text), 2)
+        if kind is None:
+            first_word = text.lstrip().split(':', 1)[0].split(' ', 1)[0].lower()
+            kind = first_word if first_word in PROBLEM_KINDS else 'message'
+        self.emit(kind, ' ' * extra + text, indent, **context)
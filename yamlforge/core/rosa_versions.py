@@ -10,6 +10,7 @@ import time
 import random
 from typing import List, Dict, Optional
 from functools import wraps
+from .profiling import api_span
 
 
 def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=60.0, backoff_factor=2.0):
@@ -87,7 +88,8 @@ class ROSAVersionManager:
                 'refresh_token': self.token
             }
             
-            response = requests.post(refresh_url, data=refresh_data, timeout=30)
+            with api_span('redhat', 'sso.token_refresh'):
+                response = requests.post(refresh_url, data=refresh_data, timeout=30)
             
             if response.status_code == 200:
                 token_data = response.json()
@@ -132,7 +134,8 @@ class ROSAVersionManager:
             page = 1
             
             while True:
-                response = requests.get(f'{url}?page={page}&size=100', headers=headers, timeout=30)
+                with api_span('redhat', 'ocm.versions.list', page=page):
+                    response = requests.get(f'{url}?page={page}&size=100', headers=headers, timeout=30)
                 
                 if response.status_code == 200:
                     data = response.json()
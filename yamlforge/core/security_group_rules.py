@@ -0,0 +1,245 @@
+"""
+Security group rule compaction for yamlforge
+
+Rewrites the rules of a security group into an equivalent, smaller set
+before the provider generators turn every rule into Terraform:
+exact duplicates are removed, overlapping or adjacent TCP/UDP port
+ranges are merged, CIDR blocks are aggregated (subnets of a listed
+supernet dropped, sibling networks joined) and rules covered entirely by
+another rule are dropped. Security group rules only ever allow traffic,
+so the union of the compacted rules is the same as the original set.
+"""
+
+import ipaddress
+from typing import Dict, List, Optional, Tuple
+
+
+# Protocols whose port_range really is a set of ports that can be merged
+PORT_PROTOCOLS = {'tcp', 'udp'}
+
+# Upper bound on merge passes; each pass that changes anything removes rules
+MAX_PASSES = 10
+
+
+class _Rule:
+    """Normalized view of one rule; 'template' is the rule dict it is written back from."""
+
+    __slots__ = ('template', 'direction', 'protocol', 'ports', 'source', 'destination')
+
+    def __init__(self, template, direction, protocol, ports, source, destination):
+        self.template = template
+        self.direction = direction
+        self.protocol = protocol
+        self.ports = ports
+        self.source = source
+        self.destination = destination
+
+    def key(self):
+        return (self.direction, self.protocol, self.ports, _endpoint_key(self.source),
+                _endpoint_key(self.destination))
+
+
+def _parse_network(value: Optional[str]):
+    if not value or '/' not in value:
+        return None
+    try:
+        return ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+def _endpoint(value: Optional[str]) -> Tuple[Optional[str], object]:
+    """Return (original string, parsed network or None for references/absent values)."""
+    return (value, _parse_network(value))
+
+
+def _network_key(network) -> tuple:
+    return ('cidr', network.version, int(network.network_address), network.prefixlen)
+
+
+def _supernet_keys(network):
+    """Yield the keys of the network itself and of every network containing it."""
+    bits = network.max_prefixlen
+    address = int(network.network_address)
+    for prefix in range(network.prefixlen, -1, -1):
+        mask = ((1 << bits) - 1) ^ ((1 << (bits - prefix)) - 1)
+        yield ('cidr', network.version, address & mask, prefix)
+
+
+def _endpoint_key(endpoint):
+    value, network = endpoint
+    return _network_key(network) if network is not None else ('ref', value)
+
+
+def _normalize(rule) -> Optional[_Rule]:
+    """Parse a rule, or return None if it is malformed (left for the converter to report)."""
+    if not isinstance(rule, dict):
+        return None
+    protocol = str(rule.get('protocol', '')).lower()
+    port_range = str(rule.get('port_range', '')).strip()
+    source = rule.get('source', '0.0.0.0/0')
+    if not protocol or not port_range or not source:
+        return None
+    try:
+        if '-' in port_range:
+            from_port, to_port = (int(part) for part in port_range.split('-', 1))
+        else:
+            from_port = to_port = int(port_range)
+    except ValueError:
+        return None
+    if from_port > to_port:
+        return None
+    return _Rule(rule, rule.get('direction', 'ingress'), protocol, (from_port, to_port),
+                 _endpoint(source), _endpoint(rule.get('destination')))
+
+
+def _dedupe(rules: List[_Rule]) -> List[_Rule]:
+    seen = set()
+    unique = []
+    for rule in rules:
+        key = rule.key()
+        if key not in seen:
+            seen.add(key)
+            unique.append(rule)
+    return unique
+
+
+def _merge_ports(rules: List[_Rule]) -> List[_Rule]:
+    """Merge overlapping/adjacent port ranges of otherwise identical TCP/UDP rules."""
+    groups: Dict[tuple, List[_Rule]] = {}
+    for rule in rules:
+        if rule.protocol in PORT_PROTOCOLS:
+            key = (rule.direction, rule.protocol, _endpoint_key(rule.source), _endpoint_key(rule.destination))
+            groups.setdefault(key, []).append(rule)
+
+    position = {id(rule): index for index, rule in enumerate(rules)}
+    replaced = {}
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        merged = []
+        for rule in sorted(group, key=lambda r: r.ports):
+            if merged and rule.ports[0] <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], rule.ports[1])
+                merged[-1][2].append(rule)
+            else:
+                merged.append([rule.ports[0], rule.ports[1], [rule]])
+        for start, end, members in merged:
+            first = min(members, key=lambda r: position[id(r)])
+            first.ports = (start, end)
+            for member in members:
+                replaced[id(member)] = first
+    return _dedupe([replaced.get(id(rule), rule) for rule in rules])
+
+
+def _aggregate(rules: List[_Rule], field: str) -> List[_Rule]:
+    """Collapse the CIDRs in 'field' of rules that are identical in everything else."""
+    other = 'destination' if field == 'source' else 'source'
+    groups: Dict[tuple, List[_Rule]] = {}
+    for rule in rules:
+        network = getattr(rule, field)[1]
+        if network is not None:
+            key = (rule.direction, rule.protocol, rule.ports, _endpoint_key(getattr(rule, other)), network.version)
+            groups.setdefault(key, []).append(rule)
+
+    result = {}
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        networks = [getattr(rule, field)[1] for rule in group]
+        collapsed = list(ipaddress.collapse_addresses(networks))
+        if len(collapsed) == len(set(networks)):
+            continue
+        collapsed = {_network_key(network): network for network in collapsed}
+        members: Dict[object, List[_Rule]] = {}
+        for rule in group:
+            key = next(key for key in _supernet_keys(getattr(rule, field)[1]) if key in collapsed)
+            members.setdefault(collapsed[key], []).append(rule)
+        for network, group_members in members.items():
+            first = group_members[0]
+            original = next((getattr(rule, field)[0] for rule in group_members
+                             if getattr(rule, field)[1] == network), None)
+            setattr(first, field, (original or str(network), network))
+            for member in group_members:
+                result[id(member)] = first
+    return _dedupe([result.get(id(rule), rule) for rule in rules])
+
+
+def _covers(outer: _Rule, inner: _Rule) -> bool:
+    if outer.direction != inner.direction or outer.protocol != inner.protocol:
+        return False
+    if inner.protocol in PORT_PROTOCOLS:
+        if not (outer.ports[0] <= inner.ports[0] and inner.ports[1] <= outer.ports[1]):
+            return False
+    elif outer.ports != inner.ports:
+        return False
+    for field in ('source', 'destination'):
+        outer_value, outer_network = getattr(outer, field)
+        inner_value, inner_network = getattr(inner, field)
+        if outer_network is not None and inner_network is not None:
+            if outer_network.version != inner_network.version or not inner_network.subnet_of(outer_network):
+                return False
+        elif _endpoint_key((outer_value, outer_network)) != _endpoint_key((inner_value, inner_network)):
+            return False
+    return True
+
+
+def _drop_covered(rules: List[_Rule]) -> List[_Rule]:
+    """Drop rules whose traffic is entirely allowed by another rule."""
+    by_source: Dict[tuple, List[_Rule]] = {}
+    for rule in rules:
+        by_source.setdefault((rule.direction, rule.protocol, _endpoint_key(rule.source)), []).append(rule)
+    covered = set()
+    for inner in rules:
+        network = inner.source[1]
+        sources = _supernet_keys(network) if network is not None else [_endpoint_key(inner.source)]
+        candidates = (outer for source in sources
+                      for outer in by_source.get((inner.direction, inner.protocol, source), ()))
+        for outer in candidates:
+            if outer is not inner and id(outer) not in covered and _covers(outer, inner):
+                covered.add(id(inner))
+                break
+    return [rule for rule in rules if id(rule) not in covered]
+
+
+def _to_dict(rule: _Rule) -> dict:
+    template = rule.template
+    original = _normalize(template)
+    if (original is not None and original.ports == rule.ports and original.source[0] == rule.source[0]
+            and original.destination[0] == rule.destination[0]):
+        return template
+    compacted = dict(template)
+    start, end = rule.ports
+    compacted['port_range'] = str(start) if start == end else f"{start}-{end}"
+    if rule.source[0] != template.get('source', '0.0.0.0/0'):
+        compacted['source'] = rule.source[0]
+    if rule.destination[0] is not None:
+        compacted['destination'] = rule.destination[0]
+    return compacted
+
+
+def compact_security_group_rules(rules: List[dict]) -> List[dict]:
+    """Return an equivalent, minimal list of rules in first-appearance order.
+
+    The input is returned unchanged when nothing can be compacted or when
+    any rule is malformed, so the converter's validation errors still apply.
+    """
+    if not rules or len(rules) < 2:
+        return rules
+    normalized = [_normalize(rule) for rule in rules]
+    if any(rule is None for rule in normalized):
+        return rules
+
+    current = _dedupe(normalized)
+    for _ in range(MAX_PASSES):
+        count = len(current)
+        current = _merge_ports(current)
+        current = _aggregate(current, 'source')
+        current = _aggregate(current, 'destination')
+        current = _drop_covered(current)
+        if len(current) == count:
+            break
+
+    if len(current) == len(rules):
+        return rules
+    return [_to_dict(rule) for rule in current]
@@ -0,0 +1,58 @@
+"""
+Shared per-region resources for yamlforge
+
+Instances that need the same AMI lookup or the same SSH public key in the
+same provider region reference a single data source or resource instead
+of each emitting its own copy. The converter writes everything registered
+here into one section of main.tf, ordered by key so the output does not
+depend on the order in which instances were generated. What generating an
+entry printed is shown with the first instance (in definition order) that
+uses it.
+"""
+
+import hashlib
+import threading
+from typing import Callable, Dict, Tuple
+
+from .render_pipeline import KeyedLocks, capture_output, show_output_once
+
+
+def key_fingerprint(public_key: str) -> str:
+    """Return a short, stable identifier of an SSH public key for resource names."""
+    return hashlib.sha256(public_key.strip().encode('utf-8')).hexdigest()[:8]
+
+
+class SharedResourceRegistry:
+    """Terraform blocks keyed by (provider, region, image/key), each generated once."""
+
+    def __init__(self):
+        self._entries: Dict[tuple, Tuple[str, str, list]] = {}
+        self._key_locks = KeyedLocks()
+        self._lock = threading.Lock()
+        self.references = 0
+
+    def get_or_create(self, key: tuple, factory: Callable[[], Tuple[str, str]]) -> str:
+        """Return the reference for key, calling factory() -> (hcl, reference) only the first time."""
+        with self._lock:
+            self.references += 1
+            entry = self._entries.get(key)
+        if entry is None:
+            # Factories may query cloud APIs, so only callers of the same key wait
+            with self._key_locks(key):
+                entry = self._entries.get(key)
+                if entry is None:
+                    (hcl, reference), output = capture_output(factory)
+                    entry = (hcl, reference, output)
+                    with self._lock:
+                        self._entries[key] = entry
+        show_output_once(('shared',) + key, entry[2])
+        return entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self) -> str:
+        """Return the HCL of every registered block, sorted by key."""
+        with self._lock:
+            entries = sorted(self._entries.items(), key=lambda item: tuple(str(part) for part in item[0]))
+        return ''.join(entry[0] for _key, entry in entries)
@@ -0,0 +1,226 @@
+"""
+Terraform provider requirements, plugin cache and local mirror for yamlforge
+
+Holds the provider sources and version constraints written into every
+generated main.tf, and produces the matching .terraform.lock.hcl and
+Terraform CLI configuration (plugin cache plus filesystem mirror) so that
+`terraform init` can reuse providers fetched once by
+`yamlforge providers prefetch` instead of downloading them for every
+output directory.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .discovery_cache import get_cache_dir
+from .reporting import run_console_command
+from .workspaces import parse_blocks
+
+
+# yamlforge provider -> Terraform providers it needs: (local name, source, version constraint)
+TERRAFORM_PROVIDERS: Dict[str, List[Tuple[str, str, str]]] = {
+    'aws': [('aws', 'hashicorp/aws', '~> 5.0')],
+    'azure': [('azurerm', 'hashicorp/azurerm', '~> 3.0'),
+              ('azuread', 'hashicorp/azuread', '~> 2.0')],
+    'gcp': [('google', 'hashicorp/google', '~> 4.0'),
+            ('time', 'hashicorp/time', '~> 0.9'),
+            ('local', 'hashicorp/local', '~> 2.4')],
+    'ibm_vpc': [('ibm', 'IBM-Cloud/ibm', '~> 1.0')],
+    'ibm_classic': [('ibm', 'IBM-Cloud/ibm', '~> 1.0')],
+    'oci': [('oci', 'oracle/oci', '~> 5.0')],
+    'vmware': [('vsphere', 'hashicorp/vsphere', '~> 2.4')],
+    'alibaba': [('alicloud', 'aliyun/alicloud', '~> 1.0')],
+    'rhcs': [('rhcs', 'terraform-redhat/rhcs', '>= 1.0.1')],
+    'kubernetes': [('kubernetes', 'hashicorp/kubernetes', '~> 2.23')],
+    'helm': [('helm', 'hashicorp/helm', '~> 2.11')],
+    'kubectl': [('kubectl', 'gavinbunney/kubectl', '~> 1.14')],
+    'cnv': [('kubernetes', 'hashicorp/kubernetes', '~> 2.23'),
+            ('kubectl', 'gavinbunney/kubectl', '~> 1.14'),
+            ('helm', 'hashicorp/helm', '~> 2.11')],
+}
+
+DEFAULT_REGISTRY = 'registry.terraform.io'
+
+# Lock file kept next to the mirrored packages by `yamlforge providers prefetch`
+MIRROR_LOCK_FILE = 'yamlforge.lock.hcl'
+
+# Terraform CLI configuration written to every output directory
+CLI_CONFIG_FILE = 'yamlforge.tfrc'
+
+LOCK_FILE = '.terraform.lock.hcl'
+
+
+def get_plugin_cache_dir() -> str:
+    """Return the shared provider plugin cache (TF_PLUGIN_CACHE_DIR or the yamlforge cache dir)."""
+    plugin_cache = os.environ.get('TF_PLUGIN_CACHE_DIR')
+    if plugin_cache:
+        return plugin_cache
+    return str(get_cache_dir() / 'terraform-plugins')
+
+
+def get_mirror_dir() -> str:
+    """Return the local provider mirror (YAMLFORGE_PROVIDER_MIRROR or the yamlforge cache dir)."""
+    mirror = os.environ.get('YAMLFORGE_PROVIDER_MIRROR')
+    if mirror:
+        return mirror
+    return str(get_cache_dir() / 'terraform-providers')
+
+
+def terraform_requirements(required_providers: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+    """Map each Terraform provider local name to (source, constraint), in first-use order."""
+    requirements: Dict[str, Tuple[str, str]] = {}
+    for provider in required_providers:
+        for name, source, constraint in TERRAFORM_PROVIDERS.get(provider, []):
+            requirements.setdefault(name, (source, constraint))
+    return requirements
+
+
+def registry_address(source: str) -> str:
+    """Return the fully qualified provider address used in lock files and mirrors."""
+    if source.count('/') == 1:
+        source = f"{DEFAULT_REGISTRY}/{source}"
+    return source.lower()
+
+
+def required_providers_block(required_providers: Iterable[str]) -> str:
+    """Return the entries of the terraform required_providers block."""
+    entries = []
+    for name, (source, constraint) in terraform_requirements(required_providers).items():
+        entries.append(f'''
+    {name} = {{
+      source  = "{source}"
+      version = "{constraint}"
+    }}''')
+    return ''.join(entries)
+
+
+def _lock_entries(content: str, source: str) -> Dict[str, str]:
+    """Return the provider blocks of a lock file keyed by address, without comments."""
+    entries = {}
+    for block in parse_blocks(content, source):
+        if block.kind == 'provider' and block.labels:
+            text = '\n'.join(line for line in block.text.splitlines() if not line.startswith('#'))
+            entries[block.labels[0]] = text.strip('\n') + '\n'
+    return entries
+
+
+def read_mirror_lock(mirror_dir: Optional[str] = None) -> Dict[str, str]:
+    """Return the provider lock blocks recorded in the mirror, keyed by registry address."""
+    lock_path = os.path.join(mirror_dir or get_mirror_dir(), MIRROR_LOCK_FILE)
+    try:
+        with open(lock_path) as f:
+            content = f.read()
+    except OSError:
+        return {}
+    try:
+        return _lock_entries(content, MIRROR_LOCK_FILE)
+    except ValueError as e:
+        print(f"Warning: Ignoring unreadable provider mirror lock file {lock_path}: {e}")
+        return {}
+
+
+def generate_lock_file(required_providers: Iterable[str], mirror_locks: Dict[str, str]) -> Optional[str]:
+    """Return a .terraform.lock.hcl for the mirrored providers, or None if none are mirrored."""
+    blocks = []
+    for source, _constraint in terraform_requirements(required_providers).values():
+        block = mirror_locks.get(registry_address(source))
+        if block:
+            blocks.append(block)
+    if not blocks:
+        return None
+    header = ("# This file is maintained automatically by \"terraform init\".\n"
+              "# Generated by YamlForge from the providers prefetched with 'yamlforge providers prefetch'.\n")
+    return header + '\n' + '\n'.join(blocks)
+
+
+def generate_cli_config(required_providers: Iterable[str], mirror_locks: Dict[str, str],
+                        mirror_dir: Optional[str] = None) -> str:
+    """Return a Terraform CLI configuration using the shared plugin cache and, when prefetched, the local mirror."""
+    mirror_dir = os.path.abspath(mirror_dir or get_mirror_dir())
+    mirrored = sorted({
+        registry_address(source) for source, _constraint in terraform_requirements(required_providers).values()
+        if registry_address(source) in mirror_locks
+    })
+    config = f'''# Terraform CLI configuration generated by YamlForge
+# Use it with: export TF_CLI_CONFIG_FILE="$PWD/{CLI_CONFIG_FILE}"
+plugin_cache_dir = "{os.path.abspath(get_plugin_cache_dir())}"
+'''
+    if mirrored:
+        addresses = ', '.join(f'"{address}"' for address in mirrored)
+        config += f'''
+# Providers prefetched with 'yamlforge providers prefetch' install from the local mirror
+provider_installation {{
+  filesystem_mirror {{
+    path    = "{mirror_dir}"
+    include = [{addresses}]
+  }}
+  direct {{
+    exclude = [{addresses}]
+  }}
+}}
+'''
+    return config
+
+
+def cli_config_env(output_dir: str, env: Optional[dict] = None) -> dict:
+    """Return env with TF_CLI_CONFIG_FILE pointing at the output directory's CLI configuration.
+
+    An explicit TF_CLI_CONFIG_FILE set by the user is left alone.
+    """
+    env = dict(os.environ if env is None else env)
+    cli_config = os.path.join(os.path.abspath(output_dir), CLI_CONFIG_FILE)
+    if 'TF_CLI_CONFIG_FILE' not in env and os.path.exists(cli_config):
+        env['TF_CLI_CONFIG_FILE'] = cli_config
+    return env
+
+
+def _run_terraform(args: List[str], cwd: str) -> None:
+    print(f"   Executing: terraform {' '.join(args)}")
+    try:
+        run_console_command(['terraform'] + args, cwd=cwd)
+    except FileNotFoundError:
+        raise ValueError("'terraform' command not found; install Terraform to prefetch providers")
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"terraform {args[0]} {args[1]} failed with exit code {e.returncode}")
+
+
+def prefetch_providers(required_providers: Iterable[str], mirror_dir: Optional[str] = None,
+                       platforms: Optional[List[str]] = None) -> Tuple[str, Dict[str, Tuple[str, str]]]:
+    """Download the providers into the local mirror and record their checksums.
+
+    Uses `terraform providers mirror` followed by `terraform providers lock
+    -fs-mirror`, so the lock entries hold the checksums of exactly the
+    packages in the mirror. Entries for providers fetched earlier are kept.
+    Returns (mirror directory, requirements that were fetched).
+    """
+    mirror_dir = os.path.abspath(mirror_dir or get_mirror_dir())
+    requirements = terraform_requirements(required_providers)
+    if not requirements:
+        raise ValueError("No Terraform providers to prefetch")
+    os.makedirs(mirror_dir, exist_ok=True)
+
+    platform_args = [f"-platform={platform}" for platform in platforms or []]
+    work_dir = tempfile.mkdtemp(prefix='yamlforge-providers-')
+    try:
+        entries = required_providers_block(required_providers)
+        with open(os.path.join(work_dir, 'main.tf'), 'w') as f:
+            f.write(f"terraform {{\n  required_providers {{{entries}\n  }}\n}}\n")
+
+        _run_terraform(['providers', 'mirror'] + platform_args + [mirror_dir], work_dir)
+        _run_terraform(['providers', 'lock', f"-fs-mirror={mirror_dir}"] + platform_args, work_dir)
+
+        mirror_locks = read_mirror_lock(mirror_dir)
+        with open(os.path.join(work_dir, LOCK_FILE)) as f:
+            mirror_locks.update(_lock_entries(f.read(), LOCK_FILE))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    lock_path = os.path.join(mirror_dir, MIRROR_LOCK_FILE)
+    with open(lock_path + '.tmp', 'w') as f:
+        f.write("# Provider checksums for the YamlForge provider mirror\n\n")
+        f.write('\n'.join(mirror_locks[address] for address in sorted(mirror_locks)))
+    os.replace(lock_path + '.tmp', lock_path)
+    return mirror_dir, requirements
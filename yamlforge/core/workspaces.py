@@ -0,0 +1,386 @@
+"""
+Provider-partitioned Terraform workspaces for yamlforge
+
+Splits the generated root module into independent root modules, one per
+group of clouds that share no references (for example aws, azure and gcp),
+so each can be initialized, planned and applied on its own. Clouds whose
+resources reference each other stay together in a single workspace.
+"""
+
+import os
+import re
+import shutil
+from typing import Dict, List, Optional, Set
+
+
+WORKSPACES_DIRNAME = 'workspaces'
+
+# Terraform provider name (resource type prefix) -> workspace group
+PROVIDER_GROUPS = {
+    'aws': 'aws',
+    'rhcs': 'aws',
+    'azurerm': 'azure',
+    'azuread': 'azure',
+    'azapi': 'azure',
+    'google': 'gcp',
+    'ibm': 'ibm',
+    'oci': 'oci',
+    'alicloud': 'alibaba',
+    'vsphere': 'vmware',
+    'kubernetes': 'kubernetes',
+    'kubectl': 'kubernetes',
+    'helm': 'kubernetes',
+}
+
+# Utility providers that belong to whichever workspace uses them
+NEUTRAL_PROVIDERS = {'random', 'time', 'local', 'null', 'tls', 'template', 'external', 'http', 'cloudinit'}
+
+# Files that are per-workspace state or artifacts and are never copied
+_SKIPPED_FILES = {'terraform.tfstate', 'terraform.tfstate.backup', 'tfplan'}
+
+_BLOCK_START = re.compile(r'^([A-Za-z_][\w-]*)((?:\s+"[^"]*")*)\s*\{')
+_BLOCK_LABEL = re.compile(r'"([^"]*)"')
+_HEREDOC = re.compile(r'<<-?\s*([A-Za-z_]\w*)\s*$')
+_REFERENCE = re.compile(r'\b((?:data\.)?[A-Za-z_][\w-]*\.[A-Za-z_][\w-]*)')
+_LOCAL_NAME = re.compile(r'^\s*([A-Za-z_][\w-]*)\s*=')
+_REQUIRED_PROVIDER = re.compile(r'^(\s*)([A-Za-z_][\w-]*)\s*=\s*\{')
+
+
+class TerraformBlock:
+    """One top-level HCL block (with the comments directly above it)."""
+
+    __slots__ = ('kind', 'labels', 'text', 'source', 'addresses', 'references')
+
+    def __init__(self, kind: str, labels: List[str], text: str, source: str):
+        self.kind = kind
+        self.labels = labels
+        self.text = text
+        self.source = source
+        self.addresses = self._addresses()
+        code = '\n'.join(line for line in text.splitlines() if not line.lstrip().startswith(('#', '//')))
+        self.references = set(_REFERENCE.findall(code)) - set(self.addresses)
+
+    def _addresses(self) -> List[str]:
+        if self.kind == 'resource' and len(self.labels) >= 2:
+            return [f"{self.labels[0]}.{self.labels[1]}"]
+        if self.kind == 'data' and len(self.labels) >= 2:
+            return [f"data.{self.labels[0]}.{self.labels[1]}"]
+        if self.kind == 'module' and self.labels:
+            return [f"module.{self.labels[0]}"]
+        if self.kind == 'locals':
+            return [f"local.{name}" for name in _top_level_attributes(self.text)]
+        return []
+
+    @property
+    def provider(self) -> Optional[str]:
+        """Terraform provider name this block belongs to, if any."""
+        if self.kind in ('resource', 'data') and self.labels:
+            return self.labels[0].split('_', 1)[0]
+        if self.kind == 'provider' and self.labels:
+            return self.labels[0]
+        return None
+
+    @property
+    def group(self) -> Optional[str]:
+        provider = self.provider
+        if not provider or provider in NEUTRAL_PROVIDERS:
+            return None
+        return PROVIDER_GROUPS.get(provider, provider)
+
+
+class Workspace:
+    """An independent Terraform root module produced by partition_terraform()."""
+
+    def __init__(self, name: str, groups: Set[str], path: str):
+        self.name = name
+        self.groups = groups
+        self.path = path
+        self.resource_count = 0
+
+    def __repr__(self):
+        return f"Workspace({self.name!r}, resources={self.resource_count})"
+
+
+def _scan_line(line: str, depth: int):
+    """Return (new brace depth, heredoc marker or None) after one line of HCL."""
+    # Each stack entry is '"' for a string or '{' for a block/interpolation
+    stack: List[str] = []
+    i = 0
+    length = len(line)
+    while i < length:
+        char = line[i]
+        in_string = stack and stack[-1] == '"'
+        if in_string:
+            if char == '\\':
+                i += 2
+                continue
+            if char == '"':
+                stack.pop()
+            elif char in '$%' and line.startswith('{', i + 1):
+                stack.append('{')
+                i += 1
+        else:
+            if char == '#' or line.startswith('//', i):
+                break
+            if char == '"':
+                stack.append('"')
+            elif char == '{':
+                if stack:
+                    stack.append('{')
+                else:
+                    depth += 1
+            elif char == '}':
+                if stack:
+                    stack.pop()
+                else:
+                    depth -= 1
+        i += 1
+
+    heredoc = _HEREDOC.search(line)
+    return depth, heredoc.group(1) if heredoc and not stack else None
+
+
+def _top_level_attributes(text: str) -> List[str]:
+    """Return the attribute names defined directly inside a block (used for locals)."""
+    names = []
+    depth = 0
+    heredoc = None
+    for line in text.splitlines():
+        if heredoc:
+            if line.strip() == heredoc:
+                heredoc = None
+            continue
+        if depth == 1:
+            match = _LOCAL_NAME.match(line)
+            if match:
+                names.append(match.group(1))
+        depth, heredoc = _scan_line(line, depth)
+    return names
+
+
+def parse_blocks(text: str, source: str = 'main.tf') -> List[TerraformBlock]:
+    """Split HCL text into its top-level blocks."""
+    blocks = []
+    pending: List[str] = []
+    current: Optional[List[str]] = None
+    kind, labels = None, []
+    depth = 0
+    heredoc = None
+
+    for line in text.splitlines():
+        if heredoc:
+            current.append(line)
+            if line.strip() == heredoc:
+                heredoc = None
+            continue
+
+        if current is None:
+            match = _BLOCK_START.match(line)
+            if not match:
+                # Comments and blank lines between blocks travel with the next block
+                if line.strip():
+                    pending.append(line)
+                elif pending and pending[-1].strip():
+                    pending.append(line)
+                continue
+            kind, labels = match.group(1), _BLOCK_LABEL.findall(match.group(2))
+            current = pending + [line]
+            pending = []
+            depth = 0
+        else:
+            current.append(line)
+
+        depth, heredoc = _scan_line(line, depth)
+        if depth <= 0 and not heredoc:
+            blocks.append(TerraformBlock(kind, labels, '\n'.join(current) + '\n', source))
+            current = None
+
+    if current is not None:
+        raise ValueError(f"Unbalanced braces in {source} near '{kind} {' '.join(labels)}'")
+    return blocks
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[second] = first
+
+
+def _filter_required_providers(terraform_block: str, providers: Set[str]) -> str:
+    """Drop required_providers entries the workspace does not use."""
+    lines = []
+    skip_depth = 0
+    in_required = False
+    for line in terraform_block.splitlines():
+        stripped = line.strip()
+        if skip_depth:
+            skip_depth += line.count('{') - line.count('}')
+            continue
+        if stripped.startswith('required_providers'):
+            in_required = True
+        elif in_required:
+            match = _REQUIRED_PROVIDER.match(line)
+            if match and match.group(2) not in providers:
+                skip_depth = line.count('{') - line.count('}')
+                continue
+            if stripped == '}':
+                in_required = False
+        lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+def partition_blocks(blocks: List[TerraformBlock]):
+    """Group blocks into independent workspaces.
+
+    Returns (workspaces, skipped_outputs) where workspaces maps a workspace
+    name to its blocks (excluding terraform/variable blocks) and
+    skipped_outputs lists outputs that combine values from several
+    workspaces and therefore cannot live in any single one.
+    """
+    graph_blocks = [b for b in blocks if b.kind not in ('terraform', 'variable', 'output')]
+    index_by_address: Dict[str, int] = {}
+    for index, block in enumerate(graph_blocks):
+        for address in block.addresses:
+            index_by_address[address] = index
+
+    # Blocks that reference each other must share a workspace
+    components = _UnionFind(len(graph_blocks))
+    for index, block in enumerate(graph_blocks):
+        for reference in block.references:
+            target = index_by_address.get(reference)
+            if target is not None:
+                components.union(index, target)
+
+    # Provider blocks alone do not create a workspace; they follow their resources
+    component_groups: Dict[int, Set[str]] = {}
+    for index, block in enumerate(graph_blocks):
+        groups = component_groups.setdefault(components.find(index), set())
+        if block.group and block.kind != 'provider':
+            groups.add(block.group)
+
+    # Clouds tied together by any component end up in the same workspace
+    group_names = sorted({group for groups in component_groups.values() for group in groups})
+    group_index = {group: i for i, group in enumerate(group_names)}
+    cloud_links = _UnionFind(len(group_names))
+    for groups in component_groups.values():
+        groups = sorted(groups)
+        for group in groups[1:]:
+            cloud_links.union(group_index[groups[0]], group_index[group])
+
+    workspace_groups: Dict[int, Set[str]] = {}
+    for group in group_names:
+        workspace_groups.setdefault(cloud_links.find(group_index[group]), set()).add(group)
+    names = {root: '-'.join(sorted(groups)) for root, groups in workspace_groups.items()}
+    default_name = min(names.values()) if names else 'default'
+
+    def workspace_for(index: int) -> Optional[str]:
+        groups = component_groups[components.find(index)]
+        if not groups:
+            block = graph_blocks[index]
+            if block.kind == 'provider':
+                # Configuration for a cloud with no resources is dropped
+                group = block.group
+                return names[cloud_links.find(group_index[group])] if group in group_index else None
+            return default_name
+        return names[cloud_links.find(group_index[next(iter(groups))])]
+
+    workspaces: Dict[str, List[TerraformBlock]] = {name: [] for name in sorted(names.values())}
+    block_workspace: Dict[int, str] = {}
+    for index, block in enumerate(graph_blocks):
+        name = workspace_for(index)
+        if name is None:
+            continue
+        block_workspace[index] = name
+        workspaces.setdefault(name, []).append(block)
+
+    skipped_outputs = []
+    for block in blocks:
+        if block.kind != 'output':
+            continue
+        targets = {block_workspace[index_by_address[ref]]
+                   for ref in block.references if index_by_address.get(ref) in block_workspace}
+        if len(targets) > 1:
+            skipped_outputs.append(block.labels[0] if block.labels else '?')
+            continue
+        workspaces.setdefault(targets.pop() if targets else default_name, []).append(block)
+
+    return workspaces, skipped_outputs
+
+
+def partition_terraform(output_dir: str, verbose: bool = False) -> List[Workspace]:
+    """Write one root module per independent cloud group under output_dir/workspaces/.
+
+    Variable declarations and terraform.tfvars are copied to every workspace
+    (unused variables are harmless), as are the other generated files such as
+    cloud-init templates referenced through path.module. Returns the
+    workspaces in name order; a single workspace means nothing can run in
+    parallel.
+    """
+    tf_files = sorted(name for name in os.listdir(output_dir) if name.endswith('.tf'))
+    blocks: List[TerraformBlock] = []
+    shared_blocks: List[TerraformBlock] = []
+    terraform_blocks: List[TerraformBlock] = []
+    for name in tf_files:
+        with open(os.path.join(output_dir, name)) as f:
+            for block in parse_blocks(f.read(), name):
+                if block.kind == 'terraform':
+                    terraform_blocks.append(block)
+                elif block.kind == 'variable':
+                    shared_blocks.append(block)
+                else:
+                    blocks.append(block)
+
+    partitions, skipped_outputs = partition_blocks(blocks)
+    for output_name in skipped_outputs:
+        print(f"Warning: Output '{output_name}' combines several workspaces and is not available in the parallel layout")
+
+    workspaces_root = os.path.join(output_dir, WORKSPACES_DIRNAME)
+    if os.path.isdir(workspaces_root):
+        # Keep existing state/provider caches, but regenerate the configuration
+        for entry in os.listdir(workspaces_root):
+            if entry not in partitions:
+                print(f"Warning: Leaving stale workspace '{entry}' in {workspaces_root} untouched")
+
+    extra_files = [
+        name for name in os.listdir(output_dir)
+        if os.path.isfile(os.path.join(output_dir, name))
+        and not name.endswith(('.tf', '.sh')) and name not in _SKIPPED_FILES
+    ]
+
+    workspaces = []
+    for name, workspace_blocks in partitions.items():
+        path = os.path.join(workspaces_root, name)
+        os.makedirs(path, exist_ok=True)
+        providers = {block.provider for block in workspace_blocks if block.provider}
+        with open(os.path.join(path, 'main.tf'), 'w') as f:
+            f.write(f"# Workspace '{name}' generated by YamlForge from {', '.join(tf_files)}\n\n")
+            for block in terraform_blocks:
+                f.write(_filter_required_providers(block.text, providers))
+                f.write('\n')
+            for block in workspace_blocks:
+                f.write(block.text)
+                f.write('\n')
+        with open(os.path.join(path, 'variables.tf'), 'w') as f:
+            for block in shared_blocks:
+                f.write(block.text)
+                f.write('\n')
+        for extra in extra_files:
+            shutil.copy2(os.path.join(output_dir, extra), os.path.join(path, extra))
+
+        workspace = Workspace(name, set(name.split('-')), path)
+        workspace.resource_count = sum(1 for block in workspace_blocks if block.kind == 'resource')
+        workspaces.append(workspace)
+        if verbose:
+            print(f"  Workspace {name}: {workspace.resource_count} resources -> {path}")
+
+    return workspaces
@@ -21,15 +21,21 @@ limitations under the License.
 """
 
 import argparse
+import atexit
 import os
 import sys
 import yaml
 import subprocess
 import json
+import copy
 from datetime import datetime
-from .utils import find_yamlforge_file
+from .utils import LIBYAML_AVAILABLE, find_yamlforge_file, load_yaml
 
 from .core.converter import YamlForgeConverter
+from .core.instance_expansion import group_instances
+from .core.profiling import get_profiler, profile_span
+from .core.reporting import OUTPUT_FORMATS, get_result_stream, redirect_console_output, run_console_command
+from .core.terraform_providers import CLI_CONFIG_FILE, cli_config_env, get_plugin_cache_dir
 
 # Optional jsonschema for validation
 try:
@@ -41,6 +47,21 @@ except ImportError:
 # Version information
 from ._version import __version__
 
+_schema_validators = {}
+
+
+def _get_schema_validator(schema_path):
+    """Return a validator for the schema file, loading and checking it only once."""
+    validator = _schema_validators.get(schema_path)
+    if validator is None:
+        with open(schema_path, 'r') as f:
+            schema = json.load(f)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = _schema_validators[schema_path] = validator_class(schema)
+    return validator
+
+
 def validate_yaml_against_schema(yaml_data, input_file_path, ansible_mode=False):
     """Validate YAML configuration against YamlForge schema"""
     
@@ -63,11 +84,10 @@ def validate_yaml_against_schema(yaml_data, input_file_path, ansible_mode=False)
             print(f"INFO: Schema file not found at {schema_path}, skipping validation")
         return True
     
-    # Load the schema
+    # Load the schema (parsed and checked once per process)
     try:
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-    except Exception as e:
+        validator = _get_schema_validator(schema_path)
+    except (OSError, ValueError, jsonschema.exceptions.SchemaError) as e:
         # Schema loading failed, skip validation
         if not ansible_mode:
             print(f"INFO: Could not load schema file: {e}")
@@ -75,7 +95,10 @@ def validate_yaml_against_schema(yaml_data, input_file_path, ansible_mode=False)
     
     # Validate the configuration
     try:
-        jsonschema.validate(yaml_data, schema)
+        # Report the same error jsonschema.validate() would
+        error = jsonschema.exceptions.best_match(validator.iter_errors(yaml_data))
+        if error is not None:
+            raise error
         return True
     except jsonschema.ValidationError as e:
         # Format the validation error nicely
@@ -119,13 +142,34 @@ def validate_yaml_against_schema(yaml_data, input_file_path, ansible_mode=False)
             print(f"INFO: Schema validation error: {e}")
         return True
 
-def run_command(command, cwd=None, description=""):
+def merge_openshift_defaults(config, verbose=False):
+    """Merge OpenShift defaults into config if OpenShift clusters are present but defaults are missing."""
+    if 'openshift_clusters' not in config or config.get('rosa_deployment'):
+        return
+    # Reuse the OpenShift defaults the providers already parsed
+    try:
+        from .providers.openshift.base import load_shared_defaults
+        openshift_defaults = load_shared_defaults('defaults/openshift.yaml')
+        
+        # Merge OpenShift defaults at root level (not under 'openshift' key);
+        # copy values so the shared parsed defaults are never mutated
+        openshift_config = openshift_defaults.get('openshift', {})
+        for key, value in openshift_config.items():
+            if key not in config:
+                config[key] = copy.deepcopy(value)
+                if verbose:
+                    print(f"Merged OpenShift default: {key}")
+    except Exception as e:
+        if verbose:
+            print(f"Could not load OpenShift defaults: {e}")
+
+def run_command(command, cwd=None, description="", env=None):
     """Run a shell command and return success status."""
     try:
         print(f"  {description}")
         print(f"   Executing: {command}")
-        subprocess.run(command, shell=True, cwd=cwd, check=True, 
-                      capture_output=False, text=True)
+        with profile_span(command, 'subprocess'):
+            run_console_command(command, shell=True, cwd=cwd, env=env)
         print(f"Success: {description}")
         return True
     except subprocess.CalledProcessError as e:
@@ -195,45 +239,15 @@ def analyze_configuration(converter, config, raw_yaml_data):
         # Track which exclusions have been shown to avoid repetition
         shown_exclusions = set()
         
-        # Expand instances with count > 1 into separate entries
-        expanded_instances = []
-        for instance in instances:
-            instance_count = instance.get('count', 1)
-            if instance_count > 1:
-                # Create separate entries for each instance in the count
-                for instance_index in range(instance_count):
-                    instance_copy = instance.copy()
-                    original_name = instance_copy['name']
-                    # Resolve GUID first before applying count naming logic
-                    if '{guid}' in original_name:
-                        guid = converter.get_validated_guid(raw_yaml_data)
-                        original_name = original_name.replace('{guid}', guid)
-                    
-                    # Check if name ends with a number and increment from there
-                    import re
-                    match = re.search(r'(.+?)(\d+)$', original_name)
-                    if match:
-                        # Name ends with number, increment from that base
-                        base_name = match.group(1)
-                        base_number_str = match.group(2)
-                        base_number = int(base_number_str)
-                        # Preserve padding (e.g., 01, 02, 003) by using the same width
-                        padding_width = len(base_number_str)
-                        new_number = base_number + instance_index
-                        instance_copy['name'] = f"{base_name}{new_number:0{padding_width}d}"
-                    else:
-                        # Name doesn't end with number, append -X
-                        instance_copy['name'] = f"{original_name}-{instance_index + 1}"
-                    instance_copy['_is_counted'] = True
-                    instance_copy['_original_name'] = original_name
-                    expanded_instances.append(instance_copy)
-            else:
-                # Single instance, add as-is
-                instance_copy = instance.copy()
-                instance_copy['_is_counted'] = False
-                expanded_instances.append(instance_copy)
+        # Members of count > 1 definitions are generated lazily, one at a time
+        members = (
+            member
+            for group in group_instances(instances, lambda: converter.get_validated_guid(raw_yaml_data))
+            for member in group
+        )
         
-        for i, instance in enumerate(expanded_instances, 1):
+        for i, member in enumerate(members, 1):
+            instance = member.to_dict()
             name = instance.get('name', 'unnamed')
             provider = instance.get('provider', 'unspecified')
             region = instance.get('region', 'unspecified')
@@ -1023,6 +1037,10 @@ def generate_deployment_instructions(config, output_dir, converter=None, raw_yam
     # Add Terraform success message after deployment instructions header
     instructions += f"Terraform configuration generated successfully in '{output_dir}'\n\n"
     
+    if os.path.exists(os.path.join(output_dir, CLI_CONFIG_FILE)):
+        instructions += f"Reuse cached providers (run 'yamlforge providers prefetch' once to work offline):\n"
+        instructions += f"  export TF_CLI_CONFIG_FILE=\"$(realpath {output_dir})/{CLI_CONFIG_FILE}\"\n\n"
+    
     # Handle case with no OpenShift clusters (just regular infrastructure)
     if not clusters:
         instructions += f"Deploy Infrastructure and VM Instances:\n"
@@ -1110,8 +1128,12 @@ def generate_deployment_instructions(config, output_dir, converter=None, raw_yam
     
     return instructions
 
-def auto_deploy_infrastructure(output_dir, yaml_data):
-    """Automatically deploy infrastructure with Terraform and ROSA."""
+def auto_deploy_infrastructure(output_dir, yaml_data, parallel=False):
+    """Automatically deploy infrastructure with Terraform and ROSA.
+
+    With parallel=True each independent cloud gets its own Terraform root
+    module under <output_dir>/workspaces/ and they are deployed concurrently.
+    """
     print("\nStarting automatic deployment...")
     
     # Check if ROSA clusters exist (look in yamlforge config structure)
@@ -1141,16 +1163,39 @@ def auto_deploy_infrastructure(output_dir, yaml_data):
     
     print(f"")
     
+    if parallel:
+        from .core.parallel_deploy import ParallelDeployment
+        from .core.workspaces import partition_terraform
+
+        workspaces = partition_terraform(output_dir, verbose=True)
+        if len(workspaces) > 1:
+            print(f"\nPHASE 1: Deploying {len(workspaces)} Terraform workspaces in parallel: "
+                  f"{', '.join(w.name for w in workspaces)}")
+            print(f"Provider plugin cache: {get_plugin_cache_dir()}")
+            rosa_script = rosa_script_path if has_rosa_clusters and has_rosa_script else None
+            if rosa_script:
+                print(f"ROSA cluster creation starts once the AWS workspace is applied")
+            deployment = ParallelDeployment(output_dir, workspaces, rosa_script)
+            if not deployment.run():
+                print(f"Parallel deployment failed: see the [workspace] logs above. Each workspace in {output_dir}/workspaces can be retried with terraform apply")
+                return False
+            print(f"\nDEPLOYMENT COMPLETE: Infrastructure ready")
+            return True
+        print(f"Only one independent workspace found, deploying serially")
+    
     # Phase 1: Terraform Infrastructure
     print(f"\nPHASE 1: Deploying Terraform Infrastructure")
     
-    if not run_command("terraform init", cwd=output_dir, description="Initializing Terraform"):
+    # Use the generated CLI configuration (plugin cache / prefetched provider mirror)
+    terraform_env = cli_config_env(output_dir)
+    
+    if not run_command("terraform init", cwd=output_dir, description="Initializing Terraform", env=terraform_env):
         return False
     
-    if not run_command("terraform plan", cwd=output_dir, description="Planning Terraform deployment"):
+    if not run_command("terraform plan", cwd=output_dir, description="Planning Terraform deployment", env=terraform_env):
         return False
     
-    if not run_command("terraform apply -auto-approve", cwd=output_dir, description="Applying Terraform configuration"):
+    if not run_command("terraform apply -auto-approve", cwd=output_dir, description="Applying Terraform configuration", env=terraform_env):
         return False
     
     print(f"[SUCCESS] PHASE 1 Complete: AWS infrastructure deployed successfully")
@@ -1179,19 +1224,125 @@ def auto_deploy_infrastructure(output_dir, yaml_data):
     
     return True
 
+def print_ansible_output(ansible_output, reporter=None):
+    """Print the Ansible JSON result, including stage timings and the reporter's warnings."""
+    if reporter is not None:
+        ansible_output['warnings'].extend(reporter.warnings)
+    ansible_output['timings'] = get_profiler().to_dict(include_spans=False)
+    print(json.dumps(ansible_output), file=get_result_stream())
+
+
+def report_profile(args):
+    """Print and/or save the --profile breakdown when the run ends."""
+    profiler = get_profiler()
+    if args.profile and not args.ansible:
+        print()
+        print(profiler.format_report())
+        print(f"YAML loader: {'libyaml (CSafeLoader)' if LIBYAML_AVAILABLE else 'pure Python (SafeLoader); install PyYAML with libyaml for faster parsing'}")
+    if args.profile_output:
+        try:
+            profiler.write(args.profile_output, args.profile_format)
+            if not args.ansible:
+                print(f"Profile written to {args.profile_output} ({args.profile_format} format)")
+        except OSError as e:
+            print(f"Warning: Could not write profile to {args.profile_output}: {e}", file=sys.stderr)
+
+
+def catalog_main(argv):
+    """Handle 'yamlforge catalog build'."""
+    from pathlib import Path
+    from .core.catalog import build_catalog
+
+    parser = argparse.ArgumentParser(prog='yamlforge catalog', description='Manage the precompiled mappings/defaults catalog snapshot')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    build_parser = subparsers.add_parser('build', help='Parse mappings/ and defaults/ and write the binary catalog snapshot')
+    build_parser.add_argument('-o', '--output', help='Snapshot path (default: YAMLFORGE_CATALOG_SNAPSHOT or the yamlforge cache directory)')
+    args = parser.parse_args(argv)
+
+    try:
+        snapshot_path, snapshot = build_catalog(Path(args.output) if args.output else None)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"ERROR: Could not build catalog snapshot: {e}")
+        sys.exit(1)
+    print(f"Catalog snapshot written to {snapshot_path}")
+    print(f"  Source files: {len(snapshot.files)}")
+    print(f"  Content hash: {snapshot.content_hash}")
+
+
+def providers_main(argv):
+    """Handle 'yamlforge providers prefetch'."""
+    from .core.terraform_providers import TERRAFORM_PROVIDERS, get_mirror_dir, prefetch_providers
+
+    parser = argparse.ArgumentParser(prog='yamlforge providers', description='Manage the local Terraform provider mirror used by generated configurations')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    prefetch_parser = subparsers.add_parser('prefetch', help='Download providers into a local filesystem mirror so terraform init can run offline')
+    prefetch_parser.add_argument('input_files', nargs='*', help='YAML configurations whose providers to fetch (default: every provider YamlForge can generate)')
+    prefetch_parser.add_argument('--mirror', help='Mirror directory (default: YAMLFORGE_PROVIDER_MIRROR or the yamlforge cache directory)')
+    prefetch_parser.add_argument('--platform', action='append', help='Target platform such as linux_amd64 (repeatable; default: the current platform)')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.input_files:
+            converter = YamlForgeConverter(analyze_mode=True)
+            required_providers = set()
+            for input_file in args.input_files:
+                with open(input_file, 'r') as f:
+                    raw_yaml_data = load_yaml(f)
+                converter.set_yaml_data(raw_yaml_data)
+                required_providers.update(converter.detect_required_providers(raw_yaml_data))
+        else:
+            required_providers = set(TERRAFORM_PROVIDERS)
+
+        print(f"Prefetching Terraform providers into {os.path.abspath(args.mirror or get_mirror_dir())}")
+        mirror_dir, requirements = prefetch_providers(sorted(required_providers), args.mirror, args.platform)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"ERROR: Could not prefetch providers: {e}")
+        sys.exit(1)
+
+    print(f"Provider mirror ready: {mirror_dir}")
+    for name, (source, constraint) in requirements.items():
+        print(f"  {name:<12} {source} {constraint}")
+    if args.mirror:
+        print(f"Set YAMLFORGE_PROVIDER_MIRROR={mirror_dir} so generated configurations use this mirror")
+    print("Generated output directories now include a .terraform.lock.hcl and yamlforge.tfrc for these providers")
+
+
 def main():
     """Main entry point for yamlforge CLI."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'catalog':
+        catalog_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'providers':
+        providers_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description='YamlForge - Convert unified YAML infrastructure to provider-specific Terraform')
     parser.add_argument('input_file', help='YAML infrastructure definition file')
     parser.add_argument('-d', '--output-dir', help='Output directory for generated Terraform files (not required with --analyze)')
     parser.add_argument('--analyze', action='store_true', help='Analyze configuration and show provider selections, cost analysis, and flavor mappings without generating Terraform files. Perfect for AI chatbots and exploring options.')
     parser.add_argument('--auto-deploy', action='store_true', help='Automatically execute Terraform and ROSA deployment after generation. WARNING: This will provision REAL cloud infrastructure and incur ACTUAL costs on your cloud provider accounts (VMs, storage, networking, OpenShift clusters can cost $100s+ per month). Use only when you understand the financial implications.')
+    parser.add_argument('--parallel-deploy', action='store_true', help='With --auto-deploy, split the Terraform into independent per-cloud workspaces (under <output-dir>/workspaces) and run their init/plan/apply concurrently with a shared provider plugin cache; ROSA creation starts once the AWS workspace is applied')
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output (show generated files, detailed AMI search info, etc.)')
     parser.add_argument('--no-credentials', action='store_true', help='Skip credential-dependent operations (dynamic image lookup, zone lookup, ROSA version lookup, etc.). WARNING: Generated Terraform will likely not work without manual updates to placeholders.')
     parser.add_argument('--ansible', action='store_true', help='Output structured JSON for Ansible module consumption instead of human-readable text')
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS, default='auto', help='Progress output: tty (styled), plain (written in blocks), json (one event per line) or quiet; auto (default) picks tty on a terminal and plain otherwise. With json, quiet or --ansible all other text goes to stderr; --ansible implies quiet')
+    parser.add_argument('--profile', action='store_true', help='Time each generation stage and cloud API call and print a sorted breakdown at the end')
+    parser.add_argument('--profile-output', metavar='FILE', help='Write the profile to FILE (implies --profile)')
+    parser.add_argument('--profile-format', choices=['json', 'chrome'], default='json', help='Format for --profile-output: json (default) or chrome (chrome://tracing / Perfetto trace)')
     
     args = parser.parse_args()
     
+    # Machine-readable output keeps stdout to itself; everything else printed goes to stderr
+    if args.ansible or args.output_format in ('json', 'quiet'):
+        redirect_console_output()
+    
+    # Timings are collected for --profile and always included in --ansible output
+    if args.profile_output:
+        args.profile = True
+    if args.profile or args.ansible:
+        get_profiler().enable()
+        atexit.register(report_profile, args)
+    
     # Validate incompatible flags
     if args.analyze and args.auto_deploy:
         print("ERROR: --analyze and --auto-deploy cannot be used together")
@@ -1200,6 +1351,10 @@ def main():
         print("  Use one or the other, not both")
         sys.exit(1)
     
+    if args.parallel_deploy and not args.auto_deploy:
+        print("ERROR: --parallel-deploy requires --auto-deploy")
+        sys.exit(1)
+    
     # Initialize Ansible output structure
     ansible_output = {
         'terraform_files': [],
@@ -1236,7 +1391,7 @@ def main():
         error_msg = f"Input file '{args.input_file}' does not exist"
         if args.ansible:
             ansible_output['errors'].append(error_msg)
-            print(json.dumps(ansible_output))
+            print_ansible_output(ansible_output)
         else:
             print(f"ERROR: {error_msg}")
         sys.exit(1)
@@ -1256,9 +1411,9 @@ def main():
             sys.exit(1)
     
     try:
-        # Load the YAML configuration
-        with open(args.input_file, 'r') as f:
-            raw_yaml_data = yaml.safe_load(f)
+        # Load the YAML configuration (parsed once; everything below receives this data)
+        with profile_span('load_input'), open(args.input_file, 'r') as f:
+            raw_yaml_data = load_yaml(f)
     except FileNotFoundError:
         print(f"ERROR: Input file '{args.input_file}' not found")
         sys.exit(1)
@@ -1266,12 +1421,16 @@ def main():
         print(f"ERROR: Invalid YAML syntax in '{args.input_file}': {e}")
         sys.exit(1)
     
+    reporter = None
     try:
         # Validate YAML against schema
-        validate_yaml_against_schema(raw_yaml_data, args.input_file, args.ansible)
+        with profile_span('schema_validation'):
+            validate_yaml_against_schema(raw_yaml_data, args.input_file, args.ansible)
         
         # Create converter instance (skip Terraform validation in analyze mode)
-        converter = YamlForgeConverter(analyze_mode=args.analyze, ansible_mode=args.ansible)
+        with profile_span('converter_init'):
+            converter = YamlForgeConverter(analyze_mode=args.analyze, ansible_mode=args.ansible, output_format=args.output_format)
+        reporter = converter.reporter
         
         # Check for root-level instances (old format) and warn
         root_instances = raw_yaml_data.get('instances', [])
@@ -1300,25 +1459,7 @@ def main():
         config = raw_yaml_data['yamlforge']
         
         # Merge OpenShift defaults if OpenShift clusters are present but defaults are missing
-        if 'openshift_clusters' in config and not config.get('rosa_deployment'):
-            # Load OpenShift defaults
-            try:
-                import yaml as yaml_loader
-                from .utils import find_yamlforge_file
-                openshift_defaults_path = find_yamlforge_file('defaults/openshift.yaml')
-                with open(openshift_defaults_path, 'r') as f:
-                    openshift_defaults = yaml_loader.safe_load(f)
-                
-                # Merge OpenShift defaults at root level (not under 'openshift' key)
-                openshift_config = openshift_defaults.get('openshift', {})
-                for key, value in openshift_config.items():
-                    if key not in config:
-                        config[key] = value
-                        if args.verbose:
-                            print(f"Merged OpenShift default: {key}")
-            except Exception as e:
-                if args.verbose:
-                    print(f"Could not load OpenShift defaults: {e}")
+        merge_openshift_defaults(config, args.verbose)
         
         # Set flags on converter so providers can access them
         converter.verbose = args.verbose
@@ -1328,10 +1469,12 @@ def main():
         if args.analyze:
             # Set analysis mode flag to suppress duplicate output
             # Run analysis mode
-            analyze_configuration(converter, config, raw_yaml_data)
+            with profile_span('analyze_configuration'):
+                analyze_configuration(converter, config, raw_yaml_data)
         else:
             # Pass the full YAML data so GUID can be extracted from root level
-            converter.convert(config, args.output_dir, verbose=args.verbose, full_yaml_data=raw_yaml_data)
+            with profile_span('convert'):
+                converter.convert(config, args.output_dir, verbose=args.verbose, full_yaml_data=raw_yaml_data)
             
             # Collect generated Terraform files for Ansible output
             if args.ansible:
@@ -1342,13 +1485,14 @@ def main():
                 
                 # Get detected providers from converter
                 if hasattr(converter, 'detected_providers'):
-                    ansible_output['providers_detected'] = list(converter.detected_providers)
+                    ansible_output['providers_detected'] = sorted(converter.detected_providers)
             
             if args.auto_deploy:
                 if args.ansible:
                     ansible_output['deployment_status'] = 'attempting'
                 try:
-                    auto_deploy_infrastructure(args.output_dir, raw_yaml_data)
+                    with profile_span('auto_deploy'):
+                        auto_deploy_infrastructure(args.output_dir, raw_yaml_data, parallel=args.parallel_deploy)
                     if args.ansible:
                         ansible_output['deployment_status'] = 'deployed'
                 except Exception as deploy_error:
@@ -1364,14 +1508,14 @@ def main():
         
         # Output JSON for Ansible if requested
         if args.ansible:
-            print(json.dumps(ansible_output))
+            print_ansible_output(ansible_output, reporter)
 
     except ValueError as e:
         # Handle user-friendly errors (like GUID validation) without stack trace
         error_msg = str(e)
         if args.ansible:
             ansible_output['errors'].append(error_msg)
-            print(json.dumps(ansible_output))
+            print_ansible_output(ansible_output, reporter)
         else:
             if "GUID is required" in error_msg or "GUID must be exactly" in error_msg or "Invalid GUID format" in error_msg:
                 print(f"\nERROR: {e}\n")
@@ -1386,7 +1530,7 @@ def main():
         error_msg = f"File Error: {e}"
         if args.ansible:
             ansible_output['errors'].append(error_msg)
-            print(json.dumps(ansible_output))
+            print_ansible_output(ansible_output, reporter)
         else:
             print(f"ERROR: {error_msg}")
         sys.exit(1)
@@ -1394,7 +1538,7 @@ def main():
         error_msg = f"Unexpected Error: {e}"
         if args.ansible:
             ansible_output['errors'].append(error_msg)
-            print(json.dumps(ansible_output))
+            print_ansible_output(ansible_output, reporter)
         else:
             print(f"ERROR: {error_msg}")
         sys.exit(1)
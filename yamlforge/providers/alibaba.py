@@ -6,8 +6,11 @@ networking, security groups, and other Alibaba Cloud resources.
 """
 
 import yaml
+import sys
 from pathlib import Path
 
+from ..core.shared_resources import key_fingerprint
+
 # Alibaba Cloud imports - optional, fallback if not available
 try:
     from alibabacloud_ecs20140526.client import Client as EcsClient  # pylint: disable=import-error
@@ -15,7 +18,7 @@ try:
     ALICLOUD_SDK_AVAILABLE = True
 except ImportError:
     ALICLOUD_SDK_AVAILABLE = False
-    print("Warning: alibabacloud-ecs20140526 not installed. Alibaba Cloud dynamic image discovery disabled.")
+    print("Warning: alibabacloud-ecs20140526 not installed. Alibaba Cloud dynamic image discovery disabled.", file=sys.stderr)
 
 
 class AlibabaImageResolver:
@@ -159,7 +162,7 @@ class AlibabaProvider:
                 raise ValueError(f"Instance '{instance_name}': Specified zone '{user_specified_zone}' does not belong to region '{alibaba_region}'. "
                                f"Zone region: '{expected_region}', Instance region: '{alibaba_region}'")
             
-            print(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{alibaba_region}'")
+            self.converter.reporter.echo(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{alibaba_region}'")
             availability_zone = user_specified_zone
             
         elif user_specified_zone and not has_region:
@@ -187,22 +190,16 @@ class AlibabaProvider:
         # Use clean_name directly if GUID is already present, otherwise add GUID
         resource_name = clean_name if has_guid_placeholder else f"{clean_name}_{guid}"
 
-        # Generate SSH key pair resource if SSH key is provided
+        # Use the region's key pair for this SSH key (shared by every instance using it)
         ssh_key_resources = ""
         key_name_ref = "null"
         
         if ssh_key_config and ssh_key_config.get('public_key'):
-            # Use clean_name directly if GUID is already present, otherwise add GUID
-            ssh_key_name = clean_name if has_guid_placeholder else f"{clean_name}_key_pair_{guid}"
-            ssh_key_resources = f'''
-# Alibaba Cloud Key Pair for {instance_name}
-resource "alicloud_ecs_key_pair" "{ssh_key_name}" {{
-  key_pair_name   = "{instance_name}-key"
-  public_key      = "{ssh_key_config['public_key']}"
-}}
-
-'''
-            key_name_ref = f"alicloud_ecs_key_pair.{ssh_key_name}.key_pair_name"
+            public_key = ssh_key_config['public_key']
+            ssh_key_resources, key_name_ref = self.converter.shared_resource(
+                ('alibaba', alibaba_region, 'ssh_key', public_key),
+                lambda: self.generate_alibaba_key_pair(public_key, alibaba_region, yaml_data)
+            )
 
         # Get Alibaba security group references with regional awareness
         alibaba_sg_refs = []
@@ -323,6 +320,21 @@ resource "alicloud_route_table_attachment" "main_rta_{clean_region}_{self.conver
 }}
 '''
 
+    def generate_alibaba_key_pair(self, public_key, region, yaml_data=None):
+        """Generate the Alibaba Cloud key pair for an SSH public key in a region; returns (hcl, key pair name reference)."""
+        guid = self.converter.get_validated_guid(yaml_data)
+        fingerprint = key_fingerprint(public_key)
+        clean_region = region.replace("-", "_").replace(".", "_")
+        ssh_key_name = f"ssh_key_{clean_region}_{fingerprint}_{guid}"
+        return f'''
+# Alibaba Cloud Key Pair: {region} ({fingerprint})
+resource "alicloud_ecs_key_pair" "{ssh_key_name}" {{
+  key_pair_name   = "yamlforge-{region}-{fingerprint}-{guid}"
+  public_key      = "{public_key}"
+}}
+
+''', f"alicloud_ecs_key_pair.{ssh_key_name}.key_pair_name"
+
     def generate_alibaba_security_group(self, sg_name, rules, region, yaml_data=None):  # noqa: vulture
         """Generate Alibaba Cloud security group with rules for specific region."""
         # Replace {guid} placeholder in security group name
@@ -5,10 +5,13 @@ Contains AWS-specific implementations for image resolution, VM generation,
 networking, security groups, and other AWS cloud resources.
 """
 
-import yaml
 from pathlib import Path
 import os # Added for create_rosa_account_roles_via_cli
-from ..utils import find_yamlforge_file
+import sys
+from ..core.catalog import load_catalog_file
+from ..core.profiling import api_span
+from ..core.render_pipeline import KeyedLocks, LazyValue, capture_output, show_output
+from ..core.shared_resources import key_fingerprint
 
 # AWS imports
 try:
@@ -20,7 +23,7 @@ try:
     AWS_SDK_AVAILABLE = True
 except ImportError:
     AWS_SDK_AVAILABLE = False
-    print("Warning: boto3 not installed. AWS dynamic AMI discovery disabled.")
+    print("Warning: boto3 not installed. AWS dynamic AMI discovery disabled.", file=sys.stderr)
 
 
 class AWSImageResolver:
@@ -34,18 +37,23 @@ class AWSImageResolver:
         self.client = None
         self.cache = {}
         self.cache_timestamps = {}
+        self._lookup_locks = KeyedLocks()
+        self._lookup_output = {}
+
+    def _echo(self, message):
+        """Report a line through the converter's reporter, or print it when used standalone."""
+        if self.converter:
+            self.converter.reporter.echo(message)
+        else:
+            print(message)
 
     def load_config(self):
         """Load AWS configuration from defaults and credentials system."""
         # Load defaults file directly
         try:
-            defaults_file = find_yamlforge_file("defaults/aws.yaml")
+            defaults_config = load_catalog_file("defaults/aws.yaml")
         except FileNotFoundError as e:
             raise Exception(f"Required AWS defaults file not found: defaults/aws.yaml")
-
-        try:
-            with open(defaults_file, 'r') as f:
-                defaults_config = yaml.safe_load(f)
         except Exception as e:
             raise Exception(f"Failed to load defaults/aws.yaml: {e}")
 
@@ -60,12 +68,12 @@ class AWSImageResolver:
         # Check if credentials are available for dynamic discovery (skip in no-credentials mode)
         if self.converter and self.converter.no_credentials:
             has_credentials = False
-            print("  NO-CREDENTIALS MODE: Skipping AWS credential discovery in image resolver")
+            self._echo("  NO-CREDENTIALS MODE: Skipping AWS credential discovery in image resolver")
         else:
             has_credentials = self.credentials and self.credentials.get_aws_credentials()
 
         if not has_credentials:
-            print("Warning: AWS credentials not found. "
+            self._echo("Warning: AWS credentials not found. "
                   "AMI discovery will fail if AWS images are requested.")
 
         return {
@@ -130,7 +138,7 @@ class AWSImageResolver:
             return client
 
         except Exception as e:
-            print(f"Warning: Failed to create AWS client for region {region}: {e}")
+            self._echo(f"Warning: Failed to create AWS client for region {region}: {e}")
             return None
 
     def is_cache_valid(self, cache_key):
@@ -160,15 +168,16 @@ class AWSImageResolver:
                     
                     # Search for all RHEL AMIs to find the best alternatives
                     try:
-                        response = client.describe_images(
-                            Filters=[
-                                {'Name': 'name', 'Values': ['RHEL*']},
-                                {'Name': 'owner-id', 'Values': [owner]},
-                                {'Name': 'state', 'Values': ['available']},
-                                {'Name': 'architecture', 'Values': [architecture]}
-                            ],
-                            MaxResults=50
-                        )
+                        with api_span('aws', 'ec2.describe_images', region=region):
+                            response = client.describe_images(
+                                Filters=[
+                                    {'Name': 'name', 'Values': ['RHEL*']},
+                                    {'Name': 'owner-id', 'Values': [owner]},
+                                    {'Name': 'state', 'Values': ['available']},
+                                    {'Name': 'architecture', 'Values': [architecture]}
+                                ],
+                                MaxResults=50
+                            )
                         
                         # Parse and score all found AMIs
                         scored_amis = []
@@ -230,15 +239,16 @@ class AWSImageResolver:
                         
                         for pattern in broader_patterns:
                             try:
-                                response = client.describe_images(
-                                    Filters=[
-                                        {'Name': 'name', 'Values': [pattern]},
-                                        {'Name': 'owner-id', 'Values': [owner]},
-                                        {'Name': 'state', 'Values': ['available']},
-                                        {'Name': 'architecture', 'Values': [architecture]}
-                                    ],
-                                    MaxResults=10
-                                )
+                                with api_span('aws', 'ec2.describe_images', region=region):
+                                    response = client.describe_images(
+                                        Filters=[
+                                            {'Name': 'name', 'Values': [pattern]},
+                                            {'Name': 'owner-id', 'Values': [owner]},
+                                            {'Name': 'state', 'Values': ['available']},
+                                            {'Name': 'architecture', 'Values': [architecture]}
+                                        ],
+                                        MaxResults=10
+                                    )
                                 
                                 for img in response['Images']:
                                     suggestions.append({
@@ -261,16 +271,17 @@ class AWSImageResolver:
                     public_owner = self._get_required_config_owner('redhat_public')
                     public_pattern = original_pattern.replace("_GA", "").replace("Access", "").replace("GOLD", "").strip("*")
                     
-                    response = client.describe_images(
-                        Filters=[
-                            {'Name': 'name', 'Values': [f"{public_pattern}*"]},
-                            {'Name': 'owner-id', 'Values': [public_owner]},
-                            {'Name': 'state', 'Values': ['available']},
-                            {'Name': 'architecture', 'Values': [architecture]},
-                            {'Name': 'is-public', 'Values': ['true']}
-                        ],
-                        MaxResults=5
-                    )
+                    with api_span('aws', 'ec2.describe_images', region=region):
+                        response = client.describe_images(
+                            Filters=[
+                                {'Name': 'name', 'Values': [f"{public_pattern}*"]},
+                                {'Name': 'owner-id', 'Values': [public_owner]},
+                                {'Name': 'state', 'Values': ['available']},
+                                {'Name': 'architecture', 'Values': [architecture]},
+                                {'Name': 'is-public', 'Values': ['true']}
+                            ],
+                            MaxResults=5
+                        )
                     
                     for img in response['Images']:
                         suggestions.append({
@@ -299,30 +310,43 @@ class AWSImageResolver:
         filters_str = str(sorted(additional_filters or []))
         cache_key = f"{name_pattern}_{owner}_{region}_{architecture}_{hash(filters_str)}"
 
-        # Check cache first
-        if self.is_cache_valid(cache_key):
-            cached_result = self.cache[cache_key]
-            # Handle both old format (string) and new format (dict)
-            if isinstance(cached_result, str):
-                ami_id = cached_result
-                ami_name = 'Unknown'
-                result = {'ami_id': ami_id, 'ami_name': ami_name}
-            else:
-                ami_id = cached_result['ami_id']
-                ami_name = cached_result['ami_name']
-                result = cached_result
-            
-            # Display cached AMI with same format as fresh lookup
-            if instance_name and image_key:
-                self.converter.print_instance_output(instance_name, 'aws', f"Dynamic image search for {instance_name} on aws for {image_key} in {region} results in {ami_id} (cached)")
-                if self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                    self.converter.print_instance_output(instance_name, 'aws', f"Verbose: {ami_name}")
+        # Instances rendered concurrently query each AMI once; what the query
+        # printed belongs to the first of them, the rest show it as cached
+        with self._lookup_locks(cache_key):
+            was_cached = self.is_cache_valid(cache_key)
+            if was_cached:
+                cached_result = self.cache[cache_key]
+                # Handle both old format (string) and new format (dict)
+                if isinstance(cached_result, str):
+                    result = {'ami_id': cached_result, 'ami_name': 'Unknown'}
+                else:
+                    result = cached_result
             else:
-                # Fallback to old format if context is not available
-                print(f"Using cached AMI: {ami_id} ({ami_name}) for pattern '{name_pattern}' in {region}")
-            
-            return result
-
+                result, output = capture_output(lambda: self._query_latest_ami(name_pattern, owner, region, architecture, additional_filters, cache_key))
+                if result is None:
+                    # Failed lookups are retried, so every caller reports its own
+                    show_output(output)
+                    return None
+                self._lookup_output[cache_key] = output
+
+        # Display cached AMI with same format as fresh lookup
+        if instance_name and image_key and self.converter:
+            cached_message = self.converter.format_instance_output(instance_name, 'aws', f"Dynamic image search for {instance_name} on aws for {image_key} in {region} results in {result['ami_id']} (cached)")
+            if cached_message and getattr(self.converter, 'verbose', False):
+                cached_message += self.converter.format_instance_output(instance_name, 'aws', f"Verbose: {result['ami_name']}")
+        else:
+            # Fallback to old format if context is not available
+            cached_message = f"Using cached AMI: {result['ami_id']} ({result['ami_name']}) for pattern '{name_pattern}' in {region}"
+            if self.converter:
+                cached_message = self.converter.reporter.output('message', cached_message, 0)
+        if self.converter:
+            self.converter.print_once(('aws-ami', cache_key), self._lookup_output.get(cache_key), cached_message)
+        elif was_cached:
+            print(cached_message)
+        return result
+
+    def _query_latest_ami(self, name_pattern, owner, region, architecture, additional_filters, cache_key):
+        """Query EC2 for the latest AMI matching the pattern and cache it under cache_key."""
         client = self.get_client(region)
         if client is None:
             return None
@@ -342,9 +366,9 @@ class AWSImageResolver:
 
             # Verbose: Show detailed AMI search info
             if self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                print(f"[DEBUG] Verbose AMI Search: pattern='{name_pattern}', owner='{owner}', region='{region}'")
+                self._echo(f"[DEBUG] Verbose AMI Search: pattern='{name_pattern}', owner='{owner}', region='{region}'")
                 if additional_filters:
-                    print(f"[DEBUG] Additional filters: {additional_filters}")
+                    self._echo(f"[DEBUG] Additional filters: {additional_filters}")
 
             # Query for AMIs with retry logic for transient failures
             import time
@@ -354,13 +378,14 @@ class AWSImageResolver:
             for attempt in range(max_retries):
                 try:
                     if attempt > 0:
-                        print(f"  Retrying AMI search (attempt {attempt + 1}/{max_retries}) after {retry_delay}s delay...")
+                        self._echo(f"  Retrying AMI search (attempt {attempt + 1}/{max_retries}) after {retry_delay}s delay...")
                         time.sleep(retry_delay)
                     
-                    response = client.describe_images(
-                        Filters=filters
-                        # No MaxResults - get all available AMIs to find true latest version
-                    )
+                    with api_span('aws', 'ec2.describe_images', region=region):
+                        response = client.describe_images(
+                            Filters=filters
+                            # No MaxResults - get all available AMIs to find true latest version
+                        )
                     break  # Success, exit retry loop
                     
                 except Exception as retry_e:
@@ -368,24 +393,24 @@ class AWSImageResolver:
                         # Last attempt failed, re-raise the exception
                         raise retry_e
                     else:
-                        print(f"  AMI search attempt {attempt + 1} failed: {retry_e}")
+                        self._echo(f"  AMI search attempt {attempt + 1} failed: {retry_e}")
                         retry_delay *= 2  # Exponential backoff
 
             images = response['Images']
             
             if self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                print(f"[DEBUG] AWS API found {len(images)} AMI(s) matching criteria")
+                self._echo(f"[DEBUG] AWS API found {len(images)} AMI(s) matching criteria")
             
             if not images:
                 
                 # Try to find similar AMIs to suggest alternatives
                 similar_amis = self.find_similar_amis(name_pattern, owner, region, architecture)
                 if similar_amis:
-                    print(f"NOTE: Found {len(similar_amis)} similar AMI(s) you might want to try:")
+                    self._echo(f"NOTE: Found {len(similar_amis)} similar AMI(s) you might want to try:")
                     for i, ami in enumerate(similar_amis, 1):
                         ami_type = " (public alternative)" if ami.get('type') == 'public_alternative' else ""
-                        print(f"   {i}. {ami['name']}{ami_type}")
-                        print(f"      ID: {ami['id']}")
+                        self._echo(f"   {i}. {ami['name']}{ami_type}")
+                        self._echo(f"      ID: {ami['id']}")
                 
                 return None
 
@@ -422,7 +447,7 @@ class AWSImageResolver:
             return result
 
         except Exception as e:
-            print(f"Warning: Failed to find AMI with pattern '{name_pattern}': {e}")
+            self._echo(f"Warning: Failed to find AMI with pattern '{name_pattern}': {e}")
             return None
 
 
@@ -434,7 +459,7 @@ class AWSProvider:
     def __init__(self, converter):
         """Initialize the instance."""
         self.converter = converter
-        self._aws_resolver = None
+        self._aws_resolver = LazyValue('aws-resolver')
 
     def validate_aws_setup(self):
         """Validate AWS setup early - credentials, SDK, etc."""
@@ -476,9 +501,7 @@ class AWSProvider:
 
     def get_aws_resolver(self):
         """Get AWS image resolver, creating it only when needed."""
-        if self._aws_resolver is None:
-            self._aws_resolver = AWSImageResolver(self.converter.credentials, self.converter)
-        return self._aws_resolver
+        return self._aws_resolver.get(lambda: AWSImageResolver(self.converter.credentials, self.converter))
 
     def get_aws_provider_reference(self, region, yaml_data=None):
         """Get the appropriate AWS provider reference for a specific region."""
@@ -509,7 +532,7 @@ class AWSProvider:
                 'name': 'is-public',
                 'values': ['false']
             })
-            print("Automatically adding is-public=false filter for GOLD image")
+            self.converter.reporter.echo("Automatically adding is-public=false filter for GOLD image")
 
         return filters
 
@@ -522,7 +545,7 @@ class AWSProvider:
 
         # Check if we're in no-credentials mode
         if self.converter.no_credentials:
-            print(f"  NO-CREDENTIALS MODE: Using placeholder AMI for '{image_key}' in region '{region}'")
+            self.converter.reporter.echo(f"  NO-CREDENTIALS MODE: Using placeholder AMI for '{image_key}' in region '{region}'")
             return '"ami-PLACEHOLDER-REPLACE-WITH-ACTUAL-AMI"', "placeholder"
 
         image_config = self.converter.images.get(image_key, {})
@@ -541,7 +564,7 @@ class AWSProvider:
                 use_data_sources = aws_yamlforge_config.get('use_data_sources', False)
                 
                 if use_data_sources:
-                    print(f"  Using Terraform data source for {image_key} (use_data_sources enabled)")
+                    self.converter.reporter.echo(f"  Using Terraform data source for {image_key} (use_data_sources enabled)")
                     return None, None
                 else:
                     raise ValueError(
@@ -566,7 +589,7 @@ class AWSProvider:
         use_data_sources = aws_yamlforge_config.get('use_data_sources', False)
         
         if use_data_sources:
-            print(f"  Using Terraform data source for {image_key} (use_data_sources enabled)")
+            self.converter.reporter.echo(f"  Using Terraform data source for {image_key} (use_data_sources enabled)")
             return None, None
 
         # Validate AWS setup before attempting AMI resolution
@@ -645,16 +668,11 @@ class AWSProvider:
                 ami_id = ami_result['ami_id']
                 ami_name = ami_result['ami_name']
                 
-                # Check if this exact result was already shown to avoid duplicate output
-                result_key = f"{ami_id}_{image_key}_{region}"
-                if not hasattr(self, '_recent_results'):
-                    self._recent_results = set()
-                
-                if result_key not in self._recent_results:
-                    self.converter.print_instance_output(instance_name, 'aws', f"Dynamic image search for {instance_name} on aws for {image_key} in {region} results in {ami_id}")
-                    if self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                        self.converter.print_instance_output(instance_name, 'aws', f"Verbose: {ami_name}")
-                    self._recent_results.add(result_key)
+                # Show this exact result only once to avoid duplicate output
+                message = self.converter.format_instance_output(instance_name, 'aws', f"Dynamic image search for {instance_name} on aws for {image_key} in {region} results in {ami_id}")
+                if message and getattr(self.converter, 'verbose', False):
+                    message += self.converter.format_instance_output(instance_name, 'aws', f"Verbose: {ami_name}")
+                self.converter.print_once(('aws-ami-result', ami_id, image_key, region), message)
                 
                 return f'"{ami_id}"', "dynamic"
             else:
@@ -664,7 +682,7 @@ class AWSProvider:
                 use_data_sources = aws_yamlforge_config.get('use_data_sources', False)
                 
                 if use_data_sources:
-                    print(f"WARNING: AWS AMI resolution failed for {image_key}, falling back to Terraform data source (use_data_sources enabled)")
+                    self.converter.reporter.echo(f"WARNING: AWS AMI resolution failed for {image_key}, falling back to Terraform data source (use_data_sources enabled)")
                     return None, None
                 else:
                     raise ValueError(self._generate_smart_aws_error('ami_resolution_failed', image_key, region))
@@ -676,7 +694,7 @@ class AWSProvider:
             use_data_sources = aws_yamlforge_config.get('use_data_sources', False)
             
             if use_data_sources:
-                print(f"WARNING: AWS AMI resolution error for {image_key}: {e}, falling back to Terraform data source (use_data_sources enabled)")
+                self.converter.reporter.echo(f"WARNING: AWS AMI resolution error for {image_key}: {e}, falling back to Terraform data source (use_data_sources enabled)")
                 return None, None
             else:
                 if "Unable to locate credentials" in str(e):
@@ -753,6 +771,28 @@ resource "aws_security_group" "{regional_sg_name}_{guid}" {{{self.get_aws_provid
 '''
         return security_group_config
 
+    def generate_aws_key_pair(self, public_key, region, yaml_data=None):
+        """Generate the AWS key pair for an SSH public key in a region; returns (hcl, key name reference)."""
+        guid = self.converter.get_validated_guid(yaml_data)
+        fingerprint = key_fingerprint(public_key)
+        clean_region = region.replace("-", "_").replace(".", "_")
+        ssh_key_name = f"ssh_key_{clean_region}_{fingerprint}_{guid}"
+        key_name = f"yamlforge-{region}-{fingerprint}-{guid}"
+        return f'''
+# AWS Key Pair: {key_name}
+resource "aws_key_pair" "{ssh_key_name}" {{{self.get_aws_provider_reference(region, yaml_data)}
+  key_name   = "{key_name}"
+  public_key = "{public_key}"
+  
+  tags = {{
+    Name = "{key_name}"
+    Environment = "{yaml_data.get('environment', 'unknown') if yaml_data else 'unknown'}"
+    ManagedBy = "yamlforge"
+  }}
+}}
+
+''', f"aws_key_pair.{ssh_key_name}.key_name"
+
     def generate_aws_vm(self, instance, index, clean_name, strategy_info, available_subnets=None, yaml_data=None, has_guid_placeholder=False):  # noqa: vulture
         """Generate AWS EC2 instance."""
         instance_name = instance.get("name", f"instance_{index}")
@@ -775,7 +815,7 @@ resource "aws_security_group" "{regional_sg_name}_{guid}" {{{self.get_aws_provid
                 raise ValueError(f"Instance '{instance_name}': Specified zone '{user_specified_zone}' does not belong to region '{aws_region}'. "
                                f"Zone region: '{expected_region}', Instance region: '{aws_region}'")
             
-            print(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{aws_region}'")
+            self.converter.reporter.echo(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{aws_region}'")
             aws_availability_zone = user_specified_zone
             
         elif user_specified_zone and not has_region:
@@ -804,9 +844,15 @@ resource "aws_security_group" "{regional_sg_name}_{guid}" {{{self.get_aws_provid
             ami_reference = ami_reference  # This is the placeholder AMI ID
             ami_data_source = ""
         elif not ami_reference:
-            # Fallback if resolution failed
-            ami_data_source = self.converter.generate_ami_data_source(image, clean_name, strategy_info['architecture'])
-            ami_reference = f"data.aws_ami.{clean_name}_ami.id"
+            # Fallback if resolution failed: one AMI data source per region, image and architecture
+            architecture = strategy_info['architecture']
+            ami_name = self.converter.clean_name(f"{image}_{aws_region}_{architecture}")[0]
+            ami_data_source, ami_reference = self.converter.shared_resource(
+                ('aws', aws_region, 'ami', image, architecture),
+                lambda: (self.converter.generate_ami_data_source(image, ami_name, architecture,
+                                                                 self.get_aws_provider_reference(aws_region, yaml_data)),
+                         f"data.aws_ami.{ami_name}_ami.id")
+            )
         elif resolution_type == "dynamic":
             # Dynamic resolution - no data source needed
             ami_data_source = ""
@@ -943,28 +989,16 @@ echo "User data script completed successfully"
             else:
                 user_data_script = custom_username_script
 
-        # Generate AWS key pair resource if SSH key is provided
+        # Use the region's key pair for this SSH key (shared by every instance using it)
         ssh_key_resources = ""
         key_name_ref = "null"
         
         if ssh_key_config and ssh_key_config.get('public_key'):
-            # Use clean_name directly if GUID is already present, otherwise add GUID
-            ssh_key_name = clean_name if has_guid_placeholder else f"{clean_name}_key_pair_{guid}"
-            ssh_key_resources = f'''
-# AWS Key Pair for {instance_name}
-resource "aws_key_pair" "{ssh_key_name}" {{{self.get_aws_provider_reference(aws_region, yaml_data)}
-  key_name   = "{instance_name}-key"
-  public_key = "{ssh_key_config['public_key']}"
-  
-  tags = {{
-    Name = "{instance_name}-key"
-    Environment = "{yaml_data.get('environment', 'unknown') if yaml_data else 'unknown'}"
-    ManagedBy = "yamlforge"
-  }}
-}}
-
-'''
-            key_name_ref = f"aws_key_pair.{ssh_key_name}.key_name"
+            public_key = ssh_key_config['public_key']
+            ssh_key_resources, key_name_ref = self.converter.shared_resource(
+                ('aws', aws_region, 'ssh_key', public_key),
+                lambda: self.generate_aws_key_pair(public_key, aws_region, yaml_data)
+            )
 
         # Use clean_name directly if GUID is already present, otherwise add GUID
         resource_name = clean_name if has_guid_placeholder else f"{clean_name}_{guid}"
@@ -1191,7 +1225,8 @@ output "private_subnet_ids_{clean_region}_{guid}" {{
                 session = boto3.Session()
                 # Use STS to verify credentials - lightweight call
                 sts = session.client('sts')
-                response = sts.get_caller_identity()
+                with api_span('aws', 'sts.get_caller_identity'):
+                    response = sts.get_caller_identity()
                 return {
                     'available': True,
                     'account_id': response.get('Account'),
@@ -8,6 +8,8 @@ security groups, and other Azure cloud resources.
 import base64
 import os
 
+from ..core.shared_resources import key_fingerprint
+
 
 class AzureProvider:
     """Azure-specific provider implementation."""
@@ -189,6 +191,28 @@ resource "azurerm_network_security_group" "{regional_sg_name}_{self.converter.ge
 '''
         return security_group_config
 
+    def generate_azure_ssh_public_key(self, public_key, region, yaml_data=None):
+        """Generate the Azure SSH public key for a key in a region; returns (hcl, public key reference)."""
+        guid = self.converter.get_validated_guid(yaml_data)
+        fingerprint = key_fingerprint(public_key)
+        clean_region = region.lower().replace(" ", "_").replace("-", "_").replace(".", "_")
+        ssh_key_name = f"ssh_key_{clean_region}_{fingerprint}_{guid}"
+        return f'''
+# Azure SSH Public Key: {region} ({fingerprint})
+resource "azurerm_ssh_public_key" "{ssh_key_name}" {{
+  name                = "yamlforge-{clean_region}-{fingerprint}-{guid}-ssh-key"
+  resource_group_name = local.resource_group_name_{clean_region}_{guid}
+  location            = local.resource_group_location_{clean_region}_{guid}
+  public_key          = "{public_key}"
+
+  tags = {{
+    Environment = "agnosticd"
+    ManagedBy = "yamlforge"
+  }}
+}}
+
+''', f"azurerm_ssh_public_key.{ssh_key_name}.public_key"
+
     def generate_azure_vm(self, instance, index, clean_name, flavor, available_subnets=None, yaml_data=None, has_guid_placeholder=False):  # noqa: vulture
         """Generate native Azure virtual machine."""
         instance_name = instance.get("name", f"instance_{index}")
@@ -210,7 +234,7 @@ resource "azurerm_network_security_group" "{regional_sg_name}_{self.converter.ge
             if not user_specified_zone.isdigit() or int(user_specified_zone) not in [1, 2, 3]:
                 raise ValueError(f"Instance '{instance_name}': Azure zones must be '1', '2', or '3'. Got: '{user_specified_zone}'")
             
-            print(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{azure_region}'")
+            self.converter.reporter.echo(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{azure_region}'")
             azure_zone = user_specified_zone
             
         elif user_specified_zone and not has_region:
@@ -244,29 +268,16 @@ resource "azurerm_network_security_group" "{regional_sg_name}_{self.converter.ge
         # Use clean_name directly if GUID is already present, otherwise add GUID
         resource_name = clean_name if has_guid_placeholder else f"{clean_name}_{guid}"
         
-        # Generate Azure SSH public key resource if SSH key is provided
+        # Use the region's SSH public key resource for this key (shared by every instance using it)
         ssh_key_resources = ""
         ssh_key_reference = "null"
         
         if ssh_key_config and ssh_key_config.get('public_key'):
-            # Use clean_name directly if GUID is already present, otherwise add GUID
-            ssh_key_name = clean_name if has_guid_placeholder else f"{clean_name}_ssh_key_{guid}"
-            ssh_key_resources = f'''
-# Azure SSH Public Key: {instance_name}
-resource "azurerm_ssh_public_key" "{ssh_key_name}" {{
-  name                = "{instance_name}-ssh-key"
-  resource_group_name = local.resource_group_name_{clean_region}_{guid}
-  location            = local.resource_group_location_{clean_region}_{guid}
-  public_key          = "{ssh_key_config['public_key']}"
-
-  tags = {{
-    Environment = "agnosticd"
-    ManagedBy = "yamlforge"
-  }}
-}}
-
-'''
-            ssh_key_reference = f"azurerm_ssh_public_key.{ssh_key_name}.public_key"
+            public_key = ssh_key_config['public_key']
+            ssh_key_resources, ssh_key_reference = self.converter.shared_resource(
+                ('azure', azure_region, 'ssh_key', public_key),
+                lambda: self.generate_azure_ssh_public_key(public_key, azure_region, yaml_data)
+            )
         
         # Get Azure image configuration
         azure_image = self.get_azure_image_reference(image)
@@ -10,7 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import subprocess
 import json
-from ...utils import find_yamlforge_file
+from ...core.catalog import load_catalog_file
+from ...core.profiling import api_span
 
 # Import kubernetes client for direct API access
 try:
@@ -36,9 +37,7 @@ class BaseCNVProvider:
     def _load_cnv_defaults(self):
         """Load CNV defaults from configuration file"""
         try:
-            defaults_path = find_yamlforge_file("mappings/cnv/defaults.yaml")
-            with open(defaults_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_catalog_file("mappings/cnv/defaults.yaml")
         except FileNotFoundError:
             raise Exception("CNV defaults file not found: mappings/cnv/defaults.yaml")
         except Exception as e:
@@ -47,7 +46,7 @@ class BaseCNVProvider:
     def validate_cnv_operator(self) -> bool:
         """Validate that CNV/KubeVirt operator is installed and working using Kubernetes client"""
         if not KUBERNETES_AVAILABLE:
-            print("Warning: kubernetes Python client not available, skipping CNV operator validation")
+            self.converter.reporter.echo("Warning: kubernetes Python client not available, skipping CNV operator validation")
             return True  # Skip validation if client not available
         
         try:
@@ -56,7 +55,7 @@ class BaseCNVProvider:
             cluster_token = os.getenv('OPENSHIFT_CLUSTER_TOKEN')
             
             if not cluster_url or not cluster_token:
-                print("Warning: OPENSHIFT_CLUSTER_URL or OPENSHIFT_CLUSTER_TOKEN not set, skipping CNV operator validation")
+                self.converter.reporter.echo("Warning: OPENSHIFT_CLUSTER_URL or OPENSHIFT_CLUSTER_TOKEN not set, skipping CNV operator validation")
                 return True  # Skip validation if credentials not available
             
             # Configure Kubernetes client with OpenShift credentials
@@ -81,10 +80,10 @@ class BaseCNVProvider:
                 apiextensions_v1.read_custom_resource_definition("virtualmachines.kubevirt.io")
             except ApiException as e:
                 if e.status == 404:
-                    print("Warning: KubeVirt CRD 'virtualmachines.kubevirt.io' not found")
+                    self.converter.reporter.echo("Warning: KubeVirt CRD 'virtualmachines.kubevirt.io' not found")
                     return False
                 else:
-                    print(f"Warning: Error checking KubeVirt CRD: {e}")
+                    self.converter.reporter.echo(f"Warning: Error checking KubeVirt CRD: {e}")
                     return False
             
             # Check for DataVolume CRDs
@@ -92,10 +91,10 @@ class BaseCNVProvider:
                 apiextensions_v1.read_custom_resource_definition("datavolumes.cdi.kubevirt.io")
             except ApiException as e:
                 if e.status == 404:
-                    print("Warning: CDI CRD 'datavolumes.cdi.kubevirt.io' not found")
+                    self.converter.reporter.echo("Warning: CDI CRD 'datavolumes.cdi.kubevirt.io' not found")
                     return False
                 else:
-                    print(f"Warning: Error checking CDI CRD: {e}")
+                    self.converter.reporter.echo(f"Warning: Error checking CDI CRD: {e}")
                     return False
             
             # Check for KubeVirt operator pods in multiple possible namespaces
@@ -106,7 +105,8 @@ class BaseCNVProvider:
             
             for namespace in possible_namespaces:
                 try:
-                    pods = core_v1.list_namespaced_pod(namespace=namespace)
+                    with api_span('kubernetes', 'list_namespaced_pod', namespace=namespace):
+                        pods = core_v1.list_namespaced_pod(namespace=namespace)
                     for pod in pods.items:
                         if pod.status.phase == 'Running':
                             # Check if it's a KubeVirt-related pod
@@ -114,23 +114,23 @@ class BaseCNVProvider:
                                 operator_found = True
                                 # Only show this message in verbose mode
                                 if hasattr(self, 'converter') and self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                                    print(f"Found running CNV/KubeVirt operator pod: {pod.metadata.name} in namespace {namespace}")
+                                    self.converter.reporter.echo(f"Found running CNV/KubeVirt operator pod: {pod.metadata.name} in namespace {namespace}")
                                 break
                     if operator_found:
                         break
                 except ApiException as e:
                     if e.status != 404:  # 404 means namespace doesn't exist, which is fine
-                        print(f"Warning: Error checking namespace {namespace}: {e}")
+                        self.converter.reporter.echo(f"Warning: Error checking namespace {namespace}: {e}")
                     continue
             
             if not operator_found:
-                print("Warning: No running CNV/KubeVirt operator pods found in expected namespaces")
+                self.converter.reporter.echo("Warning: No running CNV/KubeVirt operator pods found in expected namespaces")
                 return False
             
             return True
             
         except Exception as e:
-            print(f"Warning: Could not validate CNV operator: {e}")
+            self.converter.reporter.echo(f"Warning: Could not validate CNV operator: {e}")
             return False
     
     def discover_cnv_images(self, datavolume_namespace: str = None) -> Dict:
@@ -241,7 +241,7 @@ class BaseCNVProvider:
         discovered_pvcs = {}
         
         if not KUBERNETES_AVAILABLE:
-            print("Warning: kubernetes Python client not available, using placeholder data")
+            self.converter.reporter.echo("Warning: kubernetes Python client not available, using placeholder data")
             return {
                 'rhel-9.6': {
                     'pvc_name': 'rhel-9.6',
@@ -257,7 +257,7 @@ class BaseCNVProvider:
         cluster_token = os.getenv('OPENSHIFT_CLUSTER_TOKEN')
         
         if not cluster_url or not cluster_token:
-            print("Warning: OPENSHIFT_CLUSTER_URL or OPENSHIFT_CLUSTER_TOKEN not set, using placeholder data")
+            self.converter.reporter.echo("Warning: OPENSHIFT_CLUSTER_URL or OPENSHIFT_CLUSTER_TOKEN not set, using placeholder data")
             return {
                 'rhel-9.6': {
                     'pvc_name': 'rhel-9.6',
@@ -287,7 +287,8 @@ class BaseCNVProvider:
             core_v1 = client.CoreV1Api(api_client)
             
             # Query PVCs in the specified namespace
-            pvcs = core_v1.list_namespaced_persistent_volume_claim(namespace=namespace)
+            with api_span('kubernetes', 'list_namespaced_persistent_volume_claim', namespace=namespace):
+                pvcs = core_v1.list_namespaced_persistent_volume_claim(namespace=namespace)
             
             for pvc in pvcs.items:
                 pvc_name = pvc.metadata.name
@@ -310,12 +311,12 @@ class BaseCNVProvider:
                     }
             
             if hasattr(self, 'converter') and self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
-                print(f"Discovered {len(discovered_pvcs)} bound PVCs in namespace '{namespace}'")
+                self.converter.reporter.echo(f"Discovered {len(discovered_pvcs)} bound PVCs in namespace '{namespace}'")
             
             return discovered_pvcs
             
         except Exception as e:
-            print(f"Warning: Could not discover PVCs in namespace '{namespace}': {e}")
+            self.converter.reporter.echo(f"Warning: Could not discover PVCs in namespace '{namespace}': {e}")
             return {}
     
     def _parse_rhel_version(self, datavolume_name: str) -> Tuple[str, str]:
@@ -361,7 +362,7 @@ class BaseCNVProvider:
             elif image_name.endswith('LATEST'):
                 image_name = image_name.replace('LATEST', '-latest')
             
-            print(f"Note: GOLD images are not supported in CNV. Converting '{original_image_name}' to '{image_name}'")
+            self.converter.reporter.echo(f"Note: GOLD images are not supported in CNV. Converting '{original_image_name}' to '{image_name}'")
         
         # First, try to load static mappings from the mapping file
         static_mappings = self._load_cnv_image_patterns()
@@ -465,12 +466,7 @@ class BaseCNVProvider:
     def _load_cnv_image_patterns(self) -> Dict:
         """Load CNV image patterns from the main mappings file"""
         try:
-            # Use centralized path resolution
-            from ...utils import find_yamlforge_file
-            mappings_file = find_yamlforge_file('mappings/images.yaml')
-            
-            with open(mappings_file, 'r') as f:
-                mappings = yaml.safe_load(f)
+            mappings = load_catalog_file('mappings/images.yaml')
             
             # Extract CNV-specific mappings from the main images file
             cnv_mappings = {}
@@ -480,10 +476,10 @@ class BaseCNVProvider:
             
             return cnv_mappings
         except FileNotFoundError:
-            print(f"Warning: CNV image mappings file not found: {mappings_file}")
+            self.converter.reporter.echo("Warning: CNV image mappings file not found: mappings/images.yaml")
             return {}
         except yaml.YAMLError as e:
-            print(f"Error parsing CNV image mappings: {e}")
+            self.converter.reporter.echo(f"Error parsing CNV image mappings: {e}")
             return {}
     
     def _extract_version_number(self, datavolume_name: str) -> str:
@@ -550,10 +546,8 @@ class BaseCNVProvider:
             
         # Load CNV flavors from mappings file
         try:
-            flavors_path = find_yamlforge_file("mappings/flavors/cnv.yaml")
-            if flavors_path.exists():
-                with open(flavors_path, 'r') as f:
-                    flavors = yaml.safe_load(f)
+            flavors = load_catalog_file("mappings/flavors/cnv.yaml")
+            if flavors:
                 flavor_mappings = flavors.get('flavor_mappings', {})
                 
                 if flavor_name in flavor_mappings:
@@ -5,14 +5,19 @@ Contains GCP-specific implementations for image resolution, VM generation,
 networking, firewall rules, project management, user access control, and other GCP cloud resources.
 """
 
-import yaml
 import os
+import sys
 import json
 from pathlib import Path
 from datetime import datetime
 import re
 import subprocess
-from ..utils import find_yamlforge_file
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ..core.catalog import load_catalog_file
+from ..core.discovery_cache import DiscoveryCache
+from ..core.profiling import api_span
+from ..core.render_pipeline import KeyedLocks, LazyValue, get_render_workers
 
 # GCP imports
 try:
@@ -24,7 +29,7 @@ try:
     GOOGLE_CLOUD_AVAILABLE = True
 except ImportError:
     GOOGLE_CLOUD_AVAILABLE = False
-    print("Warning: google-cloud-compute and google-cloud-dns not installed. GCP image and DNS discovery will fail if requested.")
+    print("Warning: google-cloud-compute and google-cloud-dns not installed. GCP image and DNS discovery will fail if requested.", file=sys.stderr)
 
 
 class GCPImageResolver:
@@ -34,9 +39,13 @@ class GCPImageResolver:
         """Initialize the instance."""
         self.credentials = credentials_manager
         self.config = self.load_config()
-        self.client = None
+        self.client = LazyValue('gcp-images-client')
+        # In-memory catalog per (project, family): latest image or None if the lookup failed
         self.cache = {}
         self.cache_timestamps = {}
+        self.persistent_cache = DiscoveryCache('gcp-images')
+        # Instances are rendered concurrently, so each family is looked up once
+        self._locks = KeyedLocks()
 
     def load_config(self):
         """Load GCP configuration from credentials system."""
@@ -57,10 +66,12 @@ class GCPImageResolver:
         }
 
     def get_client(self):
-        """Initialize and return GCP Compute client."""
+        """Return the GCP Compute images client shared by every lookup in the run."""
         if not GOOGLE_CLOUD_AVAILABLE:
             return None
+        return self.client.get(self._create_client)
 
+    def _create_client(self):
         try:
             # Use Application Default Credentials or service account
             credentials, project = google_auth_default()
@@ -74,11 +85,85 @@ class GCPImageResolver:
             print(f"Warning: Failed to create GCP client: {e}")
             return None
 
+    def is_cache_valid(self, family_key):
+        """Check if cached result is still valid."""
+        timestamp = self.cache_timestamps.get(family_key)
+        return timestamp is not None and time.time() - timestamp <= self.persistent_cache.ttl
+
+    def resolve_image_family(self, project, family):
+        """Return the latest image in a family as {'name', 'self_link'}, or None if it cannot be resolved."""
+        family_key = (project, family)
+        if self.is_cache_valid(family_key):
+            return self.cache[family_key]
+
+        with self._locks(family_key):
+            if self.is_cache_valid(family_key):
+                return self.cache[family_key]
+            image, error = self._load_image_family(project, family)
+            if error:
+                print(f"Warning: Failed to resolve GCP image family '{family}' in project '{project}': {error}")
+            self._store(project, family, image)
+            return image
+
+    def _store(self, project, family, image):
+        self.cache[(project, family)] = image
+        self.cache_timestamps[(project, family)] = time.time()
+
+    def _load_image_family(self, project, family):
+        cache_key = f"{project}|{family}"
+        image = self.persistent_cache.get(cache_key)
+        if image is not None:
+            return image, None
+
+        client = self.get_client()
+        if not client:
+            return None, None
+
+        try:
+            with api_span('gcp', 'compute.images.get_from_family', project=project, family=family):
+                response = client.get_from_family(project=project, family=family)
+        except Exception as e:
+            return None, e
+
+        image = {'name': response.name, 'self_link': response.self_link}
+        self.persistent_cache.set(cache_key, image)
+        return image, None
+
+    def prefetch_image_families(self, family_keys, workers=None):
+        """Look up every distinct (project, family) concurrently ahead of rendering.
+
+        Failures are reported in a fixed order once all lookups finish; the
+        families stay cached (as unresolved) so rendering does not retry them.
+        """
+        family_keys = sorted(key for key in set(family_keys) if not self.is_cache_valid(key))
+
+        # Families cached by an earlier run need no client at all
+        pending = []
+        for project, family in family_keys:
+            image = self.persistent_cache.get(f"{project}|{family}")
+            if image is None:
+                pending.append((project, family))
+            else:
+                self._store(project, family, image)
+        family_keys = pending
 
+        # Create the client (and print what creating it printed) before the lookups share it
+        if not family_keys or not self.get_client():
+            return
 
-    def is_cache_valid(self, family):
-        """Check if cached result is still valid."""
-        return family in self.cache_timestamps
+        def lookup(family_key):
+            with self._locks(family_key):
+                image, error = self._load_image_family(*family_key)
+                self._store(*family_key, image)
+                return error
+
+        workers = min(workers or get_render_workers(), len(family_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(lookup, family_keys))
+
+        for (project, family), error in zip(family_keys, errors):
+            if error:
+                print(f"Warning: Failed to resolve GCP image family '{family}' in project '{project}': {error}")
 
 
 class GCPProvider:
@@ -89,6 +174,7 @@ class GCPProvider:
         self.converter = converter
         self.config = self.load_config()
         self.guid = None  # Will be set later when YAML data is available
+        self._image_resolver = LazyValue('gcp-image-resolver')
 
     def update_guid(self, guid):
         """Update the GUID for this provider instance."""
@@ -113,13 +199,9 @@ class GCPProvider:
         """Load GCP configuration from defaults and credentials system."""
         # Load defaults file using improved path detection
         try:
-            defaults_file = find_yamlforge_file("defaults/gcp.yaml")
+            defaults_config = load_catalog_file("defaults/gcp.yaml")
         except FileNotFoundError as e:
             raise Exception(f"Required GCP defaults file not found: defaults/gcp.yaml")
-
-        try:
-            with open(defaults_file, 'r') as f:
-                defaults_config = yaml.safe_load(f)
         except Exception as e:
             raise Exception(f"Failed to load defaults/gcp.yaml: {e}")
 
@@ -239,7 +321,7 @@ class GCPProvider:
         # Skip availability checking in no-credentials mode
         if self.converter.no_credentials:
             if not silent:
-                print(f"  NO-CREDENTIALS MODE: Skipping machine type availability check for '{machine_type}' in region '{region}'")
+                self.converter.reporter.echo(f"  NO-CREDENTIALS MODE: Skipping machine type availability check for '{machine_type}' in region '{region}'")
             return True
         
         if not GOOGLE_CLOUD_AVAILABLE:
@@ -257,7 +339,8 @@ class GCPProvider:
                     machine_type=machine_type
                 )
                 try:
-                    client.get(request=request)
+                    with api_span('gcp', 'compute.machine_types.get', zone=zone):
+                        client.get(request=request)
                     return True
                 except google_exceptions.NotFound:
                     return False
@@ -273,7 +356,8 @@ class GCPProvider:
                     zone=available_zones[0]  # Use first available zone
                 )
                 try:
-                    page_result = client.list(request=request)
+                    with api_span('gcp', 'compute.list', region=region):
+                        page_result = client.list(request=request)
                     for machine_type_obj in page_result:
                         if machine_type_obj.name == machine_type:
                             return True
@@ -314,29 +398,26 @@ class GCPProvider:
         """Fallback method to check machine type availability using known patterns."""
         # Load GPU machine type availability from YAML file
         try:
-            import yaml
             from pathlib import Path
             
-            availability_path = find_yamlforge_file("mappings/gcp/machine-type-availability.yaml")
-            if availability_path.exists():
-                with open(availability_path, 'r') as f:
-                    availability_data = yaml.safe_load(f)
-                    gpu_machine_types = availability_data.get('gpu_machine_types', {})
+            availability_data = load_catalog_file("mappings/gcp/machine-type-availability.yaml")
+            if availability_data:
+                gpu_machine_types = availability_data.get('gpu_machine_types', {})
                     
-                    # Check if this is a GPU machine type
-                    if machine_type in gpu_machine_types:
-                        available_regions = gpu_machine_types[machine_type].get('regions', [])
-                        return region in available_regions
+                # Check if this is a GPU machine type
+                if machine_type in gpu_machine_types:
+                    available_regions = gpu_machine_types[machine_type].get('regions', [])
+                    return region in available_regions
                     
-                    # For non-GPU machine types, assume they're available in most regions
-                    # This is a conservative approach - in practice, most standard machine types are widely available
-                    return True
+                # For non-GPU machine types, assume they're available in most regions
+                # This is a conservative approach - in practice, most standard machine types are widely available
+                return True
             else:
                 # Fallback if YAML file doesn't exist
                 return True
         except Exception as e:
             # Fallback if YAML loading fails
-            print(f"Warning: Could not load GCP machine type availability from YAML: {e}")
+            self.converter.reporter.echo(f"Warning: Could not load GCP machine type availability from YAML: {e}")
             return True
 
     def find_available_regions_for_machine_type(self, machine_type):
@@ -355,7 +436,8 @@ class GCPProvider:
             available_regions = set()
             
             try:
-                page_result = zones_client.list(request=request)
+                with api_span('gcp', 'compute.zones.list'):
+                    page_result = zones_client.list(request=request)
                 for zone in page_result:
                     # Check if machine type exists in this zone
                     try:
@@ -364,7 +446,8 @@ class GCPProvider:
                             zone=zone.name,
                             machine_type=machine_type
                         )
-                        client.get(request=mt_request)
+                        with api_span('gcp', 'compute.machine_types.get', zone=zone.name):
+                            client.get(request=mt_request)
                         # Extract region from zone (e.g., us-central1-a -> us-central1)
                         region = zone.name.rsplit('-', 1)[0]
                         available_regions.add(region)
@@ -384,27 +467,24 @@ class GCPProvider:
         """Fallback method to find regions for a machine type using known patterns."""
         # Load GPU machine type availability from YAML file
         try:
-            import yaml
             from pathlib import Path
             
-            availability_path = find_yamlforge_file("mappings/gcp/machine-type-availability.yaml")
-            if availability_path.exists():
-                with open(availability_path, 'r') as f:
-                    availability_data = yaml.safe_load(f)
-                    gpu_machine_types = availability_data.get('gpu_machine_types', {})
-                    common_regions = availability_data.get('common_regions', [])
+            availability_data = load_catalog_file("mappings/gcp/machine-type-availability.yaml")
+            if availability_data:
+                gpu_machine_types = availability_data.get('gpu_machine_types', {})
+                common_regions = availability_data.get('common_regions', [])
                     
-                    if machine_type in gpu_machine_types:
-                        return gpu_machine_types[machine_type].get('regions', [])
+                if machine_type in gpu_machine_types:
+                    return gpu_machine_types[machine_type].get('regions', [])
                     
-                    # For non-GPU types, return common regions
-                    return common_regions
+                # For non-GPU types, return common regions
+                return common_regions
             else:
                 # Fallback if YAML file doesn't exist
                 return ['us-central1', 'us-east1', 'us-west1', 'us-east4', 'us-west2']
         except Exception as e:
             # Fallback if YAML loading fails
-            print(f"Warning: Could not load GCP machine type availability from YAML: {e}")
+            self.converter.reporter.echo(f"Warning: Could not load GCP machine type availability from YAML: {e}")
             return ['us-central1', 'us-east1', 'us-west1', 'us-east4', 'us-west2']
 
     def find_closest_available_region(self, requested_region, available_regions):
@@ -418,32 +498,76 @@ class GCPProvider:
         
         # Load region proximity mapping from YAML file
         try:
-            import yaml
             from pathlib import Path
             
-            availability_path = find_yamlforge_file("mappings/gcp/machine-type-availability.yaml")
-            if availability_path.exists():
-                with open(availability_path, 'r') as f:
-                    availability_data = yaml.safe_load(f)
-                    region_proximity = availability_data.get('region_proximity', {})
+            availability_data = load_catalog_file("mappings/gcp/machine-type-availability.yaml")
+            if availability_data:
+                region_proximity = availability_data.get('region_proximity', {})
                     
-                    # Check nearby regions for the requested region
-                    if requested_region in region_proximity:
-                        nearby_regions = region_proximity[requested_region].get('nearby_regions', [])
-                        for nearby_region in nearby_regions:
-                            if nearby_region in available_regions:
-                                return nearby_region
+                # Check nearby regions for the requested region
+                if requested_region in region_proximity:
+                    nearby_regions = region_proximity[requested_region].get('nearby_regions', [])
+                    for nearby_region in nearby_regions:
+                        if nearby_region in available_regions:
+                            return nearby_region
                     
-                    # If no nearby region found, return the first available region
-                    return available_regions[0] if available_regions else None
+                # If no nearby region found, return the first available region
+                return available_regions[0] if available_regions else None
             else:
                 # Fallback if YAML file doesn't exist
                 return available_regions[0] if available_regions else None
         except Exception as e:
             # Fallback if YAML loading fails
-            print(f"Warning: Could not load GCP region proximity from YAML: {e}")
+            self.converter.reporter.echo(f"Warning: Could not load GCP region proximity from YAML: {e}")
             return available_regions[0] if available_regions else None
 
+    def get_image_resolver(self):
+        """Get GCP image resolver, or None when images cannot be looked up."""
+        if self.converter.no_credentials or not self.config.get('has_credentials'):
+            return None
+        return self._image_resolver.get(lambda: GCPImageResolver(self.converter.credentials))
+
+    def get_image_family(self, image_name):
+        """Return the (project, family) an image maps to on GCP, or None."""
+        gcp_config = self.converter.images.get(image_name, {}).get('gcp', {})
+        family = gcp_config.get('family') or gcp_config.get('image_family')
+        if not gcp_config.get('project') or not family:
+            return None
+        return gcp_config['project'], family
+
+    def should_pin_images(self):
+        """Whether instances boot a family's current image (yamlforge.gcp.pin_images) instead of the family."""
+        yamlforge_config = (self.converter.current_yaml_data or {}).get('yamlforge', {})
+        return bool(yamlforge_config.get('gcp', {}).get('pin_images', False))
+
+    def resolve_image_family(self, project, family):
+        """Return the latest image in a family ({'name', 'self_link'}), or None if it is not looked up."""
+        resolver = self.get_image_resolver()
+        if not resolver:
+            return None
+        return resolver.resolve_image_family(project, family)
+
+    def get_pinned_image_reference(self, project, family):
+        """Return the current image of a family when pin_images is set and it resolves, otherwise None."""
+        if not self.should_pin_images():
+            return None
+        image = self.resolve_image_family(project, family)
+        if not image:
+            return None
+        return f"projects/{project}/global/images/{image['name']}"
+
+    def prefetch_images(self, image_names):
+        """Look up the image families of every GCP image the configuration uses, concurrently.
+
+        A family that does not resolve is reported before any Terraform is written.
+        """
+        resolver = self.get_image_resolver()
+        if not resolver:
+            return
+        family_keys = {self.get_image_family(image_name) for image_name in image_names}
+        family_keys.discard(None)
+        resolver.prefetch_image_families(family_keys)
+
     def get_gcp_image_reference(self, image_name):
         """Get GCP image reference for a given image name."""
         # Default to RHEL 9
@@ -455,6 +579,12 @@ class GCPProvider:
             if gcp_config and 'image' in gcp_config:
                 return gcp_config['image']
 
+        # Reference the mapped family (checked by the image catalog), or its current image if pinned
+        family_key = self.get_image_family(image_name)
+        if family_key:
+            project, family = family_key
+            return self.get_pinned_image_reference(project, family) or f"projects/{project}/global/images/family/{family}"
+
         # Check for RHEL patterns
         if "RHEL" in image_name.upper():
             if "8" in image_name:
@@ -492,7 +622,7 @@ class GCPProvider:
                 raise ValueError(f"Instance '{instance_name}': Specified zone '{user_specified_zone}' does not belong to region '{gcp_region}'. "
                                f"Zone region: '{expected_region}', Instance region: '{gcp_region}'")
             
-            print(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{gcp_region}'")
+            self.converter.reporter.echo(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{gcp_region}'")
             gcp_zone = user_specified_zone
             
         elif user_specified_zone and not has_region:
@@ -776,7 +906,8 @@ resource "google_compute_firewall" "main_ssh_{clean_region}_{self.get_validated_
             domain_with_dot = domain if domain.endswith('.') else domain + '.'
             
             # List all managed zones in the project
-            zones = client.list_zones()
+            with api_span('gcp', 'dns.managed_zones.list', project=project_id):
+                zones = client.list_zones()
             
             # Find zone that matches our domain
             for zone in zones:
@@ -784,11 +915,11 @@ resource "google_compute_firewall" "main_ssh_{clean_region}_{self.get_validated_
                     return zone.name
             
             # If no exact match found, fallback to naming convention
-            print(f"Warning: No DNS zone found for domain '{domain}' in project '{project_id}'. Using naming convention fallback.")
+            self.converter.reporter.echo(f"Warning: No DNS zone found for domain '{domain}' in project '{project_id}'. Using naming convention fallback.")
             return domain.replace('.', '-') + '-zone'
             
         except Exception as e:
-            print(f"Warning: Failed to discover DNS zone for domain '{domain}': {e}. Using naming convention fallback.")
+            self.converter.reporter.echo(f"Warning: Failed to discover DNS zone for domain '{domain}': {e}. Using naming convention fallback.")
             return domain.replace('.', '-') + '-zone'
     
     def get_root_zone_domain(self, yaml_data):
@@ -1240,7 +1371,8 @@ output "project_info" {{
             available_zones = []
             
             try:
-                page_result = client.list(request=request)
+                with api_span('gcp', 'compute.list', region=region):
+                    page_result = client.list(request=request)
                 for zone in page_result:
                     # Check if zone belongs to this region
                     zone_region = zone.name.rsplit('-', 1)[0]
@@ -1323,7 +1455,8 @@ output "project_info" {{
                             zone=zone,
                             machine_type=machine_type
                         )
-                        client.get(request=mt_request)
+                        with api_span('gcp', 'compute.machine_types.get', zone=zone):
+                            client.get(request=mt_request)
                         if instance_name:
                             self.converter.print_instance_output(instance_name, 'gcp', f"Selected zone '{zone}' for machine type '{machine_type}' in region '{region}'")
                         return zone
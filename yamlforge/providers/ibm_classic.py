@@ -6,6 +6,8 @@ Contains IBM Classic-specific implementations for VM generation and networking.
 
 import os
 
+from ..core.shared_resources import key_fingerprint
+
 
 class IBMClassicProvider:
     """IBM Classic-specific provider implementation."""
@@ -98,17 +100,12 @@ class IBMClassicProvider:
         
         ssh_key_resources = ""
         if should_create_instance_key:
-            # Instance has a different SSH key - create it
-            ssh_key_name = clean_name if has_guid_placeholder else f"{clean_name}_ssh_key_{guid}"
-            ssh_key_resources = f'''
-# IBM Cloud Classic SSH Key for {instance_name}
-resource "ibm_compute_ssh_key" "{ssh_key_name}" {{
-  label      = "{instance_name}-key"
-  public_key = "{ssh_key_config['public_key']}"
-}}
-
-'''
-            key_name_ref = f"ibm_compute_ssh_key.{ssh_key_name}.id"
+            # Instance has a different SSH key - create it once for every instance using it
+            public_key = ssh_key_config['public_key']
+            ssh_key_resources, key_name_ref = self.converter.shared_resource(
+                ('ibm_classic', 'global', 'ssh_key', public_key),
+                lambda: self.generate_ibm_classic_ssh_key(public_key, yaml_data)
+            )
         else:
             # Use the global SSH key
             key_name_ref = global_ssh_key_ref
@@ -220,6 +217,20 @@ resource "ibm_compute_vm_instance" "{resource_name}" {{
         raise ValueError(f"No IBM Classic mapping found for '{flavor_or_instance_type}'. "
                         f"Available flavors: {', '.join(available_sizes)}")
 
+    def generate_ibm_classic_ssh_key(self, public_key, yaml_data=None):
+        """Generate the IBM Classic SSH key for an instance-specific key; returns (hcl, id reference)."""
+        guid = self.converter.get_validated_guid(yaml_data)
+        fingerprint = key_fingerprint(public_key)
+        ssh_key_name = f"ssh_key_{fingerprint}_{guid}"
+        return f'''
+# IBM Cloud Classic SSH Key: {fingerprint}
+resource "ibm_compute_ssh_key" "{ssh_key_name}" {{
+  label      = "yamlforge-{fingerprint}-{guid}-key"
+  public_key = "{public_key}"
+}}
+
+''', f"ibm_compute_ssh_key.{ssh_key_name}.id"
+
     def generate_ibm_classic_networking(self, deployment_name, deployment_config, region, yaml_data=None):
         """Generate IBM Classic networking resources."""
         return f'''
@@ -8,6 +8,9 @@ and security groups.
 import os
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from ibm_vpc import VpcV1
+from ..core.profiling import api_span
+from ..core.render_pipeline import KeyedLocks
+from ..core.shared_resources import key_fingerprint
 
 
 class IBMVPCProvider:
@@ -17,6 +20,15 @@ class IBMVPCProvider:
         """Initialize the instance."""
         self.converter = converter
         self.config = self.load_config()
+        # Run-scoped API state: one authenticator per API key (it reuses its IAM
+        # token until expiry), one VPC client per region, and discovery results
+        self._authenticators = {}
+        self._vpc_clients = {}
+        self._image_cache = {}
+        self._zone_cache = {}
+        self._key_fingerprint_cache = {}
+        # Instances are rendered concurrently, so each entry is created once
+        self._locks = KeyedLocks()
 
     def load_config(self):
         """Load IBM VPC configuration from environment variables."""
@@ -273,15 +285,14 @@ resource "ibm_is_security_group_rule" "{resource_name}_rule_{i+1}" {{
         )
         
         if should_create_instance_key:
-            # Instance has a different SSH key - create it
-            ssh_key_name = clean_name if has_guid_placeholder else f"{clean_name}_ssh_key_{guid}"
-            ssh_key_resource, key_name_ref = self.generate_ssh_key_resource(
-                ssh_key_name, 
-                ssh_key_config['public_key'], 
-                ibm_region, 
-                yaml_data
+            # Instance has a different SSH key - create it once per region and key
+            public_key = ssh_key_config['public_key']
+            clean_region = ibm_region.replace('-', '_').replace('.', '_')
+            ssh_key_name = f"ssh_key_{clean_region}_{key_fingerprint(public_key)}_{guid}"
+            ssh_key_resources, key_name_ref = self.converter.shared_resource(
+                ('ibm_vpc', ibm_region, 'ssh_key', public_key),
+                lambda: self.generate_ssh_key_resource(ssh_key_name, public_key, ibm_region, yaml_data)
             )
-            ssh_key_resources = ssh_key_resource
         else:
             # Use the global SSH key
             key_name_ref = global_ssh_key_ref
@@ -473,15 +484,39 @@ resource "ibm_is_ssh_key" "{main_key_name}" {{
 
 
 
+    def get_vpc_client(self, api_key, region=None, version=None):
+        """Return a pooled VPC client for the region, sharing one IAM authenticator per API key."""
+        client_key = (api_key, region, version)
+        with self._locks(('client',) + client_key):
+            if client_key not in self._vpc_clients:
+                with self._locks(('authenticator', api_key)):
+                    if api_key not in self._authenticators:
+                        self._authenticators[api_key] = IAMAuthenticator(api_key)
+                authenticator = self._authenticators[api_key]
+                if version:
+                    vpc = VpcV1(version, authenticator=authenticator)
+                else:
+                    vpc = VpcV1(authenticator=authenticator)
+                if region:
+                    vpc.set_service_url(f"https://{region}.iaas.cloud.ibm.com/v1")
+                self._vpc_clients[client_key] = vpc
+        return self._vpc_clients[client_key]
+
+    def list_region_images(self, region, api_key):
+        """List images for a region once per run."""
+        with self._locks(('images', region)):
+            if region not in self._image_cache:
+                vpc = self.get_vpc_client(api_key, region)
+                with api_span('ibm_vpc', 'list_images', region=region):
+                    self._image_cache[region] = vpc.list_images().get_result()["images"]
+        return self._image_cache[region]
+
     def find_latest_ibm_vpc_image(self, region, os_name, version=None, architecture=None, api_key=None):
         """Find the latest IBM VPC image matching the OS, version, and architecture."""
         api_key = api_key or os.getenv('IC_API_KEY') or os.getenv('IBM_CLOUD_API_KEY')
         if not api_key:
             raise ValueError("IBM Cloud API key not found in environment variables (IC_API_KEY or IBM_CLOUD_API_KEY)")
-        authenticator = IAMAuthenticator(api_key)
-        vpc = VpcV1(authenticator=authenticator)
-        vpc.set_service_url(f"https://{region}.iaas.cloud.ibm.com/v1")
-        images = vpc.list_images().get_result()["images"]
+        images = self.list_region_images(region, api_key)
         
         # Filter images based on OS name
         if os_name.lower() == "redhat":
@@ -518,10 +553,7 @@ resource "ibm_is_ssh_key" "{main_key_name}" {{
         api_key = os.getenv('IC_API_KEY') or os.getenv('IBM_CLOUD_API_KEY')
         if not api_key:
             raise ValueError("IBM Cloud API key not found in environment variables (IC_API_KEY or IBM_CLOUD_API_KEY)")
-        authenticator = IAMAuthenticator(api_key)
-        vpc = VpcV1(authenticator=authenticator)
-        vpc.set_service_url(f"https://{region}.iaas.cloud.ibm.com/v1")
-        images = vpc.list_images().get_result()["images"]
+        images = self.list_region_images(region, api_key)
         
         # Convert glob pattern to regex pattern
         import re
@@ -552,15 +584,16 @@ resource "ibm_is_ssh_key" "{main_key_name}" {{
             self.converter.print_provider_output('ibm_vpc', f"WARNING: --no-credentials mode: using placeholder zone for region '{region}'. Generated Terraform will not be valid for apply.")
             return ["PLACEHOLDER-ZONE"]
         try:
-            from ibm_vpc import VpcV1
-            from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-            api_key = api_key or os.getenv('IBMCLOUD_API_KEY') or os.getenv('IC_API_KEY')
-            if not api_key:
-                raise ValueError("IBM Cloud API key not found in environment variables (IBMCLOUD_API_KEY or IC_API_KEY)")
-            authenticator = IAMAuthenticator(api_key)
-            vpc = VpcV1('2023-09-12', authenticator=authenticator)
-            zones = vpc.list_region_zones(region_name=region)
-            return [z['name'] for z in zones.result['zones']]
+            with self._locks(('zones', region)):
+                if region not in self._zone_cache:
+                    api_key = api_key or os.getenv('IBMCLOUD_API_KEY') or os.getenv('IC_API_KEY')
+                    if not api_key:
+                        raise ValueError("IBM Cloud API key not found in environment variables (IBMCLOUD_API_KEY or IC_API_KEY)")
+                    vpc = self.get_vpc_client(api_key, version='2023-09-12')
+                    with api_span('ibm_vpc', 'list_region_zones', region=region):
+                        zones = vpc.list_region_zones(region_name=region)
+                    self._zone_cache[region] = [z['name'] for z in zones.result['zones']]
+            return self._zone_cache[region]
         except Exception as e:
             self.converter.print_provider_output('ibm_vpc', f"Warning: Could not fetch zones for region {region}: {e}")
             return []
@@ -604,28 +637,25 @@ resource "ibm_is_ssh_key" "{main_key_name}" {{
             # Format as SHA256:base64digest (IBM VPC format)
             formatted_fingerprint = f"SHA256:{base64.b64encode(fingerprint).decode('utf-8').rstrip('=')}"
             
-            # Use IBM VPC API to find existing key
-            api_key = os.getenv('IC_API_KEY') or os.getenv('IBM_CLOUD_API_KEY')
-            if not api_key:
-                return None
-                
-            from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-            from ibm_vpc import VpcV1
-            
-            authenticator = IAMAuthenticator(api_key)
-            vpc = VpcV1(authenticator=authenticator)
-            vpc.set_service_url(f"https://{region}.iaas.cloud.ibm.com/v1")
+            # Use IBM VPC API to find existing key, indexing the region's keys once per run
+            with self._locks(('keys', region)):
+                if region not in self._key_fingerprint_cache:
+                    api_key = os.getenv('IC_API_KEY') or os.getenv('IBM_CLOUD_API_KEY')
+                    if not api_key:
+                        return None
+
+                    vpc = self.get_vpc_client(api_key, region)
+                    with api_span('ibm_vpc', 'list_keys', region=region):
+                        keys = vpc.list_keys().get_result()["keys"]
+
+                    # Keep the first key per fingerprint, matching the original scan order
+                    fingerprint_index = {}
+                    for key in keys:
+                        fingerprint_index.setdefault(key.get("fingerprint"), key["id"])
+                    self._key_fingerprint_cache[region] = fingerprint_index
             
-            keys = vpc.list_keys().get_result()["keys"]
-            
-            for key in keys:
-                existing_fingerprint = key.get("fingerprint")
-                
-                # Compare SHA256 fingerprints
-                if existing_fingerprint == formatted_fingerprint:
-                    return key["id"]
-                    
-            return None
+            # Compare SHA256 fingerprints
+            return self._key_fingerprint_cache[region].get(formatted_fingerprint)
             
         except Exception as e:
             self.converter.print_provider_output('ibm_vpc', f"Warning: Could not check for existing SSH key: {e}")
@@ -6,7 +6,13 @@ networking, security groups, and other OCI cloud resources.
 """
 
 import yaml
+import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.discovery_cache import DiscoveryCache
+from ..core.profiling import api_span
+from ..core.render_pipeline import KeyedLocks, LazyValue, get_render_workers
 
 # OCI imports - optional, fallback if not available
 try:
@@ -14,7 +20,7 @@ try:
     OCI_SDK_AVAILABLE = True
 except ImportError:
     OCI_SDK_AVAILABLE = False
-    print("Warning: oci-python-sdk not installed. OCI dynamic image discovery disabled.")
+    print("Warning: oci-python-sdk not installed. OCI dynamic image discovery disabled.", file=sys.stderr)
 
 
 class OCIImageResolver:
@@ -24,9 +30,13 @@ class OCIImageResolver:
         """Initialize the instance."""
         self.credentials = credentials_manager
         self.config = self.load_config()
-        self.client = None
+        self.clients = {}
+        # In-memory catalog per (compartment, region, OS): images sorted newest first
         self.cache = {}
-        self.cache_timestamps = {}
+        self.pattern_cache = {}
+        self.persistent_cache = DiscoveryCache('oci-images')
+        # Instances are rendered concurrently, so each client and catalog is created once
+        self._locks = KeyedLocks()
 
     def load_config(self):
         """Load OCI configuration from credentials system."""
@@ -40,11 +50,18 @@ class OCIImageResolver:
             'has_credentials': has_credentials
         }
 
-    def get_client(self):
-        """Initialize and return OCI Compute client."""
+    def get_client(self, region=None):
+        """Return a pooled OCI Compute client for the region (defaults to the configured region)."""
         if not OCI_SDK_AVAILABLE:
             return None
 
+        with self._locks(('client', region)):
+            return self._create_client(region)
+
+    def _create_client(self, region):
+        if region in self.clients:
+            return self.clients[region]
+
         try:
             if self.credentials and self.credentials.oci_config:
                 oci_config = self.credentials.oci_config
@@ -53,9 +70,10 @@ class OCIImageResolver:
                     'key_file': oci_config.get('key_file'),
                     'fingerprint': oci_config.get('fingerprint'),
                     'tenancy': oci_config.get('tenancy_ocid'),
-                    'region': oci_config.get('region')
+                    'region': region or oci_config.get('region')
                 }
                 client = oci.core.ComputeClient(config)
+                self.clients[region] = client
                 return client
             return None
 
@@ -63,30 +81,90 @@ class OCIImageResolver:
             print(f"Warning: Failed to create OCI client: {e}")
             return None
 
-    def resolve_oci_image(self, image_pattern, compartment_id, region):
-        """Resolve OCI image using pattern matching."""
-        client = self.get_client()
-        if not client:
+    def get_image_catalog(self, compartment_id, region, operating_system="Oracle Linux"):
+        """Return every available image for (compartment, region, OS), newest first.
+
+        The catalog is listed once (all pages) and kept in memory for the run
+        and in the persistent discovery cache across runs.
+        """
+        catalog_key = f"{compartment_id}|{region}|{operating_system}"
+        with self._locks(('catalog', catalog_key)):
+            return self._load_image_catalog(catalog_key, compartment_id, region, operating_system)
+
+    def _load_image_catalog(self, catalog_key, compartment_id, region, operating_system):
+        if catalog_key in self.cache:
+            return self.cache[catalog_key]
+
+        images = self.persistent_cache.get(catalog_key)
+        if images is None:
+            client = self.get_client(region)
+            if not client:
+                return None
+
+            with api_span('oci', 'compute.list_images', region=region):
+                response = oci.pagination.list_call_get_all_results(
+                    client.list_images,
+                    compartment_id=compartment_id,
+                    operating_system=operating_system,
+                    lifecycle_state="AVAILABLE"
+                )
+            images = [{
+                'id': image.id,
+                'display_name': image.display_name,
+                'time_created': image.time_created.isoformat() if image.time_created else ''
+            } for image in response.data]
+            images.sort(key=lambda image: image['time_created'], reverse=True)
+            self.persistent_cache.set(catalog_key, images)
+
+        self.cache[catalog_key] = images
+        return images
+
+    def prefetch_image_catalogs(self, catalog_keys, workers=None):
+        """List every distinct (compartment, region, OS) catalog concurrently ahead of rendering.
+
+        Failures are reported in a fixed order once all listings finish.
+        """
+        # Catalogs cached by an earlier run need no client at all
+        catalog_keys = sorted(key for key in set(catalog_keys)
+                              if self.persistent_cache.get('|'.join(key)) is None)
+        if not catalog_keys:
+            return
+
+        # Create each regional client (and print what creating it printed) before the listings share it
+        for region in sorted({region for _, region, _ in catalog_keys}):
+            self.get_client(region)
+
+        def load(catalog_key):
+            try:
+                self.get_image_catalog(*catalog_key)
+            except Exception as e:
+                return e
             return None
 
+        workers = min(workers or get_render_workers(), len(catalog_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(load, catalog_keys))
+
+        for (_, region, operating_system), error in zip(catalog_keys, errors):
+            if error:
+                print(f"Warning: Failed to list OCI '{operating_system}' images in region '{region}': {error}")
+
+    def resolve_oci_image(self, image_pattern, compartment_id, region, operating_system="Oracle Linux"):
+        """Resolve OCI image using pattern matching."""
+        pattern_key = (compartment_id, region, operating_system, image_pattern.lower())
+        if pattern_key in self.pattern_cache:
+            return self.pattern_cache[pattern_key]
+
         try:
-            # List images in the compartment
-            response = client.list_images(
-                compartment_id=compartment_id,
-                operating_system="Oracle Linux",  # TODO: Make this configurable from image mappings
-                lifecycle_state="AVAILABLE"
-            )
-
-            # Filter images by pattern
-            matching_images = []
-            for image in response.data:
-                if image_pattern.lower() in image.display_name.lower():
-                    matching_images.append(image)
-
-            if matching_images:
-                # Sort by creation time and return the latest
-                latest_image = sorted(matching_images, key=lambda x: x.time_created, reverse=True)[0]
-                return latest_image.id
+            images = self.get_image_catalog(compartment_id, region, operating_system)
+            if images is None:
+                return None
+
+            # Catalog is sorted newest first, so the first match is the latest image
+            pattern = image_pattern.lower()
+            image_id = next((image['id'] for image in images if pattern in image['display_name'].lower()), None)
+            self.pattern_cache[pattern_key] = image_id
+            return image_id
 
         except Exception as e:
             print(f"Warning: Failed to resolve OCI image: {e}")
@@ -100,8 +178,41 @@ class OCIProvider:
     def __init__(self, converter):
         """Initialize the instance."""
         self.converter = converter
+        self._image_resolver = LazyValue('oci-image-resolver')
 
+    def get_image_resolver(self):
+        """Get OCI image resolver, or None when images cannot be looked up."""
+        if self.converter.no_credentials or not OCI_SDK_AVAILABLE or not self.get_image_compartment():
+            return None
+        return self._image_resolver.get(lambda: OCIImageResolver(self.converter.credentials))
 
+    def get_image_compartment(self):
+        """Return the compartment images are listed in (OCI_COMPARTMENT_ID, else the tenancy), or None."""
+        oci_config = self.converter.credentials.oci_config if self.converter.credentials else None
+        if not oci_config:
+            return None
+        return oci_config.get('compartment_id') or oci_config.get('tenancy_ocid')
+
+    def get_image_pattern(self, image_name):
+        """Return the display name an image maps to on OCI, or None if it maps to an OCID."""
+        oci_image = self.converter.images.get(image_name, {}).get('oci', {})
+        if isinstance(oci_image, dict):
+            if oci_image.get('image_ocid'):
+                return None
+            return oci_image.get('image_name')
+        return oci_image or None
+
+    def prefetch_images(self, image_regions):
+        """List the image catalog of every (image, region) the configuration uses, concurrently."""
+        resolver = self.get_image_resolver()
+        if not resolver:
+            return
+        compartment_id = self.get_image_compartment()
+        resolver.prefetch_image_catalogs(
+            (compartment_id, region, self.get_oci_operating_system(image_name))
+            for image_name, region in image_regions
+            if self.get_image_pattern(image_name)
+        )
 
     def get_oci_shape(self, flavor_or_instance_type):
         """Get OCI shape from flavor or instance type."""
@@ -125,12 +236,15 @@ class OCIProvider:
         raise ValueError(f"No OCI shape mapping found for flavor '{flavor_or_instance_type}'. "
                         f"Available flavors: {list(oci_flavors.keys())}")
 
-    def get_oci_image_reference(self, image_name):
+    def get_oci_image_reference(self, image_name, region=None):
         """Get OCI image reference from image mapping or direct reference."""
         
-        # Use the image resolver for dynamic discovery
-        if hasattr(self, 'image_resolver') and self.image_resolver:
-            resolved_image = self.image_resolver.resolve_oci_image(image_name)
+        # Resolve the mapped display name to the newest matching image OCID in the region
+        image_pattern = self.get_image_pattern(image_name)
+        resolver = self.get_image_resolver() if region and image_pattern else None
+        if resolver:
+            resolved_image = resolver.resolve_oci_image(
+                image_pattern, self.get_image_compartment(), region, self.get_oci_operating_system(image_name))
             if resolved_image:
                 return resolved_image
         
@@ -184,7 +298,7 @@ class OCIProvider:
                 raise ValueError(f"Instance '{instance_name}': Specified zone '{user_specified_zone}' does not belong to region '{oci_region}'. "
                                f"Zone region: '{expected_region}', Instance region: '{oci_region}'")
             
-            print(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{oci_region}'")
+            self.converter.reporter.echo(f"Using user-specified zone '{user_specified_zone}' for instance '{instance_name}' in region '{oci_region}'")
             
         elif user_specified_zone and not has_region:
             raise ValueError(f"Instance '{instance_name}': Zone '{user_specified_zone}' can only be specified when using 'region' (not 'location'). "
@@ -196,9 +310,6 @@ class OCIProvider:
         # Get shape
         oci_shape = self.get_oci_shape(flavor)
 
-        # Get image reference
-        oci_image = self.get_oci_image_reference(image)
-        
         # Get operating system from mapping
         oci_operating_system = self.get_oci_operating_system(image)
 
@@ -214,6 +325,15 @@ class OCIProvider:
         # Use clean_name directly if GUID is already present, otherwise add GUID
         resource_name = clean_name if has_guid_placeholder else f"{clean_name}_{guid}"
 
+        # Get image reference
+        oci_image = self.get_oci_image_reference(image, oci_region)
+        # Without a catalog lookup the image is found by display name at plan time
+        image_display_name = self.get_oci_image_reference(image)
+        if oci_image != image_display_name:
+            image_source_id = f'"{oci_image}"'
+        else:
+            image_source_id = f"data.oci_core_images.{resource_name}_image.images[0].id"
+
         # Get OCI NSG references with regional awareness
         oci_nsg_refs = []
         sg_names = instance.get('security_groups', [])
@@ -261,7 +381,7 @@ resource "oci_core_instance" "{resource_name}" {{
   # Boot volume
   source_details {{
     source_type = "image"
-    source_id   = data.oci_core_images.{resource_name}_image.images[0].id
+    source_id   = {image_source_id}
     boot_volume_size_in_gbs = 50
   }}'''
 
@@ -298,7 +418,8 @@ USERDATA
 '''
 
         # Add image data source
-        vm_config += f'''# OCI Image Data Source for {instance_name}
+        if oci_image == image_display_name:
+            vm_config += f'''# OCI Image Data Source for {instance_name}
 data "oci_core_images" "{resource_name}_image" {{
   compartment_id           = var.oci_compartment_id
   display_name             = "{oci_image}"
@@ -3,6 +3,7 @@ OpenShift Provider for yamlforge
 Main orchestrator that combines all OpenShift provider components
 """
 
+import textwrap
 from typing import Dict, List, Set, Any
 from .base import BaseOpenShiftProvider
 from .rosa import ROSAProvider
@@ -20,6 +21,140 @@ from .features import (
 )
 
 
+DEFAULT_ROSA_MAX_PARALLEL = 5
+
+# Shared by rosa-setup.sh and rosa-cleanup.sh: cluster operations are submitted
+# as background jobs (at most ROSA_MAX_PARALLEL at a time) and every cluster is
+# then tracked from a single `rosa list clusters -o json` per poll, backing off
+# while nothing changes. Progress is written as one JSON event per line to
+# ROSA_EVENTS_FILE so wrappers can follow it without parsing the text output.
+ROSA_ORCHESTRATION_FUNCTIONS = '''
+# =============================================================================
+# Cluster orchestration helpers
+# =============================================================================
+ROSA_EVENTS_FILE="${ROSA_EVENTS_FILE:-rosa-events.jsonl}"
+ROSA_POLL_MIN_INTERVAL="${ROSA_POLL_MIN_INTERVAL:-15}"
+ROSA_POLL_MAX_INTERVAL="${ROSA_POLL_MAX_INTERVAL:-120}"
+ROSA_SUBMIT_STATUS_DIR=$(mktemp -d)
+trap 'rm -rf "$ROSA_SUBMIT_STATUS_DIR"' EXIT
+
+SUBMITTED_CLUSTERS=()
+ACCEPTED_CLUSTERS=()
+FAILED_CLUSTERS=()
+
+require_jq() {
+    if ! command -v jq &> /dev/null; then
+        echo " jq is required to track cluster progress. Please install jq first."
+        exit 1
+    fi
+}
+
+# emit_event <event> <cluster> <state> [message]
+emit_event() {
+    jq -cn --arg ts "$(date -u +%Y-%m-%dT%H:%M:%SZ)" --arg event "$1" --arg cluster "$2" \\
+        --arg state "$3" --arg message "${4:-}" \\
+        '{ts: $ts, event: $event, cluster: $cluster, state: $state, message: $message}' >> "$ROSA_EVENTS_FILE"
+    echo " [$2] $1: $3${4:+ ($4)}"
+}
+
+# run_limited <action> <cluster> <command...>: run in the background, output in rosa-<action>-<cluster>.log
+run_limited() {
+    local action="$1" cluster="$2"
+    shift 2
+    while [ "$(jobs -rp | wc -l)" -ge "$ROSA_MAX_PARALLEL" ]; do
+        wait -n 2>/dev/null || true
+    done
+    emit_event "${action}_started" "$cluster" submitting
+    (
+        set +e
+        ( set -e; "$@" ) > "rosa-${action}-${cluster}.log" 2>&1
+        echo $? > "$ROSA_SUBMIT_STATUS_DIR/$cluster"
+    ) &
+    SUBMITTED_CLUSTERS+=("$cluster")
+}
+
+# wait_submissions <action>: wait for every run_limited job and sort clusters into ACCEPTED/FAILED
+wait_submissions() {
+    local action="$1" cluster status
+    wait || true
+    ACCEPTED_CLUSTERS=()
+    for cluster in "${SUBMITTED_CLUSTERS[@]}"; do
+        status=$(cat "$ROSA_SUBMIT_STATUS_DIR/$cluster" 2>/dev/null || echo 1)
+        if [ "$status" = "0" ]; then
+            emit_event "${action}_submitted" "$cluster" accepted
+            ACCEPTED_CLUSTERS+=("$cluster")
+        else
+            emit_event "${action}_failed" "$cluster" error "exit code $status, see rosa-${action}-${cluster}.log"
+            tail -n 20 "rosa-${action}-${cluster}.log" 2>/dev/null | sed "s/^/   [$cluster] /" || true
+            FAILED_CLUSTERS+=("$cluster")
+        fi
+    done
+    SUBMITTED_CLUSTERS=()
+}
+
+# wait_for_clusters <ready|deleted> <cluster...>: one shared poll loop for all clusters
+wait_for_clusters() {
+    local target="$1"
+    shift
+    local pending=("$@") interval="$ROSA_POLL_MIN_INTERVAL" waited=0 clusters_json cluster state
+    local -A last_state=()
+    while [ ${#pending[@]} -gt 0 ]; do
+        if clusters_json=$(rosa list clusters -o json 2>/dev/null); then
+            local still_pending=()
+            for cluster in "${pending[@]}"; do
+                state=$(echo "$clusters_json" | jq -r --arg name "$cluster" \\
+                    '(. // []) | map(select(.name == $name)) | first | .state // "not_found"')
+                state="${state:-not_found}"
+                if [ "$state" != "${last_state[$cluster]:-}" ]; then
+                    emit_event state_changed "$cluster" "$state"
+                    last_state[$cluster]="$state"
+                    interval="$ROSA_POLL_MIN_INTERVAL"
+                fi
+                if [ "$target" = "ready" ] && [ "$state" = "ready" ]; then
+                    emit_event cluster_ready "$cluster" ready
+                elif [ "$target" = "deleted" ] && [ "$state" = "not_found" ]; then
+                    emit_event cluster_deleted "$cluster" deleted
+                elif [ "$state" = "error" ]; then
+                    emit_event cluster_failed "$cluster" error "see: rosa logs install --cluster $cluster"
+                    FAILED_CLUSTERS+=("$cluster")
+                else
+                    still_pending+=("$cluster")
+                fi
+            done
+            pending=("${still_pending[@]}")
+        else
+            emit_event poll_failed "-" unknown "rosa list clusters failed, retrying"
+        fi
+        [ ${#pending[@]} -eq 0 ] && break
+        if [ "$waited" -ge "$ROSA_WAIT_TIMEOUT" ]; then
+            for cluster in "${pending[@]}"; do
+                emit_event wait_timeout "$cluster" "${last_state[$cluster]:-unknown}" "gave up after ${waited}s"
+                FAILED_CLUSTERS+=("$cluster")
+            done
+            break
+        fi
+        echo " Waiting on ${#pending[@]} cluster(s): ${pending[*]} (next check in ${interval}s)"
+        sleep "$interval"
+        waited=$((waited + interval))
+        interval=$((interval * 2))
+        if [ "$interval" -gt "$ROSA_POLL_MAX_INTERVAL" ]; then
+            interval="$ROSA_POLL_MAX_INTERVAL"
+        fi
+    done
+}
+
+# report_failures <action>: emit a summary event and fail the script if any cluster failed
+report_failures() {
+    if [ ${#FAILED_CLUSTERS[@]} -gt 0 ]; then
+        emit_event "${1}_summary" "-" failed "${FAILED_CLUSTERS[*]}"
+        echo " Cluster $1 failed for: ${FAILED_CLUSTERS[*]}"
+        exit 1
+    fi
+    emit_event "${1}_summary" "-" succeeded
+}
+'''
+
+
 class OpenShiftProvider(BaseOpenShiftProvider):
     """Main OpenShift provider orchestrator"""
     
@@ -314,6 +449,18 @@ class OpenShiftProvider(BaseOpenShiftProvider):
 
 '''
     
+    def _rosa_orchestration_functions(self, yaml_data: Dict, wait_timeout: int) -> str:
+        """Return the shared bash helpers, with the concurrency limit from rosa_deployment.max_parallel."""
+        max_parallel = yaml_data.get('rosa_deployment', {}).get('max_parallel', DEFAULT_ROSA_MAX_PARALLEL)
+        if not isinstance(max_parallel, int) or isinstance(max_parallel, bool) or max_parallel < 1:
+            raise ValueError(f"rosa_deployment.max_parallel must be a positive integer, got: {max_parallel!r}")
+        settings = f'''
+# Concurrency and timeout (override with ROSA_MAX_PARALLEL / ROSA_WAIT_TIMEOUT)
+ROSA_MAX_PARALLEL="${{ROSA_MAX_PARALLEL:-{max_parallel}}}"
+ROSA_WAIT_TIMEOUT="${{ROSA_WAIT_TIMEOUT:-{wait_timeout}}}"
+'''
+        return settings + ROSA_ORCHESTRATION_FUNCTIONS
+
     def generate_rosa_cli_script(self, yaml_data: Dict) -> str:
         """Generate the ROSA CLI setup script for cluster creation."""
         clusters = yaml_data.get('openshift_clusters', [])
@@ -338,15 +485,27 @@ class OpenShiftProvider(BaseOpenShiftProvider):
 # - Automatic ROSA login using environment variables
 # - Self-contained with no sudo requirements
 # - Complete end-to-end cluster creation
+# - Clusters are created concurrently (at most ROSA_MAX_PARALLEL at a time)
+#   and tracked together, with JSON progress events in rosa-events.jsonl
 #
 # Prerequisites:
 # - Red Hat OpenShift token in environment variables:
 #   * REDHAT_OPENSHIFT_TOKEN
 # - AWS credentials configured (environment variables or AWS CLI profiles)
+# - jq
+# - bash 4.3 or newer
 #
 # Usage: ./rosa-setup.sh
 # =============================================================================
 
+# Associative arrays and wait -n need bash 4.3+; macOS ships bash 3.2 as /bin/bash
+if [ -z "${{BASH_VERSINFO:-}}" ] || [ "${{BASH_VERSINFO[0]}}" -lt 4 ] || \\
+   {{ [ "${{BASH_VERSINFO[0]}}" -eq 4 ] && [ "${{BASH_VERSINFO[1]}}" -lt 3 ]; }}; then
+    echo " This script requires bash 4.3 or newer (running: ${{BASH_VERSION:-not bash}})."
+    echo " On macOS install a newer bash (brew install bash) and run: bash ./rosa-setup.sh"
+    exit 1
+fi
+
 set -e  # Exit on any error
 
 # Set no-credentials mode flag
@@ -473,16 +632,20 @@ if [ "$NO_CREDENTIALS_MODE" = "true" ]; then
 else
     rosa create account-roles --mode auto --yes || echo " Account roles already exist"
 fi
+'''.format(no_credentials_mode_str=str(no_credentials_mode).lower())
+
+        script_content += self._rosa_orchestration_functions(yaml_data, wait_timeout=5400)
+        script_content += '''
+require_jq
 
 # =============================================================================
 # STEP 2: Create ROSA Clusters
 # =============================================================================
-echo " Creating ROSA clusters..."
+# Each cluster gets a create function; all of them are submitted together below.
+'''
 
-'''.format(no_credentials_mode_str=str(no_credentials_mode).lower())
-        
-        # Generate commands for each ROSA cluster
-        for cluster in rosa_clusters:
+        # Generate a create function for each ROSA cluster
+        for index, cluster in enumerate(rosa_clusters):
             cluster_name = cluster.get('name')
             cluster_type = cluster.get('type')
             region = cluster.get('region')
@@ -505,13 +668,11 @@ echo " Creating ROSA clusters..."
 # =============================================================================
 # Create {cluster_type.upper()} Cluster: {cluster_name}
 # =============================================================================
-
-echo " Creating {cluster_type.upper()} cluster: {cluster_name}"
-
 '''
-            
+
+            create_commands = ''
             if cluster_type == 'rosa-classic':
-                script_content += f'''echo " Creating ROSA-CLASSIC cluster: {cluster_name}"
+                create_commands = f'''echo " Creating ROSA-CLASSIC cluster: {cluster_name}"
 
 # Create ROSA Classic cluster with STS
 # Note: Using same region as infrastructure and 3 replicas for multi-AZ
@@ -527,10 +688,11 @@ rosa create cluster \\
   --yes
 
 echo " ROSA Classic cluster '{cluster_name}' creation initiated"
-
 '''
             elif cluster_type == 'rosa-hcp':
-                script_content += f'''# Get subnet IDs from Terraform state (after terraform apply)
+                create_commands = f'''echo " Creating ROSA-HCP cluster: {cluster_name}"
+
+# Get subnet IDs from Terraform state (after terraform apply)
 SUBNET_IDS=$(terraform output -json | jq -r 'to_entries[] | select(.key | startswith("public_subnet_ids_{region.replace("-", "_")}_")) | .value.value | join(",")')
 
 if [ -z "$SUBNET_IDS" ] || [ "$SUBNET_IDS" = "null" ]; then
@@ -561,24 +723,26 @@ rosa create cluster \\
   --yes
 
 echo " ROSA HCP cluster '{cluster_name}' creation initiated"
-
 '''
-        
-        script_content += '''
+
+            script_content += f"create_cluster_{index}() {{\n{textwrap.indent(create_commands, '    ')}}}\n"
+
+        script_content += f'''
 # =============================================================================
-# Wait for all clusters to be ready
+# Submit all cluster creations, then wait for them together
 # =============================================================================
+echo " Creating {len(rosa_clusters)} ROSA cluster(s), at most $ROSA_MAX_PARALLEL at a time..."
+
+'''
+        for index, cluster in enumerate(rosa_clusters):
+            script_content += f'run_limited create "{cluster.get("name")}" create_cluster_{index}\n'
+
+        script_content += '''wait_submissions create
 
 echo "⏳ Waiting for all ROSA clusters to be ready..."
+wait_for_clusters ready "${ACCEPTED_CLUSTERS[@]}"
+report_failures create
 
-'''
-        
-        # Add wait commands for each cluster
-        for cluster in rosa_clusters:
-            cluster_name = cluster.get('name')
-            script_content += f'wait_for_cluster "{cluster_name}"\n'
-        
-        script_content += '''
 # =============================================================================
 # Display cluster information
 # =============================================================================
@@ -628,6 +792,8 @@ echo " ROSA cluster setup complete!"
 # - Safely deletes specified clusters
 # - Optional account role cleanup
 # - Safety confirmations and dry-run mode
+# - Clusters are deleted concurrently and waited on together, with JSON
+#   progress events in rosa-events.jsonl
 #
 # Usage: 
 #   ./rosa-cleanup.sh                    # Interactive mode
@@ -635,8 +801,18 @@ echo " ROSA cluster setup complete!"
 #   ./rosa-cleanup.sh --cluster <name>   # Delete specific cluster
 #   ./rosa-cleanup.sh --dry-run          # Show what would be deleted
 #   ./rosa-cleanup.sh --full-cleanup     # Delete clusters + account roles
+#
+# Requires bash 4.3 or newer and jq
 # =============================================================================
 
+# Associative arrays and wait -n need bash 4.3+; macOS ships bash 3.2 as /bin/bash
+if [ -z "${BASH_VERSINFO:-}" ] || [ "${BASH_VERSINFO[0]}" -lt 4 ] || \\
+   { [ "${BASH_VERSINFO[0]}" -eq 4 ] && [ "${BASH_VERSINFO[1]}" -lt 3 ]; }; then
+    echo " This script requires bash 4.3 or newer (running: ${BASH_VERSION:-not bash})."
+    echo " On macOS install a newer bash (brew install bash) and run: bash ./rosa-cleanup.sh"
+    exit 1
+fi
+
 set -e  # Exit on any error
 
 # Default settings
@@ -699,6 +875,13 @@ fi
 echo " ROSA CLI available and authenticated"
 echo " Logged in as: $(rosa whoami 2>/dev/null | head -1 || echo 'authenticated user')"
 echo ""
+'''
+
+        script_content += self._rosa_orchestration_functions(yaml_data, wait_timeout=3600)
+        script_content += '''
+if [ "$DRY_RUN" = false ]; then
+    require_jq
+fi
 
 # Function to list clusters
 list_clusters() {
@@ -723,7 +906,7 @@ delete_cluster() {
         return 0
     fi
     
-    echo "   ⏳ Deleting cluster '$cluster_name' (this may take 10-15 minutes)..."
+    echo "   Requesting deletion of cluster '$cluster_name'..."
     if rosa delete cluster --cluster "$cluster_name" --yes; then
         echo "    Cluster '$cluster_name' deletion initiated successfully"
     else
@@ -732,17 +915,27 @@ delete_cluster() {
     fi
 }
 
-# Function to wait for cluster deletion
-wait_for_deletion() {
-    local cluster_name="$1"
-    echo "   ⏳ Waiting for cluster '$cluster_name' to be fully deleted..."
+# Function to delete clusters concurrently and wait until all of them are gone
+delete_clusters() {
+    local cluster_name
+    if [ "$DRY_RUN" = true ]; then
+        for cluster_name in "$@"; do
+            delete_cluster "$cluster_name"
+        done
+        return 0
+    fi
     
-    while rosa describe cluster --cluster "$cluster_name" &>/dev/null; do
-        echo "    Cluster '$cluster_name' still exists, checking again in 30 seconds..."
-        sleep 30
+    echo "   Deleting $# cluster(s), at most $ROSA_MAX_PARALLEL at a time..."
+    for cluster_name in "$@"; do
+        run_limited delete "$cluster_name" delete_cluster "$cluster_name"
     done
+    wait_submissions delete
     
-    echo "    Cluster '$cluster_name' has been fully deleted"
+    if [ ${#ACCEPTED_CLUSTERS[@]} -gt 0 ]; then
+        echo "   ⏳ Waiting for ${#ACCEPTED_CLUSTERS[@]} cluster(s) to be fully deleted..."
+        wait_for_clusters deleted "${ACCEPTED_CLUSTERS[@]}"
+    fi
+    report_failures delete
 }
 
 # Function to delete account roles
@@ -791,14 +984,11 @@ fi
 # Handle different execution modes
 if [ "$SPECIFIC_CLUSTER" != "" ]; then
     echo " Deleting specific cluster: $SPECIFIC_CLUSTER"
-    delete_cluster "$SPECIFIC_CLUSTER"
+    delete_clusters "$SPECIFIC_CLUSTER"
     
 elif [ "$DELETE_ALL" = true ]; then
     echo "  Deleting all expected clusters..."
-    
-    for cluster_name in "${EXPECTED_CLUSTERS[@]}"; do
-        delete_cluster "$cluster_name"
-    done
+    delete_clusters "${EXPECTED_CLUSTERS[@]}"
     
     if [ "$DELETE_ACCOUNT_ROLES" = true ]; then
         echo ""
@@ -819,9 +1009,7 @@ else
     case $choice in
         1)
             echo "  Deleting all expected clusters..."
-            for cluster_name in "${EXPECTED_CLUSTERS[@]}"; do
-                delete_cluster "$cluster_name"
-            done
+            delete_clusters "${EXPECTED_CLUSTERS[@]}"
             ;;
         2)
             echo "Available clusters:"
@@ -829,14 +1017,12 @@ else
             echo ""
             read -p "Enter cluster name to delete: " cluster_name
             if [ -n "$cluster_name" ]; then
-                delete_cluster "$cluster_name"
+                delete_clusters "$cluster_name"
             fi
             ;;
         3)
             echo "  Full cleanup: Deleting all clusters + account roles..."
-            for cluster_name in "${EXPECTED_CLUSTERS[@]}"; do
-                delete_cluster "$cluster_name"
-            done
+            delete_clusters "${EXPECTED_CLUSTERS[@]}"
             delete_account_roles
             ;;
         4)
@@ -9,7 +9,8 @@ import time
 import requests
 from typing import Dict, List
 from .base import BaseOpenShiftProvider
-from ...utils import find_yamlforge_file
+from ...core.catalog import load_catalog_file
+from ...core.profiling import api_span
 
 
 class AROProvider(BaseOpenShiftProvider):
@@ -42,7 +43,8 @@ class AROProvider(BaseOpenShiftProvider):
         }
         
         try:
-            response = requests.post(token_url, data=token_data, timeout=30)
+            with api_span('azure', 'oauth2.token'):
+                response = requests.post(token_url, data=token_data, timeout=30)
             response.raise_for_status()
             return response.json()['access_token']
         except requests.RequestException as e:
@@ -53,7 +55,7 @@ class AROProvider(BaseOpenShiftProvider):
         # Check cache first
         if (self._aro_versions_cache and self._cache_timestamp and 
             time.time() - self._cache_timestamp < self._cache_ttl):
-            print(f"Using cached ARO versions (age: {int(time.time() - self._cache_timestamp)}s)")
+            self.converter.reporter.echo(f"Using cached ARO versions (age: {int(time.time() - self._cache_timestamp)}s)")
             return self._aro_versions_cache
         
         subscription_id = os.getenv('ARM_SUBSCRIPTION_ID') or os.getenv('AZURE_SUBSCRIPTION_ID')
@@ -76,11 +78,12 @@ class AROProvider(BaseOpenShiftProvider):
             try:
                 if attempt > 0:
                     wait_time = 2 ** attempt  # Exponential backoff
-                    print(f"Retrying Azure API call in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
+                    self.converter.reporter.echo(f"Retrying Azure API call in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                 
-                print(f"Querying Azure API for supported ARO versions in {location}...")
-                response = requests.get(api_url, headers=headers, timeout=30)
+                self.converter.reporter.echo(f"Querying Azure API for supported ARO versions in {location}...")
+                with api_span('azure', 'openshift_versions.list', location=location):
+                    response = requests.get(api_url, headers=headers, timeout=30)
                 response.raise_for_status()
                 
                 api_data = response.json()
@@ -95,13 +98,13 @@ class AROProvider(BaseOpenShiftProvider):
                 self._aro_versions_cache = sorted(versions, reverse=True)
                 self._cache_timestamp = time.time()
                 
-                print(f"Retrieved {len(versions)} supported ARO versions from Azure API")
+                self.converter.reporter.echo(f"Retrieved {len(versions)} supported ARO versions from Azure API")
                 return self._aro_versions_cache
                 
             except requests.RequestException as e:
                 if attempt == max_retries - 1:  # Last attempt
                     raise ValueError(f"Failed to query Azure API for ARO versions after {max_retries} attempts: {e}")
-                print(f"Azure API call failed (attempt {attempt + 1}/{max_retries}): {e}")
+                self.converter.reporter.echo(f"Azure API call failed (attempt {attempt + 1}/{max_retries}): {e}")
 
     def _validate_aro_version(self, version: str, region: str = "eastus") -> str:
         """Validate requested ARO version against Azure API"""
@@ -110,12 +113,12 @@ class AROProvider(BaseOpenShiftProvider):
         # Handle "latest" keyword
         if version.lower() == "latest":
             latest_version = supported_versions[0]  # First in sorted list
-            print(f"ARO version 'latest' resolved to {latest_version}")
+            self.converter.reporter.echo(f"ARO version 'latest' resolved to {latest_version}")
             return latest_version
         
         # Exact match
         if version in supported_versions:
-            print(f"ARO version {version} is supported")
+            self.converter.reporter.echo(f"ARO version {version} is supported")
             return version
         
         # Partial match (e.g., "4.15" -> "4.15.49")
@@ -123,7 +126,7 @@ class AROProvider(BaseOpenShiftProvider):
             matches = [v for v in supported_versions if v.startswith(version + '.')]
             if matches:
                 selected = matches[0]  # Take the highest (first in sorted list)
-                print(f"ARO version {version} mapped to supported version {selected}")
+                self.converter.reporter.echo(f"ARO version {version} mapped to supported version {selected}")
                 return selected
         
         # No match found - error out
@@ -151,7 +154,7 @@ class AROProvider(BaseOpenShiftProvider):
             raise ValueError(f"ARO cluster '{cluster_name}' must specify 'version'")
         
         # Validate ARO version against Azure API in real-time
-        print(f"ARO cluster '{cluster_name}': Validating OpenShift version {version} against Azure API...")
+        self.converter.reporter.echo(f"ARO cluster '{cluster_name}': Validating OpenShift version {version} against Azure API...")
         try:
             validated_version = self._validate_aro_version(version, region)
             version = validated_version  # Use the validated/mapped version
@@ -171,7 +174,7 @@ class AROProvider(BaseOpenShiftProvider):
             
         # ARO requires minimum 3 worker nodes
         if worker_count < 3:
-            print(f"ARO cluster '{cluster_name}': Worker count {worker_count} is below minimum. Adjusting to 3 worker nodes.")
+            self.converter.reporter.echo(f"ARO cluster '{cluster_name}': Worker count {worker_count} is below minimum. Adjusting to 3 worker nodes.")
             worker_count = 3
         
         worker_disk_size = cluster_config.get('worker_disk_size', 128)
@@ -180,42 +183,39 @@ class AROProvider(BaseOpenShiftProvider):
         
         # Load ARO flavor mappings from YAML file
         try:
-            import yaml
             from pathlib import Path
             
-            aro_flavors_path = find_yamlforge_file("mappings/flavors/aro.yaml")
-            if aro_flavors_path.exists():
-                with open(aro_flavors_path, 'r') as f:
-                    aro_flavors = yaml.safe_load(f)
-                    flavor_mappings = aro_flavors.get('flavor_mappings', {})
+            aro_flavors = load_catalog_file("mappings/flavors/aro.yaml")
+            if aro_flavors:
+                flavor_mappings = aro_flavors.get('flavor_mappings', {})
                     
-                    # Find the appropriate size configuration
-                    size_found = False
-                    for size_name, size_configs in flavor_mappings.items():
-                        if size_name in [controlplane_vm_size, worker_vm_size]:
-                            # Get the first (and usually only) config for this size
-                            if size_configs:
-                                flavor_name = next(iter(size_configs.keys()))
-                                flavor_config = size_configs[flavor_name]
+                # Find the appropriate size configuration
+                size_found = False
+                for size_name, size_configs in flavor_mappings.items():
+                    if size_name in [controlplane_vm_size, worker_vm_size]:
+                        # Get the first (and usually only) config for this size
+                        if size_configs:
+                            flavor_name = next(iter(size_configs.keys()))
+                            flavor_config = size_configs[flavor_name]
                                 
-                                if size_name == controlplane_vm_size:
-                                    controlplane_azure_size = flavor_config.get('controlplane_size', 'Standard_D8s_v3')
-                                if size_name == worker_vm_size:
-                                    worker_azure_size = flavor_config.get('worker_size', 'Standard_D4s_v3')
-                                size_found = True
+                            if size_name == controlplane_vm_size:
+                                controlplane_azure_size = flavor_config.get('controlplane_size', 'Standard_D8s_v3')
+                            if size_name == worker_vm_size:
+                                worker_azure_size = flavor_config.get('worker_size', 'Standard_D4s_v3')
+                            size_found = True
                     
-                    if not size_found:
-                        # Fallback to default sizes if not found in mappings
-                        controlplane_azure_size = 'Standard_D8s_v3'
-                        worker_azure_size = 'Standard_D4s_v3'
-                        print(f"Warning: ARO size configuration not found in mappings, using defaults")
+                if not size_found:
+                    # Fallback to default sizes if not found in mappings
+                    controlplane_azure_size = 'Standard_D8s_v3'
+                    worker_azure_size = 'Standard_D4s_v3'
+                    self.converter.reporter.echo(f"Warning: ARO size configuration not found in mappings, using defaults")
             else:
                 raise ValueError("ARO flavors file not found: mappings/flavors/aro.yaml")
         except Exception as e:
             # Fallback to default sizes if YAML loading fails
             controlplane_azure_size = 'Standard_D8s_v3'
             worker_azure_size = 'Standard_D4s_v3'
-            print(f"Warning: Could not load ARO flavors from YAML: {e}, using defaults")
+            self.converter.reporter.echo(f"Warning: Could not load ARO flavors from YAML: {e}, using defaults")
         
         # Security and networking configuration
         private_cluster = cluster_config.get('private', False)
@@ -3,12 +3,27 @@ Base OpenShift Provider for yamlforge
 Contains common functionality shared by all OpenShift deployment types
 """
 
-import yaml
 import json
 import re
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from ...utils import find_yamlforge_file
+from ...core.catalog import load_catalog_file
+
+
+# Parsed OpenShift defaults and operator configs, shared by every provider instance
+_SHARED_DEFAULTS: Dict[str, Any] = {}
+
+
+def load_shared_defaults(relative_path: str) -> Any:
+    """Load a defaults YAML file once per process and return the shared parsed data.
+
+    Every OpenShift sub-provider, feature provider and operator reads the same
+    defaults files, so they share one parse instead of re-reading the file on
+    every construction. Callers must treat the returned data as read-only.
+    """
+    if relative_path not in _SHARED_DEFAULTS:
+        _SHARED_DEFAULTS[relative_path] = load_catalog_file(relative_path)
+    return _SHARED_DEFAULTS[relative_path]
 
 
 class BaseOpenShiftProvider:
@@ -37,13 +52,8 @@ class BaseOpenShiftProvider:
     
     def _load_openshift_defaults(self):
         """Load OpenShift defaults configuration"""
-        import yaml
-        from ...utils import find_yamlforge_file
-        
         try:
-            defaults_path = find_yamlforge_file('defaults/openshift.yaml')
-            with open(defaults_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_shared_defaults('defaults/openshift.yaml')
         except FileNotFoundError:
             # Return minimal defaults if file not found
             return {
@@ -57,13 +67,10 @@ class BaseOpenShiftProvider:
         
     def load_config(self):
         """Load OpenShift configuration from defaults YAML file."""
-        defaults_file = find_yamlforge_file("defaults/openshift.yaml")
-        if not defaults_file.exists():
-            raise Exception(f"Required OpenShift defaults file not found: {defaults_file}")
-
         try:
-            with open(defaults_file, 'r') as f:
-                defaults_config = yaml.safe_load(f)
+            defaults_config = load_shared_defaults('defaults/openshift.yaml')
+        except FileNotFoundError as e:
+            raise Exception(f"Required OpenShift defaults file not found: {e}")
         except Exception as e:
             raise Exception(f"Failed to load defaults/openshift.yaml: {e}")
 
@@ -79,18 +86,16 @@ class BaseOpenShiftProvider:
         
     def load_operator_config(self, operator_type: str) -> Dict:
         """Load operator-specific configuration from YAML file."""
-        config_file = find_yamlforge_file(f"defaults/openshift_operators/{operator_type}.yaml")
-        if not config_file.exists():
-            raise Exception(f"Required operator config file not found: {config_file}")
-
+        config_path = f"defaults/openshift_operators/{operator_type}.yaml"
         try:
-            with open(config_file, 'r') as f:
-                operator_config = yaml.safe_load(f)
+            operator_config = load_shared_defaults(config_path)
+        except FileNotFoundError as e:
+            raise Exception(f"Required operator config file not found: {e}")
         except Exception as e:
-            raise Exception(f"Failed to load {config_file}: {e}")
+            raise Exception(f"Failed to load {config_path}: {e}")
 
         if not operator_config:
-            raise Exception(f"{config_file} is empty or invalid")
+            raise Exception(f"{config_path} is empty or invalid")
 
         return operator_config
         
@@ -115,20 +120,20 @@ class BaseOpenShiftProvider:
         """
         # Skip version validation in no-credentials mode
         if self.converter and self.converter.no_credentials:
-            print(f"  NO-CREDENTIALS MODE: Skipping OpenShift version validation for '{version}'")
+            self.converter.reporter.echo(f"  NO-CREDENTIALS MODE: Skipping OpenShift version validation for '{version}'")
             return version
         
         # For self-managed clusters, skip ROSA API validation
         # Self-managed clusters can use any OpenShift version without ROSA-specific restrictions
         if cluster_type == "self-managed":
-            print(f"  SELF-MANAGED: Skipping ROSA version validation for '{version}' (any OpenShift version allowed)")
+            self.converter.reporter.echo(f"  SELF-MANAGED: Skipping ROSA version validation for '{version}' (any OpenShift version allowed)")
             return version
         
         # Only validate against ROSA API for ROSA cluster types
         if cluster_type not in ["rosa-classic", "rosa-hcp"]:
             if self.converter and hasattr(self.converter, 'verbose') and self.converter.verbose:
                 cluster_info = f" for cluster '{cluster_name}'" if cluster_name else ""
-                print(f"  [DEBUG] NON-ROSA CLUSTER: Skipping ROSA version validation for '{version}'{cluster_info} (cluster type: {cluster_type})")
+                self.converter.reporter.echo(f"  [DEBUG] NON-ROSA CLUSTER: Skipping ROSA version validation for '{version}'{cluster_info} (cluster type: {cluster_type})")
             return version
             
         try:
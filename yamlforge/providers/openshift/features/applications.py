@@ -10,10 +10,132 @@ Handles deployment of applications across OpenShift clusters including:
 import json
 from typing import Dict, List, Any, Optional
 
+from ..templates import HCLTemplate
+
 
 class ApplicationProvider:
     """Provider for OpenShift application deployments and management."""
     
+    # Per-cluster fragments for multi-cluster applications
+    MULTICLUSTER_DEPLOYMENT_TEMPLATE = HCLTemplate('''
+# Multi-Cluster Application: {app_name} on {cluster_name}
+resource "kubernetes_namespace" "{clean_app_name}_{clean_cluster_name}_multi_namespace" {{
+  provider = kubernetes.{clean_cluster_name}_app_deployer
+  
+  metadata {{
+    name = "{namespace}"
+  }}
+  
+  depends_on = [kubernetes_service_account.{clean_cluster_name}_app_deployer]
+}}
+
+resource "kubernetes_deployment" "{clean_app_name}_{clean_cluster_name}_multi_deployment" {{
+  provider = kubernetes.{clean_cluster_name}_app_deployer
+  
+  metadata {{
+    name      = "{app_name}"
+    namespace = "{namespace}"
+    labels = {{
+      app     = "{app_name}"
+      cluster = "{cluster_name}"
+    }}
+  }}
+
+  spec {{
+    replicas = {replicas}
+    
+    selector {{
+      match_labels = {{
+        app = "{app_name}"
+      }}
+    }}
+
+    template {{
+      metadata {{
+        labels = {{
+          app     = "{app_name}"
+          cluster = "{cluster_name}"
+        }}
+      }}
+
+      spec {{
+        container {{
+          name  = "{app_name}"
+          image = "{image}"
+          
+          port {{
+            container_port = {port}
+          }}
+        }}
+      }}
+    }}
+  }}
+  
+  depends_on = [
+    kubernetes_namespace.{clean_app_name}_{clean_cluster_name}_multi_namespace,
+    kubernetes_service_account.{clean_cluster_name}_app_deployer
+  ]
+}}
+
+resource "kubernetes_service" "{clean_app_name}_{clean_cluster_name}_multi_service" {{
+  provider = kubernetes.{clean_cluster_name}_app_deployer
+  
+  metadata {{
+    name      = "{app_name}-service"
+    namespace = "{namespace}"
+  }}
+
+  spec {{
+    selector = {{
+      app = "{app_name}"
+    }}
+
+    port {{
+      port        = {port}
+      target_port = {port}
+    }}
+
+    type = "ClusterIP"
+  }}
+  
+  depends_on = [kubernetes_deployment.{clean_app_name}_{clean_cluster_name}_multi_deployment]
+}}''')
+    
+    MULTICLUSTER_ARGOCD_TEMPLATE = HCLTemplate('''
+# Multi-Cluster ArgoCD Application: {app_name} on {cluster_name}
+resource "kubernetes_manifest" "{clean_app_name}_{clean_cluster_name}_multi_argocd" {{
+  provider = kubernetes.{clean_cluster_name}_app_deployer
+  
+  manifest = {{
+    apiVersion = "argoproj.io/v1alpha1"
+    kind       = "Application"
+    metadata = {{
+      name      = "{app_name}-{cluster_name}"
+      namespace = "openshift-gitops"
+    }}
+    spec = {{
+      destination = {{
+        namespace = "{namespace}"
+        server    = "https://kubernetes.default.svc"
+      }}
+      project = "default"
+      source = {{
+        path           = "{path}"
+        repoURL        = "{git_repo}"
+        targetRevision = "{branch}"
+      }}
+      syncPolicy = {{
+        automated = {{
+          prune    = true
+          selfHeal = true
+        }}
+      }}
+    }}
+  }}
+  
+  depends_on = [kubernetes_service_account.{clean_cluster_name}_app_deployer]
+}}''')
+    
     def __init__(self, converter=None):
         """Initialize the ApplicationProvider."""
         self.converter = converter
@@ -395,6 +517,8 @@ resource "kubernetes_manifest" "{clean_app_name}_{clean_cluster_name}_argocd_app
 
 '''
         
+        known_clusters = {cluster.get('name') for cluster in cluster_configs}
+        
         for app in multi_apps:
             app_name = app.get('name', 'unnamed-multi-app')
             clean_app_name = self.clean_name(app_name)
@@ -407,163 +531,64 @@ resource "kubernetes_manifest" "{clean_app_name}_{clean_cluster_name}_argocd_app
             
             deployment_type = app.get('deployment_type', 'deployment')
             
+            # Bind the application-wide values once for the whole fan-out
+            if deployment_type == 'deployment':
+                app_template = self._bind_multicluster_deployment(app, clean_app_name)
+            elif deployment_type == 'argocd':
+                app_template = self._bind_multicluster_argocd(app, clean_app_name)
+            else:
+                continue
+            
             # Generate application on each target cluster
             for cluster_name in target_clusters:
-                if not cluster_name:
-                    continue
-                    
-                cluster_config = next((c for c in cluster_configs if c.get('name') == cluster_name), None)
-                if not cluster_config:
+                if not cluster_name or cluster_name not in known_clusters:
                     continue
                     
                 clean_cluster_name = self.clean_name(cluster_name)
                 
                 # Create a deployment-type application for each cluster
                 if deployment_type == 'deployment':
-                    terraform_config += self._generate_multicluster_deployment(app, cluster_name, clean_app_name, clean_cluster_name)
-                elif deployment_type == 'argocd':
-                    terraform_config += self._generate_multicluster_argocd(app, cluster_name, clean_app_name, clean_cluster_name)
+                    terraform_config += self._generate_multicluster_deployment(app, app_template, cluster_name, clean_cluster_name)
+                else:
+                    terraform_config += self._generate_multicluster_argocd(app_template, cluster_name, clean_cluster_name)
 
         return terraform_config
     
-    def _generate_multicluster_deployment(self, app: Dict[str, Any], cluster_name: str, clean_app_name: str, clean_cluster_name: str) -> str:
+    def _bind_multicluster_deployment(self, app: Dict[str, Any], clean_app_name: str) -> HCLTemplate:
+        """Bind the cluster-independent values of a multi-cluster deployment."""
+        return self.MULTICLUSTER_DEPLOYMENT_TEMPLATE.bind(
+            app_name=app.get('name', 'unnamed-multi-app'),
+            clean_app_name=clean_app_name,
+            port=app.get('port', 80),
+            namespace=app.get('namespace', 'default')
+        )
+    
+    def _generate_multicluster_deployment(self, app: Dict[str, Any], app_template: HCLTemplate, cluster_name: str, clean_cluster_name: str) -> str:
         """Generate a deployment for multi-cluster application."""
-        app_name = app.get('name', 'unnamed-multi-app')
-        image = app.get('image', 'nginx:latest')
-        replicas = app.get('replicas', 1)
-        port = app.get('port', 80)
-        namespace = app.get('namespace', 'default')
-        
         # Cluster-specific overrides
         cluster_overrides = app.get('cluster_overrides', {}).get(cluster_name, {})
-        image = cluster_overrides.get('image', image)
-        replicas = cluster_overrides.get('replicas', replicas)
         
-        return f'''
-# Multi-Cluster Application: {app_name} on {cluster_name}
-resource "kubernetes_namespace" "{clean_app_name}_{clean_cluster_name}_multi_namespace" {{
-  provider = kubernetes.{clean_cluster_name}_app_deployer
-  
-  metadata {{
-    name = "{namespace}"
-  }}
-  
-  depends_on = [kubernetes_service_account.{clean_cluster_name}_app_deployer]
-}}
-
-resource "kubernetes_deployment" "{clean_app_name}_{clean_cluster_name}_multi_deployment" {{
-  provider = kubernetes.{clean_cluster_name}_app_deployer
-  
-  metadata {{
-    name      = "{app_name}"
-    namespace = "{namespace}"
-    labels = {{
-      app     = "{app_name}"
-      cluster = "{cluster_name}"
-    }}
-  }}
-
-  spec {{
-    replicas = {replicas}
-    
-    selector {{
-      match_labels = {{
-        app = "{app_name}"
-      }}
-    }}
-
-    template {{
-      metadata {{
-        labels = {{
-          app     = "{app_name}"
-          cluster = "{cluster_name}"
-        }}
-      }}
-
-      spec {{
-        container {{
-          name  = "{app_name}"
-          image = "{image}"
-          
-          port {{
-            container_port = {port}
-          }}
-        }}
-      }}
-    }}
-  }}
-  
-  depends_on = [
-    kubernetes_namespace.{clean_app_name}_{clean_cluster_name}_multi_namespace,
-    kubernetes_service_account.{clean_cluster_name}_app_deployer
-  ]
-}}
-
-resource "kubernetes_service" "{clean_app_name}_{clean_cluster_name}_multi_service" {{
-  provider = kubernetes.{clean_cluster_name}_app_deployer
-  
-  metadata {{
-    name      = "{app_name}-service"
-    namespace = "{namespace}"
-  }}
-
-  spec {{
-    selector = {{
-      app = "{app_name}"
-    }}
-
-    port {{
-      port        = {port}
-      target_port = {port}
-    }}
-
-    type = "ClusterIP"
-  }}
-  
-  depends_on = [kubernetes_deployment.{clean_app_name}_{clean_cluster_name}_multi_deployment]
-}}'''
-
-    def _generate_multicluster_argocd(self, app: Dict[str, Any], cluster_name: str, clean_app_name: str, clean_cluster_name: str) -> str:
+        return app_template.render(
+            cluster_name=cluster_name,
+            clean_cluster_name=clean_cluster_name,
+            image=cluster_overrides.get('image', app.get('image', 'nginx:latest')),
+            replicas=cluster_overrides.get('replicas', app.get('replicas', 1))
+        )
+
+    def _bind_multicluster_argocd(self, app: Dict[str, Any], clean_app_name: str) -> HCLTemplate:
+        """Bind the cluster-independent values of a multi-cluster ArgoCD application."""
+        return self.MULTICLUSTER_ARGOCD_TEMPLATE.bind(
+            app_name=app.get('name', 'unnamed-multi-app'),
+            clean_app_name=clean_app_name,
+            git_repo=app.get('git_repo', ''),
+            path=app.get('path', '.'),
+            branch=app.get('branch', 'main'),
+            namespace=app.get('namespace', 'default')
+        )
+
+    def _generate_multicluster_argocd(self, app_template: HCLTemplate, cluster_name: str, clean_cluster_name: str) -> str:
         """Generate ArgoCD application for multi-cluster deployment."""
-        app_name = app.get('name', 'unnamed-multi-app')
-        git_repo = app.get('git_repo', '')
-        path = app.get('path', '.')
-        branch = app.get('branch', 'main')
-        namespace = app.get('namespace', 'default')
-        
-        return f'''
-# Multi-Cluster ArgoCD Application: {app_name} on {cluster_name}
-resource "kubernetes_manifest" "{clean_app_name}_{clean_cluster_name}_multi_argocd" {{
-  provider = kubernetes.{clean_cluster_name}_app_deployer
-  
-  manifest = {{
-    apiVersion = "argoproj.io/v1alpha1"
-    kind       = "Application"
-    metadata = {{
-      name      = "{app_name}-{cluster_name}"
-      namespace = "openshift-gitops"
-    }}
-    spec = {{
-      destination = {{
-        namespace = "{namespace}"
-        server    = "https://kubernetes.default.svc"
-      }}
-      project = "default"
-      source = {{
-        path           = "{path}"
-        repoURL        = "{git_repo}"
-        targetRevision = "{branch}"
-      }}
-      syncPolicy = {{
-        automated = {{
-          prune    = true
-          selfHeal = true
-        }}
-      }}
-    }}
-  }}
-  
-  depends_on = [kubernetes_service_account.{clean_cluster_name}_app_deployer]
-}}'''
+        return app_template.render(cluster_name=cluster_name, clean_cluster_name=clean_cluster_name)
+
 
  
\ No newline at end of file
@@ -3,7 +3,7 @@ OpenShift Operators Orchestrator for yamlforge
 Manages all OpenShift operator installations and configurations
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from ...base import BaseOpenShiftProvider
 
 # Import core operators
@@ -27,30 +27,49 @@ from .networking import SubmarinerOperator, MetalLBOperator
 from .backup import OADPOperator
 
 
+# Registry of operator generators keyed by operator `type`.
+# Each entry maps to (operator class, generator method name).
+OPERATOR_REGISTRY = {
+    # Core operators - all require admin permissions
+    'monitoring': (MonitoringOperator, 'generate_monitoring_operator'),
+    'logging': (LoggingOperator, 'generate_logging_operator'),
+    'service-mesh': (ServiceMeshOperator, 'generate_service_mesh_operator'),
+    'storage': (StorageOperator, 'generate_storage_operator'),
+    'pipelines': (PipelinesOperator, 'generate_pipelines_operator'),
+    'serverless': (ServerlessOperator, 'generate_serverless_operator'),
+    'gitops': (GitOpsOperator, 'generate_gitops_operator'),
+    
+    # Security operators - require admin permissions
+    'cert-manager': (CertManagerOperator, 'generate_cert_manager_operator'),
+    
+    # Networking operators - require admin permissions
+    'metallb': (MetalLBOperator, 'generate_metallb_operator'),
+    'submariner': (SubmarinerOperator, 'generate_submariner_operator'),
+    
+    # Backup operators - require admin permissions
+    'oadp': (OADPOperator, 'generate_oadp_operator'),
+}
+
+
 class OpenShiftOperatorProvider(BaseOpenShiftProvider):
     """Main OpenShift Operators provider orchestrator"""
     
     def __init__(self, converter):
         super().__init__(converter)
         
-        # Initialize core operator providers
-        self.monitoring_operator = MonitoringOperator(converter)
-        self.logging_operator = LoggingOperator(converter)
-        self.service_mesh_operator = ServiceMeshOperator(converter)
-        self.storage_operator = StorageOperator(converter)
-        self.pipelines_operator = PipelinesOperator(converter)
-        self.serverless_operator = ServerlessOperator(converter)
-        self.gitops_operator = GitOpsOperator(converter)
-        
-        # Initialize security operator providers
-        self.cert_manager_operator = CertManagerOperator(converter)
+        # Operator generators are built on first use, keyed by operator type
+        self._operators = {}
+    
+    def get_operator(self, operator_type: str) -> Optional[BaseOpenShiftProvider]:
+        """Return the generator for an operator type, building it on first use"""
+        if operator_type not in OPERATOR_REGISTRY:
+            return None
         
-        # Initialize networking operator providers
-        self.submariner_operator = SubmarinerOperator(converter)
-        self.metallb_operator = MetalLBOperator(converter)
+        if operator_type not in self._operators:
+            operator_class = OPERATOR_REGISTRY[operator_type][0]
+            self._operators[operator_type] = operator_class(self.converter)
         
-        # Initialize backup operator providers
-        self.oadp_operator = OADPOperator(converter)
+        return self._operators[operator_type]
     
     def generate_operators(self, yaml_data: Dict, clusters: List[Dict]) -> str:
         """Generate OpenShift operators for clusters"""
@@ -73,41 +92,16 @@ class OpenShiftOperatorProvider(BaseOpenShiftProvider):
             if not target_clusters:
                 target_clusters = cluster_names
             
-            # Core operators - all require admin permissions
-            if operator_type == 'monitoring':
-                terraform_config += self.monitoring_operator.generate_monitoring_operator(operator, target_clusters)
-            elif operator_type == 'logging':
-                terraform_config += self.logging_operator.generate_logging_operator(operator, target_clusters)
-            elif operator_type == 'service-mesh':
-                terraform_config += self.service_mesh_operator.generate_service_mesh_operator(operator, target_clusters)
-            elif operator_type == 'storage':
-                terraform_config += self.storage_operator.generate_storage_operator(operator, target_clusters)
-            elif operator_type == 'pipelines':
-                terraform_config += self.pipelines_operator.generate_pipelines_operator(operator, target_clusters)
-            elif operator_type == 'serverless':
-                terraform_config += self.serverless_operator.generate_serverless_operator(operator, target_clusters)
-            elif operator_type == 'gitops':
-                terraform_config += self.gitops_operator.generate_gitops_operator(operator, target_clusters)
-            
-            # Security operators - require admin permissions
-            elif operator_type == 'cert-manager':
-                terraform_config += self.cert_manager_operator.generate_cert_manager_operator(operator, clusters)
-            
-            # Networking operators - require admin permissions
-            elif operator_type == 'metallb':
-                terraform_config += self.metallb_operator.generate_metallb_operator(operator, target_clusters)
-            elif operator_type == 'submariner':
-                terraform_config += self.submariner_operator.generate_submariner_operator(operator, target_clusters)
-            
-            # Backup operators - require admin permissions
-            elif operator_type == 'oadp':
-                terraform_config += self.oadp_operator.generate_oadp_operator(operator, target_clusters)
-            
-            else:
+            operator_generator = self.get_operator(operator_type)
+            if operator_generator is None:
                 print(f"Warning: Unknown operator type '{operator_type}' for operator '{operator_name}'")
+                continue
+            
+            generator_method = OPERATOR_REGISTRY[operator_type][1]
+            terraform_config += getattr(operator_generator, generator_method)(operator, target_clusters)
         
         return terraform_config
 
 
 # Export the main provider
-__all__ = ['OpenShiftOperatorProvider'] 
\ No newline at end of file
+__all__ = ['OpenShiftOperatorProvider', 'OPERATOR_REGISTRY'] 
\ No newline at end of file
@@ -5,51 +5,14 @@ Supports ArgoCD configuration
 
 from typing import Dict, List
 from ....base import BaseOpenShiftProvider
+from ....templates import HCLTemplate
 
 
 class GitOpsOperator(BaseOpenShiftProvider):
     """OpenShift GitOps operator for continuous deployment"""
     
-    def __init__(self, converter):
-        super().__init__(converter)
-        self.operator_config = self.load_operator_config('core/gitops')
-    
-    def generate_gitops_operator(self, operator_config: Dict, target_clusters: List[str]) -> str:
-        """Generate OpenShift GitOps (ArgoCD) operator"""
-        
-        # Load defaults from YAML configuration
-        defaults = self.operator_config.get('defaults', {})
-        subscription_config = self.operator_config.get('subscription', {})
-
-        controller_config = self.operator_config.get('controller', {})
-        repo_server_config = self.operator_config.get('repoServer', {})
-        redis_config = self.operator_config.get('redis', {})
-
-        
-        operator_name = operator_config.get('name', defaults.get('name', 'openshift-gitops'))
-        clean_name = self.clean_name(operator_name)
-        
-        # Configuration options with YAML defaults
-
-
-
-        server_route_enabled = operator_config.get('server_route_enabled', defaults.get('server_route_enabled', True))
-        server_insecure = operator_config.get('server_insecure', defaults.get('server_insecure', False))
-
-        
-        terraform_config = f'''
-# =============================================================================
-# OPENSHIFT GITOPS OPERATOR: {operator_name}
-# =============================================================================
-# Clusters: {', '.join(target_clusters) if target_clusters else 'All clusters'}
-
-'''
-        
-        # Generate operator for each target cluster
-        for cluster_name in target_clusters:
-            clean_cluster_name = self.clean_name(cluster_name)
-            
-            terraform_config += f'''
+    # Subscription and ArgoCD instance generated for every target cluster
+    CLUSTER_TEMPLATE = HCLTemplate('''
 # OpenShift GitOps Subscription for {cluster_name}
 resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_subscription" {{
   count    = var.deploy_day2_operations ? 1 : 0
@@ -59,15 +22,15 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_subscription"
     apiVersion = "operators.coreos.com/v1alpha1"
     kind       = "Subscription"
     metadata = {{
-      name      = "{subscription_config.get('name', 'openshift-gitops-operator')}"
+      name      = "{subscription_name}"
       namespace = "openshift-operators"
     }}
     spec = {{
-      channel = "{subscription_config.get('channel', 'latest')}"
-      name    = "{subscription_config.get('name', 'openshift-gitops-operator')}"
-      source  = "{subscription_config.get('source', 'redhat-operators')}"
-      sourceNamespace = "{subscription_config.get('sourceNamespace', 'openshift-marketplace')}"
-      installPlanApproval = "{subscription_config.get('installPlanApproval', 'Automatic')}"
+      channel = "{subscription_channel}"
+      name    = "{subscription_name}"
+      source  = "{subscription_source}"
+      sourceNamespace = "{subscription_source_namespace}"
+      installPlanApproval = "{install_plan_approval}"
     }}
   }}
   
@@ -89,9 +52,9 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_argocd" {{
     spec = {{
       server = {{
         route = {{
-          enabled = {str(server_route_enabled).lower()}
+          enabled = {server_route_enabled}
         }}
-        insecure = {str(server_insecure).lower()}
+        insecure = {server_insecure}
         grpc = {{
           web = true
         }}
@@ -100,12 +63,12 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_argocd" {{
       controller = {{
         resources = {{
           requests = {{
-            cpu = "{controller_config.get('resources', {}).get('requests', {}).get('cpu', '250m')}"
-            memory = "{controller_config.get('resources', {}).get('requests', {}).get('memory', '1Gi')}"
+            cpu = "{controller_cpu_request}"
+            memory = "{controller_memory_request}"
           }}
           limits = {{
-            cpu = "{controller_config.get('resources', {}).get('limits', {}).get('cpu', '2')}"
-            memory = "{controller_config.get('resources', {}).get('limits', {}).get('memory', '2Gi')}"
+            cpu = "{controller_cpu_limit}"
+            memory = "{controller_memory_limit}"
           }}
         }}
       }}
@@ -113,12 +76,12 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_argocd" {{
       redis = {{
         resources = {{
           requests = {{
-            cpu = "{redis_config.get('resources', {}).get('requests', {}).get('cpu', '250m')}"
-            memory = "{redis_config.get('resources', {}).get('requests', {}).get('memory', '128Mi')}"
+            cpu = "{redis_cpu_request}"
+            memory = "{redis_memory_request}"
           }}
           limits = {{
-            cpu = "{redis_config.get('resources', {}).get('limits', {}).get('cpu', '500m')}"
-            memory = "{redis_config.get('resources', {}).get('limits', {}).get('memory', '256Mi')}"
+            cpu = "{redis_cpu_limit}"
+            memory = "{redis_memory_limit}"
           }}
         }}
       }}
@@ -126,12 +89,12 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_argocd" {{
       repoServer = {{
         resources = {{
           requests = {{
-            cpu = "{repo_server_config.get('resources', {}).get('requests', {}).get('cpu', '250m')}"
-            memory = "{repo_server_config.get('resources', {}).get('requests', {}).get('memory', '256Mi')}"
+            cpu = "{repo_server_cpu_request}"
+            memory = "{repo_server_memory_request}"
           }}
           limits = {{
-            cpu = "{repo_server_config.get('resources', {}).get('limits', {}).get('cpu', '1')}"
-            memory = "{repo_server_config.get('resources', {}).get('limits', {}).get('memory', '1Gi')}"
+            cpu = "{repo_server_cpu_limit}"
+            memory = "{repo_server_memory_limit}"
           }}
         }}
       }}
@@ -144,7 +107,81 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_argocd" {{
   ]
 }}
 
+''')
+    
+    def __init__(self, converter):
+        super().__init__(converter)
+        self.operator_config = self.load_operator_config('core/gitops')
+    
+    def generate_gitops_operator(self, operator_config: Dict, target_clusters: List[str]) -> str:
+        """Generate OpenShift GitOps (ArgoCD) operator"""
+        
+        # Load defaults from YAML configuration
+        defaults = self.operator_config.get('defaults', {})
+        subscription_config = self.operator_config.get('subscription', {})
+
+        controller_config = self.operator_config.get('controller', {})
+        repo_server_config = self.operator_config.get('repoServer', {})
+        redis_config = self.operator_config.get('redis', {})
+
+        # Component resource settings shared by every cluster
+        controller_requests = controller_config.get('resources', {}).get('requests', {})
+        controller_limits = controller_config.get('resources', {}).get('limits', {})
+        repo_server_requests = repo_server_config.get('resources', {}).get('requests', {})
+        repo_server_limits = repo_server_config.get('resources', {}).get('limits', {})
+        redis_requests = redis_config.get('resources', {}).get('requests', {})
+        redis_limits = redis_config.get('resources', {}).get('limits', {})
+
+        
+        operator_name = operator_config.get('name', defaults.get('name', 'openshift-gitops'))
+        clean_name = self.clean_name(operator_name)
+        
+        # Configuration options with YAML defaults
+
+
+
+        server_route_enabled = operator_config.get('server_route_enabled', defaults.get('server_route_enabled', True))
+        server_insecure = operator_config.get('server_insecure', defaults.get('server_insecure', False))
+
+        
+        terraform_config = f'''
+# =============================================================================
+# OPENSHIFT GITOPS OPERATOR: {operator_name}
+# =============================================================================
+# Clusters: {', '.join(target_clusters) if target_clusters else 'All clusters'}
+
 '''
+        
+        # Operator-wide values are bound once; each cluster only fills in its names
+        cluster_template = self.CLUSTER_TEMPLATE.bind(
+            clean_name=clean_name,
+            subscription_name=subscription_config.get('name', 'openshift-gitops-operator'),
+            subscription_channel=subscription_config.get('channel', 'latest'),
+            subscription_source=subscription_config.get('source', 'redhat-operators'),
+            subscription_source_namespace=subscription_config.get('sourceNamespace', 'openshift-marketplace'),
+            install_plan_approval=subscription_config.get('installPlanApproval', 'Automatic'),
+            server_route_enabled=str(server_route_enabled).lower(),
+            server_insecure=str(server_insecure).lower(),
+            controller_cpu_request=controller_requests.get('cpu', '250m'),
+            controller_memory_request=controller_requests.get('memory', '1Gi'),
+            controller_cpu_limit=controller_limits.get('cpu', '2'),
+            controller_memory_limit=controller_limits.get('memory', '2Gi'),
+            redis_cpu_request=redis_requests.get('cpu', '250m'),
+            redis_memory_request=redis_requests.get('memory', '128Mi'),
+            redis_cpu_limit=redis_limits.get('cpu', '500m'),
+            redis_memory_limit=redis_limits.get('memory', '256Mi'),
+            repo_server_cpu_request=repo_server_requests.get('cpu', '250m'),
+            repo_server_memory_request=repo_server_requests.get('memory', '256Mi'),
+            repo_server_cpu_limit=repo_server_limits.get('cpu', '1'),
+            repo_server_memory_limit=repo_server_limits.get('memory', '1Gi')
+        )
+        
+        # Generate operator for each target cluster
+        for cluster_name in target_clusters:
+            terraform_config += cluster_template.render(
+                cluster_name=cluster_name,
+                clean_cluster_name=self.clean_name(cluster_name)
+            )
 
         # Add ArgoCD Applications if configured
         applications = operator_config.get('applications', defaults.get('applications', []))
@@ -5,42 +5,14 @@ Supports Prometheus, Grafana, and AlertManager configuration
 
 from typing import Dict, List
 from ....base import BaseOpenShiftProvider
+from ....templates import HCLTemplate
 
 
 class MonitoringOperator(BaseOpenShiftProvider):
     """OpenShift Monitoring operator for observability"""
     
-    def __init__(self, converter):
-        super().__init__(converter)
-        self.operator_config = self.load_operator_config('core/monitoring')
-    
-    def generate_monitoring_operator(self, operator_config: Dict, target_clusters: List[str]) -> str:
-        """Generate OpenShift monitoring operator"""
-        
-        # Load defaults from YAML configuration
-        defaults = self.operator_config.get('defaults', {})
-        monitoring_config = operator_config.get('monitoring', defaults.get('monitoring', {}))
-        alertmanager_config = operator_config.get('alertmanager', defaults.get('alertmanager', {}))
-        
-        operator_name = operator_config.get('name', defaults.get('name', 'monitoring-operator'))
-        clean_name = self.clean_name(operator_name)
-        
-        # Configuration options with YAML defaults
-        enable_alertmanager = operator_config.get('enable_alertmanager', defaults.get('enable_alertmanager', True))
-        
-        terraform_config = f'''
-# =============================================================================
-# MONITORING OPERATOR: {operator_name}
-# =============================================================================
-# Clusters: {', '.join(target_clusters) if target_clusters else 'All clusters'}
-
-'''
-        
-        # Generate operator for each target cluster
-        for cluster_name in target_clusters:
-            clean_cluster_name = self.clean_name(cluster_name)
-            
-            terraform_config += f'''
+    # User workload monitoring resources generated for every target cluster
+    CLUSTER_TEMPLATE = HCLTemplate('''
 # User Workload Monitoring ConfigMap for {cluster_name}
 resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_user_workload_monitoring" {{
   count    = var.deploy_day2_operations ? 1 : 0
@@ -56,29 +28,29 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_user_workload_
     data = {{
       "config.yaml" = <<-EOT
         prometheus:
-          retention: {monitoring_config.get('retention', '15d')}
+          retention: {retention}
           resources:
             requests:
-              cpu: {monitoring_config.get('resources', {}).get('requests', {}).get('cpu', '200m')}
-              memory: {monitoring_config.get('resources', {}).get('requests', {}).get('memory', '2Gi')}
+              cpu: {prometheus_cpu}
+              memory: {prometheus_memory}
           volumeClaimTemplate:
             spec:
-              storageClassName: {monitoring_config.get('storageClass', 'gp2')}
+              storageClassName: {prometheus_storage_class}
               resources:
                 requests:
-                  storage: {monitoring_config.get('storage', '40Gi')}
+                  storage: {prometheus_storage}
         alertmanager:
-          enabled: {str(enable_alertmanager).lower()}
+          enabled: {enable_alertmanager}
           resources:
             requests:
-              cpu: {alertmanager_config.get('resources', {}).get('requests', {}).get('cpu', '100m')}
-              memory: {alertmanager_config.get('resources', {}).get('requests', {}).get('memory', '200Mi')}
+              cpu: {alertmanager_cpu}
+              memory: {alertmanager_memory}
           volumeClaimTemplate:
             spec:
-              storageClassName: {alertmanager_config.get('storageClass', 'gp2')}
+              storageClassName: {alertmanager_storage_class}
               resources:
                 requests:
-                  storage: {alertmanager_config.get('storage', '20Gi')}
+                  storage: {alertmanager_storage}
       EOT
     }}
   }}
@@ -86,6 +58,54 @@ resource "kubernetes_manifest" "{clean_name}_{clean_cluster_name}_user_workload_
   depends_on = [kubernetes_service_account.{clean_cluster_name}_cluster_admin_limited]
 }}
 
+''')
+    
+    def __init__(self, converter):
+        super().__init__(converter)
+        self.operator_config = self.load_operator_config('core/monitoring')
+    
+    def generate_monitoring_operator(self, operator_config: Dict, target_clusters: List[str]) -> str:
+        """Generate OpenShift monitoring operator"""
+        
+        # Load defaults from YAML configuration
+        defaults = self.operator_config.get('defaults', {})
+        monitoring_config = operator_config.get('monitoring', defaults.get('monitoring', {}))
+        alertmanager_config = operator_config.get('alertmanager', defaults.get('alertmanager', {}))
+        
+        operator_name = operator_config.get('name', defaults.get('name', 'monitoring-operator'))
+        clean_name = self.clean_name(operator_name)
+        
+        # Configuration options with YAML defaults
+        enable_alertmanager = operator_config.get('enable_alertmanager', defaults.get('enable_alertmanager', True))
+        
+        terraform_config = f'''
+# =============================================================================
+# MONITORING OPERATOR: {operator_name}
+# =============================================================================
+# Clusters: {', '.join(target_clusters) if target_clusters else 'All clusters'}
+
 '''
         
+        # Operator-wide values are bound once; each cluster only fills in its names
+        cluster_template = self.CLUSTER_TEMPLATE.bind(
+            clean_name=clean_name,
+            retention=monitoring_config.get('retention', '15d'),
+            prometheus_cpu=monitoring_config.get('resources', {}).get('requests', {}).get('cpu', '200m'),
+            prometheus_memory=monitoring_config.get('resources', {}).get('requests', {}).get('memory', '2Gi'),
+            prometheus_storage_class=monitoring_config.get('storageClass', 'gp2'),
+            prometheus_storage=monitoring_config.get('storage', '40Gi'),
+            enable_alertmanager=str(enable_alertmanager).lower(),
+            alertmanager_cpu=alertmanager_config.get('resources', {}).get('requests', {}).get('cpu', '100m'),
+            alertmanager_memory=alertmanager_config.get('resources', {}).get('requests', {}).get('memory', '200Mi'),
+            alertmanager_storage_class=alertmanager_config.get('storageClass', 'gp2'),
+            alertmanager_storage=alertmanager_config.get('storage', '20Gi')
+        )
+        
+        # Generate operator for each target cluster
+        for cluster_name in target_clusters:
+            terraform_config += cluster_template.render(
+                cluster_name=cluster_name,
+                clean_cluster_name=self.clean_name(cluster_name)
+            )
+        
         return terraform_config 
\ No newline at end of file
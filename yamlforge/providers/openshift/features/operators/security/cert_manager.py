@@ -41,7 +41,7 @@ class CertManagerOperator(BaseOpenShiftProvider):
             }
         }
     
-    def generate_cert_manager_operator(self, operator_config: Dict, target_clusters: List[Dict]) -> str:
+    def generate_cert_manager_operator(self, operator_config: Dict, target_clusters: List[str]) -> str:
         """Generate cert-manager operator for certificate management"""
         
         # Load defaults from YAML configuration
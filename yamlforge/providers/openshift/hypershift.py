@@ -115,7 +115,7 @@ data "aws_ami" "{clean_name}_worker_ami" {{
                     # Data source HCL returned
                     return f'data.aws_ami.{clean_name}_worker_ami.id', resolution_type or ""
         except Exception as e:
-            print(f"Warning: Failed to resolve CoreOS image {coreos_image_key}: {e}")
+            self.converter.reporter.echo(f"Warning: Failed to resolve CoreOS image {coreos_image_key}: {e}")
         
         # Fallback to data source
         data_source = self.generate_coreos_ami_data_source(clean_name, coreos_image_key)
@@ -126,23 +126,20 @@ data "aws_ami" "{clean_name}_worker_ami" {{
         if no_credentials_mode:
             return '"projects/rhcos-cloud/global/images/family/rhcos"', ""
         
-        # Try dynamic resolution first using GCP provider
+        # Try dynamic resolution first using the GCP image catalog
         try:
-            gcp_provider = getattr(self.converter, 'providers', {}).get('gcp')
-            if gcp_provider:
-                # Check if the GCP provider has image resolution methods
-                image_config = self.converter.images.get(coreos_image_key, {})
-                gcp_config = image_config.get('gcp', {})
-                
-                if gcp_config:
-                    image_family = gcp_config.get('image_family', 'rhcos')
-                    project = gcp_config.get('project', 'rhcos-cloud')
-                    
-                    # Use data source for GCP CoreOS images
-                    data_source = self.generate_gcp_coreos_image_data_source(clean_name, image_family, project)
-                    return f'data.google_compute_image.{clean_name}_worker_image.self_link', data_source
+            family_key = self.converter.gcp_provider.get_image_family(coreos_image_key)
+            if family_key:
+                project, image_family = family_key
+                pinned_image = self.converter.gcp_provider.get_pinned_image_reference(project, image_family)
+                if pinned_image:
+                    return f'"{pinned_image}"', ""
+
+                # Use data source for GCP CoreOS images
+                data_source = self.generate_gcp_coreos_image_data_source(clean_name, image_family, project)
+                return f'data.google_compute_image.{clean_name}_worker_image.self_link', data_source
         except Exception as e:
-            print(f"Warning: Failed to resolve GCP CoreOS image {coreos_image_key}: {e}")
+            self.converter.reporter.echo(f"Warning: Failed to resolve GCP CoreOS image {coreos_image_key}: {e}")
         
         # Fallback to hardcoded RHCOS family
         data_source = self.generate_gcp_coreos_image_data_source(clean_name, "rhcos", "rhcos-cloud")
@@ -187,7 +184,7 @@ data "google_compute_image" "{clean_name}_worker_image" {{
     version   = "{version}"'''
                 return image_ref, ""
         except Exception as e:
-            print(f"Warning: Failed to resolve Azure CoreOS image {coreos_image_key}: {e}")
+            self.converter.reporter.echo(f"Warning: Failed to resolve Azure CoreOS image {coreos_image_key}: {e}")
         
         # Fallback to hardcoded CoreOS configuration
         image_ref = '''
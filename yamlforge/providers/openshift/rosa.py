@@ -42,7 +42,7 @@ class ROSAProvider(BaseOpenShiftProvider):
         # Enforce ROSA Classic multi-AZ requirement: minimum 3 worker nodes
         multi_az = cluster_config.get('multi_az', True)  # Default to multi-AZ
         if multi_az and worker_count < 3:
-            print(f"Warning: ROSA Classic multi-AZ clusters require at least 3 worker nodes. Adjusting from {worker_count} to 3. Update your input YAML!")
+            self.converter.reporter.echo(f"Warning: ROSA Classic multi-AZ clusters require at least 3 worker nodes. Adjusting from {worker_count} to 3. Update your input YAML!")
             worker_count = 3
         
         min_replicas = cluster_config.get('min_replicas')
@@ -103,7 +103,7 @@ class ROSAProvider(BaseOpenShiftProvider):
         az_count = 3  # Standard for us-east-1, us-west-2, etc.
         if worker_count % az_count != 0:
             adjusted_count = ((worker_count // az_count) + 1) * az_count
-            print(f"Warning: ROSA HCP clusters require worker count to be multiple of availability zones ({az_count}). Adjusting from {worker_count} to {adjusted_count}. Update your input YAML!")
+            self.converter.reporter.echo(f"Warning: ROSA HCP clusters require worker count to be multiple of availability zones ({az_count}). Adjusting from {worker_count} to {adjusted_count}. Update your input YAML!")
             worker_count = adjusted_count
         
         min_replicas = cluster_config.get('min_replicas')
@@ -0,0 +1,82 @@
+"""
+Compiled HCL templates for yamlforge OpenShift generators
+Pre-parses Terraform fragments once so fan-out to many clusters only substitutes values
+"""
+
+from string import Formatter
+from typing import Any, FrozenSet, List, Tuple
+
+
+class HCLTemplate:
+    """HCL fragment compiled once into literal chunks and named placeholders.
+
+    Templates use the same syntax as the f-string fragments they replace:
+    ``{name}`` marks a placeholder and ``{{`` / ``}}`` produce literal braces.
+    Placeholders must be plain identifiers; expressions are evaluated by the
+    caller and passed in by name.
+
+    ``bind()`` substitutes values that are shared by every cluster (operator
+    settings, subscription config) and returns a smaller template, so each
+    cluster render only fills in the cluster-specific names.
+    """
+
+    __slots__ = ('_chunks', '_fields')
+
+    def __init__(self, source: str):
+        chunks: List[Any] = []
+        fields: List[Tuple[int, str]] = []
+
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if literal:
+                chunks.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Unsupported HCL template placeholder '{{{field_name}}}': only plain names are allowed")
+            fields.append((len(chunks), field_name))
+            chunks.append(None)
+
+        self._chunks = tuple(chunks)
+        self._fields = tuple(fields)
+
+    @classmethod
+    def _from_parts(cls, chunks: List[Any], fields: List[Tuple[int, str]]) -> 'HCLTemplate':
+        """Build a template from already compiled chunks without re-parsing."""
+        template = cls.__new__(cls)
+        template._chunks = tuple(chunks)
+        template._fields = tuple(fields)
+        return template
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        """Names of the placeholders still to be substituted."""
+        return frozenset(name for _, name in self._fields)
+
+    def bind(self, **values) -> 'HCLTemplate':
+        """Substitute the given placeholders now and return a template for the rest."""
+        field_names = {index: name for index, name in self._fields}
+        chunks: List[Any] = []
+        fields: List[Tuple[int, str]] = []
+
+        for index, chunk in enumerate(self._chunks):
+            name = field_names.get(index)
+            if name is not None and name not in values:
+                fields.append((len(chunks), name))
+                chunks.append(None)
+                continue
+
+            text = chunk if name is None else str(values[name])
+            # Merge adjacent literal text so later renders join fewer pieces
+            if chunks and chunks[-1] is not None:
+                chunks[-1] += text
+            else:
+                chunks.append(text)
+
+        return self._from_parts(chunks, fields)
+
+    def render(self, **values) -> str:
+        """Render the template, substituting every remaining placeholder."""
+        chunks = list(self._chunks)
+        for index, name in self._fields:
+            chunks[index] = str(values[name])
+        return ''.join(chunks)
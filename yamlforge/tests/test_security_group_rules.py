@@ -0,0 +1,106 @@
+"""
+Unit tests for security group rule compaction.
+
+Run with:
+    python -m pytest yamlforge/tests/test_security_group_rules.py
+"""
+
+from yamlforge.core.security_group_rules import compact_security_group_rules
+
+
+def rule(port_range, source='0.0.0.0/0', direction='ingress', protocol='tcp', **extra):
+    return dict(direction=direction, protocol=protocol, port_range=port_range, source=source, **extra)
+
+
+def summarize(rules):
+    return [(r['direction'], r['protocol'], r['port_range'], r['source']) for r in rules]
+
+
+def test_single_rule_is_returned_unchanged():
+    rules = [rule('22')]
+    assert compact_security_group_rules(rules) is rules
+
+
+def test_exact_duplicates_are_removed():
+    rules = [rule('22'), rule('443'), rule('22')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '22', '0.0.0.0/0'),
+        ('ingress', 'tcp', '443', '0.0.0.0/0'),
+    ]
+
+
+def test_adjacent_and_overlapping_port_ranges_are_merged():
+    rules = [rule('80'), rule('81-90'), rule('85-100'), rule('443')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '80-100', '0.0.0.0/0'),
+        ('ingress', 'tcp', '443', '0.0.0.0/0'),
+    ]
+
+
+def test_sibling_cidrs_are_collapsed():
+    rules = [rule('22', '10.0.0.0/25'), rule('22', '10.0.0.128/25')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '22', '10.0.0.0/24'),
+    ]
+
+
+def test_subnet_of_listed_supernet_is_dropped():
+    rules = [rule('22', '10.0.0.0/8'), rule('22', '10.1.2.0/24')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '22', '10.0.0.0/8'),
+    ]
+
+
+def test_rule_covered_by_wider_rule_is_dropped():
+    rules = [rule('1-1024', '10.0.0.0/16'), rule('443', '10.0.5.0/24')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '1-1024', '10.0.0.0/16'),
+    ]
+
+
+def test_rule_fields_other_than_ports_and_source_are_kept():
+    rules = [rule('80', description='http'), rule('81', description='alt')]
+    compacted = compact_security_group_rules(rules)
+    assert compacted == [dict(rules[0], port_range='80-81')]
+    assert rules[0]['port_range'] == '80'
+
+
+def test_different_directions_are_not_merged():
+    rules = [rule('80'), rule('81', direction='egress'), rule('80', direction='egress')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '80', '0.0.0.0/0'),
+        ('egress', 'tcp', '80-81', '0.0.0.0/0'),
+    ]
+
+
+def test_different_directions_do_not_cover_each_other():
+    rules = [rule('1-65535'), rule('443', direction='egress')]
+    assert compact_security_group_rules(rules) is rules
+
+
+def test_different_protocols_are_not_merged():
+    rules = [rule('53'), rule('53', protocol='udp'), rule('54', protocol='udp')]
+    assert summarize(compact_security_group_rules(rules)) == [
+        ('ingress', 'tcp', '53', '0.0.0.0/0'),
+        ('ingress', 'udp', '53-54', '0.0.0.0/0'),
+    ]
+
+
+def test_different_protocols_do_not_cover_each_other():
+    rules = [rule('1-65535', protocol='tcp'), rule('443', protocol='udp')]
+    assert compact_security_group_rules(rules) is rules
+
+
+def test_non_port_protocol_ranges_are_not_merged():
+    rules = [rule('8', protocol='icmp'), rule('9', protocol='icmp')]
+    assert compact_security_group_rules(rules) is rules
+
+
+def test_different_sources_keep_separate_port_ranges():
+    rules = [rule('80', '10.0.0.0/24'), rule('81', '192.168.0.0/24')]
+    assert compact_security_group_rules(rules) is rules
+
+
+def test_malformed_rule_leaves_input_unchanged():
+    rules = [rule('22'), rule('22'), rule('not-a-port')]
+    assert compact_security_group_rules(rules) is rules
@@ -8,6 +8,32 @@ for defaults, mappings, and docs files across different installation modes.
 from pathlib import Path
 import tempfile
 
+import yaml
+
+# Prefer the libyaml C loader; it parses the large mapping files several times faster
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+    LIBYAML_AVAILABLE = False
+
+
+def load_yaml(stream):
+    """
+    Parse YAML safely, equivalent to yaml.safe_load().
+    
+    Uses the libyaml-backed CSafeLoader when PyYAML was built with it and the
+    pure-Python SafeLoader otherwise.
+    
+    Args:
+        stream: YAML text or an open file object
+    
+    Returns:
+        The parsed document (None for an empty document)
+    """
+    return yaml.load(stream, Loader=YamlSafeLoader)
+
 
 def find_yamlforge_file(filename):
     """